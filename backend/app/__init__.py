@@ -18,20 +18,26 @@ cache = Cache()
 compress = Compress()
 
 
-def create_app(config_name='development'):
+def create_app(config_name='development', background=True):
     """
     Flask 애플리케이션 팩토리 함수
 
     Args:
         config_name: 설정 환경 이름 (development, production, testing)
+        background: 스케줄러/조회수 flush 스레드 시작 여부 (격리 작업 자식 프로세스는 False)
 
     Returns:
         Flask: 설정된 Flask 애플리케이션 인스턴스
     """
     app = Flask(__name__)
+    app.config_name = config_name
 
     # Load configuration
-    app.config.from_object(f'app.config.{config_name.capitalize()}Config')
+    # pydantic 설정 필드는 클래스 속성이 아니므로 from_object 로는 복사되지 않음, 인스턴스 값을 넣음
+    from app.config import config_by_name
+    settings = config_by_name[config_name]()
+    app.config.from_mapping(settings.model_dump())
+    app.extensions['settings'] = settings
 
     # Initialize extensions
     db.init_app(app)
@@ -40,12 +46,22 @@ def create_app(config_name='development'):
 
     # Initialize caching (Simple cache for development, Redis for production)
     cache_config = {
-        'CACHE_TYPE': 'SimpleCache',  # Use 'RedisCache' in production
+        'CACHE_TYPE': settings.CACHE_TYPE,  # 'RedisCache' + CACHE_REDIS_URL in production
         'CACHE_DEFAULT_TIMEOUT': 300,  # 5 minutes
     }
+    if settings.CACHE_REDIS_URL:
+        cache_config['CACHE_REDIS_URL'] = settings.CACHE_REDIS_URL
     app.config.update(cache_config)
     cache.init_app(app)
 
+    # 공개 엔드포인트 캐시 예열 (스케줄러 작업, 배포 후 훅)
+    from app.services.cache_warming import init_cache_warmer
+    init_cache_warmer(app)
+
+    # 게시물 조회수 버퍼 (테스트에서는 직접 flush)
+    from app.services.view_counter import init_view_counter
+    init_view_counter(app, start=background and not app.testing)
+
     # Initialize compression
     compress.init_app(app)
 
@@ -105,7 +121,7 @@ def create_app(config_name='development'):
         return {'status': 'healthy', 'service': 'NewsKoo API'}, 200
 
     # Initialize scheduler (production only)
-    if not app.debug and not app.testing:
+    if background and not app.debug and not app.testing:
         from app.services.scheduler import init_scheduler
         init_scheduler(app)
         app.logger.info('Scheduler initialized')
@@ -5,13 +5,17 @@ Admin API
 - 스케줄러 관리
 - 시스템 통계
 - 크롤링 작업 제어
+- 캐시 예열
 """
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
 from app.utils.errors import NotFoundError, ValidationError
 from app.utils.decorators import admin_required
+from app.models import JobCancelRequest, JobRun
 from app.services.scheduler import get_scheduler
+from app.services.cache_warming import get_cache_warmer
+from app.services.http_cache import get_http_cache
 from app.services.reddit_crawler import RedditCrawler
 from app.config import Settings
 
@@ -26,7 +30,9 @@ def get_scheduler_status():
     스케줄러 상태 조회
 
     Returns:
-        - running: 실행 중 여부
+        - running: 이 워커에서 작업 실행 중 여부
+        - is_leader: 이 워커가 리더인지
+        - leader: 리더 하트비트 (hostname, pid, heartbeat_at, alive)
         - total_jobs: 전체 작업 수
         - active_jobs: 활성 작업 수
         - jobs: 작업 목록
@@ -44,6 +50,8 @@ def get_scheduler_status():
 
     return jsonify({
         'running': stats['running'],
+        'is_leader': stats['is_leader'],
+        'leader': scheduler.get_leader_status()['leader'],
         'total_jobs': stats['total_jobs'],
         'active_jobs': stats['active_jobs'],
         'recent_24h': stats['recent_24h'],
@@ -51,6 +59,31 @@ def get_scheduler_status():
     }), 200
 
 
+@admin_bp.route('/scheduler/leader', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_scheduler_leader():
+    """
+    스케줄러 리더 상태 조회 (어느 워커가 응답해도 같은 리더 정보)
+
+    Returns:
+        - is_leader: 응답한 워커가 리더인지
+        - worker: 응답한 워커 (hostname:pid)
+        - leader: 리더 하트비트 (없으면 null)
+    """
+    scheduler = get_scheduler()
+
+    if not scheduler:
+        return jsonify({
+            'is_leader': False,
+            'worker': None,
+            'leader': None,
+            'message': 'Scheduler not initialized (debug/testing mode)'
+        }), 200
+
+    return jsonify(scheduler.get_leader_status()), 200
+
+
 @admin_bp.route('/scheduler/jobs', methods=['GET'])
 @jwt_required()
 @admin_required
@@ -96,7 +129,7 @@ def get_job(job_id: str):
         raise NotFoundError(f'Job {job_id} not found')
 
     # 히스토리
-    history = scheduler.get_job_history(job_id=job_id, limit=10)
+    history = scheduler.get_job_history(job_id=job_id, limit=10)['history']
 
     return jsonify({
         'job': job,
@@ -188,32 +221,79 @@ def resume_job(job_id: str):
     }), 200
 
 
+@admin_bp.route('/scheduler/jobs/<job_id>/cancel', methods=['POST'])
+@jwt_required()
+@admin_required
+def cancel_job_run(job_id: str):
+    """
+    실행 중인 격리 작업 취소 (자식 프로세스 종료, 실행 기록은 cancelled)
+
+    작업은 리더 워커의 자식 프로세스에서 실행되므로, 다른 워커가 요청을 받으면
+    DB 에 취소 요청을 남기고 리더가 다음 하트비트에 처리합니다 (202).
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        성공 메시지
+    """
+    scheduler = get_scheduler()
+
+    if not scheduler:
+        raise NotFoundError('Scheduler not initialized')
+
+    if scheduler.cancel_job_run(job_id):
+        return jsonify({
+            'message': f'Job {job_id} cancelled'
+        }), 200
+
+    if scheduler.is_leader or not scheduler.scheduler.get_job(job_id):
+        raise NotFoundError(f'Job {job_id} is not running')
+
+    JobCancelRequest.request(job_id)
+    return jsonify({
+        'message': f'Cancellation of job {job_id} requested; the scheduler leader applies it on its next heartbeat',
+        'leader': scheduler.get_leader_status()['leader']
+    }), 202
+
+
 @admin_bp.route('/scheduler/history', methods=['GET'])
 @jwt_required()
 @admin_required
 def get_job_history():
     """
-    작업 실행 히스토리 조회
+    작업 실행 히스토리 조회 (모든 워커/재시작에 걸친 DB 기록, 최신순)
 
     Query Parameters:
         - job_id: 특정 작업 필터 (선택)
-        - limit: 최대 개수 (기본: 20)
+        - status: 상태 필터 (success, failed, timeout, cancelled, missed, skipped)
+        - cursor: 이전 응답의 next_cursor (다음 페이지)
+        - limit: 최대 개수 (기본: 20, 최대: 100)
 
     Returns:
-        히스토리 목록
+        - history: 실행 기록 (시작/종료 시각, 소요 시간, CPU 시간, 최대 RSS, 상태, 반환 요약, 에러)
+        - next_cursor: 다음 페이지 커서 (마지막 페이지면 null)
     """
     scheduler = get_scheduler()
 
     if not scheduler:
-        return jsonify({'history': []}), 200
+        return jsonify({'history': [], 'next_cursor': None}), 200
+
+    status = request.args.get('status')
+    if status and status not in JobRun.STATUSES:
+        raise ValidationError(f'status must be one of: {", ".join(JobRun.STATUSES)}')
 
-    job_id = request.args.get('job_id')
     limit = request.args.get('limit', 20, type=int)
-    limit = min(limit, 100)  # 최대 100
+    limit = max(1, min(limit, 100))  # 최대 100
 
-    history = scheduler.get_job_history(job_id=job_id, limit=limit)
+    result = scheduler.get_job_history(
+        job_id=request.args.get('job_id'),
+        status=status,
+        before_id=request.args.get('cursor', type=int),
+        limit=limit
+    )
 
-    return jsonify({'history': history}), 200
+    return jsonify(result), 200
 
 
 @admin_bp.route('/crawler/collect-now', methods=['POST'])
@@ -226,7 +306,8 @@ def trigger_collection():
     Request Body:
         - subreddits: Subreddit 목록 (선택)
         - limit_per_subreddit: subreddit당 개수 (기본: 10)
-        - time_filter: 시간 필터 (기본: 'day')
+        - time_filter: 시간 필터 (기본: 'day', 'hot'/'new' 리스팅도 가능)
+        - incremental: 이전 수집 지점 이후만 가져올지 여부 (기본: true)
 
     Returns:
         수집 결과
@@ -236,12 +317,13 @@ def trigger_collection():
     subreddits = data.get('subreddits')
     limit_per_subreddit = data.get('limit_per_subreddit', 10)
     time_filter = data.get('time_filter', 'day')
+    incremental = bool(data.get('incremental', True))
 
     # Validation
     if limit_per_subreddit > 25:
         raise ValidationError('limit_per_subreddit must be <= 25')
 
-    if time_filter not in ['hour', 'day', 'week', 'month', 'year', 'all']:
+    if time_filter not in ['hour', 'day', 'week', 'month', 'year', 'all', 'hot', 'new']:
         raise ValidationError('Invalid time_filter')
 
     # Reddit 크롤러
@@ -259,13 +341,19 @@ def trigger_collection():
         subreddit_names=subreddits,
         limit_per_subreddit=limit_per_subreddit,
         time_filter=time_filter,
-        create_inspirations=True
+        create_inspirations=True,
+        incremental=incremental
     )
 
     return jsonify({
         'message': 'Collection completed',
         'sources_created': result['sources_created'],
-        'inspirations_created': result['inspirations_created']
+        'inspirations_created': result['inspirations_created'],
+        'posts_fetched': result['posts_fetched'],
+        'posts_skipped': result['posts_skipped'],
+        'subreddits': result['subreddits'],
+        'timed_out_subreddits': result['timed_out_subreddits'],
+        'failed_subreddits': result['failed_subreddits']
     }), 200
 
 
@@ -277,7 +365,7 @@ def get_crawler_statistics():
     크롤러 통계 조회
 
     Returns:
-        크롤러 통계
+        크롤러 통계 (http_cache: 응답 캐시 hit/miss, 절약한 바이트 등)
     """
     settings = Settings()
     crawler = RedditCrawler(
@@ -286,5 +374,46 @@ def get_crawler_statistics():
     )
 
     stats = crawler.get_statistics()
+    stats['http_cache'] = get_http_cache().stats()
 
     return jsonify(stats), 200
+
+
+@admin_bp.route('/cache/warm', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_cache_warm_status():
+    """
+    캐시 예열 상태 조회 (이 워커 기준)
+
+    Returns:
+        - targets: 예열 대상 (이름, 경로)
+        - entries: 예열한 항목과 만료까지 남은 시간(초)
+        - last_report: 마지막 예열 결과
+    """
+    return jsonify(get_cache_warmer().status()), 200
+
+
+@admin_bp.route('/cache/warm', methods=['POST'])
+@jwt_required()
+@admin_required
+def warm_cache():
+    """
+    캐시 예열 즉시 실행 (캐시를 비운 뒤 등)
+
+    Request Body:
+        - targets: 예열할 대상 이름 목록 (선택, 기본: 전체)
+
+    Returns:
+        예열 결과 (예열한 키 수, 대상별 소요 시간, 에러)
+    """
+    data = request.get_json(silent=True) or {}
+    warmer = get_cache_warmer()
+
+    names = data.get('targets')
+    if names is not None:
+        unknown = [name for name in names if name not in warmer.targets]
+        if unknown:
+            raise ValidationError(f'Unknown cache warming targets: {", ".join(unknown)}')
+
+    return jsonify(warmer.warm(names=names)), 200
@@ -5,16 +5,24 @@ Draft 작성을 돕는 AI 보조 기능 엔드포인트:
 - 여러 버전 생성
 - 문단 개선
 - 제목 생성
-- 유사도 체크
+- 유사도 체크 (단건 / 배치)
 - 피드백 기반 재작성
 """
-from flask import Blueprint, request, jsonify
+import json
+
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from typing import List
 
 from app import db
+from app.config import Settings
 from app.models import User, Inspiration
 from app.services.ai_rewriter import get_ai_rewriter, RewriteVersion
+from app.services.batch_similarity import (
+    iter_batch_similarity,
+    load_inspiration_pairs,
+    persist_similarity_scores
+)
 from app.utils.errors import ValidationError, NotFoundError
 from app.utils.decorators import jwt_required_custom
 
@@ -297,6 +305,121 @@ def check_similarity():
         raise ValidationError(f'Failed to check similarity: {str(e)}')
 
 
+@ai_assistant_bp.route('/check-similarity/batch', methods=['POST'])
+@jwt_required()
+def check_similarity_batch():
+    """
+    여러 쌍의 Fair Use 유사도 일괄 체크 (NDJSON 스트리밍)
+
+    텍스트 쌍 또는 Inspiration ID(원본 컨셉 ↔ 연결된 Draft 내용)를 받아
+    프로세스 풀에서 채점하고, 완료된 항목부터 한 줄씩 반환합니다.
+    Inspiration 항목의 similarity_score 는 마지막에 한 번의 bulk UPDATE 로 저장합니다.
+    채점 도중 실패하면 error 줄을 보내고, 그때까지 채점한 점수를 저장한 뒤 summary 로 끝냅니다.
+
+    Request:
+        {
+            "pairs": [{"original": str, "generated": str}],  # 텍스트 쌍 (선택)
+            "inspiration_ids": [int],  # Inspiration ID (선택)
+            "threshold": float,        # Fair Use 임계값 (선택, 기본: 0.70)
+            "persist": bool            # similarity_score 저장 여부 (선택, 기본: true)
+        }
+
+    Response (application/x-ndjson, 완료 순서):
+        {"index": int, "inspiration_id": int|null, "result": {...}}
+        {"index": int, "inspiration_id": int, "error": str}
+        {"error": str}  # 채점 중단 (워커 종료 등)
+        {"summary": {"total": int, "scored": int, "errors": int, "updated": int}}
+    """
+    data = request.get_json()
+    if not data:
+        raise ValidationError('Request body is required')
+
+    pairs = data.get('pairs') or []
+    inspiration_ids = data.get('inspiration_ids') or []
+    threshold = data.get('threshold', 0.70)
+    persist = data.get('persist', True)
+
+    if not isinstance(pairs, list) or not isinstance(inspiration_ids, list):
+        raise ValidationError('pairs and inspiration_ids must be lists')
+    if not pairs and not inspiration_ids:
+        raise ValidationError('pairs or inspiration_ids is required')
+
+    max_pairs = Settings().BATCH_SIMILARITY_MAX_PAIRS
+    if len(pairs) + len(inspiration_ids) > max_pairs:
+        raise ValidationError(f'Too many items (max: {max_pairs})')
+
+    if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 1:
+        raise ValidationError('Threshold must be between 0.0 and 1.0')
+
+    # 입력 항목: (inspiration_id, original, generated)
+    items = []
+    for i, pair in enumerate(pairs):
+        if not isinstance(pair, dict) or not pair.get('original') or not pair.get('generated'):
+            raise ValidationError(f'pairs[{i}] requires original and generated')
+        items.append((None, pair['original'], pair['generated']))
+
+    if not all(isinstance(insp_id, int) for insp_id in inspiration_ids):
+        raise ValidationError('inspiration_ids must be integers')
+
+    loaded = load_inspiration_pairs(inspiration_ids)
+    errors = []
+    for insp_id in inspiration_ids:
+        if insp_id in loaded:
+            items.append((insp_id, *loaded[insp_id]))
+        else:
+            errors.append(insp_id)
+
+    def generate():
+        # 조회 실패한 Inspiration 은 먼저 알림
+        for offset, insp_id in enumerate(errors):
+            yield json.dumps({
+                'index': len(items) + offset,
+                'inspiration_id': insp_id,
+                'error': 'Inspiration not found or has no draft'
+            }) + '\n'
+
+        scores = {}
+        scored = 0
+        updated = 0
+        try:
+            for index, result in iter_batch_similarity([(original, generated) for _, original, generated in items]):
+                insp_id = items[index][0]
+                if insp_id is not None:
+                    scores[insp_id] = result.overall_similarity
+
+                scored += 1
+                yield json.dumps({
+                    'index': index,
+                    'inspiration_id': insp_id,
+                    'result': {
+                        'is_fair_use': result.overall_similarity < threshold,
+                        'overall_similarity': result.overall_similarity,
+                        'structural_similarity': result.structural_similarity,
+                        'lexical_similarity': result.lexical_similarity,
+                        'semantic_similarity': result.semantic_similarity,
+                        'semantic_available': result.details.get('semantic_available', False)
+                    }
+                }) + '\n'
+        except Exception as e:
+            current_app.logger.exception('Batch similarity check failed')
+            yield json.dumps({'error': f'Batch similarity check failed: {e}'}) + '\n'
+        finally:
+            # 중단되거나 클라이언트가 끊겨도 이미 채점한 점수는 저장
+            if persist:
+                updated = persist_similarity_scores(scores)
+
+        yield json.dumps({
+            'summary': {
+                'total': len(items) + len(errors),
+                'scored': scored,
+                'errors': len(errors),
+                'updated': updated
+            }
+        }) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
 @ai_assistant_bp.route('/rewrite-with-feedback', methods=['POST'])
 @jwt_required()
 def rewrite_with_feedback():
@@ -485,6 +608,7 @@ def get_statistics():
             'improve_paragraph': 'Improve a specific paragraph',
             'generate_titles': 'Generate catchy titles',
             'check_similarity': 'Check Fair Use compliance',
+            'check_similarity_batch': 'Re-score many pairs or inspirations (NDJSON stream)',
             'rewrite_with_feedback': 'Rewrite based on feedback',
             'generate_from_inspiration': 'Generate versions from saved Inspiration'
         }
@@ -3,15 +3,30 @@ Categories API
 카테고리 관련 엔드포인트
 """
 from flask import Blueprint, request, jsonify
-from app import db
-from app.models import Category
+from app import db, cache
+from app.models import Category, Post
 from app.utils.errors import NotFoundError, ValidationError, ConflictError
 from app.utils.decorators import jwt_required_custom, admin_required
+from app.services.cache_warming import is_warming
+from app.utils.conditional import conditional, row_version, table_versions, versioned_cache_key
 
 categories_bp = Blueprint('categories', __name__)
 
 
+def category_list_version():
+    """카테고리 목록 버전 (게시물 수가 담기므로 게시물 테이블 포함)"""
+    return table_versions(Category, Post)
+
+
+def category_version(category_id=None, slug=None):
+    """카테고리 버전"""
+    criteria = Category.id == category_id if category_id is not None else Category.slug == slug
+    return row_version(Category, criteria, related=(Post,))
+
+
 @categories_bp.route('', methods=['GET'])
+@conditional(category_list_version, cache_control='public, max-age=300')
+@cache.cached(timeout=600, make_cache_key=versioned_cache_key, forced_update=is_warming)
 def get_categories():
     """
     카테고리 목록 조회
@@ -20,13 +35,15 @@ def get_categories():
         JSON: 카테고리 목록
     """
     categories = Category.query.order_by(Category.name).all()
+    active_post_counts = Category.active_post_counts()
 
     return jsonify({
-        'categories': [category.to_dict() for category in categories]
+        'categories': [category.to_list_dict(active_post_counts) for category in categories]
     }), 200
 
 
 @categories_bp.route('/<int:category_id>', methods=['GET'])
+@conditional(category_version, cache_control='public, max-age=300')
 def get_category(category_id):
     """
     카테고리 상세 조회
@@ -46,6 +63,7 @@ def get_category(category_id):
 
 
 @categories_bp.route('/slug/<string:slug>', methods=['GET'])
+@conditional(category_version, cache_control='public, max-age=300')
 def get_category_by_slug(slug):
     """
     Slug로 카테고리 조회
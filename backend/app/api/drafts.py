@@ -13,10 +13,14 @@ from datetime import datetime
 from pathlib import Path
 
 from app import db
+from app.config import Settings
 from app.models import Draft, Post, User, Category, WritingStyle
 from app.utils.errors import NotFoundError, ValidationError, AuthorizationError
 from app.utils.decorators import jwt_required_custom
+from app.utils.pagination import Keyset, SortKey, paginate_request
 from app.services.image_processor import ImageProcessor
+from app.services.near_duplicate_index import get_near_duplicate_index
+from app.services.shingle_index import check_corpus_overlap, get_shingle_index
 
 drafts_bp = Blueprint('drafts', __name__)
 
@@ -29,7 +33,9 @@ def list_drafts():
 
     Query Parameters:
         - page (int): 페이지 번호 (기본: 1)
+        - cursor (str): 커서 모드 (이전 응답의 next_cursor, 빈 값이면 첫 페이지)
         - per_page (int): 페이지당 개수 (기본: 20, 최대: 100)
+        - include_total (bool): 커서 모드에서 전체 개수 포함 여부
         - category_id (int): 카테고리 필터 (선택)
         - status (str): 상태 필터 ('draft', 'ai_generated', 선택)
         - user_id (int): 작성자 필터 (선택, Admin/Editor만)
@@ -40,14 +46,12 @@ def list_drafts():
     current_user_id = get_jwt_identity()
     current_user = User.query.get(current_user_id)
 
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 20, type=int), 100)
     category_id = request.args.get('category_id', type=int)
     status = request.args.get('status')
     user_id = request.args.get('user_id', type=int)
 
-    # 쿼리 시작
-    query = Draft.query
+    # 쿼리 시작 (목록에 필요한 관계는 미리 로드)
+    query = Draft.query.options(*Draft.list_options())
 
     # 권한 체크: 일반 사용자는 자신의 Draft만 조회
     if not current_user.is_admin() and current_user.role != 'editor':
@@ -66,23 +70,13 @@ def list_drafts():
         elif status == 'ai_generated':
             query = query.filter_by(ai_generated=True)
 
-    # 정렬 및 페이지네이션
-    pagination = query.order_by(Draft.updated_at.desc()).paginate(
-        page=page,
-        per_page=per_page,
-        error_out=False
-    )
+    # 정렬 및 페이지네이션 (최근 수정순)
+    keyset = Keyset(SortKey(Draft.updated_at), SortKey(Draft.id))
+    drafts, pagination = paginate_request(query, keyset)
 
     return jsonify({
-        'drafts': [draft.to_dict() for draft in pagination.items],
-        'pagination': {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        'drafts': [draft.to_list_dict() for draft in drafts],
+        'pagination': pagination
     }), 200
 
 
@@ -334,6 +328,15 @@ def publish_draft(draft_id: int):
     else:
         scheduled_datetime = None
 
+    # 자기 표절 체크 (이미 발행된 게시물과 거의 같은 내용인지)
+    near_duplicate_index = get_near_duplicate_index()
+    near_duplicates = near_duplicate_index.query(
+        draft.content,
+        k=5,
+        threshold=Settings().NEAR_DUPLICATE_THRESHOLD,
+        doc_type='post'
+    )
+
     # Post 생성
     post = Post.create(
         user_id=draft.user_id,
@@ -352,12 +355,70 @@ def publish_draft(draft_id: int):
 
     db.session.commit()
 
+    near_duplicate_index.add('post', post.id, post.content)
+    get_shingle_index().add('post', post.id, post.content)
+
     return jsonify({
         'message': 'Draft published successfully',
-        'post': post.to_dict()
+        'post': post.to_dict(),
+        'self_plagiarism': {
+            'flagged': bool(near_duplicates),
+            'near_duplicates': [d.to_dict() for d in near_duplicates]
+        }
     }), 201
 
 
+@drafts_bp.route('/<int:draft_id>/plagiarism-check', methods=['GET'])
+@jwt_required()
+def check_draft_plagiarism(draft_id: int):
+    """
+    Draft 코퍼스 표절 체크
+
+    발행된 모든 게시물과 저장된 컨셉 중 Draft 와 겹치는 문서를 찾습니다.
+    역색인으로 공유 shingle 상위 후보를 고른 뒤, 후보만 정밀 유사도로 비교합니다.
+
+    Args:
+        draft_id: Draft ID
+
+    Query Parameters:
+        - top_n (int): 정밀 비교할 후보 수 (기본: CORPUS_CHECK_TOP_N, 최대: 50)
+        - doc_type (str): 문서 타입 필터 ('post', 'inspiration', 선택)
+
+    Returns:
+        후보 문서별 유사도 및 Fair Use 판정
+    """
+    current_user_id = get_jwt_identity()
+    current_user = User.query.get(current_user_id)
+
+    draft = Draft.query.get(draft_id)
+    if not draft:
+        raise NotFoundError(f'Draft {draft_id} not found')
+
+    # 권한 체크: 작성자 또는 Admin/Editor만 조회 가능
+    if draft.user_id != current_user_id:
+        if not current_user.is_admin() and current_user.role != 'editor':
+            raise AuthorizationError('You can only check your own drafts')
+
+    top_n = min(
+        request.args.get('top_n', Settings().CORPUS_CHECK_TOP_N, type=int),
+        50
+    )
+    doc_type = request.args.get('doc_type')
+    if doc_type not in (None, 'post', 'inspiration'):
+        raise ValidationError("doc_type must be 'post' or 'inspiration'")
+
+    # 발행된 Draft 는 자기 자신(게시물)과 비교하지 않음
+    exclude = ('post', draft.post.id) if draft.post else None
+    matches = check_corpus_overlap(draft.content, top_n=top_n, doc_type=doc_type, exclude=exclude)
+
+    return jsonify({
+        'draft_id': draft.id,
+        'flagged': any(not m.is_fair_use_compliant for m in matches),
+        'indexed_documents': len(get_shingle_index()),
+        'matches': [m.to_dict() for m in matches]
+    }), 200
+
+
 @drafts_bp.route('/<int:draft_id>/autosave', methods=['POST'])
 @jwt_required()
 def autosave_draft(draft_id: int):
@@ -17,6 +17,7 @@ from app.models import Inspiration, Source, Draft, User, Category, WritingStyle
 from app.services.content_generator import ContentGenerator
 from app.utils.errors import NotFoundError, ValidationError, AuthorizationError
 from app.utils.decorators import jwt_required_custom, admin_required, editor_required
+from app.utils.pagination import Keyset, SortKey, paginate_request
 
 inspirations_bp = Blueprint('inspirations', __name__)
 
@@ -29,7 +30,9 @@ def list_inspirations():
 
     Query Parameters:
         page (int): 페이지 번호 (기본: 1)
+        cursor (str): 커서 모드 (이전 응답의 next_cursor, 빈 값이면 첫 페이지)
         per_page (int): 페이지당 항목 수 (기본: 20, 최대: 100)
+        include_total (bool): 커서 모드에서 전체 개수 포함 여부
         status (str): 상태 필터 ('pending', 'approved', 'rejected', 'used')
         min_similarity (float): 최소 유사도 (0.0-1.0)
         max_similarity (float): 최대 유사도 (0.0-1.0)
@@ -46,10 +49,6 @@ def list_inspirations():
     """
     current_user_id = get_jwt_identity()
 
-    # 페이지네이션
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 20, type=int), 100)
-
     # 필터링
     status = request.args.get('status')
     min_similarity = request.args.get('min_similarity', type=float)
@@ -61,8 +60,8 @@ def list_inspirations():
     sort_by = request.args.get('sort_by', 'created_at')
     order = request.args.get('order', 'desc')
 
-    # 쿼리 생성
-    query = Inspiration.query
+    # 쿼리 생성 (목록에 필요한 관계는 미리 로드)
+    query = Inspiration.query.options(*Inspiration.list_options())
 
     # 필터 적용
     if status:
@@ -83,40 +82,23 @@ def list_inspirations():
         else:
             query = query.filter(Inspiration.draft_id.is_(None))
 
-    # 정렬 적용
-    if sort_by == 'created_at':
-        sort_column = Inspiration.created_at
-    elif sort_by == 'similarity_score':
-        sort_column = Inspiration.similarity_score
+    # 정렬 적용 (같은 값은 id 순)
+    descending = order == 'desc'
+    if sort_by == 'similarity_score':
+        sort_key = SortKey(Inspiration.similarity_score, descending)
     elif sort_by == 'source_upvotes':
         query = query.join(Source)
-        sort_column = Source.upvotes
-    else:
-        sort_column = Inspiration.created_at
-
-    if order == 'desc':
-        query = query.order_by(sort_column.desc())
+        sort_key = SortKey(Source.score, descending, value=lambda inspiration: inspiration.source.score)
     else:
-        query = query.order_by(sort_column.asc())
+        sort_key = SortKey(Inspiration.created_at, descending)
+    keyset = Keyset(sort_key, SortKey(Inspiration.id, descending))
 
     # 페이지네이션 실행
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-
-    # 응답 생성
-    inspirations = []
-    for inspiration in pagination.items:
-        inspirations.append(inspiration.to_dict())
+    inspirations, pagination = paginate_request(query, keyset)
 
     return jsonify({
-        'inspirations': inspirations,
-        'pagination': {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        'inspirations': [inspiration.to_list_dict() for inspiration in inspirations],
+        'pagination': pagination
     }), 200
 
 
@@ -3,22 +3,55 @@ Posts API
 게시물 관련 엔드포인트
 """
 from flask import Blueprint, request, jsonify
-from app import db
+from app import db, cache
 from app.models import Post, Category, Tag
 from app.utils.errors import NotFoundError, ValidationError
 from app.utils.decorators import jwt_required_custom, editor_required, get_current_user
+from app.utils.conditional import conditional, row_version, table_versions, versioned_cache_key
+from app.utils.pagination import Keyset, SortKey, paginate_request
+from app.services.cache_warming import is_warming
+from app.services.near_duplicate_index import get_near_duplicate_index
+from app.services.view_counter import get_view_counter
+from app.services.shingle_index import get_shingle_index
 
 posts_bp = Blueprint('posts', __name__)
 
 
+def post_detail(post):
+    """게시물 상세 응답 (아직 반영하지 않은 조회수 포함)"""
+    data = post.to_dict(include_content=True)
+    data['view_count'] += get_view_counter().pending(post.id)
+    return data
+
+
+def post_list_version():
+    """게시물 목록 버전 (게시물, 카테고리, 태그 테이블)"""
+    return table_versions(Post, Category, Tag)
+
+
+def post_version(post_id=None, slug=None):
+    """발행된 게시물 버전 (미발행 게시물은 조건부 처리 안 함)"""
+    criteria = Post.id == post_id if post_id is not None else Post.slug == slug
+    return row_version(Post, criteria, Post.is_published.is_(True), related=(Category, Tag))
+
+
+def count_view(version, **kwargs):
+    """304 응답도 조회로 집계 (버전 첫 값이 게시물 ID)"""
+    get_view_counter().increment(int(version.split('|', 1)[0]))
+
+
 @posts_bp.route('', methods=['GET'])
+@conditional(post_list_version, cache_control='public, max-age=30')
+@cache.cached(timeout=120, make_cache_key=versioned_cache_key, forced_update=is_warming)
 def get_posts():
     """
     게시물 목록 조회
 
     Query Parameters:
         page (int): 페이지 번호 (default: 1)
+        cursor (str): 커서 모드 (이전 응답의 next_cursor, 빈 값이면 첫 페이지)
         per_page (int): 페이지당 개수 (default: 20, max: 100)
+        include_total (bool): 커서 모드에서 전체 개수 포함 여부
         category_id (int): 카테고리 필터
         tag (str): 태그 필터
         published (bool): 발행 상태 필터 (default: true)
@@ -26,14 +59,12 @@ def get_posts():
     Returns:
         JSON: 게시물 목록
     """
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 20, type=int), 100)
     category_id = request.args.get('category_id', type=int)
     tag_name = request.args.get('tag', type=str)
     published = request.args.get('published', 'true').lower() == 'true'
 
     # 기본 쿼리
-    query = Post.query
+    query = Post.query.options(*Post.list_options())
 
     # 발행 상태 필터
     if published:
@@ -49,24 +80,24 @@ def get_posts():
         if tag:
             query = query.filter(Post.tags.contains(tag))
 
-    # 정렬 및 페이지네이션
-    query = query.order_by(Post.published_at.desc())
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    # 정렬 및 페이지네이션 (발행 게시물만 보면 published_at 은 NULL 이 아님)
+    keyset = Keyset(SortKey(Post.published_at, nullable=not published), SortKey(Post.id))
+    posts, pagination = paginate_request(query, keyset)
+
+    # 아직 반영하지 않은 조회수 포함
+    pending_views = get_view_counter().pending_many(post.id for post in posts)
+    posts_data = [post.to_list_dict() for post in posts]
+    for data in posts_data:
+        data['view_count'] += pending_views.get(data['id'], 0)
 
     return jsonify({
-        'posts': [post.to_dict(include_content=False) for post in pagination.items],
-        'pagination': {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev,
-        }
+        'posts': posts_data,
+        'pagination': pagination
     }), 200
 
 
 @posts_bp.route('/<int:post_id>', methods=['GET'])
+@conditional(post_version, not_modified=count_view)
 def get_post(post_id):
     """
     게시물 상세 조회
@@ -88,14 +119,15 @@ def get_post(post_id):
         if not current_user or not current_user.is_editor():
             raise NotFoundError('Post not found')
 
-    # 조회수 증가 (발행된 게시물만)
+    # 조회수 증가 (발행된 게시물만, 주기적으로 한 번에 반영)
     if post.is_published:
-        post.increment_view_count()
+        get_view_counter().increment(post.id)
 
-    return jsonify(post.to_dict(include_content=True)), 200
+    return jsonify(post_detail(post)), 200
 
 
 @posts_bp.route('/slug/<string:slug>', methods=['GET'])
+@conditional(post_version, not_modified=count_view)
 def get_post_by_slug(slug):
     """
     Slug로 게시물 조회
@@ -111,10 +143,10 @@ def get_post_by_slug(slug):
     if not post:
         raise NotFoundError(f'Post with slug "{slug}" not found')
 
-    # 조회수 증가
-    post.increment_view_count()
+    # 조회수 증가 (주기적으로 한 번에 반영)
+    get_view_counter().increment(post.id)
 
-    return jsonify(post.to_dict(include_content=True)), 200
+    return jsonify(post_detail(post)), 200
 
 
 @posts_bp.route('', methods=['POST'])
@@ -170,6 +202,9 @@ def create_post():
 
     db.session.commit()
 
+    get_near_duplicate_index().add('post', post.id, post.content)
+    get_shingle_index().add('post', post.id, post.content)
+
     return jsonify(post.to_dict(include_content=True)), 201
 
 
@@ -206,7 +241,8 @@ def update_post(post_id):
         # slug 재생성
         post.slug = Post._generate_unique_slug(data['title'], post.id)
 
-    if 'content' in data:
+    content_changed = 'content' in data
+    if content_changed:
         post.content = data['content']
         post.render_content_html()
 
@@ -225,6 +261,11 @@ def update_post(post_id):
 
     db.session.commit()
 
+    # 유사도 인덱스는 커밋된 내용만 반영
+    if content_changed:
+        get_near_duplicate_index().add('post', post.id, post.content)
+        get_shingle_index().add('post', post.id, post.content)
+
     return jsonify(post.to_dict(include_content=True)), 200
 
 
@@ -248,6 +289,10 @@ def delete_post(post_id):
 
     post.delete()
 
+    # 삭제가 커밋된 뒤에 유사도 인덱스에서 제거
+    get_near_duplicate_index().remove('post', post_id)
+    get_shingle_index().remove('post', post_id)
+
     return jsonify({'message': 'Post deleted successfully'}), 200
 
 
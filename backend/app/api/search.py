@@ -7,6 +7,7 @@ from flask import Blueprint, request, jsonify
 from sqlalchemy import or_, and_, func, desc
 from app.models import Post, Category, Tag, User
 from app import db, cache
+from app.services.cache_warming import is_warming
 from datetime import datetime, timedelta
 
 
@@ -228,7 +229,7 @@ def autocomplete():
 
 
 @search_bp.route('/filters', methods=['GET'])
-@cache.cached(timeout=600)
+@cache.cached(timeout=600, forced_update=is_warming)
 def get_filters():
     """
     검색 필터 옵션 조회
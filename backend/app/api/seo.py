@@ -3,15 +3,17 @@ SEO API
 Sitemap 및 SEO 관련 엔드포인트
 """
 from flask import Blueprint, Response
-from app import db
+from app import db, cache
 from app.models.post import Post
 from app.models.category import Category
+from app.services.cache_warming import is_warming
 from datetime import datetime
 
 seo_bp = Blueprint('seo', __name__)
 
 
 @seo_bp.route('/sitemap.xml', methods=['GET'])
+@cache.cached(timeout=3600, forced_update=is_warming)
 def sitemap():
     """
     동적 Sitemap XML 생성
@@ -35,7 +37,7 @@ def sitemap():
     xml.append('  </url>')
 
     # Published Posts
-    posts = Post.query.filter_by(status='published').order_by(Post.updated_at.desc()).all()
+    posts = Post.query.filter_by(is_published=True).order_by(Post.updated_at.desc()).all()
     for post in posts:
         xml.append('  <url>')
         xml.append(f'    <loc>{base_url}/post/{post.slug}</loc>')
@@ -15,6 +15,7 @@ from app import db
 from app.models import Source, Inspiration
 from app.utils.errors import NotFoundError, ValidationError
 from app.utils.decorators import admin_required, editor_required
+from app.utils.pagination import Keyset, SortKey, paginate_request
 
 sources_bp = Blueprint('sources', __name__)
 
@@ -27,8 +28,11 @@ def list_sources():
 
     Query Parameters:
         page (int): 페이지 번호 (기본: 1)
+        cursor (str): 커서 모드 (이전 응답의 next_cursor, 빈 값이면 첫 페이지)
         per_page (int): 페이지당 항목 수 (기본: 20, 최대: 100)
+        include_total (bool): 커서 모드에서 전체 개수 포함 여부
         platform (str): 플랫폼 필터 ('reddit', 'twitter' 등)
+        subreddit (str): Subreddit 필터
         min_upvotes (int): 최소 upvotes
         min_comments (int): 최소 comments
         has_inspiration (bool): Inspiration 존재 여부
@@ -41,12 +45,9 @@ def list_sources():
             "pagination": {...}
         }
     """
-    # 페이지네이션
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 20, type=int), 100)
-
     # 필터링
     platform = request.args.get('platform')
+    subreddit = request.args.get('subreddit')
     min_upvotes = request.args.get('min_upvotes', type=int)
     min_comments = request.args.get('min_comments', type=int)
     has_inspiration = request.args.get('has_inspiration', type=lambda v: v.lower() == 'true' if v else None)
@@ -62,11 +63,14 @@ def list_sources():
     if platform:
         query = query.filter(Source.platform == platform)
 
+    if subreddit:
+        query = query.filter(Source.subreddit == subreddit)
+
     if min_upvotes is not None:
-        query = query.filter(Source.upvotes >= min_upvotes)
+        query = query.filter(Source.score >= min_upvotes)
 
     if min_comments is not None:
-        query = query.filter(Source.comments >= min_comments)
+        query = query.filter(Source.num_comments >= min_comments)
 
     if has_inspiration is not None:
         if has_inspiration:
@@ -74,39 +78,23 @@ def list_sources():
         else:
             query = query.outerjoin(Inspiration).filter(Inspiration.id.is_(None))
 
-    # 정렬 적용
-    if sort_by == 'created_at':
-        sort_column = Source.created_at
-    elif sort_by == 'upvotes':
-        sort_column = Source.upvotes
+    # 정렬 적용 (같은 값은 id 순)
+    if sort_by == 'upvotes':
+        sort_column = Source.score
     elif sort_by == 'comments':
-        sort_column = Source.comments
+        sort_column = Source.num_comments
     else:
         sort_column = Source.created_at
 
-    if order == 'desc':
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    descending = order == 'desc'
+    keyset = Keyset(SortKey(sort_column, descending), SortKey(Source.id, descending))
 
     # 페이지네이션 실행
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-
-    # 응답 생성
-    sources = []
-    for source in pagination.items:
-        sources.append(source.to_dict())
+    sources, pagination = paginate_request(query, keyset)
 
     return jsonify({
-        'sources': sources,
-        'pagination': {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        'sources': [source.to_dict() for source in sources],
+        'pagination': pagination
     }), 200
 
 
@@ -194,8 +182,12 @@ def get_statistics():
     by_platform = {platform: count for platform, count in platform_stats}
 
     # 평균 upvotes 및 comments
-    avg_upvotes = db.session.query(func.avg(Source.upvotes)).scalar() or 0.0
-    avg_comments = db.session.query(func.avg(Source.comments)).scalar() or 0.0
+    avg_upvotes, avg_comments = db.session.query(
+        func.avg(Source.score),
+        func.avg(Source.num_comments)
+    ).one()
+    avg_upvotes = avg_upvotes or 0.0
+    avg_comments = avg_comments or 0.0
 
     # Inspiration 연결 여부
     with_inspiration = db.session.query(Source).join(Inspiration).distinct().count()
@@ -265,7 +257,7 @@ def get_top_sources():
     if platform:
         query = query.filter(Source.platform == platform)
 
-    sources = query.order_by(Source.upvotes.desc()).limit(limit).all()
+    sources = query.order_by(Source.score.desc()).limit(limit).all()
 
     return jsonify({
         'sources': [source.to_dict() for source in sources]
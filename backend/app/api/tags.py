@@ -7,11 +7,24 @@ from app import db
 from app.models import Tag
 from app.utils.errors import NotFoundError, ValidationError, ConflictError
 from app.utils.decorators import jwt_required_custom, admin_required
+from app.utils.conditional import conditional, row_version, table_versions
 
 tags_bp = Blueprint('tags', __name__)
 
 
+def tag_list_version():
+    """태그 목록 버전"""
+    return table_versions(Tag)
+
+
+def tag_version(tag_id=None, slug=None):
+    """태그 버전"""
+    criteria = Tag.id == tag_id if tag_id is not None else Tag.slug == slug
+    return row_version(Tag, criteria)
+
+
 @tags_bp.route('', methods=['GET'])
+@conditional(tag_list_version, cache_control='public, max-age=300')
 def get_tags():
     """
     태그 목록 조회
@@ -40,6 +53,7 @@ def get_tags():
 
 
 @tags_bp.route('/<int:tag_id>', methods=['GET'])
+@conditional(tag_version, cache_control='public, max-age=300')
 def get_tag(tag_id):
     """
     태그 상세 조회
@@ -59,6 +73,7 @@ def get_tag(tag_id):
 
 
 @tags_bp.route('/slug/<string:slug>', methods=['GET'])
+@conditional(tag_version, cache_control='public, max-age=300')
 def get_tag_by_slug(slug):
     """
     Slug로 태그 조회
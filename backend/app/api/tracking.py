@@ -6,6 +6,8 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
 from app import db
 from app.models.user_activity import UserActivity, PageView, SearchLog
+from app.utils.counting import count_query, validate_strategy
+from app.utils.pagination import Keyset, SortKey, paginate_keyset
 import uuid
 from datetime import datetime
 
@@ -252,6 +254,9 @@ def get_user_analytics():
         date_from: 시작 날짜 (YYYY-MM-DD)
         date_to: 종료 날짜 (YYYY-MM-DD)
         limit: 결과 개수 (default: 100)
+        cursor: 커서 모드 (이전 응답의 next_cursor, 빈 값이면 첫 페이지)
+        include_total: 커서 모드에서 전체 개수 포함 여부
+        count: 전체 개수 전략 (exact, cached, estimated, auto)
 
     Returns:
         {
@@ -294,12 +299,26 @@ def get_user_analytics():
         except ValueError:
             pass
 
-    # 최신순 정렬
-    activities = query.order_by(UserActivity.created_at.desc()).limit(limit).all()
+    count = request.args.get('count')
+    if count is not None:
+        validate_strategy(count)
+
+    # 최신순 정렬 (커서 모드는 OFFSET/COUNT 없이 이어서 조회)
+    pagination = None
+    if 'cursor' in request.args:
+        keyset = Keyset(SortKey(UserActivity.created_at), SortKey(UserActivity.id))
+        include_total = request.args.get('include_total', 'false').lower() == 'true'
+        activities, pagination = paginate_keyset(
+            query, keyset, limit, request.args['cursor'] or None, include_total, count
+        )
+        total_activities, total_exact = pagination['total'], pagination['total_exact']
+    else:
+        activities = query.order_by(UserActivity.created_at.desc()).limit(limit).all()
+        total_activities, total_exact = count_query(query, count)
 
     # 요약 통계
     summary = {
-        'total_activities': query.count(),
+        'total_activities': total_activities,
         'activity_types': db.session.query(
             UserActivity.activity_type,
             db.func.count(UserActivity.id)
@@ -314,7 +333,9 @@ def get_user_analytics():
             'activities': [a.to_dict() for a in activities],
             'summary': {
                 'total': summary['total_activities'],
+                'total_exact': total_exact,
                 'by_type': {at: count for at, count in summary['activity_types']}
-            }
+            },
+            'pagination': pagination
         }
     })
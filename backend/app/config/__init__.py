@@ -48,6 +48,90 @@ class Settings(BaseSettings):
     REDDIT_CLIENT_ID: str = os.getenv('REDDIT_CLIENT_ID', '')
     REDDIT_CLIENT_SECRET: str = os.getenv('REDDIT_CLIENT_SECRET', '')
     REDDIT_USER_AGENT: str = 'NewsKoo/1.0'
+    REDDIT_OAUTH_URL: str = 'https://oauth.reddit.com'  # 로컬 가짜 서버로 교체 가능
+    REDDIT_URL: str = 'https://www.reddit.com'
+    REDDIT_CRAWL_CONCURRENCY: int = 4  # 동시에 수집할 subreddit 수
+    REDDIT_REQUESTS_PER_MINUTE: int = 100  # 프로세스 전체 공유 할당량 (Reddit OAuth 기준)
+    REDDIT_RATE_LIMIT_BURST: int = 10  # 버스트 허용 요청 수
+    REDDIT_SUBREDDIT_TIMEOUT: float = 30.0  # subreddit 하나 수집 제한 시간(초)
+    REDDIT_REQUEST_TIMEOUT: float = 16.0  # HTTP 요청 타임아웃(초)
+    CRAWL_PIPELINE_QUEUE_SIZE: int = 200  # 수집 파이프라인 단계별 큐 크기 (backpressure 기준)
+    CRAWL_PIPELINE_BATCH_SIZE: int = 100  # DB 저장 배치 크기
+    # subreddit 별 적응형 수집 주기 (실행당 새 게시물 수가 목표에 가깝도록 조정)
+    REDDIT_CRAWL_LIMIT: int = 10  # 실행당 subreddit 수집 개수
+    REDDIT_CRAWL_INTERVAL: float = 43200.0  # 수집 기록이 없을 때 주기(초, 12시간)
+    REDDIT_CRAWL_MIN_INTERVAL: float = 3600.0  # 최소 주기(초, 1시간)
+    REDDIT_CRAWL_MAX_INTERVAL: float = 604800.0  # 최대 주기(초, 1주)
+    REDDIT_CRAWL_TARGET_YIELD: float = 3.0  # 실행당 목표 새 게시물 수
+    REDDIT_CRAWL_JITTER: float = 0.1  # 주기 대비 실행 시각 흔들기 비율
+
+    # RSS/Atom 피드 및 HTML 목록 페이지 커넥터
+    # 예: [{"type": "feed", "name": "HN", "url": "https://hnrss.org/frontpage"},
+    #      {"type": "html", "name": "Blog", "url": "https://...", "item_selector": "article"}]
+    FEED_SOURCES: list = []
+    FEED_CRAWL_CONCURRENCY: int = 16  # 동시 요청 수 (연결 풀 크기)
+    FEED_REQUEST_TIMEOUT: float = 15.0  # 요청 타임아웃(초)
+    FEED_MAX_ENTRIES: int = 50  # 커넥터당 최대 항목 수
+    FEED_USER_AGENT: str = 'NewsKoo/1.0 (+feed collector)'
+
+    # 크롤러 HTTP 응답 캐시 (조건부 요청, LRU 크기 제한)
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_DIR: str = os.getenv(
+        'HTTP_CACHE_DIR',
+        str(Path(__file__).parent.parent.parent / 'data' / 'http_cache')
+    )
+    HTTP_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64MB
+
+    # 응답 캐시 (SimpleCache 는 워커별 메모리, 여러 워커가 예열 결과를 공유하려면 RedisCache)
+    CACHE_TYPE: str = os.getenv('CACHE_TYPE', 'SimpleCache')
+    CACHE_REDIS_URL: str = os.getenv('CACHE_REDIS_URL', '')
+    CACHE_WARM_INTERVAL: float = 60.0  # 예열 작업 주기(초), 다음 실행 전에 만료될 항목을 다시 채움
+    # 조건부 GET 응답의 Cache-Control (엔드포인트 이름별로 라우트 기본값을 덮어씀)
+    # 예: {"posts.get_posts": "public, max-age=60", "tags.get_tags": "public, max-age=600"}
+    CACHE_CONTROL: dict = {}
+
+    # 페이지네이션 전체 개수 전략 (exact, cached, estimated, auto), 요청에서 ?count= 로 바꿀 수 있음
+    PAGINATION_COUNT_STRATEGY: str = 'auto'
+    COUNT_CACHE_TTL: int = 60  # 필터 조합별 COUNT 결과 캐시 시간(초)
+    COUNT_ESTIMATE_MIN_ROWS: int = 100000  # auto 에서 추정치를 쓰는 최소 행 수 (작은 테이블은 정확히 셈)
+
+    # 게시물 Markdown 일괄 재렌더링 프로세스 수 (0이면 CPU 코어 수)
+    MARKDOWN_RENDER_WORKERS: int = 0
+
+    # 게시물 조회수 write-behind (워커별로 모아 주기마다 한 번의 UPDATE 로 반영)
+    VIEW_COUNT_FLUSH_INTERVAL: float = 5.0
+
+    # 스케줄러 리더 선출 (gunicorn 워커 중 하나만 작업 실행)
+    # PostgreSQL 은 advisory lock, 그 외(SQLite)는 같은 호스트의 파일 잠금 사용
+    SCHEDULER_LOCK_FILE: str = os.getenv(
+        'SCHEDULER_LOCK_FILE',
+        str(Path(__file__).parent.parent.parent / 'data' / 'scheduler.lock')
+    )
+    SCHEDULER_LEADER_INTERVAL: float = 15.0  # 리더 확인/하트비트 주기(초), 3주기 동안 없으면 죽은 것으로 표시
+    SCHEDULER_RUN_BATCH_SIZE: int = 20  # 작업 실행 기록 배치 저장 크기 (그 전에는 하트비트마다 저장)
+    # 별도 프로세스에서 실행할 작업 (웹 요청과 GIL/메모리를 다투지 않도록)
+    # 작업 종류로 지정 ('reddit_collection' 은 subreddit 별 작업 'reddit_collection:<name>' 모두)
+    SCHEDULER_ISOLATED_JOBS: list = ['reddit_collection', 'feed_collection', 'concept_clustering']
+    SCHEDULER_PROCESS_POOL_SIZE: int = 2  # 동시에 실행할 격리 작업 프로세스 수
+    SCHEDULER_JOB_TIMEOUT: float = 1800.0  # 격리 작업 하드 타임아웃(초)
+    SCHEDULER_JOB_TIMEOUTS: dict = {}  # 작업별 타임아웃 (예: {"concept_clustering": 600})
+
+    # 유사도 인덱스 (근접 중복 탐지)
+    SIMILARITY_INDEX_DIR: str = os.getenv(
+        'SIMILARITY_INDEX_DIR',
+        str(Path(__file__).parent.parent.parent / 'data' / 'similarity')
+    )
+    NEAR_DUPLICATE_THRESHOLD: float = 0.8  # 추정 Jaccard 유사도 80% 이상이면 중복
+    CONCEPT_CLUSTER_THRESHOLD: float = 0.6  # 같은 클러스터로 묶을 최소 유사도 (생성 전 중복 제거)
+    CORPUS_CHECK_TOP_N: int = 10  # 코퍼스 표절 체크 시 정밀 비교할 후보 수
+    SIMILARITY_WORKERS: int = 0  # 배치 유사도 체크 프로세스 수 (0이면 CPU 코어 수)
+    BATCH_SIMILARITY_MAX_PAIRS: int = 1000  # 배치 요청당 최대 쌍 수
+
+    # 의미적 유사도 (로컬 문장 임베딩, CPU)
+    SEMANTIC_SIMILARITY_ENABLED: bool = True
+    EMBEDDING_MODEL_NAME: str = 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'
+    EMBEDDING_DEVICE: str = 'cpu'
+    EMBEDDING_BATCH_SIZE: int = 32
 
     class Config:
         env_file = '.env'
@@ -74,6 +158,7 @@ class TestingConfig(Settings):
     """테스트 환경 설정"""
     TESTING: bool = True
     SQLALCHEMY_DATABASE_URI: str = 'sqlite:///:memory:'
+    SEMANTIC_SIMILARITY_ENABLED: bool = False  # 테스트에서 모델 다운로드 방지
 
 
 # 환경별 설정 매핑
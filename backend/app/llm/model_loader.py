@@ -6,13 +6,17 @@ RTX 5070 TI (16GB VRAM)에서 효율적으로 실행합니다.
 """
 import os
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+from typing import Optional, List, Dict, Any, Iterator
 import torch
 from transformers import (
     AutoModelForCausalLM,
     AutoTokenizer,
     BitsAndBytesConfig,
-    GenerationConfig
+    GenerationConfig,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    TextIteratorStreamer
 )
 
 logger = logging.getLogger(__name__)
@@ -181,25 +185,13 @@ class LLMModelLoader:
         if not self.is_loaded():
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
-        # 입력 토크나이징
-        inputs = self.tokenizer(
+        inputs, generation_config = self._prepare_generation(
             prompt,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=2048
-        ).to(self.device)
-
-        # 생성 설정 업데이트
-        generation_config = GenerationConfig(
             max_new_tokens=max_new_tokens,
             temperature=temperature,
             top_p=top_p,
             top_k=top_k,
             repetition_penalty=repetition_penalty,
-            do_sample=True,
-            pad_token_id=self.tokenizer.pad_token_id,
-            eos_token_id=self.tokenizer.eos_token_id,
             **kwargs
         )
 
@@ -220,6 +212,123 @@ class LLMModelLoader:
 
         return generated_text.strip()
 
+    def generate_stream(
+        self,
+        prompt: str,
+        max_new_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        top_k: int = 50,
+        repetition_penalty: float = 1.1,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        텍스트 스트리밍 생성
+
+        별도 스레드에서 model.generate() 를 실행하고 디코딩된 텍스트 조각을 순서대로 반환합니다.
+        호출 측에서 반복을 중단하면 (break / close()) 다음 토큰에서 생성이 멈춥니다.
+
+        Args:
+            prompt: 입력 프롬프트
+            max_new_tokens: 생성할 최대 토큰 수
+            temperature: 샘플링 온도
+            top_p: Nucleus sampling
+            top_k: Top-K sampling
+            repetition_penalty: 반복 페널티
+            **kwargs: 추가 GenerationConfig 파라미터
+
+        Yields:
+            생성된 텍스트 조각 (프롬프트 제외)
+        """
+        if not self.is_loaded():
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        inputs, generation_config = self._prepare_generation(
+            prompt,
+            max_new_tokens=max_new_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            repetition_penalty=repetition_penalty,
+            **kwargs
+        )
+
+        streamer = TextIteratorStreamer(
+            self.tokenizer,
+            skip_prompt=True,
+            skip_special_tokens=True
+        )
+        stop_event = threading.Event()
+        errors: List[BaseException] = []
+
+        def run_generation():
+            try:
+                with torch.no_grad():
+                    self.model.generate(
+                        **inputs,
+                        generation_config=generation_config,
+                        streamer=streamer,
+                        stopping_criteria=StoppingCriteriaList([_StopEventCriteria(stop_event)])
+                    )
+            except BaseException as e:
+                errors.append(e)
+                streamer.end()
+
+        thread = threading.Thread(target=run_generation, daemon=True)
+        thread.start()
+
+        try:
+            for chunk in streamer:
+                if chunk:
+                    yield chunk
+        finally:
+            # 조기 중단 시 생성 스레드도 다음 토큰에서 종료
+            stop_event.set()
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def _prepare_generation(
+        self,
+        prompt: str,
+        max_new_tokens: int,
+        temperature: float,
+        top_p: float,
+        top_k: int,
+        repetition_penalty: float,
+        **kwargs
+    ):
+        """
+        입력 토크나이징 및 GenerationConfig 구성
+
+        Returns:
+            (inputs, generation_config) 튜플
+        """
+        # 입력 토크나이징
+        inputs = self.tokenizer(
+            prompt,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=2048
+        ).to(self.device)
+
+        # 생성 설정 업데이트
+        generation_config = GenerationConfig(
+            max_new_tokens=max_new_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            repetition_penalty=repetition_penalty,
+            do_sample=True,
+            pad_token_id=self.tokenizer.pad_token_id,
+            eos_token_id=self.tokenizer.eos_token_id,
+            **kwargs
+        )
+
+        return inputs, generation_config
+
     def generate_with_system_prompt(
         self,
         system_prompt: str,
@@ -237,8 +346,31 @@ class LLMModelLoader:
         Returns:
             생성된 텍스트
         """
-        # 프롬프트 템플릿 구성
-        full_prompt = f"""### System:
+        return self.generate(self.build_chat_prompt(system_prompt, user_prompt), **kwargs)
+
+    def generate_stream_with_system_prompt(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        시스템 프롬프트와 사용자 프롬프트를 결합하여 스트리밍 생성
+
+        Args:
+            system_prompt: 시스템 역할 정의
+            user_prompt: 사용자 요청
+            **kwargs: generate_stream() 메서드의 추가 파라미터
+
+        Yields:
+            생성된 텍스트 조각
+        """
+        return self.generate_stream(self.build_chat_prompt(system_prompt, user_prompt), **kwargs)
+
+    @staticmethod
+    def build_chat_prompt(system_prompt: str, user_prompt: str) -> str:
+        """시스템/사용자 프롬프트를 모델 프롬프트 템플릿으로 결합"""
+        return f"""### System:
 {system_prompt}
 
 ### User:
@@ -247,8 +379,6 @@ class LLMModelLoader:
 ### Assistant:
 """
 
-        return self.generate(full_prompt, **kwargs)
-
     def batch_generate(
         self,
         prompts: List[str],
@@ -297,6 +427,16 @@ class LLMModelLoader:
         return info
 
 
+class _StopEventCriteria(StoppingCriteria):
+    """외부 이벤트가 설정되면 생성을 멈추는 StoppingCriteria"""
+
+    def __init__(self, stop_event: threading.Event):
+        self.stop_event = stop_event
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        return self.stop_event.is_set()
+
+
 # 싱글톤 인스턴스 (메모리 절약)
 _global_llm_instance: Optional[LLMModelLoader] = None
 
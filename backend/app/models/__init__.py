@@ -7,10 +7,15 @@ from app.models.user import User
 from app.models.category import Category
 from app.models.tag import Tag, post_tags
 from app.models.source import Source
+from app.models.crawl_state import CrawlState
 from app.models.inspiration import Inspiration
 from app.models.writing_style import WritingStyle
 from app.models.draft import Draft
 from app.models.post import Post
+from app.models.scheduler_leader import SchedulerLeader
+from app.models.job_run import JobRun
+from app.models.job_cancel_request import JobCancelRequest
+from app.models.content_version import ContentVersion
 
 # 모든 모델 export
 __all__ = [
@@ -21,8 +26,13 @@ __all__ = [
     'Tag',
     'post_tags',
     'Source',
+    'CrawlState',
     'Inspiration',
     'WritingStyle',
     'Draft',
     'Post',
+    'SchedulerLeader',
+    'JobRun',
+    'JobCancelRequest',
+    'ContentVersion',
 ]
@@ -40,6 +40,32 @@ class Category(BaseModel):
         self.post_count = self.posts.filter_by(is_published=True).count()
         db.session.commit()
 
+    @classmethod
+    def active_post_counts(cls):
+        """
+        카테고리별 발행 게시물 수 (GROUP BY 한 번)
+
+        Returns:
+            {category_id: count} (게시물이 없는 카테고리는 생략)
+        """
+        from app.models.post import Post
+
+        rows = db.session.query(Post.category_id, db.func.count(Post.id)).filter(
+            Post.is_published.is_(True)
+        ).group_by(Post.category_id)
+        return dict(rows.all())
+
+    def to_list_dict(self, active_post_counts):
+        """
+        목록용 딕셔너리 (카테고리마다 COUNT 하지 않음)
+
+        Args:
+            active_post_counts: active_post_counts() 결과
+        """
+        data = super().to_dict()
+        data['active_post_count'] = active_post_counts.get(self.id, 0)
+        return data
+
     def to_dict(self, exclude=None):
         """딕셔너리 변환"""
         data = super().to_dict(exclude=exclude)
@@ -0,0 +1,74 @@
+"""
+ContentVersion 모델
+공개 콘텐츠 테이블별 버전 카운터 (조건부 GET 의 ETag 용)
+
+게시물/카테고리/태그가 ORM 으로 추가·수정·삭제되면 같은 flush 안에서 해당 테이블의
+버전을 1 올립니다. 목록 ETag 는 행 수 COUNT 나 MAX(updated_at) 스캔 없이 이 행들만 읽습니다.
+ORM 을 거치지 않는 일괄 UPDATE 는 ContentVersion.bump() 를 직접 호출해야 합니다
+(조회수처럼 weak ETag 에서 제외하는 값은 호출하지 않음).
+"""
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import event, insert, update
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models.base import BaseModel
+
+
+class ContentVersion(BaseModel):
+    """테이블별 콘텐츠 버전 모델"""
+    __tablename__ = 'content_versions'
+
+    # 버전을 관리하는 테이블 (공개 조건부 GET 응답에 담기는 테이블)
+    TRACKED_TABLES = frozenset({'posts', 'categories', 'tags'})
+
+    table_name = db.Column(db.String(50), unique=True, nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    @classmethod
+    def bump(cls, connection, table_names: Iterable[str]) -> None:
+        """
+        테이블 버전 올리기 (호출한 트랜잭션 안에서)
+
+        Args:
+            connection: 현재 트랜잭션의 연결 (db.session.connection())
+            table_names: 테이블 이름
+        """
+        table = cls.__table__
+        now = datetime.utcnow()
+
+        for name in sorted(set(table_names)):
+            increment = update(table).where(table.c.table_name == name).values(
+                version=table.c.version + 1, updated_at=now
+            )
+            if connection.execute(increment).rowcount:
+                continue
+            try:
+                with connection.begin_nested():
+                    connection.execute(insert(table).values(
+                        table_name=name, version=1, created_at=now, updated_at=now
+                    ))
+            except IntegrityError:
+                connection.execute(increment)  # 다른 트랜잭션이 먼저 행을 만듦
+
+    def __repr__(self):
+        return f"<ContentVersion {self.table_name}={self.version}>"
+
+
+@event.listens_for(db.session, 'after_flush')
+def _bump_content_versions(session, flush_context):
+    """flush 한 추가/수정/삭제 중 버전 관리 테이블이 있으면 버전 올리기"""
+    changed = {
+        instance.__tablename__ for instance in (*session.new, *session.deleted)
+        if getattr(instance, '__tablename__', None) in ContentVersion.TRACKED_TABLES
+    }
+    for instance in session.dirty:
+        table_name = getattr(instance, '__tablename__', None)
+        if table_name in ContentVersion.TRACKED_TABLES and table_name not in changed \
+                and session.is_modified(instance):
+            changed.add(table_name)
+
+    if changed:
+        ContentVersion.bump(session.connection(), changed)
@@ -0,0 +1,109 @@
+"""
+CrawlState 모델
+subreddit/리스팅별 증분 수집 상태 (high-water mark + 최근 본 게시물 ID)
+"""
+import json
+from app import db
+from app.models.base import BaseModel
+
+
+class CrawlState(BaseModel):
+    """증분 수집 상태 모델"""
+    __tablename__ = 'crawl_states'
+    __table_args__ = (
+        db.UniqueConstraint('platform', 'subreddit', 'listing', name='uq_crawl_state_listing'),
+    )
+
+    # 최근 본 게시물 ID 보관 개수 (top/hot 리스팅은 시간순이 아니므로 ID 로 판별)
+    SEEN_ID_LIMIT = 1000
+
+    platform = db.Column(db.String(20), nullable=False, default='reddit', server_default='reddit')
+    subreddit = db.Column(db.String(100), nullable=False)
+    listing = db.Column(db.String(20), nullable=False)  # new, hot, top:day, top:week ...
+
+    # High-water mark (가장 최근에 본 게시물)
+    last_created_utc = db.Column(db.Float, nullable=True)
+    last_fullname = db.Column(db.String(20), nullable=True)  # 예: t3_abc123
+
+    # 최근 본 게시물 ID (JSON 리스트, 최신순)
+    seen_ids_json = db.Column(db.Text, nullable=True)
+
+    # 마지막 실행 결과
+    last_run_at = db.Column(db.DateTime, nullable=True)
+    last_new_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    last_skipped_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    # 적응형 수집 주기 (CrawlIntervalPolicy 가 갱신)
+    crawl_interval_sec = db.Column(db.Float, nullable=True)  # None이면 기본 주기
+    yield_ema = db.Column(db.Float, nullable=True)  # 실행당 새 게시물 수 이동평균
+
+    @property
+    def seen_ids(self):
+        """최근 본 게시물 ID 리스트 (최신순)"""
+        if not self.seen_ids_json:
+            return []
+        try:
+            return json.loads(self.seen_ids_json)
+        except json.JSONDecodeError:
+            return []
+
+    def advance(self, posts, skipped_count, run_at):
+        """
+        수집 결과로 상태 갱신
+
+        Args:
+            posts: 이번에 새로 가져온 게시물 (post_id, created_utc 속성)
+            skipped_count: 이미 본 게시물이라 건너뛴 수
+            run_at: 실행 시각
+        """
+        if posts:
+            newest = max(posts, key=lambda post: post.created_utc)
+            if self.last_created_utc is None or newest.created_utc > self.last_created_utc:
+                self.last_created_utc = newest.created_utc
+                self.last_fullname = f"t3_{newest.post_id}"
+
+            seen = [post.post_id for post in posts]
+            new_ids = set(seen)
+            seen.extend(post_id for post_id in self.seen_ids if post_id not in new_ids)
+            self.seen_ids_json = json.dumps(seen[:self.SEEN_ID_LIMIT])
+
+        self.last_run_at = run_at
+        self.last_new_count = len(posts)
+        self.last_skipped_count = skipped_count
+
+    @classmethod
+    def load_many(cls, subreddits, listing, platform='reddit'):
+        """
+        여러 subreddit 의 상태를 한 번에 조회 (없는 것은 새로 생성)
+
+        Args:
+            subreddits: subreddit 이름 리스트
+            listing: 리스팅 키
+            platform: 플랫폼
+
+        Returns:
+            {subreddit: CrawlState}
+        """
+        states = {
+            state.subreddit: state
+            for state in cls.query.filter(
+                cls.platform == platform,
+                cls.listing == listing,
+                cls.subreddit.in_(subreddits)
+            )
+        }
+
+        for subreddit in subreddits:
+            if subreddit not in states:
+                states[subreddit] = cls.create(platform=platform, subreddit=subreddit, listing=listing)
+
+        return states
+
+    def to_dict(self, exclude=None):
+        """딕셔너리 변환"""
+        data = super().to_dict(exclude=(exclude or []) + ['seen_ids_json'])
+        data['seen_id_count'] = len(self.seen_ids)
+        return data
+
+    def __repr__(self):
+        return f"<CrawlState {self.platform}:{self.subreddit}:{self.listing}>"
@@ -2,6 +2,7 @@
 Draft 모델
 작성 중인 콘텐츠 관리 (AI 보조 또는 수동 작성)
 """
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
 from app import db
 from app.models.base import BaseModel
 
@@ -110,6 +111,30 @@ class Draft(BaseModel):
         self.status = 'abandoned'
         db.session.commit()
 
+    @classmethod
+    def list_options(cls):
+        """
+        목록 조회 로더 옵션
+
+        작성자, Inspiration, 문체는 JOIN 으로, 발행 여부 판단용 Post 는 필요한 컬럼만
+        IN 쿼리 한 번으로 로드합니다. 그 외 관계를 지연 로드하면 N+1 대신 에러가 나도록 막습니다.
+        """
+        from app.models.post import Post
+
+        return (
+            joinedload(cls.author),
+            joinedload(cls.inspiration),
+            joinedload(cls.writing_style),
+            selectinload(cls.post).options(
+                load_only(Post.id, Post.draft_id, Post.is_published), raiseload('*')
+            ),
+            raiseload('*'),
+        )
+
+    def to_list_dict(self):
+        """목록용 딕셔너리 (list_options 로 미리 로드한 데이터만 사용)"""
+        return self.to_dict()
+
     def to_dict(self, exclude=None):
         """딕셔너리 변환"""
         data = super().to_dict(exclude=exclude)
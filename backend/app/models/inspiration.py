@@ -2,6 +2,7 @@
 Inspiration 모델
 Source로부터 영감을 받은 재창작 아이디어
 """
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
 from app import db
 from app.models.base import BaseModel
 
@@ -29,6 +30,9 @@ class Inspiration(BaseModel):
         index=True
     )  # collected, reviewing, approved, in_progress, completed, rejected
 
+    # 근접 중복 클러스터 (대표 Inspiration ID, 클러스터가 없으면 NULL)
+    cluster_id = db.Column(db.Integer, nullable=True)
+
     # 관계
     source = db.relationship('Source', back_populates='inspirations')
     draft = db.relationship('Draft', back_populates='inspiration', uselist=False)  # 1:1
@@ -46,6 +50,14 @@ class Inspiration(BaseModel):
         }
         return status_names.get(self.status, self.status)
 
+    @property
+    def is_cluster_representative(self):
+        """
+        클러스터 대표 여부
+        (클러스터에 속하지 않은 Inspiration 도 대표로 간주)
+        """
+        return self.cluster_id is None or self.cluster_id == self.id
+
     @property
     def is_fair_use_compliant(self):
         """
@@ -79,6 +91,26 @@ class Inspiration(BaseModel):
         self.status = 'completed'
         db.session.commit()
 
+    @classmethod
+    def list_options(cls):
+        """
+        목록 조회 로더 옵션
+
+        Source 는 JOIN, Draft 는 존재 여부만 알면 되므로 ID 만 IN 쿼리 한 번으로 로드합니다.
+        그 외 관계를 지연 로드하면 N+1 대신 에러가 나도록 막습니다.
+        """
+        from app.models.draft import Draft
+
+        return (
+            joinedload(cls.source),
+            selectinload(cls.draft).options(load_only(Draft.id, Draft.inspiration_id), raiseload('*')),
+            raiseload('*'),
+        )
+
+    def to_list_dict(self):
+        """목록용 딕셔너리 (list_options 로 미리 로드한 데이터만 사용)"""
+        return self.to_dict()
+
     def to_dict(self, exclude=None):
         """딕셔너리 변환"""
         data = super().to_dict(exclude=exclude)
@@ -86,6 +118,7 @@ class Inspiration(BaseModel):
         # 추가 정보
         data['status_display'] = self.status_display
         data['is_fair_use_compliant'] = self.is_fair_use_compliant
+        data['is_cluster_representative'] = self.is_cluster_representative
         data['has_draft'] = self.draft is not None
 
         # Source 정보 포함
@@ -107,3 +140,4 @@ class Inspiration(BaseModel):
 db.Index('idx_inspiration_status', Inspiration.status)
 db.Index('idx_inspiration_source', Inspiration.source_id)
 db.Index('idx_inspiration_similarity', Inspiration.similarity_score)
+db.Index('idx_inspiration_cluster', Inspiration.cluster_id)
@@ -0,0 +1,51 @@
+"""
+JobCancelRequest 모델
+실행 중인 격리 작업 취소 요청 (리더가 아닌 워커가 남기고 리더가 하트비트마다 처리)
+"""
+from typing import List
+
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models.base import BaseModel
+
+
+class JobCancelRequest(BaseModel):
+    """작업 취소 요청 모델 (작업당 한 행)"""
+    __tablename__ = 'job_cancel_requests'
+
+    job_id = db.Column(db.String(100), unique=True, nullable=False)
+
+    @classmethod
+    def request(cls, job_id: str) -> None:
+        """
+        취소 요청 기록 (이미 요청되어 있으면 그대로)
+
+        Args:
+            job_id: Job ID
+        """
+        db.session.add(cls(job_id=job_id))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+
+    @classmethod
+    def take_all(cls) -> List[str]:
+        """
+        쌓인 취소 요청을 꺼내고 삭제
+
+        Returns:
+            취소 요청된 Job ID 목록
+        """
+        requests = cls.query.all()
+        if not requests:
+            return []
+
+        job_ids = [request.job_id for request in requests]
+        cls.query.filter(cls.id.in_([request.id for request in requests])).delete(synchronize_session=False)
+        db.session.commit()
+        return job_ids
+
+    def __repr__(self):
+        return f"<JobCancelRequest {self.job_id}>"
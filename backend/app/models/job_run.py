@@ -0,0 +1,103 @@
+"""
+JobRun 모델
+스케줄러 작업 실행 기록 (워커/재시작과 무관하게 DB 에 보관)
+"""
+import json
+
+from app import db
+from app.models.base import BaseModel
+
+
+class JobRun(BaseModel):
+    """작업 실행 기록 모델"""
+    __tablename__ = 'job_runs'
+
+    STATUSES = ('success', 'failed', 'timeout', 'cancelled', 'missed', 'skipped')
+
+    job_id = db.Column(db.String(100), nullable=False)
+    status = db.Column(db.String(20), nullable=False)  # success, failed, timeout, cancelled, missed, skipped
+
+    scheduled_at = db.Column(db.DateTime, nullable=True)  # 예정 실행 시각
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    duration_sec = db.Column(db.Float, nullable=True)  # 벽시계 시간
+
+    # 자원 사용량 (프로세스 격리 실행 시 자식 프로세스 기준)
+    isolated = db.Column(db.Boolean, nullable=False, default=False, server_default='0')
+    cpu_time_sec = db.Column(db.Float, nullable=True)
+    peak_rss_mb = db.Column(db.Float, nullable=True)
+
+    summary_json = db.Column(db.Text, nullable=True)  # 작업 반환값 (JSON)
+    error = db.Column(db.Text, nullable=True)
+    worker = db.Column(db.String(200), nullable=True)  # 실행한 워커 (hostname:pid)
+
+    @property
+    def summary(self):
+        """작업 반환값"""
+        if not self.summary_json:
+            return None
+        try:
+            return json.loads(self.summary_json)
+        except json.JSONDecodeError:
+            return None
+
+    @classmethod
+    def page(cls, job_id=None, status=None, before_id=None, limit=20):
+        """
+        최신순 커서 페이지 조회
+
+        (job_id, status, id) 인덱스를 id 역순으로 따라가므로
+        OFFSET 없이 어느 페이지든 같은 비용으로 읽습니다.
+
+        Args:
+            job_id: 작업 필터 (선택)
+            status: 상태 필터 (선택)
+            before_id: 이 ID 보다 오래된 기록만 (이전 페이지의 next_cursor)
+            limit: 페이지 크기
+
+        Returns:
+            (JobRun 리스트, 다음 페이지 커서 또는 None)
+        """
+        query = cls.query
+        if job_id:
+            query = query.filter(cls.job_id == job_id)
+        if status:
+            query = query.filter(cls.status == status)
+        if before_id:
+            query = query.filter(cls.id < before_id)
+
+        runs = query.order_by(cls.id.desc()).limit(limit + 1).all()
+        if len(runs) > limit:
+            return runs[:limit], runs[limit - 1].id
+        return runs, None
+
+    @classmethod
+    def count_by_status(cls, since):
+        """
+        기간 내 상태별 실행 횟수
+
+        Args:
+            since: 기준 시각 (UTC, finished_at 기준)
+
+        Returns:
+            {status: count}
+        """
+        rows = db.session.query(cls.status, db.func.count(cls.id)).filter(
+            cls.finished_at >= since
+        ).group_by(cls.status)
+        return dict(rows.all())
+
+    def to_dict(self, exclude=None):
+        """딕셔너리 변환"""
+        data = super().to_dict(exclude=(exclude or []) + ['summary_json'])
+        data['summary'] = self.summary
+        return data
+
+    def __repr__(self):
+        return f"<JobRun {self.job_id} ({self.status})>"
+
+
+# 인덱스 (작업/상태 필터 + id 역순 커서 페이지네이션)
+db.Index('idx_job_run_job', JobRun.job_id, JobRun.id)
+db.Index('idx_job_run_status', JobRun.status, JobRun.id)
+db.Index('idx_job_run_job_status', JobRun.job_id, JobRun.status, JobRun.id)
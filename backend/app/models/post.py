@@ -3,6 +3,7 @@ Post 모델
 발행된 게시물 관리
 """
 from datetime import datetime
+from sqlalchemy.orm import defer, joinedload, raiseload, selectinload
 from app import db
 from app.models.base import BaseModel
 from app.models.tag import post_tags
@@ -32,6 +33,8 @@ class Post(BaseModel):
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)  # Markdown
     content_html = db.Column(db.Text, nullable=True)  # HTML (렌더링된 버전)
+    content_hash = db.Column(db.String(64), nullable=True)  # content_html 을 렌더링한 원문 해시
+    render_version = db.Column(db.Integer, nullable=True)  # content_html 을 만든 렌더러 버전
 
     # URL
     slug = db.Column(db.String(250), unique=True, nullable=False, index=True)
@@ -97,6 +100,7 @@ class Post(BaseModel):
         if not self.is_published:
             self.is_published = True
             self.published_at = datetime.utcnow()
+            self.render_content_html()
             db.session.commit()
 
             # 카테고리 게시물 수 업데이트
@@ -120,7 +124,7 @@ class Post(BaseModel):
         return False
 
     def increment_view_count(self):
-        """조회수 증가 (비동기 처리 권장)"""
+        """조회수 증가 (즉시 커밋, API 요청에서는 ViewCounter 버퍼 사용)"""
         self.view_count += 1
         db.session.commit()
 
@@ -155,15 +159,29 @@ class Post(BaseModel):
 
         db.session.commit()
 
-    def render_content_html(self):
+    def render_content_html(self, force=False):
         """
-        Markdown을 HTML로 렌더링
-        (향후 markdown2 또는 mistune 라이브러리 사용)
+        Markdown을 sanitize 된 HTML로 렌더링 (커밋은 호출한 쪽에서)
+
+        원문과 렌더러가 마지막 렌더링 때와 같으면 건너뜁니다.
+
+        Args:
+            force: 같아도 다시 렌더링
+
+        Returns:
+            bool: 렌더링 여부
         """
-        # Phase 2에서는 간단히 content를 그대로 사용
-        # 향후 Phase에서 markdown 렌더링 추가
-        self.content_html = self.content
-        db.session.commit()
+        from app.services.markdown_renderer import (
+            RENDERER_VERSION, content_hash, needs_render, render_markdown
+        )
+
+        if not force and not needs_render(self.content, self.content_hash, self.render_version):
+            return False
+
+        self.content_html = render_markdown(self.content)
+        self.content_hash = content_hash(self.content)
+        self.render_version = RENDERER_VERSION
+        return True
 
     @classmethod
     def get_published_posts(cls, limit=None, offset=None):
@@ -199,6 +217,27 @@ class Post(BaseModel):
         """
         return cls.query.filter_by(slug=slug, is_published=True).first()
 
+    @classmethod
+    def list_options(cls):
+        """
+        목록 조회 로더 옵션
+
+        to_list_dict 가 쓰는 관계(작성자, 카테고리, 태그)를 미리 로드하고 본문은 읽지 않습니다.
+        그 외 관계를 지연 로드하면 N+1 대신 에러가 나도록 막습니다.
+        """
+        return (
+            defer(cls.content),
+            defer(cls.content_html),
+            joinedload(cls.author),
+            joinedload(cls.category),
+            selectinload(cls.tags),
+            raiseload('*'),
+        )
+
+    def to_list_dict(self):
+        """목록용 딕셔너리 (list_options 로 미리 로드한 데이터만 사용)"""
+        return self.to_dict(include_content=False)
+
     def to_dict(self, exclude=None, include_content=True):
         """
         딕셔너리 변환
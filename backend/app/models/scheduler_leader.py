@@ -0,0 +1,71 @@
+"""
+SchedulerLeader 모델
+스케줄러 리더 워커의 하트비트 (모든 워커가 리더 상태를 조회하는 용도)
+"""
+from datetime import datetime, timedelta
+
+from app import db
+from app.models.base import BaseModel
+
+
+class SchedulerLeader(BaseModel):
+    """스케줄러 리더 하트비트 모델 (잠금 이름당 한 행)"""
+    __tablename__ = 'scheduler_leaders'
+
+    name = db.Column(db.String(100), unique=True, nullable=False)  # 잠금 이름
+    holder = db.Column(db.String(200), nullable=False)  # hostname:pid
+    hostname = db.Column(db.String(200), nullable=False)
+    pid = db.Column(db.Integer, nullable=False)
+    lock_backend = db.Column(db.String(20), nullable=False)  # file, advisory
+    acquired_at = db.Column(db.DateTime, nullable=False)
+    heartbeat_at = db.Column(db.DateTime, nullable=False)
+
+    @classmethod
+    def record_heartbeat(cls, name, hostname, pid, lock_backend, acquired_at, now=None):
+        """
+        리더 하트비트 기록 (행이 없으면 생성)
+
+        Args:
+            name: 잠금 이름
+            hostname: 리더 호스트 이름
+            pid: 리더 프로세스 ID
+            lock_backend: 잠금 방식
+            acquired_at: 리더가 된 시각
+            now: 하트비트 시각 (None이면 현재)
+
+        Returns:
+            SchedulerLeader 인스턴스
+        """
+        leader = cls.query.filter_by(name=name).first()
+        if leader is None:
+            leader = cls(name=name)
+            db.session.add(leader)
+
+        leader.holder = f"{hostname}:{pid}"
+        leader.hostname = hostname
+        leader.pid = pid
+        leader.lock_backend = lock_backend
+        leader.acquired_at = acquired_at
+        leader.heartbeat_at = now or datetime.utcnow()
+        db.session.commit()
+        return leader
+
+    def is_alive(self, interval, now=None):
+        """
+        하트비트가 최근 3주기 안에 있었는지
+
+        Args:
+            interval: 하트비트 주기(초)
+            now: 기준 시각 (None이면 현재)
+        """
+        return (now or datetime.utcnow()) - self.heartbeat_at <= timedelta(seconds=interval * 3)
+
+    def to_dict(self, exclude=None, interval=None):
+        """딕셔너리 변환 (interval 을 주면 alive 포함)"""
+        data = super().to_dict(exclude=exclude)
+        if interval is not None:
+            data['alive'] = self.is_alive(interval)
+        return data
+
+    def __repr__(self):
+        return f"<SchedulerLeader {self.name} ({self.holder})>"
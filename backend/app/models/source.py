@@ -31,8 +31,12 @@ class Source(BaseModel):
     score = db.Column(db.Integer, nullable=True)  # Reddit upvotes 등
     posted_at = db.Column(db.DateTime, nullable=True, index=True)
 
+    # 필터/통계용 컬럼 (metadata_json 에서 승격, 인덱스 사용)
+    subreddit = db.Column(db.String(100), nullable=True)
+    num_comments = db.Column(db.Integer, nullable=True)
+
     # 추가 메타데이터 (JSON)
-    metadata_json = db.Column(db.Text, nullable=True)  # subreddit, flair, comments_count 등
+    metadata_json = db.Column(db.Text, nullable=True)  # flair, permalink 등
 
     # 관계
     inspirations = db.relationship('Inspiration', back_populates='source', lazy='dynamic')
@@ -59,6 +63,80 @@ class Source(BaseModel):
         """
         return cls.query.filter_by(source_url=url).first()
 
+    @staticmethod
+    def columns_from_metadata(metadata_json):
+        """
+        metadata_json 에서 승격 컬럼 값 추출
+
+        Args:
+            metadata_json: 메타데이터 JSON 문자열
+
+        Returns:
+            dict: subreddit, num_comments (없는 값은 None)
+        """
+        import json
+
+        try:
+            metadata = json.loads(metadata_json) if metadata_json else {}
+        except (TypeError, json.JSONDecodeError):
+            metadata = {}
+        if not isinstance(metadata, dict):
+            metadata = {}
+
+        num_comments = metadata.get('num_comments', metadata.get('comments_count'))
+        try:
+            num_comments = int(num_comments) if num_comments is not None else None
+        except (TypeError, ValueError):
+            num_comments = None
+
+        return {
+            'subreddit': metadata.get('subreddit') or None,
+            'num_comments': num_comments,
+        }
+
+    @classmethod
+    def backfill_from_metadata(cls, batch_size=500):
+        """
+        승격 컬럼이 비어 있는 기존 행을 metadata_json 으로 채우기
+
+        id 순서로 batch_size 개씩 읽어 배치마다 커밋하므로
+        큰 테이블도 메모리/잠금 부담 없이 여러 번 나눠 실행할 수 있습니다.
+
+        Args:
+            batch_size: 배치 크기
+
+        Returns:
+            int: 갱신된 행 수
+        """
+        updated = 0
+        last_id = 0
+
+        while True:
+            rows = db.session.query(cls.id, cls.metadata_json).filter(
+                cls.id > last_id,
+                cls.metadata_json.isnot(None),
+                cls.subreddit.is_(None),
+                cls.num_comments.is_(None)
+            ).order_by(cls.id).limit(batch_size).all()
+
+            if not rows:
+                break
+
+            values = []
+            for row_id, metadata_json in rows:
+                columns = cls.columns_from_metadata(metadata_json)
+                if columns['subreddit'] is not None or columns['num_comments'] is not None:
+                    values.append({'id': row_id, **columns})
+
+            if values:
+                db.session.execute(db.update(cls), values)
+            db.session.commit()
+
+            updated += len(values)
+            last_id = rows[-1][0]
+
+        return updated
+
     @classmethod
     def create_from_reddit(cls, reddit_post_data):
         """
@@ -80,6 +158,8 @@ class Source(BaseModel):
             author=reddit_post_data.get('author'),
             score=reddit_post_data.get('score'),
             posted_at=datetime.fromtimestamp(reddit_post_data.get('created_utc', 0)),
+            subreddit=reddit_post_data.get('subreddit'),
+            num_comments=reddit_post_data.get('num_comments'),
             metadata_json=json.dumps({
                 'subreddit': reddit_post_data.get('subreddit'),
                 'num_comments': reddit_post_data.get('num_comments'),
@@ -117,3 +197,6 @@ class Source(BaseModel):
 # 인덱스
 db.Index('idx_source_platform', Source.platform)
 db.Index('idx_source_posted_at', Source.posted_at.desc())
+db.Index('idx_source_platform_subreddit', Source.platform, Source.subreddit)
+db.Index('idx_source_score', Source.score)
+db.Index('idx_source_num_comments', Source.num_comments)
@@ -333,24 +333,25 @@ class AIRewriter:
         else:
             recommendation = f"✗ 유사도 {similarity_result.overall_similarity:.1%} (임계값: {threshold:.1%}). 재생성을 권장합니다."
 
-        # 상세 분석
+        # 상세 분석 (의미적 유사도를 측정할 수 없으면 가중치가 재분배됨)
+        weights = similarity_result.details['weights']
         details = {
             'threshold': threshold,
             'passed': similarity_result.is_fair_use,
             'similarity_breakdown': {
                 'structural': {
                     'score': similarity_result.structural_similarity,
-                    'weight': 0.3,
+                    'weight': weights['structural'],
                     'description': '문장 구조 유사도'
                 },
                 'lexical': {
                     'score': similarity_result.lexical_similarity,
-                    'weight': 0.5,
+                    'weight': weights['lexical'],
                     'description': '어휘 유사도'
                 },
                 'semantic': {
                     'score': similarity_result.semantic_similarity,
-                    'weight': 0.2,
+                    'weight': weights['semantic'],
                     'description': '의미 유사도'
                 }
             }
@@ -0,0 +1,184 @@
+"""
+배치 유사도 체크 서비스
+
+임계값 조정 후 수백 건의 Draft 를 다시 채점할 때 사용합니다.
+    - 의미적 유사도: 부모 프로세스에서 청크 단위 배치 인코딩 (임베딩 모델은 한 번만 로드)
+    - 구조적/어휘적 유사도: 프로세스 풀에 청크 단위로 분배 (순수 Python, GIL 회피)
+완료된 청크부터 결과를 반환하므로 API 는 NDJSON 으로 바로 스트리밍할 수 있고,
+Inspiration.similarity_score 는 마지막에 한 번의 bulk UPDATE 로 저장합니다.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import update
+
+from app import db
+from app.config import Settings
+from app.models import Draft, Inspiration
+from app.services.similarity_checker import SimilarityChecker, SimilarityResult
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스별 체커 (의미적 유사도는 부모에서 계산해 전달)
+_worker_checker: Optional[SimilarityChecker] = None
+
+
+def _score_chunk(
+    start: int,
+    pairs: List[Tuple[str, str]],
+    semantic_scores: List[Optional[float]]
+) -> List[Tuple[int, SimilarityResult]]:
+    """
+    워커 프로세스에서 청크 채점
+
+    Args:
+        start: 청크 첫 항목의 전체 인덱스
+        pairs: (원본, 생성) 쌍 리스트
+        semantic_scores: 미리 계산한 의미적 유사도 (없으면 None)
+
+    Returns:
+        (인덱스, SimilarityResult) 리스트
+    """
+    global _worker_checker
+    if _worker_checker is None:
+        _worker_checker = SimilarityChecker(use_semantic=False)
+
+    return [
+        (start + offset, _worker_checker.check_similarity(original, generated, semantic_similarity=semantic))
+        for offset, ((original, generated), semantic) in enumerate(zip(pairs, semantic_scores))
+    ]
+
+
+def iter_batch_similarity(
+    pairs: Sequence[Tuple[str, str]],
+    checker: Optional[SimilarityChecker] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 32
+) -> Iterator[Tuple[int, SimilarityResult]]:
+    """
+    여러 (원본, 생성) 쌍을 채점하여 완료 순서대로 반환
+
+    Args:
+        pairs: (원본, 생성) 쌍 리스트
+        checker: 의미적 유사도 계산용 체커 (None이면 기본 생성)
+        executor: 청크를 실행할 Executor (None이면 글로벌 프로세스 풀)
+        chunk_size: 워커 한 번에 보낼 쌍 수
+
+    Yields:
+        (입력 인덱스, SimilarityResult) - 입력 순서와 다를 수 있음
+    """
+    checker = checker or SimilarityChecker()
+    pairs = list(pairs)
+
+    # 한 청크 이하면 풀 왕복 비용 없이 바로 계산
+    if len(pairs) <= chunk_size:
+        originals = [original for original, _ in pairs]
+        generated = [text for _, text in pairs]
+        semantic_scores = checker.batch_semantic_similarity(originals, generated)
+        yield from _score_chunk(0, pairs, semantic_scores)
+        return
+
+    executor = executor or get_similarity_executor()
+    pending: List[Future] = []
+
+    for start in range(0, len(pairs), chunk_size):
+        chunk = pairs[start:start + chunk_size]
+        semantic_scores = checker.batch_semantic_similarity(
+            [original for original, _ in chunk],
+            [text for _, text in chunk]
+        )
+        pending.append(executor.submit(_score_chunk, start, chunk, semantic_scores))
+
+        # 다음 청크를 인코딩하는 동안 끝난 청크는 먼저 반환
+        done = [future for future in pending if future.done()]
+        for future in done:
+            pending.remove(future)
+            yield from future.result()
+
+    for future in as_completed(pending):
+        yield from future.result()
+
+
+def load_inspiration_pairs(
+    inspiration_ids: Sequence[int]
+) -> Dict[int, Tuple[str, str]]:
+    """
+    Inspiration 원본 컨셉과 연결된 Draft 내용을 한 번의 쿼리로 조회
+
+    Args:
+        inspiration_ids: Inspiration ID 리스트
+
+    Returns:
+        {inspiration_id: (original_concept, draft_content)} (Draft 가 있는 것만)
+    """
+    if not inspiration_ids:
+        return {}
+
+    rows = db.session.query(
+        Inspiration.id,
+        Inspiration.original_concept,
+        Draft.content
+    ).join(
+        Draft, Draft.inspiration_id == Inspiration.id
+    ).filter(
+        Inspiration.id.in_(set(inspiration_ids))
+    )
+
+    return {insp_id: (concept, content) for insp_id, concept, content in rows}
+
+
+def persist_similarity_scores(scores: Dict[int, float]) -> int:
+    """
+    Inspiration.similarity_score 를 한 번의 bulk UPDATE 로 저장
+
+    Args:
+        scores: {inspiration_id: similarity_score}
+
+    Returns:
+        갱신한 행 수
+    """
+    if not scores:
+        return 0
+
+    db.session.execute(
+        update(Inspiration),
+        [
+            {'id': insp_id, 'similarity_score': score}
+            for insp_id, score in scores.items()
+        ]
+    )
+    db.session.commit()
+    return len(scores)
+
+
+# 글로벌 프로세스 풀
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_similarity_executor() -> ProcessPoolExecutor:
+    """
+    글로벌 유사도 채점 프로세스 풀 반환 (최초 호출 시 생성)
+
+    fork 대신 spawn 을 사용하여 LLM/임베딩 모델이 로드된 부모 프로세스를 복제하지 않습니다.
+
+    Returns:
+        ProcessPoolExecutor 인스턴스
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = Settings().SIMILARITY_WORKERS or os.cpu_count() or 1
+                _executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                logger.info(f"Similarity process pool started ({max_workers} workers)")
+
+    return _executor
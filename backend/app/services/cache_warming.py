@@ -0,0 +1,238 @@
+"""
+캐시 예열 (cache warming)
+
+배포나 캐시 비우기 직후 첫 방문자가 느린 응답을 받지 않도록, 자주 호출되는 공개 엔드포인트의
+응답을 미리 캐시에 채웁니다. 예열 대상은 WARM_TARGETS 에 (경로, 파라미터 조합)으로 선언하고,
+만료 시간은 대상 뷰의 @cache.cached(timeout=...) 값을 그대로 씁니다.
+
+- 예열 요청은 캐시를 읽지 않고 새로 계산해 덮어씀 (뷰에 forced_update=is_warming 지정)
+- 스케줄러 작업(cache_warming)이 다음 실행 전에 만료될 항목만 다시 채움
+- 스케줄러 시작 직후(배포/재시작), scripts/warm_cache.py, POST /api/admin/cache/warm 에서 전체 예열
+
+예열 기록(항목별 만료 예정 시각)은 프로세스 메모리에 있으므로, 새 프로세스의 첫 예열은 전체를 채웁니다.
+"""
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlencode
+
+from flask import current_app
+
+from app import db
+from app.models import Category
+
+logger = logging.getLogger(__name__)
+
+_warming: ContextVar[bool] = ContextVar('cache_warming', default=False)
+
+
+def is_warming() -> bool:
+    """예열 요청 처리 중인지 (@cache.cached(forced_update=is_warming) 용)"""
+    return _warming.get()
+
+
+ParamSets = Union[List[Dict[str, Any]], Callable[[], List[Dict[str, Any]]]]
+
+
+@dataclass
+class WarmTarget:
+    """예열 대상 (GET 경로와 쿼리 파라미터 조합)"""
+    name: str
+    path: str
+    params: ParamSets = field(default_factory=lambda: [{}])  # 리스트 또는 리스트를 만드는 함수 (app context 에서 호출)
+
+    def param_sets(self) -> List[Dict[str, Any]]:
+        """예열할 쿼리 파라미터 조합"""
+        return self.params() if callable(self.params) else list(self.params)
+
+
+def post_list_params() -> List[Dict[str, Any]]:
+    """게시물 목록: 첫 페이지 + 카테고리별 첫 페이지"""
+    return [{}] + [{'category_id': category_id} for (category_id,) in db.session.query(Category.id)]
+
+
+WARM_TARGETS = [
+    WarmTarget('posts', '/api/posts', post_list_params),
+    WarmTarget('search_filters', '/api/search/filters'),
+    WarmTarget('categories', '/api/categories'),
+    WarmTarget('sitemap', '/sitemap.xml'),
+]
+
+
+class CacheWarmer:
+    """
+    캐시 예열기 (스레드 안전)
+
+    Usage:
+        warmer = get_cache_warmer(app)
+        warmer.register(WarmTarget('tags', '/api/tags'))
+        report = warmer.warm()                  # 전체 다시 채움
+        report = warmer.warm(horizon=90)        # 90초 안에 만료될 항목만
+    """
+
+    def __init__(self, app, targets: Optional[List[WarmTarget]] = None):
+        """
+        Args:
+            app: Flask app instance
+            targets: 예열 대상 (None이면 WARM_TARGETS)
+        """
+        self.app = app
+        self.targets: Dict[str, WarmTarget] = {target.name: target for target in (targets or WARM_TARGETS)}
+        self.last_report: Optional[Dict[str, Any]] = None
+
+        self._expires: Dict[tuple, float] = {}  # (대상 이름, 쿼리 문자열) -> 만료 예정 시각 (time.time)
+        self._lock = threading.Lock()
+
+    def register(self, target: WarmTarget) -> None:
+        """예열 대상 추가 (같은 이름이면 교체)"""
+        self.targets[target.name] = target
+
+    def cache_timeout(self, path: str) -> Optional[int]:
+        """
+        경로에 연결된 뷰의 캐시 만료 시간
+
+        Args:
+            path: GET 경로
+
+        Returns:
+            만료 시간(초), 캐시하지 않는 뷰면 None
+        """
+        endpoint, _ = self.app.url_map.bind('localhost').match(path, method='GET')
+        view = self.app.view_functions[endpoint]
+        if not hasattr(view, 'uncached'):
+            return None
+        return view.cache_timeout or self.app.config.get('CACHE_DEFAULT_TIMEOUT', 300)
+
+    def warm(self, names: Optional[List[str]] = None, horizon: Optional[float] = None) -> Dict[str, Any]:
+        """
+        예열 실행
+
+        Args:
+            names: 예열할 대상 이름 (None이면 전체)
+            horizon: 이 시간(초) 안에 만료되지 않는 항목은 건너뜀 (None이면 모두 다시 채움)
+
+        Returns:
+            {'keys_warmed', 'keys_skipped', 'errors', 'duration_ms', 'warmed_at',
+             'targets': {name: {'keys_warmed', 'keys_skipped', 'timeout', 'duration_ms', 'errors'}}}
+
+        Raises:
+            KeyError: 등록되지 않은 대상 이름
+        """
+        targets = [self.targets[name] for name in (names or list(self.targets))]
+        report = {'keys_warmed': 0, 'keys_skipped': 0, 'errors': 0, 'targets': {}}
+        start = time.monotonic()
+        client = self.app.test_client()
+
+        token = _warming.set(True)
+        try:
+            for target in targets:
+                stats = self._warm_target(client, target, horizon)
+                report['targets'][target.name] = stats
+                report['keys_warmed'] += stats['keys_warmed']
+                report['keys_skipped'] += stats['keys_skipped']
+                report['errors'] += len(stats['errors'])
+        finally:
+            _warming.reset(token)
+
+        report['duration_ms'] = round((time.monotonic() - start) * 1000, 2)
+        report['warmed_at'] = time.time()
+        self.last_report = report
+
+        logger.info(
+            f"Cache warming: {report['keys_warmed']} keys warmed, "
+            f"{report['keys_skipped']} still fresh, {report['errors']} errors "
+            f"in {report['duration_ms']}ms"
+        )
+        return report
+
+    def _warm_target(self, client, target: WarmTarget, horizon: Optional[float]) -> Dict[str, Any]:
+        start = time.monotonic()
+        stats = {'keys_warmed': 0, 'keys_skipped': 0, 'timeout': None, 'errors': []}
+
+        try:
+            stats['timeout'] = timeout = self.cache_timeout(target.path)
+            if timeout is None:
+                raise ValueError(f"{target.path} is not cached")
+            with self.app.app_context():
+                param_sets = target.param_sets()
+        except Exception as e:
+            logger.warning(f"Cache warming target {target.name} skipped: {e}")
+            stats['errors'].append(str(e))
+            param_sets = []
+
+        for params in param_sets:
+            key = (target.name, urlencode(sorted(params.items())))
+            now = time.time()
+            with self._lock:
+                expires_at = self._expires.get(key, 0)
+            if horizon is not None and expires_at - now > horizon:
+                stats['keys_skipped'] += 1
+                continue
+
+            try:
+                response = client.get(target.path, query_string=params)
+            except Exception as e:
+                stats['errors'].append(f"{key[1] or '(default)'}: {e}")
+                continue
+            if response.status_code != 200:
+                stats['errors'].append(f"{key[1] or '(default)'}: HTTP {response.status_code}")
+                continue
+
+            with self._lock:
+                self._expires[key] = now + timeout
+            stats['keys_warmed'] += 1
+
+        stats['duration_ms'] = round((time.monotonic() - start) * 1000, 2)
+        return stats
+
+    def status(self) -> Dict[str, Any]:
+        """
+        예열 상태
+
+        Returns:
+            {'targets': [...], 'entries': [{'target', 'params', 'expires_in'}], 'last_report'}
+        """
+        now = time.time()
+        with self._lock:
+            entries = [
+                {'target': name, 'params': params, 'expires_in': round(expires_at - now, 1)}
+                for (name, params), expires_at in sorted(self._expires.items())
+            ]
+
+        return {
+            'targets': [{'name': target.name, 'path': target.path} for target in self.targets.values()],
+            'entries': entries,
+            'last_report': self.last_report
+        }
+
+
+def init_cache_warmer(app) -> CacheWarmer:
+    """
+    캐시 예열기 초기화 (Flask 앱 시작 시 호출)
+
+    Args:
+        app: Flask app instance
+
+    Returns:
+        CacheWarmer 인스턴스
+    """
+    warmer = CacheWarmer(app)
+    app.extensions['cache_warmer'] = warmer
+    return warmer
+
+
+def get_cache_warmer(app=None) -> CacheWarmer:
+    """
+    앱의 캐시 예열기 반환
+
+    Args:
+        app: Flask app instance (None이면 current_app)
+
+    Returns:
+        CacheWarmer 인스턴스
+    """
+    app = app or current_app._get_current_object()
+    return app.extensions['cache_warmer']
@@ -0,0 +1,169 @@
+"""
+컨셉 클러스터링 서비스
+
+여러 subreddit 에 다시 올라온 같은 유머처럼 컨셉이 비슷한 Inspiration 을
+클러스터로 묶고, 클러스터마다 대표 하나만 LLM 생성 대상으로 남깁니다.
+
+대표는 이미 생성이 시작된 Inspiration 을 우선하고, 그다음 원본 점수와
+최신성(Reddit hot 공식)으로 고릅니다. 순위가 높은 것부터 차례로 보면서
+기존 대표와 MinHash 유사도가 임계값 이상이면 그 클러스터에 넣고,
+아니면 새 대표가 됩니다 (연쇄적으로 멀어지는 컨셉이 한 클러스터로 묶이지 않음).
+
+Inspiration.cluster_id 에는 대표의 ID 를 저장하며, 멤버가 없는 대표는 NULL 입니다.
+"""
+import logging
+import math
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from app import db
+from app.config import Settings
+from app.models import Inspiration, Source
+from app.services.near_duplicate_index import NearDuplicateIndex, strip_concept_boilerplate
+
+logger = logging.getLogger(__name__)
+
+# 클러스터링 대상 상태 (거절된 Inspiration 은 제외)
+CLUSTER_STATUSES = ('collected', 'reviewing', 'approved', 'in_progress', 'completed')
+
+# 이미 생성이 시작된 상태 (대표 우선)
+GENERATED_STATUSES = ('in_progress', 'completed')
+
+# Reddit hot 공식 기준 시각 (2005-12-08)
+_HOT_EPOCH = 1134028003
+
+
+def hot_score(score: Optional[int], posted_at: Optional[datetime]) -> float:
+    """
+    점수와 최신성을 합친 순위 점수 (Reddit hot 공식)
+
+    점수가 10배가 되는 것과 12.5시간 더 최근인 것이 같은 가치를 가집니다.
+
+    Args:
+        score: 원본 점수 (업보트 등)
+        posted_at: 원본 게시 시각 (UTC)
+
+    Returns:
+        순위 점수 (클수록 우선)
+    """
+    score = score or 0
+    order = math.log10(max(abs(score), 1))
+    sign = 1 if score > 0 else -1 if score < 0 else 0
+    seconds = (posted_at - datetime(1970, 1, 1)).total_seconds() - _HOT_EPOCH if posted_at else 0.0
+    return round(sign * order + seconds / 45000, 7)
+
+
+class ConceptClusterer:
+    """
+    Inspiration 근접 중복 클러스터링
+
+    Usage:
+        result = ConceptClusterer().cluster()
+        print(result['duplicates'])
+    """
+
+    def __init__(self, threshold: Optional[float] = None):
+        """
+        Args:
+            threshold: 같은 클러스터로 묶을 최소 추정 Jaccard 유사도
+                       (None이면 CONCEPT_CLUSTER_THRESHOLD)
+        """
+        self.threshold = threshold if threshold is not None else Settings().CONCEPT_CLUSTER_THRESHOLD
+
+    def cluster(self) -> Dict[str, Any]:
+        """
+        전체 Inspiration 을 다시 클러스터링하고 바뀐 cluster_id 만 저장
+
+        Returns:
+            {'inspirations', 'clusters', 'duplicates', 'updated'}
+            (clusters 는 멤버가 있는 클러스터 수, duplicates 는 생성을 건너뛸 멤버 수)
+        """
+        rows = db.session.query(
+            Inspiration.id,
+            Inspiration.original_concept,
+            Inspiration.status,
+            Inspiration.cluster_id,
+            Inspiration.created_at,
+            Source.score,
+            Source.posted_at
+        ).join(Source, Inspiration.source_id == Source.id).filter(
+            Inspiration.status.in_(CLUSTER_STATUSES)
+        ).all()
+
+        ranked = sorted(
+            rows,
+            key=lambda row: (
+                row.status in GENERATED_STATUSES,
+                hot_score(row.score, row.posted_at or row.created_at),
+                -row.id
+            ),
+            reverse=True
+        )
+
+        # 대표만 담는 메모리 인덱스
+        representatives = NearDuplicateIndex()
+        assignment: Dict[int, int] = {}
+        members: Dict[int, int] = {}
+
+        for row in ranked:
+            text = strip_concept_boilerplate(row.original_concept)
+            matches = representatives.query(text, k=1, threshold=self.threshold, doc_type='inspiration')
+            if matches:
+                representative_id = matches[0].doc_id
+                assignment[row.id] = representative_id
+                members[representative_id] += 1
+            else:
+                representatives.add('inspiration', row.id, text, persist=False)
+                assignment[row.id] = row.id
+                members[row.id] = 0
+
+        # 멤버가 없는 대표는 클러스터 없음(NULL)으로 저장
+        updates = []
+        for row in rows:
+            cluster_id = assignment[row.id] if members.get(assignment[row.id]) else None
+            if row.cluster_id != cluster_id:
+                updates.append({'id': row.id, 'cluster_id': cluster_id})
+
+        if updates:
+            db.session.execute(db.update(Inspiration), updates)
+
+        # 거절된 Inspiration 은 클러스터에서 제외
+        released = Inspiration.query.filter(
+            Inspiration.status.notin_(CLUSTER_STATUSES),
+            Inspiration.cluster_id.isnot(None)
+        ).update({'cluster_id': None}, synchronize_session=False)
+        db.session.commit()
+
+        result = {
+            'inspirations': len(rows),
+            'clusters': sum(1 for count in members.values() if count),
+            'duplicates': sum(members.values()),
+            'updated': len(updates) + released
+        }
+        logger.info(
+            f"Clustered {result['inspirations']} inspirations: "
+            f"{result['clusters']} clusters, {result['duplicates']} duplicates"
+        )
+        return result
+
+
+def find_cluster_duplicates(inspiration_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    대표가 아닌 클러스터 멤버 찾기 (배치 생성에서 건너뛸 대상)
+
+    Args:
+        inspiration_ids: Inspiration ID 목록
+
+    Returns:
+        {멤버 ID: 대표 ID}
+    """
+    ids = list(inspiration_ids)
+    if not ids:
+        return {}
+
+    rows = db.session.query(Inspiration.id, Inspiration.cluster_id).filter(
+        Inspiration.id.in_(ids),
+        Inspiration.cluster_id.isnot(None),
+        Inspiration.cluster_id != Inspiration.id
+    )
+    return {row.id: row.cluster_id for row in rows}
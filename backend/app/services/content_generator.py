@@ -11,6 +11,8 @@ from datetime import datetime
 from app.llm.model_loader import get_llm_instance
 from app.llm.prompts import PromptTemplate, HumorStyle
 from app.models import Inspiration, WritingStyle, Draft
+from app.services.concept_clustering import find_cluster_duplicates
+from app.services.similarity_checker import SimilarityChecker
 from app import db
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,8 @@ class GenerationResult:
     success: bool
     error_message: Optional[str] = None
     similarity_score: Optional[float] = None
+    early_aborts: int = 0  # 유사도 초과로 중간에 버린 생성 시도 수
+    duplicate_of: Optional[int] = None  # 클러스터 멤버라 건너뛴 경우 대표 Inspiration ID
 
 
 class ContentGenerator:
@@ -37,12 +41,18 @@ class ContentGenerator:
     Fair Use를 준수하는 한국어 유머 콘텐츠를 생성합니다.
     """
 
-    def __init__(self, auto_load_model: bool = False):
+    def __init__(
+        self,
+        auto_load_model: bool = False,
+        similarity_checker: Optional[SimilarityChecker] = None
+    ):
         """
         Args:
             auto_load_model: True면 초기화 시 모델 로드
+            similarity_checker: 스트리밍 중 Fair Use 체크용 (None이면 기본 생성)
         """
         self.llm = get_llm_instance(auto_load=auto_load_model)
+        self.similarity_checker = similarity_checker or SimilarityChecker()
 
     def generate_from_inspiration(
         self,
@@ -102,6 +112,9 @@ class ContentGenerator:
         """
         원본 컨셉으로부터 콘텐츠 생성
 
+        토큰을 스트리밍하면서 원본과의 어휘적 유사도를 증분 체크하여,
+        Fair Use 기준을 확실히 넘는 초안은 끝까지 디코딩하지 않고 재샘플링합니다.
+
         Args:
             original_concept: 원본 아이디어/컨셉
             style: 유머 스타일
@@ -144,16 +157,47 @@ class ContentGenerator:
         gen_params.update(generation_kwargs)
 
         # 생성 시도
+        early_aborts = 0
         for attempt in range(max_retries + 1):
+            is_last_attempt = attempt == max_retries
             try:
                 start_time = datetime.now()
 
-                # LLM 생성
-                generated_text = self.llm.generate_with_system_prompt(
+                # LLM 스트리밍 생성 + 증분 Fair Use 체크
+                session = self.similarity_checker.incremental(original_concept)
+                stream = self.llm.generate_stream_with_system_prompt(
                     system_prompt=system_prompt,
                     user_prompt=user_prompt,
                     **gen_params
                 )
+                aborted = False
+                try:
+                    for chunk in stream:
+                        session.update(chunk)
+                        # 마지막 시도는 끝까지 생성
+                        if not is_last_attempt and session.should_abort():
+                            aborted = True
+                            break
+                finally:
+                    stream.close()
+
+                if aborted:
+                    early_aborts += 1
+                    logger.info(
+                        f"Generation attempt {attempt + 1} aborted early: lexical similarity "
+                        f"{session.lexical_similarity:.2f} after {session.char_count} chars, resampling"
+                    )
+                    continue
+
+                similarity_result = session.result()
+                if not similarity_result.is_fair_use_compliant and not is_last_attempt:
+                    logger.info(
+                        f"Generation attempt {attempt + 1} failed Fair Use check "
+                        f"({similarity_result.overall_similarity:.2f}), resampling"
+                    )
+                    continue
+
+                generated_text = session.text.strip()
 
                 end_time = datetime.now()
                 generation_time = (end_time - start_time).total_seconds()
@@ -170,12 +214,14 @@ class ContentGenerator:
                     style=style.value,
                     generation_time_sec=generation_time,
                     token_count=token_count,
-                    success=True
+                    success=True,
+                    similarity_score=similarity_result.overall_similarity,
+                    early_aborts=early_aborts
                 )
 
             except Exception as e:
                 logger.error(f"Generation attempt {attempt + 1} failed: {e}")
-                if attempt == max_retries:
+                if is_last_attempt:
                     return GenerationResult(
                         title="",
                         content="",
@@ -183,7 +229,8 @@ class ContentGenerator:
                         generation_time_sec=0.0,
                         token_count=0,
                         success=False,
-                        error_message=str(e)
+                        error_message=str(e),
+                        early_aborts=early_aborts
                     )
 
         # Should not reach here
@@ -294,6 +341,8 @@ class ContentGenerator:
                     'style': result.style,
                     'generation_time_sec': result.generation_time_sec,
                     'token_count': result.token_count,
+                    'similarity_score': result.similarity_score,
+                    'early_aborts': result.early_aborts,
                     'model': self.llm.model_name,
                     'timestamp': datetime.utcnow().isoformat()
                 }
@@ -313,22 +362,44 @@ class ContentGenerator:
         self,
         inspiration_ids: List[int],
         style: HumorStyle = HumorStyle.CASUAL,
-        use_few_shot: bool = True
+        use_few_shot: bool = True,
+        skip_cluster_duplicates: bool = True
     ) -> List[GenerationResult]:
         """
         여러 Inspiration에 대해 배치 생성
 
+        근접 중복 클러스터의 대표가 아닌 멤버는 생성하지 않고
+        duplicate_of 에 대표 ID 를 담은 실패 결과를 반환합니다.
+
         Args:
             inspiration_ids: Inspiration ID 리스트
             style: 유머 스타일
             use_few_shot: Few-shot 사용 여부
+            skip_cluster_duplicates: 클러스터 멤버 건너뛰기 여부
 
         Returns:
-            GenerationResult 리스트
+            GenerationResult 리스트 (inspiration_ids 와 같은 순서)
         """
+        duplicates = find_cluster_duplicates(inspiration_ids) if skip_cluster_duplicates else {}
+        if duplicates:
+            logger.info(f"Skipping {len(duplicates)} clustered duplicate inspirations")
+
         results = []
 
         for insp_id in inspiration_ids:
+            if insp_id in duplicates:
+                results.append(GenerationResult(
+                    title="",
+                    content="",
+                    style=style.value,
+                    generation_time_sec=0.0,
+                    token_count=0,
+                    success=False,
+                    error_message=f"Near-duplicate of inspiration {duplicates[insp_id]}",
+                    duplicate_of=duplicates[insp_id]
+                ))
+                continue
+
             result = self.generate_from_inspiration(
                 inspiration_id=insp_id,
                 style=style,
@@ -389,6 +460,8 @@ class ContentGenerator:
                 'style': result.style,
                 'generation_time_sec': result.generation_time_sec,
                 'token_count': result.token_count,
+                'similarity_score': result.similarity_score,
+                'early_aborts': result.early_aborts,
                 'model': self.llm.model_name,
                 'timestamp': datetime.utcnow().isoformat(),
                 'regenerated': True
@@ -0,0 +1,105 @@
+"""
+subreddit 별 적응형 수집 주기
+
+subreddit 마다 새 게시물(MIN_SCORE/MIN_COMMENTS 통과)이 올라오는 속도가 크게 다르므로
+실행당 새 게시물 수(yield)를 지수이동평균으로 추적하여 목표치(target_yield)에 맞도록
+수집 주기를 늘리거나 줄입니다.
+
+- 새 게시물이 목표보다 많으면 주기 단축, 적으면 연장 (한 번에 최대 2배)
+- 가져온 게시물이 모두 새 것이면(limit 도달) 놓친 게시물이 있을 수 있으므로 절반으로 단축
+- 최소/최대 주기로 제한하고, 실행 시각에 jitter 를 주어 subreddit 들이 같은 시각에 몰리지 않게 함
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config import Settings
+
+
+@dataclass
+class CrawlIntervalPolicy:
+    """수집 주기 조정 정책"""
+    default: float = 43200.0  # 수집 기록이 없을 때 주기(초)
+    minimum: float = 3600.0
+    maximum: float = 604800.0
+    target_yield: float = 3.0  # 실행당 목표 새 게시물 수
+    jitter: float = 0.1  # 주기 대비 실행 시각 흔들기 비율
+    smoothing: float = 0.5  # 지수이동평균 가중치 (최근 실행)
+    max_factor: float = 2.0  # 한 번에 늘리거나 줄이는 최대 배수
+
+    @classmethod
+    def from_settings(cls) -> 'CrawlIntervalPolicy':
+        """설정값으로 정책 생성"""
+        settings = Settings()
+        return cls(
+            default=settings.REDDIT_CRAWL_INTERVAL,
+            minimum=settings.REDDIT_CRAWL_MIN_INTERVAL,
+            maximum=settings.REDDIT_CRAWL_MAX_INTERVAL,
+            target_yield=settings.REDDIT_CRAWL_TARGET_YIELD,
+            jitter=settings.REDDIT_CRAWL_JITTER
+        )
+
+    def clamp(self, interval: float) -> int:
+        """최소/최대 주기로 제한 (트리거 비교가 안정적이도록 초 단위 정수)"""
+        return int(round(min(max(interval, self.minimum), self.maximum)))
+
+    def initial_interval(self, state=None) -> int:
+        """
+        작업 등록 시 주기
+
+        Args:
+            state: CrawlState (없으면 기본 주기)
+
+        Returns:
+            주기(초)
+        """
+        if state is not None and state.crawl_interval_sec:
+            return self.clamp(state.crawl_interval_sec)
+        return self.clamp(self.default)
+
+    def jitter_seconds(self, interval: float) -> int:
+        """실행 시각 jitter(초)"""
+        return int(interval * self.jitter)
+
+    def next_interval(self, current: Optional[float], yield_ema: float, saturated: bool) -> int:
+        """
+        다음 수집 주기 계산
+
+        Args:
+            current: 현재 주기(초, None이면 기본 주기)
+            yield_ema: 실행당 새 게시물 수 이동평균
+            saturated: 이번 실행에서 limit 만큼 모두 새 게시물이었는지
+
+        Returns:
+            주기(초)
+        """
+        if saturated:
+            factor = 1 / self.max_factor
+        elif yield_ema <= 0:
+            factor = self.max_factor
+        else:
+            factor = min(max(self.target_yield / yield_ema, 1 / self.max_factor), self.max_factor)
+        return self.clamp((current or self.default) * factor)
+
+    def update(self, state, new_count: int, limit: int) -> int:
+        """
+        수집 결과로 CrawlState 의 주기 갱신
+
+        Args:
+            state: CrawlState
+            new_count: 이번 실행의 새 게시물 수 (MIN_SCORE/MIN_COMMENTS 통과)
+            limit: 이번 실행의 수집 개수 제한
+
+        Returns:
+            새 주기(초)
+        """
+        if state.yield_ema is None:
+            state.yield_ema = float(new_count)
+        else:
+            state.yield_ema = self.smoothing * new_count + (1 - self.smoothing) * state.yield_ema
+
+        state.crawl_interval_sec = self.next_interval(
+            state.crawl_interval_sec,
+            state.yield_ema,
+            saturated=new_count >= limit
+        )
+        return state.crawl_interval_sec
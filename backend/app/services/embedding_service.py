@@ -0,0 +1,346 @@
+"""
+문장 임베딩 서비스
+
+작은 로컬 문장 임베딩 모델(기본: 다국어 MiniLM)로 텍스트를 CPU 에서 배치 인코딩하고,
+텍스트 해시 기준의 영구 캐시(SQLite 파일)에 저장합니다.
+원본 컨셉은 수집 시점에 한 번만 임베딩해 두므로, Draft 유사도 체크 시에는
+새로 생성된 텍스트만 인코딩하면 됩니다.
+
+torch / transformers 가 없거나 모델을 로드할 수 없으면 is_available() 이 False 를 반환하고,
+SimilarityChecker 는 의미적 유사도 없이 가중치를 재분배합니다.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from flask import current_app, has_app_context
+
+from app.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def text_hash(text: str) -> str:
+    """캐시 키용 텍스트 해시 (SHA-256)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    임베딩 영구 캐시
+
+    (모델 이름, 텍스트 해시) → float32 벡터를 SQLite 파일에 저장합니다.
+    WAL 모드를 사용하므로 여러 워커 프로세스가 동시에 읽고 쓸 수 있습니다.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (None이면 메모리 전용)
+        """
+        self.path = Path(path) if path else None
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), timeout=30)
+                conn.execute('PRAGMA journal_mode=WAL')
+            else:
+                conn = sqlite3.connect(':memory:')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS embeddings ('
+                ' model TEXT NOT NULL,'
+                ' text_hash TEXT NOT NULL,'
+                ' vector BLOB NOT NULL,'
+                ' PRIMARY KEY (model, text_hash))'
+            )
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        캐시 조회
+
+        Args:
+            model: 모델 이름
+            hashes: 텍스트 해시 목록
+
+        Returns:
+            {text_hash: vector} (캐시에 있는 것만)
+        """
+        found: Dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(hashes))
+        conn = self._connection()
+
+        # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = conn.execute(
+                f'SELECT text_hash, vector FROM embeddings '
+                f'WHERE model = ? AND text_hash IN ({placeholders})',
+                [model, *chunk]
+            )
+            for hash_value, blob in rows:
+                found[hash_value] = np.frombuffer(blob, dtype=np.float32)
+
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, np.ndarray]) -> None:
+        """
+        캐시 저장
+
+        Args:
+            model: 모델 이름
+            vectors: {text_hash: vector}
+        """
+        if not vectors:
+            return
+
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)',
+                [
+                    (model, hash_value, np.asarray(vector, dtype=np.float32).tobytes())
+                    for hash_value, vector in vectors.items()
+                ]
+            )
+
+
+class EmbeddingService:
+    """
+    로컬 문장 임베딩 서비스
+
+    Usage:
+        service = get_embedding_service()
+        if service.is_available():
+            vectors = service.encode([text1, text2])
+            similarity = service.similarity(text1, text2)
+    """
+
+    def __init__(
+        self,
+        model_name: str = 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2',
+        cache: Optional[EmbeddingCache] = None,
+        device: str = 'cpu',
+        batch_size: int = 32,
+        max_length: int = 256,
+        model_cache_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            model_name: HuggingFace 모델 ID
+            cache: 임베딩 캐시 (None이면 메모리 캐시)
+            device: 실행 디바이스 (기본: cpu, LLM 과 VRAM 경쟁 방지)
+            batch_size: 인코딩 배치 크기
+            max_length: 최대 토큰 길이
+            model_cache_dir: 모델 다운로드 캐시 디렉토리 (선택)
+        """
+        self.model_name = model_name
+        self.cache = cache or EmbeddingCache()
+        self.device = device
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.model_cache_dir = model_cache_dir or None
+
+        self.model = None
+        self.tokenizer = None
+        self._load_failed = False
+        self._lock = threading.Lock()
+
+    def load_model(self) -> bool:
+        """
+        임베딩 모델 로드
+
+        Returns:
+            로드 성공 여부
+        """
+        with self._lock:
+            if self.model is not None:
+                return True
+            if self._load_failed:
+                return False
+
+            try:
+                import torch  # noqa: F401
+                from transformers import AutoModel, AutoTokenizer
+
+                logger.info(f"Loading embedding model: {self.model_name}")
+                self.tokenizer = AutoTokenizer.from_pretrained(
+                    self.model_name,
+                    cache_dir=self.model_cache_dir
+                )
+                model = AutoModel.from_pretrained(
+                    self.model_name,
+                    cache_dir=self.model_cache_dir
+                )
+                self.model = model.to(self.device).eval()
+                logger.info("Embedding model loaded")
+                return True
+
+            except Exception as e:
+                logger.warning(f"Embedding model unavailable, semantic similarity disabled: {e}")
+                self._load_failed = True
+                self.model = None
+                self.tokenizer = None
+                return False
+
+    def is_available(self) -> bool:
+        """임베딩 사용 가능 여부 (필요하면 모델 로드)"""
+        return self.model is not None or self.load_model()
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        모델로 배치 인코딩 (mean pooling + L2 정규화)
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            (len(texts), dim) float32 배열
+        """
+        import torch
+
+        inputs = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors='pt'
+        ).to(self.device)
+
+        with torch.no_grad():
+            token_embeddings = self.model(**inputs).last_hidden_state
+
+        mask = inputs['attention_mask'].unsqueeze(-1).to(token_embeddings.dtype)
+        pooled = (token_embeddings * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        vectors = pooled.cpu().numpy().astype(np.float32)
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        텍스트 임베딩 (캐시 우선, 누락분만 배치 인코딩)
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            (len(texts), dim) 정규화된 float32 배열
+
+        Raises:
+            RuntimeError: 모델을 사용할 수 없을 때
+        """
+        hashes = [text_hash(text) for text in texts]
+        vectors = self.cache.get_many(self.model_name, hashes)
+
+        missing: Dict[str, str] = {}
+        for hash_value, text in zip(hashes, texts):
+            if hash_value not in vectors:
+                missing.setdefault(hash_value, text)
+
+        if missing:
+            if not self.is_available():
+                raise RuntimeError("Embedding model not available")
+
+            missing_hashes = list(missing.keys())
+            encoded: Dict[str, np.ndarray] = {}
+            for i in range(0, len(missing_hashes), self.batch_size):
+                batch_hashes = missing_hashes[i:i + self.batch_size]
+                batch_vectors = self._encode_batch([missing[h] for h in batch_hashes])
+                encoded.update(zip(batch_hashes, batch_vectors))
+
+            self.cache.put_many(self.model_name, encoded)
+            vectors.update(encoded)
+
+        return np.stack([vectors[hash_value] for hash_value in hashes])
+
+    def similarity(self, text1: str, text2: str) -> float:
+        """
+        두 텍스트의 코사인 유사도 (0.0-1.0, 음수는 0으로)
+
+        Args:
+            text1: 첫 번째 텍스트
+            text2: 두 번째 텍스트
+
+        Returns:
+            코사인 유사도
+        """
+        vectors = self.encode([text1, text2])
+        return cosine_similarity(vectors[0], vectors[1])
+
+    def pairwise_similarity(
+        self,
+        originals: Sequence[str],
+        generated: Sequence[str]
+    ) -> List[float]:
+        """
+        (원본, 생성) 쌍별 코사인 유사도 (한 번의 배치 인코딩)
+
+        Args:
+            originals: 원본 텍스트 리스트
+            generated: 생성 텍스트 리스트
+
+        Returns:
+            유사도 리스트
+        """
+        if len(originals) != len(generated):
+            raise ValueError("Original and generated lists must have same length")
+        if not originals:
+            return []
+
+        vectors = self.encode(list(originals) + list(generated))
+        left, right = vectors[:len(originals)], vectors[len(originals):]
+        scores = np.einsum('ij,ij->i', left, right)
+        return [float(s) for s in np.clip(scores, 0.0, 1.0)]
+
+
+def cosine_similarity(vector1: np.ndarray, vector2: np.ndarray) -> float:
+    """코사인 유사도 (0.0-1.0 으로 클리핑)"""
+    denominator = float(np.linalg.norm(vector1) * np.linalg.norm(vector2))
+    if denominator == 0.0:
+        return 0.0
+    return float(np.clip(np.dot(vector1, vector2) / denominator, 0.0, 1.0))
+
+
+# 글로벌 인스턴스
+_embedding_service: Optional[EmbeddingService] = None
+_embedding_lock = threading.Lock()
+
+
+def get_embedding_service() -> Optional[EmbeddingService]:
+    """
+    글로벌 임베딩 서비스 반환
+
+    Returns:
+        EmbeddingService 인스턴스 (SEMANTIC_SIMILARITY_ENABLED=False 이면 None)
+    """
+    global _embedding_service
+
+    # 앱 컨텍스트가 있으면 앱의 환경별 설정(TestingConfig 등)을 따름
+    settings = current_app.extensions['settings'] if has_app_context() else Settings()
+    if not settings.SEMANTIC_SIMILARITY_ENABLED:
+        return None
+
+    if _embedding_service is None:
+        with _embedding_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService(
+                    model_name=settings.EMBEDDING_MODEL_NAME,
+                    cache=EmbeddingCache(Path(settings.SIMILARITY_INDEX_DIR) / 'embeddings.sqlite'),
+                    device=settings.EMBEDDING_DEVICE,
+                    batch_size=settings.EMBEDDING_BATCH_SIZE,
+                    model_cache_dir=settings.LLM_CACHE_DIR
+                )
+
+    return _embedding_service
@@ -0,0 +1,353 @@
+"""
+크롤러 HTTP 응답 디스크 캐시
+
+URL 별로 검증자(ETag / Last-Modified)와 본문을 디스크에 저장하고,
+다음 수집 때 조건부 요청(If-None-Match / If-Modified-Since)을 보내
+304 Not Modified 면 본문을 다시 받지도, 파싱하지도 않게 합니다.
+검증자를 주지 않는 서버는 본문 해시가 같으면 변경 없음으로 처리합니다.
+
+캐시 전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다 (LRU).
+항목마다 <key>.json (메타데이터) 와 <key>.body (본문) 두 파일을 쓰며,
+임시 파일에 쓴 뒤 os.replace 로 교체하므로 중간에 끊겨도 깨진 항목이 남지 않습니다.
+
+통계(hit/miss 등)는 프로세스마다 증가분만 모아 두었다가 flush_stats() 에서
+파일 잠금 안에서 디스크 합계에 더합니다 (수집은 리더 워커나 격리된 자식 프로세스에서 실행).
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows (개발 환경)
+    fcntl = None
+
+from app.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목 메타데이터"""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    size: int
+    stored_at: float
+    last_used: float
+
+
+class HTTPCache:
+    """
+    크기 제한이 있는 HTTP 응답 디스크 캐시 (스레드 안전)
+
+    Example:
+        cache = HTTPCache('/var/cache/newskoo/http', max_bytes=64 * 1024 * 1024)
+        response = client.get(url, headers=cache.conditional_headers(url))
+        if response.status_code == 304:
+            cache.record_not_modified(url)
+        elif cache.is_unchanged(url, response.content):
+            ...
+        else:
+            cache.store(url, response.headers, response.content)
+    """
+
+    STATS_FILE = '_stats.json'
+    STATS_LOCK_FILE = '_stats.lock'
+    COUNTERS = ('hits', 'misses', 'not_modified', 'bytes_saved', 'evictions')
+
+    def __init__(self, directory, max_bytes: int):
+        """
+        Args:
+            directory: 캐시 디렉터리
+            max_bytes: 본문 합계 최대 크기 (바이트)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: Optional[Dict[str, CacheEntry]] = None
+        self._size = 0
+        self._stats = dict.fromkeys(self.COUNTERS, 0)  # 이 프로세스에서 아직 디스크에 더하지 않은 증가분
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(url: str) -> str:
+        """URL 을 파일 이름으로 변환"""
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _load(self) -> Dict[str, CacheEntry]:
+        """디스크의 항목 메타데이터를 한 번만 읽기"""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        for meta_path in self.directory.glob('*.json'):
+            if meta_path.name == self.STATS_FILE:
+                continue
+            try:
+                entry = CacheEntry(**json.loads(meta_path.read_text(encoding='utf-8')))
+            except (OSError, TypeError, ValueError):
+                meta_path.unlink(missing_ok=True)
+                continue
+            if not self._body_path(meta_path.stem).exists():
+                meta_path.unlink(missing_ok=True)
+                continue
+            self._entries[meta_path.stem] = entry
+            self._size += entry.size
+
+        return self._entries
+
+    def _stats_lock(self, exclusive: bool):
+        """통계 파일 잠금 (프로세스 간)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.directory / self.STATS_LOCK_FILE, 'a')
+        if fcntl is not None:  # 없으면 단일 프로세스로 가정
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return lock_file
+
+    def _read_stats(self) -> Dict[str, int]:
+        """디스크에 저장된 통계 합계 (잠금 안에서 호출)"""
+        totals = dict.fromkeys(self.COUNTERS, 0)
+        stats_path = self.directory / self.STATS_FILE
+        try:
+            stored = json.loads(stats_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return totals
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable HTTP cache stats: {e}")
+            return totals
+        for name in self.COUNTERS:
+            totals[name] += int(stored.get(name, 0))
+        return totals
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f'{key}.body'
+
+    def _write(self, path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """URL 의 캐시 항목 (없으면 None)"""
+        with self._lock:
+            return self._load().get(self.key(url))
+
+    def read_body(self, url: str) -> Optional[bytes]:
+        """캐시된 본문 (없으면 None)"""
+        with self._lock:
+            if self.get(url) is None:
+                return None
+            try:
+                return self._body_path(self.key(url)).read_bytes()
+            except OSError:
+                return None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        조건부 요청 헤더
+
+        Args:
+            url: 요청 URL
+
+        Returns:
+            If-None-Match / If-Modified-Since 헤더 (캐시 항목이 없으면 빈 dict)
+        """
+        entry = self.get(url)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def record_not_modified(self, url: str) -> None:
+        """304 응답 기록 (본문 크기만큼 절약)"""
+        with self._lock:
+            entry = self.get(url)
+            self._stats['hits'] += 1
+            self._stats['not_modified'] += 1
+            if entry is not None:
+                self._stats['bytes_saved'] += entry.size
+                self._touch(entry)
+
+    def is_unchanged(self, url: str, body: bytes) -> bool:
+        """
+        200 응답 본문이 캐시된 본문과 같은지 확인 (검증자를 주지 않는 서버용)
+
+        같으면 hit 으로, 다르거나 캐시가 없으면 miss 로 기록합니다.
+
+        Args:
+            url: 요청 URL
+            body: 응답 본문
+
+        Returns:
+            변경 없음 여부
+        """
+        with self._lock:
+            entry = self.get(url)
+            if entry is not None and entry.content_hash == hashlib.sha256(body).hexdigest():
+                self._stats['hits'] += 1
+                self._touch(entry)
+                return True
+            self._stats['misses'] += 1
+            return False
+
+    def _touch(self, entry: CacheEntry) -> None:
+        entry.last_used = time.time()
+        try:
+            self._write(self._meta_path(self.key(entry.url)), json.dumps(asdict(entry)).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Failed to update HTTP cache entry: {e}")
+
+    def store(self, url: str, headers: Mapping[str, str], body: bytes) -> bool:
+        """
+        응답 저장 (max_bytes 보다 큰 본문은 저장하지 않음)
+
+        Args:
+            url: 요청 URL
+            headers: 응답 헤더 (ETag, Last-Modified)
+            body: 응답 본문
+
+        Returns:
+            저장 여부
+        """
+        if len(body) > self.max_bytes:
+            return False
+
+        with self._lock:
+            entries = self._load()
+            key = self.key(url)
+            now = time.time()
+            entry = CacheEntry(
+                url=url,
+                etag=headers.get('etag'),
+                last_modified=headers.get('last-modified'),
+                content_hash=hashlib.sha256(body).hexdigest(),
+                size=len(body),
+                stored_at=now,
+                last_used=now
+            )
+
+            try:
+                self._write(self._body_path(key), body)
+                self._write(self._meta_path(key), json.dumps(asdict(entry)).encode('utf-8'))
+            except OSError as e:
+                logger.warning(f"Failed to write HTTP cache entry for {url}: {e}")
+                self._remove(key)
+                return False
+
+            previous = entries.get(key)
+            self._size += entry.size - (previous.size if previous else 0)
+            entries[key] = entry
+            self._evict(keep=key)
+            return True
+
+    def _remove(self, key: str) -> None:
+        entry = self._load().pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+        self._meta_path(key).unlink(missing_ok=True)
+        self._body_path(key).unlink(missing_ok=True)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """크기 제한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        if self._size <= self.max_bytes:
+            return
+
+        for key, _ in sorted(self._entries.items(), key=lambda item: item[1].last_used):
+            if self._size <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._remove(key)
+            self._stats['evictions'] += 1
+
+    def flush_stats(self) -> None:
+        """통계 증가분을 디스크 합계에 더하기 (다른 프로세스/재시작 후에도 유지)"""
+        with self._lock:
+            if not any(self._stats.values()):
+                return
+            try:
+                lock_file = self._stats_lock(exclusive=True)
+                try:
+                    totals = self._read_stats()
+                    for name, delta in self._stats.items():
+                        totals[name] += delta
+                    self._write(self.directory / self.STATS_FILE, json.dumps(totals).encode('utf-8'))
+                finally:
+                    lock_file.close()
+            except OSError as e:
+                logger.warning(f"Failed to write HTTP cache stats: {e}")
+                return
+            self._stats = dict.fromkeys(self.COUNTERS, 0)
+
+    def clear(self) -> None:
+        """모든 항목 삭제 (통계 유지)"""
+        with self._lock:
+            for key in list(self._load()):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 (다른 프로세스가 저장한 항목/통계까지 디스크에서 다시 읽음)
+
+        Returns:
+            hits, misses, not_modified, bytes_saved, evictions, hit_rate, entries, size_bytes, max_bytes
+        """
+        with self._lock:
+            self._entries, self._size = None, 0
+            entries = self._load()
+
+            lock_file = self._stats_lock(exclusive=False)
+            try:
+                totals = self._read_stats()
+            finally:
+                lock_file.close()
+            for name, delta in self._stats.items():
+                totals[name] += delta
+
+            requests = totals['hits'] + totals['misses']
+            return {
+                **totals,
+                'hit_rate': round(totals['hits'] / requests, 4) if requests else 0.0,
+                'entries': len(entries),
+                'size_bytes': self._size,
+                'max_bytes': self.max_bytes,
+            }
+
+
+# 글로벌 캐시 인스턴스
+_cache_instance: Optional[HTTPCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache:
+    """
+    글로벌 HTTP 응답 캐시 반환
+
+    Returns:
+        HTTPCache 인스턴스
+    """
+    global _cache_instance
+
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                settings = Settings()
+                _cache_instance = HTTPCache(settings.HTTP_CACHE_DIR, settings.HTTP_CACHE_MAX_BYTES)
+
+    return _cache_instance
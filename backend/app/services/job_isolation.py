@@ -0,0 +1,269 @@
+"""
+스케줄러 작업 프로세스 격리 실행
+
+크롤링처럼 오래 걸리는 작업을 웹 프로세스의 스레드가 아니라 자식 프로세스에서 실행하여
+요청 처리와 GIL/메모리를 다투지 않게 합니다.
+
+- 실행마다 새 자식 프로세스 (동시 실행 수는 max_workers 슬롯으로 제한)
+- 하드 타임아웃: 제한 시간을 넘기면 SIGKILL
+- 취소: cancel(job_id) 로 실행 중인 자식 프로세스 종료
+- 자원 사용량: os.wait4 로 자식의 CPU 시간과 최대 RSS 를 (강제 종료된 경우에도) 측정
+
+웹 워커는 스케줄러, 리더 선출, 조회수 flush, 요청 스레드가 도는 멀티스레드 프로세스라
+그대로 fork 하면 다른 스레드가 잡고 있던 잠금(인덱스 싱글톤, torch/OpenMP 스레드 풀 등)을 안은 채
+복제되어 자식이 멈출 수 있습니다. 그래서 fork 직후 exec 하는 subprocess 로
+`python -m app.services.job_isolation` 을 새로 띄우고, 자식은 백그라운드 스레드 없이 앱을 다시 만듭니다.
+작업 함수와 인자는 pickle 로 넘기므로 모듈 수준 함수여야 합니다.
+POSIX 가 아닌 플랫폼에서는 호출한 스레드에서 그대로 실행합니다.
+"""
+import logging
+import os
+import pickle
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResourceMetrics:
+    """작업 1회 실행의 자원 사용량"""
+    wall_time_sec: float
+    cpu_time_sec: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    isolated: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class IsolatedJobResult:
+    """격리 실행 결과 (스케줄러 리스너가 반환값과 자원 사용량을 분리해 기록)"""
+    value: Any
+    metrics: ResourceMetrics
+
+
+class IsolatedJobError(Exception):
+    """격리 실행 실패 (status: 'failed', 'timeout', 'cancelled')"""
+
+    def __init__(self, message: str, metrics: ResourceMetrics, status: str = 'failed'):
+        super().__init__(message)
+        self.metrics = metrics
+        self.status = status
+
+
+class ProcessJobRunner:
+    """
+    작업을 자식 프로세스에서 실행하는 실행기 (스레드 안전)
+
+    Usage:
+        runner = ProcessJobRunner(app, max_workers=2)
+        result = runner.run('reddit_collection', crawl_subreddit, args=('funny',), timeout=1800)
+        print(result.metrics.cpu_time_sec)
+    """
+
+    # 자식 프로세스 작업 디렉터리 (app 패키지를 import 할 수 있는 backend 루트)
+    ROOT = Path(__file__).resolve().parents[2]
+
+    def __init__(self, app, max_workers: int = 2):
+        """
+        Args:
+            app: Flask app instance (자식이 같은 설정 환경으로 앱을 다시 만듦)
+            max_workers: 동시에 실행할 자식 프로세스 수
+        """
+        self.app = app
+        self.max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._running: Dict[str, int] = {}  # job_id -> pid
+        self._cancelled: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """프로세스 격리 가능 여부 (POSIX: 결과 파이프 전달과 wait4 지원)"""
+        return os.name == 'posix' and hasattr(os, 'wait4')
+
+    def running(self) -> Dict[str, int]:
+        """실행 중인 작업 {job_id: pid}"""
+        with self._lock:
+            return dict(self._running)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        실행 중인 작업 취소 (자식 프로세스 종료)
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            실행 중이던 작업이 있었는지 여부
+        """
+        with self._lock:
+            pid = self._running.get(job_id)
+            if pid is None:
+                return False
+            self._cancelled.add(job_id)
+
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        logger.warning(f"Cancelled isolated job {job_id} (pid {pid})")
+        return True
+
+    def run(self, job_id: str, func: Callable[..., Any], args: Sequence[Any] = (),
+            timeout: Optional[float] = None) -> IsolatedJobResult:
+        """
+        작업 실행 (완료/타임아웃/취소까지 대기)
+
+        Args:
+            job_id: Job ID (취소 키, 같은 작업은 동시에 하나만)
+            func: 모듈 수준 작업 함수 (자식의 app context 안에서 호출, 반환값은 pickle 가능해야 함)
+            args: 작업 함수 인자 (pickle 가능해야 함)
+            timeout: 하드 타임아웃(초, None이면 제한 없음)
+
+        Returns:
+            IsolatedJobResult
+
+        Raises:
+            IsolatedJobError: 작업 예외, 타임아웃, 취소
+        """
+        if not self.available:
+            return self._run_inline(func, args)
+
+        with self._slots:
+            return self._run_subprocess(job_id, func, args, timeout)
+
+    def _run_inline(self, func: Callable[..., Any], args: Sequence[Any]) -> IsolatedJobResult:
+        """프로세스 격리를 쓸 수 없을 때 현재 스레드에서 실행"""
+        start = time.monotonic()
+        cpu_start = time.thread_time()
+        try:
+            with self.app.app_context():
+                value = func(*args)
+        except Exception as e:
+            metrics = ResourceMetrics(time.monotonic() - start, time.thread_time() - cpu_start)
+            raise IsolatedJobError(str(e), metrics) from e
+        return IsolatedJobResult(value, ResourceMetrics(time.monotonic() - start, time.thread_time() - cpu_start))
+
+    def _run_subprocess(self, job_id: str, func: Callable[..., Any], args: Sequence[Any],
+                        timeout: Optional[float]) -> IsolatedJobResult:
+        payload = pickle.dumps((self.app.config_name, func, tuple(args)))
+        read_fd, write_fd = os.pipe()
+        start = time.monotonic()
+        try:
+            # 결과는 stdout 이 아닌 전용 파이프로 받음 (작업이 print 해도 섞이지 않음)
+            process = subprocess.Popen(
+                [sys.executable, '-m', __name__, str(write_fd)],
+                stdin=subprocess.PIPE,
+                pass_fds=(write_fd,),
+                cwd=self.ROOT
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        pid = process.pid
+
+        with self._lock:
+            self._running[job_id] = pid
+        logger.info(f"Started isolated job {job_id} (pid {pid})")
+
+        chunks = []
+        timed_out = False
+        try:
+            try:
+                process.stdin.write(payload)
+                process.stdin.close()
+            except BrokenPipeError:
+                pass  # 자식이 바로 죽음 → 결과 없음으로 처리
+            deadline = start + timeout if timeout else None
+            while True:
+                wait = 1.0 if deadline is None else min(1.0, deadline - time.monotonic())
+                if wait <= 0:
+                    timed_out = True
+                    os.kill(pid, signal.SIGKILL)
+                    break
+                readable, _, _ = select.select([read_fd], [], [], wait)
+                if readable:
+                    chunk = os.read(read_fd, 65536)
+                    if not chunk:  # 자식이 결과를 쓰고 종료 (또는 강제 종료)
+                        break
+                    chunks.append(chunk)
+        finally:
+            os.close(read_fd)
+            _, status, usage = os.wait4(pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)  # 직접 회수했음을 Popen 에 알림
+            with self._lock:
+                self._running.pop(job_id, None)
+                cancelled = job_id in self._cancelled
+                self._cancelled.discard(job_id)
+
+        metrics = ResourceMetrics(
+            wall_time_sec=time.monotonic() - start,
+            cpu_time_sec=usage.ru_utime + usage.ru_stime,
+            peak_rss_mb=usage.ru_maxrss / 1024,  # Linux: KB
+            isolated=True
+        )
+
+        if timed_out:
+            raise IsolatedJobError(f"Job {job_id} exceeded timeout of {timeout}s", metrics, status='timeout')
+        if cancelled:
+            raise IsolatedJobError(f"Job {job_id} was cancelled", metrics, status='cancelled')
+
+        try:
+            outcome, payload = pickle.loads(b''.join(chunks))
+        except Exception:
+            raise IsolatedJobError(
+                f"Job {job_id} process exited without a result (status {os.waitstatus_to_exitcode(status)})",
+                metrics
+            )
+
+        if outcome != 'success':
+            raise IsolatedJobError(payload, metrics)
+        return IsolatedJobResult(payload, metrics)
+
+
+def _child_main(result_fd: int) -> int:
+    """
+    격리 작업 자식 프로세스 본체
+
+    stdin 으로 (설정 환경 이름, 작업 함수, 인자)를 받아 백그라운드 스레드 없이 만든 앱의
+    app context 안에서 실행하고, 결과를 result_fd 파이프에 pickle 로 씁니다.
+    """
+    try:
+        config_name, func, args = pickle.load(sys.stdin.buffer)
+
+        from app import create_app
+        app = create_app(config_name, background=False)
+
+        try:
+            with app.app_context():
+                result = ('success', func(*args))
+        except BaseException as e:
+            result = ('failed', f"{type(e).__name__}: {e}")
+
+        try:
+            data = pickle.dumps(result)
+        except Exception as e:
+            data = pickle.dumps(('failed', f"Job result is not picklable: {e}"))
+
+        with os.fdopen(result_fd, 'wb') as pipe:
+            pipe.write(data)
+        return 0
+    except BaseException:
+        logger.exception("Isolated job process failed")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(_child_main(int(sys.argv[1])))
@@ -0,0 +1,183 @@
+"""
+스케줄러 작업 실행 기록
+
+작업 제출 시각(실행기)과 APScheduler 완료 이벤트로 실행 기록을 만들어 메모리에 모아 두었다가
+batch_size 개가 쌓이거나 flush() 가 호출되면(리더 하트비트마다) 한 번의 bulk INSERT 로
+job_runs 테이블에 저장합니다.
+"""
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from apscheduler.executors.pool import ThreadPoolExecutor
+from sqlalchemy import insert
+
+from app import db
+from app.models import JobRun
+from app.services.job_isolation import ResourceMetrics
+
+logger = logging.getLogger(__name__)
+
+
+def to_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """타임존이 있는 시각을 DB 저장용 UTC naive 시각으로 변환"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def dump_summary(value: Any) -> Optional[str]:
+    """작업 반환값을 JSON 문자열로 변환 (직렬화할 수 없는 값은 문자열로)"""
+    if value is None:
+        return None
+    try:
+        return json.dumps(value, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        return json.dumps(str(value), ensure_ascii=False)
+
+
+class JobRunRecorder:
+    """
+    작업 실행 기록 버퍼 (스레드 안전)
+
+    Usage:
+        recorder = JobRunRecorder(app, batch_size=20, worker='host:123')
+        recorder.started('reddit_collection', scheduled_at)
+        recorder.finished('reddit_collection', scheduled_at, 'success', summary=result)
+        recorder.flush()
+    """
+
+    MAX_BUFFER = 1000  # 저장이 계속 실패할 때 보관할 최대 기록 수 (오래된 것부터 버림)
+
+    def __init__(self, app, batch_size: int = 20, worker: Optional[str] = None):
+        """
+        Args:
+            app: Flask app instance (저장 시 app context 용)
+            batch_size: 이 개수만큼 쌓이면 바로 저장
+            worker: 실행 워커 식별자 (hostname:pid)
+        """
+        self.app = app
+        self.batch_size = batch_size
+        self.worker = worker
+
+        self._started: Dict[tuple, datetime] = {}
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """저장 대기 중인 기록 수"""
+        return len(self._buffer)
+
+    def started(self, job_id: str, scheduled_at: Optional[datetime]) -> None:
+        """
+        작업 시작 시각 기억
+
+        Args:
+            job_id: Job ID
+            scheduled_at: 예정 실행 시각 (완료 이벤트와 짝을 맞추는 키)
+        """
+        with self._lock:
+            self._started[(job_id, scheduled_at)] = datetime.utcnow()
+
+    def finished(
+        self,
+        job_id: str,
+        scheduled_at: Optional[datetime],
+        status: str,
+        summary: Any = None,
+        error: Optional[str] = None,
+        metrics: Optional[ResourceMetrics] = None
+    ) -> None:
+        """
+        실행 기록 추가 (batch_size 에 도달하면 저장)
+
+        Args:
+            job_id: Job ID
+            scheduled_at: 예정 실행 시각
+            status: 'success', 'failed', 'timeout', 'cancelled', 'missed', 'skipped'
+            summary: 작업 반환값
+            error: 에러 메시지
+            metrics: 자원 사용량 (있으면 벽시계 시간도 이 값 사용)
+        """
+        finished_at = datetime.utcnow()
+
+        with self._lock:
+            started_at = self._started.pop((job_id, scheduled_at), None)
+            if metrics is not None:
+                duration = metrics.wall_time_sec
+            else:
+                duration = (finished_at - started_at).total_seconds() if started_at else None
+            self._buffer.append({
+                'job_id': job_id,
+                'status': status,
+                'scheduled_at': to_utc_naive(scheduled_at),
+                'started_at': started_at,
+                'finished_at': finished_at,
+                'duration_sec': duration,
+                'isolated': bool(metrics and metrics.isolated),
+                'cpu_time_sec': metrics.cpu_time_sec if metrics else None,
+                'peak_rss_mb': metrics.peak_rss_mb if metrics else None,
+                'summary_json': dump_summary(summary),
+                'error': error,
+                'worker': self.worker,
+                'created_at': finished_at,
+                'updated_at': finished_at
+            })
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        버퍼의 기록을 한 번에 저장
+
+        실패하면 기록을 버퍼에 되돌려 다음 flush 에서 다시 시도합니다.
+
+        Returns:
+            저장한 기록 수
+        """
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+
+        if not rows:
+            return 0
+
+        with self.app.app_context():
+            try:
+                db.session.execute(insert(JobRun), rows)
+                db.session.commit()
+                return len(rows)
+            except Exception as e:
+                db.session.rollback()
+                logger.warning(f"Failed to save {len(rows)} job runs: {e}")
+                with self._lock:
+                    self._buffer[:0] = rows
+                    del self._buffer[:-self.MAX_BUFFER]
+                return 0
+
+
+class RecordingThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    작업 시작 시각을 기록하는 스레드 풀 실행기
+
+    완료 이벤트보다 먼저 기록되도록 스케줄러 스레드에서 제출 직전에 기록합니다
+    (EVENT_JOB_SUBMITTED 는 제출 후에 발생하므로 짧은 작업은 완료가 먼저 도착할 수 있음).
+    """
+
+    def __init__(self, recorder: JobRunRecorder, max_workers: int = 10):
+        """
+        Args:
+            recorder: 실행 기록 버퍼
+            max_workers: 최대 스레드 수
+        """
+        super().__init__(max_workers)
+        self.recorder = recorder
+
+    def _do_submit_job(self, job, run_times):
+        for run_time in run_times:
+            self.recorder.started(job.id, run_time)
+        super()._do_submit_job(job, run_times)
@@ -0,0 +1,292 @@
+"""
+스냅샷 + 저널 기반 인메모리 인덱스 베이스 클래스
+
+유사도 인덱스(NearDuplicateIndex, ShingleIndex)가 공통으로 쓰는 영속화 방식:
+    - 스냅샷 파일 (pickle): 전체 상태
+    - 저널 파일 (append-only): 스냅샷 이후 추가/삭제된 문서
+삽입 시에는 저널에 한 줄만 추가하므로 비용이 O(1)이며,
+다른 워커 프로세스가 추가한 문서도 조회 시 저널을 이어 읽어 반영합니다.
+
+compact 는 새 세대(generation) 토큰을 스냅샷과 새 저널의 첫 줄에 함께 기록합니다.
+저널을 이어 읽을 때 세대가 다르면 다른 프로세스가 compact 한 것이므로 스냅샷부터 다시 읽습니다
+(새 저널이 이전 저널의 읽은 위치보다 커졌더라도 줄 중간부터 읽지 않음).
+"""
+import logging
+import os
+import pickle
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows (개발 환경)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# compact 가 쓰는 저널 첫 줄 (세대 토큰)
+GENERATION_HEADER = b'#generation\t'
+
+
+class JournaledIndex(ABC):
+    """
+    스냅샷 + 저널 영속화 베이스 클래스
+
+    하위 클래스 구현 항목:
+        _reset(): 인메모리 상태 초기화
+        _insert(key, value): 문서 추가/교체
+        _remove(key): 문서 제거
+        _encode_value(value) / _decode_value(raw): 저널용 직렬화 (bytes)
+        _snapshot_state() / _restore_state(snapshot): 스냅샷 직렬화
+    """
+
+    SNAPSHOT_VERSION = 1
+    INDEX_NAME = 'index'
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: 스냅샷 파일 경로 (None이면 메모리 전용)
+        """
+        self.path = Path(path) if path else None
+        self._journal_offset = 0
+        self._journal_generation: Optional[str] = None  # 읽고 있는 저널 세대 (스냅샷과 짝)
+        self._journal_inode: Optional[int] = None
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 하위 클래스 구현
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _insert(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _remove(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _encode_value(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _decode_value(self, raw: bytes) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _snapshot_state(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _restore_state(self, snapshot: Dict[str, Any]) -> bool:
+        """스냅샷 상태 복원 (호환되지 않으면 False)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------
+    # 영속화
+    # ------------------------------------------------------------------
+
+    @property
+    def journal_path(self) -> Optional[Path]:
+        return self.path.with_suffix(self.path.suffix + '.log') if self.path else None
+
+    @property
+    def lock_path(self) -> Optional[Path]:
+        return self.path.with_suffix(self.path.suffix + '.lock') if self.path else None
+
+    def _file_lock(self, exclusive: bool):
+        """스냅샷/저널 파일 잠금 (프로세스 간)"""
+        lock_file = open(self.lock_path, 'a')
+        if fcntl is not None:  # 없으면 단일 프로세스로 가정
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return lock_file
+
+    def _append_journal(self, entries: List[Tuple[str, Optional[Any]]]) -> None:
+        """저널에 (key, value) 기록 (value 가 None 이면 삭제)"""
+        if not self.path:
+            return
+
+        payload = ''.join(
+            f"{key}\t{self._encode_value(value).hex() if value is not None else '-'}\n"
+            for key, value in entries
+        ).encode('utf-8')
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = self._file_lock(exclusive=False)
+        try:
+            # O_APPEND + 단일 write 로 다른 프로세스의 기록과 섞이지 않게 함
+            fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, payload)
+                end = os.lseek(fd, 0, os.SEEK_CUR)
+                inode = os.fstat(fd).st_ino
+            finally:
+                os.close(fd)
+
+            # 자신이 쓴 내용은 이미 반영됨 (같은 저널의 앞부분을 모두 읽은 상태일 때만 건너뜀)
+            if inode == self._journal_inode and end - len(payload) == self._journal_offset:
+                self._journal_offset = end
+        finally:
+            lock_file.close()
+
+    def _replay_journal(self, locked: bool = False, reloaded: bool = False) -> int:
+        """
+        저널에서 아직 반영하지 않은 항목 적용
+
+        Args:
+            locked: 이미 파일 잠금을 잡고 있는지 (load/compact)
+            reloaded: 스냅샷부터 다시 읽은 뒤인지 (다시 어긋나도 재로드하지 않음)
+        """
+        journal_path = self.journal_path
+        if not journal_path or not journal_path.exists():
+            return 0
+
+        stat = journal_path.stat()
+        if stat.st_ino == self._journal_inode and stat.st_size == self._journal_offset:
+            return 0
+
+        applied = 0
+        with open(journal_path, 'rb') as journal:
+            generation, header_size = self._read_generation(journal)
+            size = os.fstat(journal.fileno()).st_size
+            if generation != self._journal_generation or size < self._journal_offset:
+                if not reloaded:
+                    # 다른 프로세스가 compact 함 → 스냅샷부터 다시 로드
+                    return self._reload(locked)
+                # 스냅샷과 짝이 맞지 않는 저널 (compact 중단, 스냅샷 삭제 등) → 저널을 그대로 읽음
+                logger.warning(f"{self.INDEX_NAME.capitalize()} journal does not match snapshot: {journal_path}")
+                self._journal_generation = generation
+
+            self._journal_inode = os.fstat(journal.fileno()).st_ino
+            self._journal_offset = max(self._journal_offset, header_size)
+            journal.seek(self._journal_offset)
+            for raw_line in journal:
+                if not raw_line.endswith(b'\n'):
+                    break  # 쓰는 중인 줄
+                try:
+                    key, _, payload = raw_line.decode('utf-8').rstrip('\n').partition('\t')
+                    value = None if payload == '-' else self._decode_value(bytes.fromhex(payload))
+                except ValueError as e:
+                    if not reloaded:
+                        logger.warning(
+                            f"Invalid {self.INDEX_NAME} journal line at {self._journal_offset}, reloading: {e}"
+                        )
+                        return self._reload(locked)
+                    logger.warning(f"Skipping invalid {self.INDEX_NAME} journal line at {self._journal_offset}")
+                    self._journal_offset += len(raw_line)
+                    continue
+
+                self._journal_offset += len(raw_line)
+                if value is None:
+                    self._remove(key)
+                else:
+                    self._insert(key, value)
+                applied += 1
+
+        return applied
+
+    def _read_generation(self, journal) -> Tuple[Optional[str], int]:
+        """저널 첫 줄의 세대 토큰과 그 줄 길이 (compact 전 저널은 (None, 0))"""
+        first_line = journal.readline()
+        if first_line.startswith(GENERATION_HEADER) and first_line.endswith(b'\n'):
+            return first_line[len(GENERATION_HEADER):-1].decode('ascii', 'replace'), len(first_line)
+        return None, 0
+
+    def _reload(self, locked: bool) -> int:
+        """스냅샷부터 다시 로드 (진행 중인 compact 가 끝난 뒤 스냅샷/저널 짝을 맞춰 읽음)"""
+        lock_file = None if locked else self._file_lock(exclusive=False)
+        try:
+            self._load_snapshot()
+            return self._replay_journal(locked=True, reloaded=True)
+        finally:
+            if lock_file:
+                lock_file.close()
+
+    def _load_snapshot(self) -> None:
+        self._reset()
+        self._journal_offset = 0
+        self._journal_generation = None
+        self._journal_inode = None
+
+        if not self.path or not self.path.exists():
+            return
+
+        with open(self.path, 'rb') as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+
+        if snapshot.get('version') != self.SNAPSHOT_VERSION or not self._restore_state(snapshot):
+            logger.warning(f"Incompatible {self.INDEX_NAME} snapshot ignored: {self.path}")
+            self._reset()
+            return
+        self._journal_generation = snapshot.get('generation')
+
+    def load(self):
+        """스냅샷 + 저널 로드"""
+        if not self.path:
+            return self
+
+        lock_file = self._file_lock(exclusive=False) if self.path.parent.exists() else None
+        try:
+            with self._lock:
+                self._load_snapshot()
+                replayed = self._replay_journal(locked=True)
+        finally:
+            if lock_file:
+                lock_file.close()
+
+        logger.info(
+            f"{self.INDEX_NAME.capitalize()} loaded: {len(self)} documents "
+            f"({replayed} from journal)"
+        )
+        return self
+
+    def sync(self) -> int:
+        """다른 프로세스가 저널에 추가한 항목 반영"""
+        if not self.path:
+            return 0
+        with self._lock:
+            return self._replay_journal()
+
+    def compact(self) -> None:
+        """현재 상태를 스냅샷으로 저장하고 새 세대의 빈 저널로 교체"""
+        if not self.path:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = self._file_lock(exclusive=True)
+        try:
+            with self._lock:
+                self._replay_journal(locked=True)
+                generation = uuid.uuid4().hex
+                snapshot = {'version': self.SNAPSHOT_VERSION, 'generation': generation, **self._snapshot_state()}
+                tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+                with open(tmp_path, 'wb') as tmp_file:
+                    pickle.dump(snapshot, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.path)
+
+                # 저널은 잘라내지 않고 새 파일로 교체 (이어 읽던 프로세스는 세대/inode 로 알아챔)
+                header = GENERATION_HEADER + generation.encode('ascii') + b'\n'
+                tmp_journal = self.journal_path.with_suffix(self.journal_path.suffix + '.tmp')
+                with open(tmp_journal, 'wb') as journal:
+                    journal.write(header)
+                os.replace(tmp_journal, self.journal_path)
+
+                self._journal_generation = generation
+                self._journal_offset = len(header)
+                self._journal_inode = os.stat(self.journal_path).st_ino
+        finally:
+            lock_file.close()
+
+        logger.info(f"{self.INDEX_NAME.capitalize()} compacted: {len(self)} documents")
@@ -0,0 +1,299 @@
+"""
+스케줄러 리더 선출
+
+gunicorn 워커마다 create_app 이 스케줄러를 만들기 때문에,
+잠금을 잡은 워커 하나만 작업을 실행하도록 리더를 선출합니다.
+
+- PostgreSQL: 세션 advisory lock (pg_try_advisory_lock)
+- 그 외 (SQLite): 같은 호스트의 파일 잠금 (fcntl.flock)
+
+두 방식 모두 프로세스가 죽으면 DB 세션/파일 디스크립터와 함께 잠금이 풀리므로,
+다른 워커가 다음 확인 주기에 잠금을 잡아 리더를 이어받습니다.
+리더는 주기마다 scheduler_leaders 테이블에 하트비트를 남겨 모든 워커가 상태를 조회할 수 있습니다.
+"""
+import logging
+import os
+import socket
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy.engine import Connection, Engine
+
+try:
+    import fcntl
+except ImportError:  # Windows (개발 환경)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLock(ABC):
+    """리더 잠금 인터페이스"""
+
+    backend = 'none'
+
+    @abstractmethod
+    def acquire(self) -> bool:
+        """잠금 시도 (블로킹하지 않음)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_held(self) -> bool:
+        """잠금을 여전히 잡고 있는지 확인"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self) -> None:
+        """잠금 해제"""
+        raise NotImplementedError
+
+
+class FileLeaderLock(LeaderLock):
+    """
+    파일 잠금 (같은 호스트의 프로세스 간)
+
+    flock 은 열린 파일마다 걸리므로 같은 프로세스 안의 두 인스턴스도 서로 배제합니다.
+    """
+
+    backend = 'file'
+
+    def __init__(self, path):
+        """
+        Args:
+            path: 잠금 파일 경로
+        """
+        self.path = Path(path)
+        self._file = None
+
+    def acquire(self) -> bool:
+        if self._file is not None:
+            return True
+
+        if fcntl is None:
+            logger.warning("fcntl unavailable, assuming single scheduler process")
+            self._file = True
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.path, 'a+')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(f"{socket.gethostname()}:{os.getpid()}\n")
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def is_held(self) -> bool:
+        return self._file is not None
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+        self._file = None
+
+
+class AdvisoryLeaderLock(LeaderLock):
+    """
+    PostgreSQL 세션 advisory lock
+
+    잠금은 전용 연결(세션)에 묶이므로 연결이 끊기면 잠금도 잃은 것으로 봅니다.
+    """
+
+    backend = 'advisory'
+
+    def __init__(self, engine: Engine, name: str):
+        """
+        Args:
+            engine: SQLAlchemy 엔진
+            name: 잠금 이름 (64비트 키로 변환)
+        """
+        self.engine = engine
+        self.key = zlib.crc32(name.encode('utf-8'))
+        self._connection: Optional[Connection] = None
+
+    def acquire(self) -> bool:
+        if self._connection is not None:
+            return True
+
+        connection = self.engine.connect()
+        try:
+            acquired = connection.exec_driver_sql(
+                f"SELECT pg_try_advisory_lock({self.key})"
+            ).scalar()
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+
+        if not acquired:
+            connection.close()
+            return False
+
+        self._connection = connection
+        return True
+
+    def is_held(self) -> bool:
+        if self._connection is None:
+            return False
+        try:
+            self._connection.exec_driver_sql("SELECT 1")
+            self._connection.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"Scheduler leader connection lost: {e}")
+            self._close()
+            return False
+
+    def release(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.exec_driver_sql(f"SELECT pg_advisory_unlock({self.key})")
+            self._connection.commit()
+        except Exception:
+            pass
+        self._close()
+
+    def _close(self) -> None:
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+
+def build_leader_lock(engine: Engine, name: str, lock_file: str) -> LeaderLock:
+    """
+    DB 종류에 맞는 리더 잠금 생성
+
+    Args:
+        engine: SQLAlchemy 엔진
+        name: 잠금 이름
+        lock_file: 파일 잠금 경로 (PostgreSQL 이 아닐 때)
+
+    Returns:
+        LeaderLock 인스턴스
+    """
+    if engine.dialect.name == 'postgresql':
+        return AdvisoryLeaderLock(engine, name)
+    return FileLeaderLock(lock_file)
+
+
+class LeaderElector:
+    """
+    주기적으로 리더 잠금을 확인하는 백그라운드 스레드
+
+    리더가 되면 on_elected, 잠금을 잃거나 멈추면 on_demoted 를 호출하고,
+    리더인 동안 주기마다 on_heartbeat 를 호출합니다.
+
+    Usage:
+        elector = LeaderElector(lock, on_elected=scheduler.resume, on_demoted=scheduler.pause)
+        elector.start()
+    """
+
+    def __init__(
+        self,
+        lock: LeaderLock,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+        on_heartbeat: Optional[Callable[['LeaderElector'], None]] = None,
+        interval: float = 15.0
+    ):
+        """
+        Args:
+            lock: 리더 잠금
+            on_elected: 리더가 되었을 때 호출
+            on_demoted: 리더에서 물러날 때 호출
+            on_heartbeat: 리더인 동안 주기마다 호출 (하트비트 기록)
+            interval: 확인 주기(초)
+        """
+        self.lock = lock
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.on_heartbeat = on_heartbeat
+        self.interval = interval
+
+        self.hostname = socket.gethostname()
+        self.pid = os.getpid()
+        self.is_leader = False
+        self.acquired_at: Optional[datetime] = None
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def identity(self) -> str:
+        """이 워커 식별자 (hostname:pid)"""
+        return f"{self.hostname}:{self.pid}"
+
+    def start(self) -> None:
+        """첫 선출을 바로 시도한 뒤 백그라운드 확인 시작"""
+        self.tick()
+        self._thread = threading.Thread(target=self._run, name='scheduler-leader', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.tick()
+
+    def tick(self) -> None:
+        """잠금 상태 한 번 확인 (리더면 잠금 유지 확인 + 하트비트, 아니면 잠금 시도)"""
+        with self._lock:
+            try:
+                if self.is_leader:
+                    if not self.lock.is_held():
+                        logger.warning(f"Scheduler leadership lost by {self.identity}")
+                        self._demote()
+                        return
+                else:
+                    if not self.lock.acquire():
+                        return
+                    try:
+                        self.on_elected()
+                    except Exception:
+                        self.lock.release()
+                        raise
+                    self.is_leader = True
+                    self.acquired_at = datetime.utcnow()
+                    logger.info(f"Scheduler leadership acquired by {self.identity}")
+            except Exception as e:
+                logger.error(f"Scheduler leader election failed: {e}", exc_info=True)
+                return
+
+            if self.on_heartbeat:
+                try:
+                    self.on_heartbeat(self)
+                except Exception as e:
+                    logger.warning(f"Failed to record scheduler heartbeat: {e}")
+
+    def _demote(self) -> None:
+        self.is_leader = False
+        self.acquired_at = None
+        try:
+            self.on_demoted()
+        finally:
+            self.lock.release()
+
+    def stop(self) -> None:
+        """확인 중지 및 리더 잠금 반환"""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval + 5)
+        with self._lock:
+            if self.is_leader:
+                logger.info(f"Scheduler leadership released by {self.identity}")
+                self._demote()
@@ -0,0 +1,160 @@
+"""
+게시물 Markdown 렌더링
+
+게시물 본문(Markdown)을 발행/수정 시점에 한 번만 sanitize 된 HTML 로 렌더링해
+posts.content_html 에 저장합니다. 요청마다 또는 클라이언트에서 렌더링하지 않습니다.
+
+- content_hash 에 렌더링한 원문의 해시를 저장해, 원문이 그대로면 다시 렌더링하지 않음
+- render_version 에 렌더러 버전을 저장, 렌더러(확장/허용 태그)를 바꾸면 RENDERER_VERSION 을
+  올리고 scripts/rerender_posts.py 로 전체 게시물을 다시 렌더링 (프로세스 풀)
+- Markdown 안의 raw HTML 과 위험한 URL(javascript: 등)은 nh3 로 제거
+"""
+import hashlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Optional
+
+import markdown
+import nh3
+from sqlalchemy import bindparam, select, update
+
+from app import db
+from app.config import Settings
+from app.models import ContentVersion, Post
+
+logger = logging.getLogger(__name__)
+
+# 렌더링 결과가 달라지는 변경(확장, 허용 태그/속성)을 하면 올림
+RENDERER_VERSION = 1
+
+MARKDOWN_EXTENSIONS = ['extra', 'sane_lists']
+
+ALLOWED_TAGS = {
+    'p', 'br', 'hr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'strong', 'em', 'b', 'i', 'del', 'sup', 'sub', 'abbr',
+    'blockquote', 'code', 'pre', 'ul', 'ol', 'li', 'dl', 'dt', 'dd',
+    'a', 'img', 'table', 'thead', 'tbody', 'tr', 'th', 'td',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'img': {'src', 'alt', 'title'},
+    'abbr': {'title'},
+    'code': {'class'},  # fenced code 언어 (language-python)
+    'th': {'align'},
+    'td': {'align'},
+}
+ALLOWED_URL_SCHEMES = {'http', 'https', 'mailto'}
+
+
+def content_hash(content: Optional[str]) -> str:
+    """원문 해시 (SHA-256 hex)"""
+    return hashlib.sha256((content or '').encode('utf-8')).hexdigest()
+
+
+def render_markdown(content: Optional[str]) -> str:
+    """
+    Markdown 을 sanitize 된 HTML 로 렌더링
+
+    Args:
+        content: Markdown 원문
+
+    Returns:
+        HTML
+    """
+    html = markdown.markdown(content or '', extensions=MARKDOWN_EXTENSIONS, output_format='html')
+    return nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes=ALLOWED_URL_SCHEMES,
+    )
+
+
+def needs_render(content: Optional[str], stored_hash: Optional[str], stored_version: Optional[int]) -> bool:
+    """원문이나 렌더러가 저장된 HTML 을 만들 때와 달라졌는지"""
+    return stored_version != RENDERER_VERSION or stored_hash != content_hash(content)
+
+
+def _render_item(item):
+    """프로세스 풀 작업 (게시물 ID, 원문) -> (게시물 ID, HTML, 해시)"""
+    post_id, content = item
+    return post_id, render_markdown(content), content_hash(content)
+
+
+def rerender_posts(force: bool = False, workers: Optional[int] = None, batch_size: int = 200,
+                   executor: Optional[Executor] = None) -> Dict[str, int]:
+    """
+    전체 게시물 다시 렌더링 (app context 안에서 호출)
+
+    렌더러 버전이나 원문 해시가 다른 게시물만 골라 프로세스 풀에서 렌더링하고,
+    배치마다 한 번의 batched UPDATE 로 저장합니다.
+
+    Args:
+        force: 해시/버전이 같아도 모두 다시 렌더링
+        workers: 프로세스 수 (None이면 MARKDOWN_RENDER_WORKERS, 0이면 CPU 코어 수)
+        batch_size: 한 번에 읽고 저장할 게시물 수
+        executor: 렌더링을 실행할 Executor (None이면 이 호출 동안 쓸 프로세스 풀 생성)
+
+    Returns:
+        {'scanned', 'rendered', 'skipped'}
+    """
+    if workers is None:
+        workers = Settings().MARKDOWN_RENDER_WORKERS
+    workers = workers or os.cpu_count() or 1
+
+    posts = Post.__table__
+    statement = update(posts).where(
+        posts.c.id == bindparam('post_id')
+    ).values(
+        content_html=bindparam('html'),
+        content_hash=bindparam('hash'),
+        render_version=RENDERER_VERSION,
+    )  # updated_at 은 onupdate 로 갱신되어 상세 ETag 가 바뀜 (목록은 배치마다 ContentVersion.bump)
+
+    # 원문 해시는 읽어서 비교해야 하므로 id 순으로 모두 훑음 (OFFSET 없이 마지막 id 다음부터)
+    query = select(posts.c.id, posts.c.content, posts.c.content_hash, posts.c.render_version).order_by(posts.c.id)
+
+    stats = {'scanned': 0, 'rendered': 0, 'skipped': 0}
+    last_id = 0
+
+    # fork 대신 spawn (스케줄러/모델이 로드된 부모 프로세스를 복제하지 않음)
+    owned = executor is None
+    if owned:
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+    try:
+        while True:
+            rows = db.session.execute(query.where(posts.c.id > last_id).limit(batch_size)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            stats['scanned'] += len(rows)
+
+            pending = [
+                (row.id, row.content) for row in rows
+                if force or needs_render(row.content, row.content_hash, row.render_version)
+            ]
+            stats['skipped'] += len(rows) - len(pending)
+            if not pending:
+                continue
+
+            chunksize = max(1, len(pending) // (workers * 4))
+            results = [
+                {'post_id': post_id, 'html': html, 'hash': digest}
+                for post_id, html, digest in executor.map(_render_item, pending, chunksize=chunksize)
+            ]
+            db.session.execute(statement, results)
+            ContentVersion.bump(db.session.connection(), [posts.name])
+            db.session.commit()
+            stats['rendered'] += len(results)
+    finally:
+        if owned:
+            executor.shutdown()
+
+    logger.info(
+        f"Re-rendered {stats['rendered']} posts "
+        f"({stats['skipped']} unchanged, {stats['scanned']} scanned, renderer v{RENDERER_VERSION})"
+    )
+    return stats
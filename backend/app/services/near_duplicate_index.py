@@ -0,0 +1,422 @@
+"""
+근접 중복(Near-duplicate) 인덱스
+
+Inspiration.original_concept 와 Post.content 의 문자 n-gram shingle 로
+MinHash 서명을 만들고, LSH(Locality Sensitive Hashing) 밴드 버킷에 저장합니다.
+전체 코퍼스를 SimilarityChecker 로 쌍별 비교(O(n²))하지 않고도
+"임계값 이상인 근접 중복 top-k" 를 서브 밀리초 단위로 조회할 수 있습니다.
+
+영속화는 JournaledIndex (스냅샷 + append-only 저널) 를 사용합니다.
+"""
+import logging
+import re
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.config import Settings
+from app.services.journaled_index import JournaledIndex
+
+logger = logging.getLogger(__name__)
+
+# MinHash 해시 파라미터 (datasketch 와 동일한 방식)
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Inspiration 컨셉 요약의 고정 라벨 (모든 문서에 공통이라 유사도를 왜곡함)
+_CONCEPT_DROP_PREFIXES = ('Context:', 'Popularity:')
+_CONCEPT_LABEL_RE = re.compile(r'^(Title|Preview):\s*')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Shingle 생성을 위한 정규화 (소문자 + 공백 제거)
+
+    SimilarityChecker._get_ngrams 와 같은 방식으로 공백을 제거합니다.
+    """
+    return ''.join((text or '').lower().split())
+
+
+def strip_concept_boilerplate(concept: str) -> str:
+    """
+    RedditCrawler 가 만든 컨셉 요약에서 라벨/부가 정보 제거
+
+    'Context: r/...', 'Popularity: ...' 줄은 모든 Inspiration 에 공통으로
+    들어가므로 지문(fingerprint)에서 제외합니다.
+
+    Args:
+        concept: Inspiration.original_concept
+
+    Returns:
+        본문만 남긴 텍스트
+    """
+    lines = []
+    for line in (concept or '').splitlines():
+        line = line.strip()
+        if not line or line.startswith(_CONCEPT_DROP_PREFIXES):
+            continue
+        lines.append(_CONCEPT_LABEL_RE.sub('', line))
+    return '\n'.join(lines)
+
+
+def shingle_hashes(text: str, n: int = 3) -> np.ndarray:
+    """
+    문자 n-gram shingle 의 32bit 해시 배열 (중복 제거)
+
+    Args:
+        text: 입력 텍스트
+        n: shingle 크기
+
+    Returns:
+        uint64 배열 (값 범위는 32bit)
+    """
+    normalized = normalize_text(text)
+    if len(normalized) < n:
+        # 짧은 텍스트는 전체를 하나의 shingle 로 취급
+        shingles = {normalized} if normalized else set()
+    else:
+        shingles = {normalized[i:i + n] for i in range(len(normalized) - n + 1)}
+
+    return np.fromiter(
+        (zlib.crc32(s.encode('utf-8')) for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+
+
+@dataclass
+class NearDuplicate:
+    """근접 중복 조회 결과"""
+    doc_type: str  # 'inspiration' 또는 'post'
+    doc_id: int
+    similarity: float  # 추정 Jaccard 유사도 (0.0-1.0)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'doc_type': self.doc_type,
+            'doc_id': self.doc_id,
+            'similarity': round(self.similarity, 4)
+        }
+
+
+class NearDuplicateIndex(JournaledIndex):
+    """
+    MinHash + LSH 근접 중복 인덱스
+
+    Usage:
+        index = get_near_duplicate_index()
+        index.add('inspiration', 12, concept_text)
+        duplicates = index.query(text, k=5, threshold=0.8)
+    """
+
+    INDEX_NAME = 'near-duplicate index'
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 3,
+        seed: int = 1
+    ):
+        """
+        Args:
+            path: 스냅샷 파일 경로 (None이면 메모리 전용)
+            num_perm: MinHash 순열 수
+            bands: LSH 밴드 수 (num_perm 의 약수여야 함)
+            shingle_size: 문자 n-gram 크기
+            seed: 해시 파라미터 시드 (스냅샷과 동일해야 함)
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        super().__init__(path)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+
+    # ------------------------------------------------------------------
+    # 서명 계산
+    # ------------------------------------------------------------------
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        텍스트의 MinHash 서명 계산
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            uint32 배열 (길이 num_perm)
+        """
+        hashes = shingle_hashes(text, self.shingle_size)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """밴드별 버킷 키"""
+        return [
+            signature[i * self.rows:(i + 1) * self.rows].tobytes()
+            for i in range(self.bands)
+        ]
+
+    @staticmethod
+    def _doc_key(doc_type: str, doc_id: int) -> str:
+        return f"{doc_type}:{doc_id}"
+
+    # ------------------------------------------------------------------
+    # 인덱스 갱신
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._signatures = {}
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def _insert(self, key: str, signature: np.ndarray) -> None:
+        self._remove(key)
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+
+    def _remove(self, key: str) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def add(self, doc_type: str, doc_id: int, text: str, persist: bool = True) -> None:
+        """
+        문서 추가 (같은 문서가 있으면 교체)
+
+        Args:
+            doc_type: 'inspiration' 또는 'post'
+            doc_id: 문서 ID
+            text: 문서 텍스트
+            persist: 저널에 기록할지 여부
+        """
+        self.add_signature(doc_type, doc_id, self.signature(text), persist=persist)
+
+    def add_signature(self, doc_type: str, doc_id: int, signature: np.ndarray, persist: bool = True) -> None:
+        """미리 계산한 서명으로 문서 추가 (같은 문서가 있으면 교체)"""
+        key = self._doc_key(doc_type, doc_id)
+        with self._lock:
+            self._insert(key, signature)
+            if persist:
+                self._append_journal([(key, signature)])
+
+    def add_many(
+        self,
+        documents: Iterable[Tuple[str, int, str]],
+        persist: bool = True
+    ) -> int:
+        """
+        여러 문서 일괄 추가 (저널 쓰기 1회)
+
+        Args:
+            documents: (doc_type, doc_id, text) 이터러블
+            persist: 저널에 기록할지 여부
+
+        Returns:
+            추가된 문서 수
+        """
+        entries = [
+            (self._doc_key(doc_type, doc_id), self.signature(text))
+            for doc_type, doc_id, text in documents
+        ]
+
+        with self._lock:
+            for key, signature in entries:
+                self._insert(key, signature)
+            if persist and entries:
+                self._append_journal(entries)
+
+        return len(entries)
+
+    def remove(self, doc_type: str, doc_id: int, persist: bool = True) -> None:
+        """문서 제거"""
+        key = self._doc_key(doc_type, doc_id)
+        with self._lock:
+            self._remove(key)
+            if persist:
+                self._append_journal([(key, None)])
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, item: Tuple[str, int]) -> bool:
+        return self._doc_key(*item) in self._signatures
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        text: str,
+        k: int = 5,
+        threshold: float = 0.8,
+        doc_type: Optional[str] = None,
+        exclude: Optional[Tuple[str, int]] = None
+    ) -> List[NearDuplicate]:
+        """
+        근접 중복 top-k 조회
+
+        Args:
+            text: 조회할 텍스트
+            k: 최대 결과 수
+            threshold: 최소 추정 Jaccard 유사도
+            doc_type: 문서 타입 필터 (None이면 전체)
+            exclude: 제외할 (doc_type, doc_id) (자기 자신 등)
+
+        Returns:
+            NearDuplicate 리스트 (유사도 내림차순)
+        """
+        self.sync()
+        return self.query_signature(
+            self.signature(text),
+            k=k,
+            threshold=threshold,
+            doc_type=doc_type,
+            exclude=exclude
+        )
+
+    def query_signature(
+        self,
+        signature: np.ndarray,
+        k: int = 5,
+        threshold: float = 0.8,
+        doc_type: Optional[str] = None,
+        exclude: Optional[Tuple[str, int]] = None
+    ) -> List[NearDuplicate]:
+        """미리 계산한 서명으로 근접 중복 조회"""
+        excluded_key = self._doc_key(*exclude) if exclude else None
+        prefix = f"{doc_type}:" if doc_type else None
+
+        with self._lock:
+            candidates: Set[str] = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                bucket = self._buckets[band].get(band_key)
+                if bucket:
+                    candidates.update(bucket)
+
+            results = []
+            for key in candidates:
+                if key == excluded_key or (prefix and not key.startswith(prefix)):
+                    continue
+                similarity = float(np.mean(self._signatures[key] == signature))
+                if similarity >= threshold:
+                    found_type, found_id = key.split(':', 1)
+                    results.append(NearDuplicate(found_type, int(found_id), similarity))
+
+        results.sort(key=lambda r: r.similarity, reverse=True)
+        return results[:k]
+
+    # ------------------------------------------------------------------
+    # 영속화
+    # ------------------------------------------------------------------
+
+    def _encode_value(self, signature: np.ndarray) -> bytes:
+        return signature.tobytes()
+
+    def _decode_value(self, raw: bytes) -> np.ndarray:
+        return np.frombuffer(raw, dtype=np.uint32).copy()
+
+    def _snapshot_state(self) -> Dict[str, object]:
+        return {
+            'num_perm': self.num_perm,
+            'seed': self.seed,
+            'shingle_size': self.shingle_size,
+            'signatures': {
+                key: signature.tobytes()
+                for key, signature in self._signatures.items()
+            }
+        }
+
+    def _restore_state(self, snapshot: Dict[str, object]) -> bool:
+        if (
+            snapshot.get('num_perm') != self.num_perm
+            or snapshot.get('seed') != self.seed
+            or snapshot.get('shingle_size') != self.shingle_size
+        ):
+            return False
+
+        for key, raw in snapshot['signatures'].items():
+            self._insert(key, self._decode_value(raw))
+        return True
+
+    def rebuild_from_database(self, batch_size: int = 1000) -> int:
+        """
+        DB의 모든 Inspiration / Post 로 인덱스 재구축 (app context 필요)
+
+        Args:
+            batch_size: 한 번에 읽을 행 수
+
+        Returns:
+            인덱싱된 문서 수
+        """
+        from app import db
+        from app.models import Inspiration, Post
+
+        with self._lock:
+            self._reset()
+
+            rows = db.session.query(Inspiration.id, Inspiration.original_concept).yield_per(batch_size)
+            self.add_many(
+                (('inspiration', insp_id, strip_concept_boilerplate(concept)) for insp_id, concept in rows),
+                persist=False
+            )
+
+            rows = db.session.query(Post.id, Post.content).yield_per(batch_size)
+            self.add_many(
+                (('post', post_id, content) for post_id, content in rows),
+                persist=False
+            )
+
+        self.compact()
+        return len(self)
+
+
+# 글로벌 인스턴스
+_index_instance: Optional[NearDuplicateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """
+    글로벌 근접 중복 인덱스 반환 (최초 호출 시 디스크에서 로드)
+
+    Returns:
+        NearDuplicateIndex 인스턴스
+    """
+    global _index_instance
+
+    if _index_instance is None:
+        with _index_lock:
+            if _index_instance is None:
+                settings = Settings()
+                _index_instance = NearDuplicateIndex(
+                    path=Path(settings.SIMILARITY_INDEX_DIR) / 'near_duplicates.pkl'
+                ).load()
+
+    return _index_instance
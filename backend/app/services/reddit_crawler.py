@@ -3,19 +3,38 @@ Reddit 영감 수집 크롤러
 
 PRAW를 사용하여 Reddit의 유머 subreddit에서 메타데이터만 수집합니다.
 Fair Use를 준수하기 위해 전문 복사는 하지 않고, URL과 요약만 저장합니다.
+
+여러 subreddit 은 스레드 풀에서 동시에 가져오고(네트워크 대기 중첩),
+DB 저장은 호출 스레드에서 가져오기가 끝난 subreddit 부터 순서대로 처리합니다.
+모든 요청은 프로세스 전체가 공유하는 토큰 버킷을 거치므로 동시성을 높여도
+Reddit API 할당량을 넘지 않습니다.
 """
+import json
 import logging
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+import threading
+import time
+from typing import Any, ClassVar, Dict, FrozenSet, Iterator, List, Optional
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import praw
+import prawcore
 from praw.models import Submission
+from requests.exceptions import Timeout
 
-from app.models import Source, Inspiration
+from app.models import CrawlState, Source, Inspiration
 from app import db
+from app.config import Settings
+from app.services.near_duplicate_index import NearDuplicateIndex, strip_concept_boilerplate
+from app.services.shingle_index import ShingleIndex
+from app.services.source_ingestion import SourceIngestor
+from app.utils.pipeline import Pipeline, Stage
+from app.utils.rate_limiter import RateLimitTimeout, TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# 스레드별 요청 마감 시각 (subreddit 단위 타임아웃)
+_request_context = threading.local()
+
 
 @dataclass
 class RedditPostMetadata:
@@ -32,6 +51,152 @@ class RedditPostMetadata:
     is_self: bool  # 텍스트 게시물 여부
     selftext: Optional[str]  # 텍스트 게시물 내용 (요약용, 저장 안함)
 
+    platform: ClassVar[str] = 'reddit'
+
+    def source_fields(self) -> Dict[str, Any]:
+        """Source 컬럼 값으로 변환"""
+        return {
+            'platform': self.platform,
+            'source_url': self.permalink,
+            'source_id': self.post_id,
+            'title': self.title,
+            'author': self.author,
+            'score': self.score,
+            'posted_at': datetime.utcfromtimestamp(self.created_utc),
+            'subreddit': self.subreddit,
+            'num_comments': self.num_comments,
+            'metadata_json': json.dumps({
+                'subreddit': self.subreddit,
+                'score': self.score,
+                'num_comments': self.num_comments,
+                'created_utc': self.created_utc,
+                'is_self': self.is_self,
+                'url': self.url  # 외부 링크 (이미지, 동영상 등)
+            })
+        }
+
+    def summarize(self) -> str:
+        """
+        핵심 컨셉 요약
+
+        Fair Use를 위해 직접 복사는 하지 않고 핵심 아이디어만 추출합니다.
+
+        Returns:
+            요약된 컨셉
+        """
+        # 제목 기반 컨셉
+        concept_parts = [f"Title: {self.title}"]
+
+        # Subreddit 컨텍스트
+        concept_parts.append(f"Context: r/{self.subreddit}")
+
+        # 텍스트 게시물이면 첫 200자만 (컨셉 이해용)
+        if self.is_self and self.selftext:
+            preview = self.selftext[:200].replace('\n', ' ').strip()
+            if len(self.selftext) > 200:
+                preview += "..."
+            concept_parts.append(f"Preview: {preview}")
+
+        # 인기도
+        concept_parts.append(f"Popularity: {self.score} upvotes, {self.num_comments} comments")
+
+        return "\n".join(concept_parts)
+
+
+@dataclass(frozen=True)
+class CrawlCursor:
+    """
+    수집 스레드에 넘기는 증분 수집 상태 스냅샷 (읽기 전용)
+
+    time_ordered 리스팅(new)은 high-water mark 보다 오래된 게시물에서 멈추고,
+    그 외 리스팅(top/hot)은 최근 본 게시물 ID 만 건너뜁니다.
+    """
+    last_created_utc: Optional[float] = None
+    seen_ids: FrozenSet[str] = frozenset()
+    time_ordered: bool = False
+
+    @classmethod
+    def from_state(cls, state: CrawlState) -> 'CrawlCursor':
+        return cls(
+            last_created_utc=state.last_created_utc,
+            seen_ids=frozenset(state.seen_ids),
+            time_ordered=state.listing == 'new'
+        )
+
+    def is_behind(self, created_utc: float) -> bool:
+        """이미 수집한 구간인지 (시간순 리스팅에서만 판단)"""
+        return (
+            self.time_ordered
+            and self.last_created_utc is not None
+            and created_utc < self.last_created_utc
+        )
+
+
+@dataclass
+class SubredditFetchResult:
+    """subreddit 하나의 가져오기 결과 (DB 저장 전)"""
+    subreddit: str
+    posts: List[RedditPostMetadata] = field(default_factory=list)
+    submissions: List[Submission] = field(default_factory=list)  # 정규화 전 리스팅 항목
+    skipped: int = 0  # 이미 본 게시물이라 건너뛴 수
+    stopped_early: bool = False  # high-water mark 에 도달해 페이징 중단
+    elapsed: float = 0.0
+    timed_out: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class _CrawlItem:
+    """수집 파이프라인 단계 사이를 흐르는 항목"""
+    subreddit: str  # 요청한 subreddit 이름 (CrawlState 키)
+    submission: Optional[Submission] = None
+    metadata: Optional[RedditPostMetadata] = None
+    concept: Optional[str] = None
+
+
+def listing_key(time_filter: str) -> str:
+    """
+    시간 필터를 CrawlState 리스팅 키로 변환
+
+    Args:
+        time_filter: 'hot', 'new' 또는 top 시간 필터
+
+    Returns:
+        'hot', 'new', 'top:day' 등
+    """
+    return time_filter if time_filter in ('hot', 'new') else f"top:{time_filter}"
+
+
+class RateLimitedRequestor(prawcore.Requestor):
+    """
+    공유 토큰 버킷을 거쳐 HTTP 요청을 보내는 PRAW Requestor
+
+    현재 스레드에 마감 시각이 설정되어 있으면 토큰 대기와 HTTP 타임아웃을
+    남은 시간으로 제한합니다.
+    """
+
+    def __init__(self, *args, rate_limiter: Optional[TokenBucket] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def request(self, *args, timeout: Optional[float] = None, **kwargs):
+        deadline = getattr(_request_context, 'deadline', None)
+        remaining = deadline - time.monotonic() if deadline is not None else None
+
+        if remaining is not None and remaining <= 0:
+            raise RateLimitTimeout('Subreddit deadline exceeded')
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(timeout=remaining)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+
+        timeout = timeout or self.timeout
+        if remaining is not None:
+            timeout = max(min(timeout, remaining), 0.001)
+
+        return super().request(*args, timeout=timeout, **kwargs)
+
 
 class RedditCrawler:
     """
@@ -57,23 +222,69 @@ class RedditCrawler:
     MIN_SCORE = 100  # 최소 100 upvotes
     MIN_COMMENTS = 10  # 최소 10 comments
 
+    # 수집 파이프라인 단계별 워커 수 (fetch 는 max_workers, 상태가 있는 dedup/fingerprint 는 1)
+    PIPELINE_WORKERS = {
+        'normalize': 1,
+        'summarize': 2,
+    }
+
     def __init__(
         self,
         client_id: str,
         client_secret: str,
-        user_agent: str = "NewsKoo/1.0"
+        user_agent: str = "NewsKoo/1.0",
+        near_duplicate_index: Optional[NearDuplicateIndex] = None,
+        shingle_index: Optional[ShingleIndex] = None,
+        oauth_url: Optional[str] = None,
+        reddit_url: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_workers: Optional[int] = None,
+        subreddit_timeout: Optional[float] = None
     ):
         """
         Args:
             client_id: Reddit API client ID
             client_secret: Reddit API client secret
             user_agent: User agent string
+            near_duplicate_index: 근접 중복 인덱스 (None이면 글로벌 인덱스)
+            shingle_index: 코퍼스 표절 체크용 역색인 (None이면 글로벌 인덱스)
+            oauth_url: API 엔드포인트 (None이면 설정값, 테스트 시 가짜 서버)
+            reddit_url: 인증 엔드포인트 (None이면 설정값)
+            rate_limiter: 요청 토큰 버킷 (None이면 프로세스 공유 버킷)
+            max_workers: 동시에 수집할 subreddit 수 (None이면 설정값)
+            subreddit_timeout: subreddit 하나 수집 제한 시간(초) (None이면 설정값)
         """
+        settings = Settings()
+
         self.client_id = client_id
         self.client_secret = client_secret
         self.user_agent = user_agent
 
+        self.oauth_url = oauth_url or settings.REDDIT_OAUTH_URL
+        self.reddit_url = reddit_url or settings.REDDIT_URL
+        self.rate_limiter = rate_limiter or get_reddit_rate_limiter()
+        self.max_workers = max(1, max_workers or settings.REDDIT_CRAWL_CONCURRENCY)
+        self.subreddit_timeout = subreddit_timeout or settings.REDDIT_SUBREDDIT_TIMEOUT
+        self.request_timeout = settings.REDDIT_REQUEST_TIMEOUT
+        self.pipeline_queue_size = settings.CRAWL_PIPELINE_QUEUE_SIZE
+        self.pipeline_batch_size = settings.CRAWL_PIPELINE_BATCH_SIZE
+
         self.reddit: Optional[praw.Reddit] = None
+        # PRAW 인스턴스는 스레드 안전하지 않으므로 수집 스레드마다 따로 생성
+        self._local = threading.local()
+
+        # 공용 저장 경로 (중복 제거, bulk INSERT, 근접 중복 필터, 임베딩)
+        self.ingestor = SourceIngestor(near_duplicate_index, shingle_index)
+
+    @property
+    def near_duplicate_index(self) -> NearDuplicateIndex:
+        """근접 중복 인덱스 (지연 로드)"""
+        return self.ingestor.near_duplicate_index
+
+    @property
+    def shingle_index(self) -> ShingleIndex:
+        """코퍼스 표절 체크용 역색인 (지연 로드)"""
+        return self.ingestor.shingle_index
 
     def connect(self) -> bool:
         """
@@ -83,12 +294,8 @@ class RedditCrawler:
             연결 성공 여부
         """
         try:
-            self.reddit = praw.Reddit(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                user_agent=self.user_agent,
-                check_for_async=False
-            )
+            self.reddit = self._create_client()
+            self._local.reddit = self.reddit
 
             # 연결 테스트
             _ = self.reddit.user.me()  # 인증되면 None 반환 (read-only)
@@ -105,6 +312,28 @@ class RedditCrawler:
         """연결 상태 확인"""
         return self.reddit is not None
 
+    def _create_client(self) -> praw.Reddit:
+        """공유 레이트 리미터를 거치는 PRAW 인스턴스 생성"""
+        return praw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent=self.user_agent,
+            oauth_url=self.oauth_url,
+            reddit_url=self.reddit_url,
+            timeout=self.request_timeout,
+            requestor_class=RateLimitedRequestor,
+            requestor_kwargs={'rate_limiter': self.rate_limiter},
+            check_for_async=False,
+            check_for_updates=False
+        )
+
+    def _client(self) -> praw.Reddit:
+        """현재 스레드용 PRAW 인스턴스"""
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = self._local.reddit = self._create_client()
+        return reddit
+
     def fetch_hot_posts(
         self,
         subreddit_name: str,
@@ -126,30 +355,133 @@ class RedditCrawler:
             logger.error("Not connected to Reddit API")
             return []
 
+        return self.fetch_subreddit(subreddit_name, limit, time_filter).posts
+
+    def fetch_subreddit(
+        self,
+        subreddit_name: str,
+        limit: int = 25,
+        time_filter: str = 'day',
+        cursor: Optional[CrawlCursor] = None
+    ) -> SubredditFetchResult:
+        """
+        subreddit 하나에서 게시물 가져오기 (DB 접근 없음, 수집 스레드에서 실행)
+
+        subreddit_timeout 을 넘기면 그때까지 가져온 게시물만 반환합니다.
+        cursor 가 있으면 이미 본 게시물은 건너뛰고, 시간순 리스팅은
+        이전 수집 지점에 도달하면 다음 페이지를 요청하지 않습니다.
+
+        Args:
+            subreddit_name: Subreddit 이름
+            limit: 가져올 게시물 수
+            time_filter: 시간 필터 ('hot'/'new' 이면 해당 리스팅)
+            cursor: 증분 수집 상태 (None이면 전체 수집)
+
+        Returns:
+            SubredditFetchResult
+        """
+        result = self.fetch_submissions(subreddit_name, limit, time_filter, cursor)
+        result.posts = [
+            metadata for metadata in map(self._normalize_submission, result.submissions)
+            if metadata is not None
+        ]
+        return result
+
+    def fetch_submissions(
+        self,
+        subreddit_name: str,
+        limit: int = 25,
+        time_filter: str = 'day',
+        cursor: Optional[CrawlCursor] = None
+    ) -> SubredditFetchResult:
+        """
+        subreddit 리스팅 항목 가져오기 (네트워크 구간만, 정규화 전)
+
+        Args:
+            subreddit_name: Subreddit 이름
+            limit: 가져올 게시물 수
+            time_filter: 시간 필터 ('hot'/'new' 이면 해당 리스팅)
+            cursor: 증분 수집 상태 (None이면 전체 수집)
+
+        Returns:
+            submissions 가 채워진 SubredditFetchResult
+        """
+        result = SubredditFetchResult(subreddit=subreddit_name)
+        started = time.monotonic()
+        deadline = started + self.subreddit_timeout
+        _request_context.deadline = deadline
+
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            posts = []
+            subreddit = self._client().subreddit(subreddit_name)
 
-            # hot 또는 top 게시물 가져오기
+            # hot / new / top 게시물 가져오기
             if time_filter == 'hot':
                 submissions = subreddit.hot(limit=limit)
+            elif time_filter == 'new':
+                submissions = subreddit.new(limit=limit)
             else:
                 submissions = subreddit.top(time_filter=time_filter, limit=limit)
 
             for submission in submissions:
-                # 메타데이터 추출
-                metadata = self._extract_metadata(submission)
+                if cursor is not None:
+                    if cursor.is_behind(submission.created_utc):
+                        # 이후는 모두 이전 실행에서 본 구간 → 페이징 중단
+                        result.stopped_early = True
+                        break
+                    if submission.id in cursor.seen_ids:
+                        result.skipped += 1
+                        continue
+
+                result.submissions.append(submission)
+
+                if time.monotonic() >= deadline:
+                    raise RateLimitTimeout('Subreddit deadline exceeded')
+
+        except RateLimitTimeout:
+            result.timed_out = True
+        except prawcore.exceptions.RequestException as e:
+            if isinstance(e.original_exception, Timeout):
+                result.timed_out = True
+            else:
+                result.error = str(e)
+        except Exception as e:
+            result.error = str(e)
+        finally:
+            _request_context.deadline = None
+            result.elapsed = time.monotonic() - started
+
+        if result.timed_out:
+            logger.warning(
+                f"Timed out fetching r/{subreddit_name} after {result.elapsed:.1f}s "
+                f"({len(result.submissions)} posts kept)"
+            )
+        elif result.error:
+            logger.error(f"Error fetching posts from r/{subreddit_name}: {result.error}")
+        else:
+            logger.info(
+                f"Fetched {len(result.submissions)} posts from r/{subreddit_name} "
+                f"({result.skipped} already seen, {result.elapsed:.2f}s)"
+            )
+
+        return result
 
-                # 필터링: 최소 인기도
-                if metadata.score >= self.MIN_SCORE and metadata.num_comments >= self.MIN_COMMENTS:
-                    posts.append(metadata)
+    def _normalize_submission(self, submission: Submission) -> Optional[RedditPostMetadata]:
+        """
+        리스팅 항목을 메타데이터로 변환 (최소 인기도 미달이면 None)
 
-            logger.info(f"Fetched {len(posts)} posts from r/{subreddit_name}")
-            return posts
+        Args:
+            submission: PRAW Submission 객체
 
-        except Exception as e:
-            logger.error(f"Error fetching posts from r/{subreddit_name}: {e}")
-            return []
+        Returns:
+            RedditPostMetadata 또는 None
+        """
+        # 메타데이터 추출
+        metadata = self._extract_metadata(submission)
+
+        # 필터링: 최소 인기도
+        if metadata.score >= self.MIN_SCORE and metadata.num_comments >= self.MIN_COMMENTS:
+            return metadata
+        return None
 
     def _extract_metadata(self, submission: Submission) -> RedditPostMetadata:
         """
@@ -202,21 +534,7 @@ class RedditCrawler:
                 return existing
 
             # Source 생성
-            source = Source.create(
-                platform='reddit',
-                source_url=metadata.permalink,
-                source_id=metadata.post_id,
-                title=metadata.title,
-                author=metadata.author,
-                metadata_json={
-                    'subreddit': metadata.subreddit,
-                    'score': metadata.score,
-                    'num_comments': metadata.num_comments,
-                    'created_utc': metadata.created_utc,
-                    'is_self': metadata.is_self,
-                    'url': metadata.url  # 외부 링크 (이미지, 동영상 등)
-                }
-            )
+            source = Source.create(**metadata.source_fields())
 
             db.session.commit()
             logger.info(f"Created Source: {source.id} ({metadata.title[:50]}...)")
@@ -234,6 +552,29 @@ class RedditCrawler:
             db.session.rollback()
             return None
 
+    def save_batch(
+        self,
+        posts: List[RedditPostMetadata],
+        create_inspirations: bool = True,
+        crawl_state: Optional[CrawlState] = None,
+        skipped: int = 0,
+        concepts: Optional[Dict[str, str]] = None
+    ) -> Dict[str, int]:
+        """
+        가져온 게시물 묶음을 한 트랜잭션으로 저장 (SourceIngestor.save_batch 참고)
+
+        Args:
+            posts: Reddit 메타데이터 리스트
+            create_inspirations: Inspiration 도 생성할지 여부
+            crawl_state: 함께 갱신할 증분 수집 상태 (선택)
+            skipped: 가져오기 단계에서 이미 본 게시물이라 건너뛴 수 (상태 기록용)
+            concepts: 미리 요약/근접 중복 판정한 {post_id: 컨셉} (None이면 여기서 계산)
+
+        Returns:
+            {'sources_created', 'inspirations_created', 'duplicates_skipped', 'near_duplicates_skipped'}
+        """
+        return self.ingestor.save_batch(posts, create_inspirations, crawl_state, skipped, concepts)
+
     def _create_inspiration_from_source(
         self,
         source: Source,
@@ -254,6 +595,21 @@ class RedditCrawler:
         try:
             # 원본 컨셉 요약 (Fair Use)
             original_concept = self._summarize_concept(metadata)
+            fingerprint_text = strip_concept_boilerplate(original_concept)
+
+            # 근접 중복 체크 (같은 유머가 여러 subreddit 에 올라오는 경우)
+            duplicates = self.near_duplicate_index.query(
+                fingerprint_text,
+                k=1,
+                threshold=self.ingestor.near_duplicate_threshold,
+                doc_type='inspiration'
+            )
+            if duplicates:
+                logger.info(
+                    f"Skipping near-duplicate inspiration for {metadata.post_id} "
+                    f"(inspiration {duplicates[0].doc_id}, {duplicates[0].similarity:.0%})"
+                )
+                return None
 
             # Inspiration 생성
             inspiration = Inspiration.create(
@@ -263,6 +619,8 @@ class RedditCrawler:
             )
 
             db.session.commit()
+
+            self.ingestor.index_documents([('inspiration', inspiration.id, original_concept)])
             return inspiration
 
         except Exception as e:
@@ -271,98 +629,165 @@ class RedditCrawler:
             return None
 
     def _summarize_concept(self, metadata: RedditPostMetadata) -> str:
-        """
-        메타데이터로부터 핵심 컨셉 요약
-
-        Fair Use를 위해 직접 복사는 하지 않고 핵심 아이디어만 추출합니다.
-
-        Args:
-            metadata: Reddit 메타데이터
-
-        Returns:
-            요약된 컨셉
-        """
-        # 제목 기반 컨셉
-        concept_parts = [f"Title: {metadata.title}"]
-
-        # Subreddit 컨텍스트
-        concept_parts.append(f"Context: r/{metadata.subreddit}")
-
-        # 텍스트 게시물이면 첫 200자만 (컨셉 이해용)
-        if metadata.is_self and metadata.selftext:
-            preview = metadata.selftext[:200].replace('\n', ' ').strip()
-            if len(metadata.selftext) > 200:
-                preview += "..."
-            concept_parts.append(f"Preview: {preview}")
-
-        # 인기도
-        concept_parts.append(f"Popularity: {metadata.score} upvotes, {metadata.num_comments} comments")
-
-        return "\n".join(concept_parts)
+        """메타데이터로부터 핵심 컨셉 요약 (RedditPostMetadata.summarize)"""
+        return metadata.summarize()
 
     def collect_from_subreddits(
         self,
         subreddit_names: Optional[List[str]] = None,
         limit_per_subreddit: int = 10,
         time_filter: str = 'day',
-        create_inspirations: bool = True
-    ) -> Dict[str, int]:
+        create_inspirations: bool = True,
+        incremental: bool = True
+    ) -> Dict[str, Any]:
         """
         여러 subreddit에서 배치 수집
 
+        fetch → normalize → dedup → summarize → fingerprint → persist 단계를
+        제한된 큐로 연결한 스트리밍 파이프라인으로 실행합니다. 가져오기는 여러 스레드에서
+        동시에, DB 저장은 호출 스레드에서 배치 단위로 처리하며 (세션/앱 컨텍스트는 스레드별),
+        저장이 느리면 큐가 차서 가져오기도 멈춥니다 (backpressure).
+        subreddit/리스팅별 CrawlState 로 이전 실행에서 본 게시물은 가져오기 단계에서 건너뜁니다.
+
         Args:
             subreddit_names: Subreddit 목록 (None이면 기본 목록)
             limit_per_subreddit: subreddit당 수집 개수
-            time_filter: 시간 필터
+            time_filter: 시간 필터 ('hot', 'new' 또는 top 시간 필터)
             create_inspirations: Inspiration도 생성할지 여부
+            incremental: 이전 수집 상태를 사용할지 여부 (False면 전체 다시 확인)
 
         Returns:
-            {'sources_created': N, 'inspirations_created': M}
+            {'sources_created': N, 'inspirations_created': M, 'duplicates_skipped': D,
+             'posts_fetched': K, 'posts_skipped': S, 'subreddits': {name: {...}},
+             'timed_out_subreddits': [...], 'failed_subreddits': [...], 'stages': [단계별 지표]}
         """
+        summary = {
+            'sources_created': 0,
+            'inspirations_created': 0,
+            'duplicates_skipped': 0,
+            'posts_fetched': 0,
+            'posts_skipped': 0,
+            'subreddits': {},
+            'timed_out_subreddits': [],
+            'failed_subreddits': [],
+            'stages': []
+        }
+
         if not self.is_connected():
             if not self.connect():
                 logger.error("Failed to connect to Reddit")
-                return {'sources_created': 0, 'inspirations_created': 0}
-
-        subreddits = subreddit_names or self.DEFAULT_SUBREDDITS
-
-        sources_created = 0
-        inspirations_created = 0
-
-        for subreddit_name in subreddits:
-            logger.info(f"Collecting from r/{subreddit_name}...")
+                return summary
+
+        subreddits = list(dict.fromkeys(subreddit_names or self.DEFAULT_SUBREDDITS))
+        max_workers = min(self.max_workers, len(subreddits))
+        logger.info(f"Collecting from {len(subreddits)} subreddits ({max_workers} concurrent)...")
+
+        # 수집 상태는 호출 스레드에서 한 번에 읽고, 수집 스레드에는 스냅샷만 전달
+        states = CrawlState.load_many(subreddits, listing_key(time_filter))
+        db.session.commit()
+        cursors = {
+            name: CrawlCursor.from_state(state) if incremental else None
+            for name, state in states.items()
+        }
 
-            # 게시물 가져오기
-            posts = self.fetch_hot_posts(
-                subreddit_name=subreddit_name,
-                limit=limit_per_subreddit,
-                time_filter=time_filter
+        fetch_results: Dict[str, SubredditFetchResult] = {}
+        normalized: Dict[str, int] = {name: 0 for name in subreddits}
+        normalized_lock = threading.Lock()
+        seen_in_run: set = set()
+        persisted: Dict[str, List[RedditPostMetadata]] = {name: [] for name in subreddits}
+        persist_failed: set = set()
+        is_new_concept = self.ingestor.near_duplicate_filter() if create_inspirations else None
+
+        def fetch(name: str) -> Iterator[_CrawlItem]:
+            fetched = self.fetch_submissions(name, limit_per_subreddit, time_filter, cursors[name])
+            fetch_results[name] = fetched
+            submissions, fetched.submissions = fetched.submissions, []
+            for submission in submissions:
+                yield _CrawlItem(subreddit=name, submission=submission)
+
+        def normalize(item: _CrawlItem) -> Iterator[_CrawlItem]:
+            item.metadata = self._normalize_submission(item.submission)
+            item.submission = None
+            if item.metadata is not None:
+                with normalized_lock:
+                    normalized[item.subreddit] += 1
+                yield item
+
+        def dedup(item: _CrawlItem) -> Iterator[_CrawlItem]:
+            # 같은 실행 안의 중복만 (DB 중복은 persist 에서 배치당 IN 쿼리 한 번)
+            if item.metadata.post_id not in seen_in_run:
+                seen_in_run.add(item.metadata.post_id)
+                yield item
+
+        def summarize(item: _CrawlItem) -> Iterator[_CrawlItem]:
+            item.concept = item.metadata.summarize()
+            yield item
+
+        def fingerprint(item: _CrawlItem) -> Iterator[_CrawlItem]:
+            if not is_new_concept(item.metadata.post_id, item.concept):
+                item.concept = None  # Source 만 저장
+            yield item
+
+        def persist(batch: List[_CrawlItem]) -> None:
+            counts = self.ingestor.try_save_batch(
+                [item.metadata for item in batch],
+                create_inspirations,
+                concepts={item.metadata.post_id: item.concept for item in batch if item.concept}
             )
+            if counts is None:
+                persist_failed.update(item.subreddit for item in batch)
+                return
+            for key in ('sources_created', 'inspirations_created', 'duplicates_skipped'):
+                summary[key] += counts[key]
+            for item in batch:
+                persisted[item.subreddit].append(item.metadata)
+
+        stages = [
+            Stage('fetch', fetch, workers=max_workers, queue_size=len(subreddits)),
+            Stage('normalize', normalize, workers=self.PIPELINE_WORKERS['normalize'], queue_size=self.pipeline_queue_size),
+            Stage('dedup', dedup, workers=1, queue_size=self.pipeline_queue_size),
+        ]
+        if create_inspirations:
+            stages += [
+                Stage('summarize', summarize, workers=self.PIPELINE_WORKERS['summarize'], queue_size=self.pipeline_queue_size),
+                Stage('fingerprint', fingerprint, workers=1, queue_size=self.pipeline_queue_size),
+            ]
+        sink = Stage('persist', persist, queue_size=self.pipeline_queue_size, batch_size=self.pipeline_batch_size)
+
+        summary['stages'] = Pipeline(stages, sink).run(subreddits)
+
+        # 수집 지점 전진 (중간에 끊겼거나 저장에 실패한 subreddit 은 그대로 둠)
+        run_at = datetime.utcnow()
+        for name in subreddits:
+            fetched = fetch_results.get(name) or SubredditFetchResult(subreddit=name, error='fetch stage failed')
+            summary['posts_fetched'] += normalized[name]
+            summary['posts_skipped'] += fetched.skipped
+            if fetched.timed_out:
+                summary['timed_out_subreddits'].append(name)
+            elif fetched.error or name in persist_failed:
+                summary['failed_subreddits'].append(name)
+            else:
+                states[name].advance(persisted[name], fetched.skipped, run_at)
 
-            # 저장
-            for post in posts:
-                source = self.save_to_database(
-                    post,
-                    create_inspiration=create_inspirations
-                )
-
-                if source:
-                    sources_created += 1
+            summary['subreddits'][name] = {
+                'new': normalized[name],
+                'skipped': fetched.skipped,
+                'stopped_early': fetched.stopped_early
+            }
+        db.session.commit()
 
-                    if create_inspirations:
-                        # Inspiration이 생성되었는지 확인
-                        if Inspiration.query.filter_by(source_id=source.id).first():
-                            inspirations_created += 1
+        # 원본 컨셉 임베딩 (Draft 유사도 체크 시 새 텍스트만 인코딩하도록)
+        self.ingestor.embed_pending_concepts()
 
         logger.info(
-            f"Collection complete: {sources_created} sources, "
-            f"{inspirations_created} inspirations"
+            f"Collection complete: {summary['sources_created']} sources, "
+            f"{summary['inspirations_created']} inspirations "
+            f"({summary['posts_skipped']} already seen, "
+            f"{len(summary['timed_out_subreddits'])} timed out, "
+            f"{len(summary['failed_subreddits'])} failed)"
         )
 
-        return {
-            'sources_created': sources_created,
-            'inspirations_created': inspirations_created
-        }
+        return summary
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -383,13 +808,13 @@ class RedditCrawler:
             Source.created_at >= yesterday
         ).count()
 
-        # Subreddit별 분포
+        # Subreddit별 분포 (idx_source_platform_subreddit 인덱스만으로 집계)
         subreddit_dist = db.session.query(
-            db.func.json_extract(Source.metadata_json, '$.subreddit').label('subreddit'),
+            Source.subreddit,
             db.func.count().label('count')
         ).filter(
             Source.platform == 'reddit'
-        ).group_by('subreddit').all()
+        ).group_by(Source.subreddit).all()
 
         return {
             'total_sources': total_sources,
@@ -401,6 +826,32 @@ class RedditCrawler:
         }
 
 
+# 프로세스 공유 레이트 리미터 (스케줄러/관리자 수집이 같은 할당량 사용)
+_rate_limiter: Optional[TokenBucket] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_reddit_rate_limiter() -> TokenBucket:
+    """
+    프로세스 공유 Reddit 요청 토큰 버킷 반환
+
+    Returns:
+        TokenBucket 인스턴스
+    """
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                settings = Settings()
+                _rate_limiter = TokenBucket.per_minute(
+                    settings.REDDIT_REQUESTS_PER_MINUTE,
+                    capacity=settings.REDDIT_RATE_LIMIT_BURST
+                )
+
+    return _rate_limiter
+
+
 # 테스트용 함수
 def test_reddit_crawler():
     """RedditCrawler 테스트"""
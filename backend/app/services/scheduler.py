@@ -2,25 +2,74 @@
 스케줄링 서비스
 
 APScheduler를 사용하여 주기적 작업을 관리합니다.
-- Reddit 크롤링
+여러 워커(gunicorn -w 4)가 각자 스케줄러를 만들어도 리더로 선출된 워커만 작업을 실행하고,
+나머지는 일시 정지 상태로 대기하다가 리더가 죽으면 이어받습니다.
+작업 정의는 DB 잡스토어(apscheduler_jobs)에, 실행 기록은 job_runs 테이블에 저장하므로
+재시작 후에도 유지되고 모든 워커가 같은 내용을 봅니다.
+SCHEDULER_ISOLATED_JOBS 의 작업은 자식 프로세스에서 하드 타임아웃과 함께 실행하고
+CPU 시간/최대 RSS 를 실행 기록에 남깁니다.
+- Reddit 크롤링 (subreddit 별 작업, 새 게시물 수에 따라 주기 자동 조정)
+- RSS/HTML 피드 수집
+- 컨셉 클러스터링 (생성 전 근접 중복 제거)
+- 공개 엔드포인트 캐시 예열 (시작 직후 전체, 이후 만료 전 갱신)
 - 콘텐츠 생성
 - 데이터 정리
 """
+import atexit
 import logging
+import os
+import socket
 from typing import Optional, Dict, List, Any
-from datetime import datetime
+from datetime import datetime, timedelta
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.job import Job
-from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED
+)
+from flask import current_app
 
 from app import db
-from app.services.reddit_crawler import RedditCrawler
+from app.models import CrawlState, JobCancelRequest, JobRun, SchedulerLeader
+from app.services.cache_warming import get_cache_warmer
+from app.services.concept_clustering import ConceptClusterer
+from app.services.crawl_schedule import CrawlIntervalPolicy
+from app.services.job_isolation import IsolatedJobResult, ProcessJobRunner
+from app.services.job_runs import JobRunRecorder, RecordingThreadPoolExecutor
+from app.services.leader_election import LeaderElector, LeaderLock, build_leader_lock
+from app.services.reddit_crawler import RedditCrawler, listing_key
+from app.services.source_connectors import ConnectorCollector, build_connectors
 from app.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# subreddit 별 수집 작업 ID 접두어 ('reddit_collection:<subreddit>')
+SUBREDDIT_JOB_PREFIX = 'reddit_collection:'
+SUBREDDIT_TIME_FILTER = 'day'
+
+
+def subreddit_job_id(subreddit: str) -> str:
+    """subreddit 수집 작업 ID"""
+    return f"{SUBREDDIT_JOB_PREFIX}{subreddit}"
+
+
+def job_family(job_id: str) -> str:
+    """작업 종류 ('reddit_collection:funny' -> 'reddit_collection', 격리/타임아웃 설정 키)"""
+    return job_id.split(':', 1)[0]
+
+
+class SharedEngineJobStore(SQLAlchemyJobStore):
+    """앱과 엔진을 공유하는 잡스토어 (스케줄러 종료 시 앱 엔진을 dispose 하지 않음)"""
+
+    def shutdown(self):
+        pass
+
 
 class SchedulerService:
     """
@@ -29,6 +78,8 @@ class SchedulerService:
     APScheduler를 사용하여 주기적 작업을 스케줄링하고 관리합니다.
     """
 
+    LEADER_LOCK_NAME = 'newskoo-scheduler'
+
     def __init__(self, app=None):
         """
         Args:
@@ -36,8 +87,9 @@ class SchedulerService:
         """
         self.scheduler: Optional[BackgroundScheduler] = None
         self.app = app
-        self._job_history: List[Dict[str, Any]] = []
-        self._max_history = 100  # 최대 기록 보관 개수
+        self.recorder: Optional[JobRunRecorder] = None
+        self.process_runner: Optional[ProcessJobRunner] = None
+        self.elector: Optional[LeaderElector] = None
 
         if app:
             self.init_app(app)
@@ -51,9 +103,20 @@ class SchedulerService:
         """
         self.app = app
 
+        # 실행 기록 (배치 저장)
+        self.recorder = JobRunRecorder(
+            app,
+            batch_size=Settings().SCHEDULER_RUN_BATCH_SIZE,
+            worker=f"{socket.gethostname()}:{os.getpid()}"
+        )
+
+        # 격리 작업용 프로세스 실행기
+        self.process_runner = ProcessJobRunner(app, max_workers=Settings().SCHEDULER_PROCESS_POOL_SIZE)
+
         # 스케줄러 생성
         self.scheduler = BackgroundScheduler(
             timezone='Asia/Seoul',
+            executors={'default': RecordingThreadPoolExecutor(self.recorder)},
             job_defaults={
                 'coalesce': True,  # 누적된 작업을 하나로 병합
                 'max_instances': 1,  # 동시 실행 방지
@@ -64,101 +127,175 @@ class SchedulerService:
         # 이벤트 리스너 등록
         self.scheduler.add_listener(
             self._job_executed_listener,
-            EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+            EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
         )
 
-        # 기본 작업 등록
-        self._register_default_jobs()
-
         logger.info("Scheduler service initialized")
 
     def _job_executed_listener(self, event):
         """
-        작업 실행 이벤트 리스너
+        작업 실행 이벤트 리스너 (실행 기록 생성)
 
         Args:
-            event: APScheduler JobExecutionEvent
+            event: APScheduler JobSubmissionEvent / JobExecutionEvent
         """
         job_id = event.job_id
-        execution_time = datetime.now()
 
-        if event.exception:
-            # 에러 발생
-            logger.error(
-                f"Job {job_id} failed at {execution_time}: {event.exception}"
+        if event.code == EVENT_JOB_MAX_INSTANCES:
+            logger.warning(f"Job {job_id} skipped: previous run still in progress")
+            for run_time in event.scheduled_run_times:
+                self.recorder.finished(job_id, run_time, 'skipped', error='Maximum running instances reached')
+            return
+
+        if event.code == EVENT_JOB_MISSED:
+            logger.warning(f"Job {job_id} missed its run time {event.scheduled_run_time}")
+            self.recorder.finished(job_id, event.scheduled_run_time, 'missed')
+        elif event.exception:
+            # 격리 실행 실패는 상태(timeout, cancelled)와 자원 사용량을 함께 전달
+            status = getattr(event.exception, 'status', 'failed')
+            logger.error(f"Job {job_id} {status}: {event.exception}")
+            self.recorder.finished(
+                job_id, event.scheduled_run_time, status,
+                error=str(event.exception),
+                metrics=getattr(event.exception, 'metrics', None)
             )
-            status = 'failed'
-            error_message = str(event.exception)
         else:
-            # 성공
-            logger.info(f"Job {job_id} completed at {execution_time}")
-            status = 'success'
-            error_message = None
-
-        # 히스토리 기록
-        self._add_to_history(
-            job_id=job_id,
-            status=status,
-            execution_time=execution_time,
-            error_message=error_message,
-            return_value=event.retval if not event.exception else None
-        )
+            logger.info(f"Job {job_id} completed")
+            summary, metrics = event.retval, None
+            if isinstance(summary, IsolatedJobResult):
+                summary, metrics = summary.value, summary.metrics
+            self.recorder.finished(job_id, event.scheduled_run_time, 'success', summary=summary, metrics=metrics)
 
-    def _add_to_history(
-        self,
-        job_id: str,
-        status: str,
-        execution_time: datetime,
-        error_message: Optional[str] = None,
-        return_value: Any = None
-    ):
+    def _execute(self, job_id: str, method_name: str, *args) -> Any:
         """
-        작업 히스토리 추가
+        작업 실행 (SCHEDULER_ISOLATED_JOBS 면 자식 프로세스에서)
 
         Args:
-            job_id: Job ID
-            status: 상태 ('success', 'failed')
-            execution_time: 실행 시간
-            error_message: 에러 메시지 (실패 시)
-            return_value: 반환 값 (성공 시)
-        """
-        history_entry = {
-            'job_id': job_id,
-            'status': status,
-            'execution_time': execution_time.isoformat(),
-            'error_message': error_message,
-            'return_value': return_value
-        }
+            job_id: Job ID (격리/타임아웃 설정은 작업 종류 기준)
+            method_name: 실행할 SchedulerService 메서드 이름
+            *args: 메서드 인자
 
-        self._job_history.append(history_entry)
+        Returns:
+            작업 반환값 (격리 실행이면 IsolatedJobResult)
+        """
+        settings = Settings()
+        family = job_family(job_id)
+
+        if family not in settings.SCHEDULER_ISOLATED_JOBS:
+            return getattr(self, method_name)(*args)
+
+        timeout = settings.SCHEDULER_JOB_TIMEOUTS.get(family, settings.SCHEDULER_JOB_TIMEOUT)
+        return self.process_runner.run(job_id, run_isolated_method, args=(method_name, *args), timeout=timeout)
+
+    def cancel_job_run(self, job_id: str) -> bool:
+        """
+        실행 중인 격리 작업 취소 (이 워커에서 실행 중일 때만)
+
+        다른 워커는 JobCancelRequest 로 요청을 남기고, 리더가 하트비트마다 이 메서드로 처리합니다.
+
+        Args:
+            job_id: Job ID
 
-        # 최대 개수 초과 시 오래된 것 삭제
-        if len(self._job_history) > self._max_history:
-            self._job_history = self._job_history[-self._max_history:]
+        Returns:
+            취소 여부
+        """
+        if not self.process_runner:
+            return False
+        return self.process_runner.cancel(job_id)
 
     def _register_default_jobs(self):
         """기본 작업 등록"""
-        # Reddit 크롤링 (하루 2회: 오전 9시, 오후 9시)
+        # Reddit 크롤링 (subreddit 별 적응형 주기)
+        self._register_subreddit_jobs(RedditCrawler.DEFAULT_SUBREDDITS)
+
+        # 피드 수집 (설정된 피드가 있을 때만, 3시간마다)
+        if Settings().FEED_SOURCES:
+            self.add_job(
+                func=feed_collection_job,
+                trigger='interval',
+                hours=3,
+                job_id='feed_collection',
+                name='Feed Inspiration Collection',
+                replace_existing=True
+            )
+        elif self.scheduler.get_job('feed_collection'):
+            self.remove_job('feed_collection')
+
+        # 컨셉 클러스터링 (매시 30분, 수집 직후 생성 대상 정리)
         self.add_job(
-            func=self._reddit_collection_job,
+            func=concept_clustering_job,
             trigger='cron',
-            hour='9,21',  # 09:00, 21:00
-            minute='0',
-            job_id='reddit_collection',
-            name='Reddit Inspiration Collection',
+            minute='30',
+            job_id='concept_clustering',
+            name='Inspiration Concept Clustering',
+            replace_existing=True
+        )
+
+        # 캐시 예열 (다음 실행 전에 만료될 항목 갱신)
+        self.add_job(
+            func=cache_warming_job,
+            trigger='interval',
+            seconds=Settings().CACHE_WARM_INTERVAL,
+            job_id='cache_warming',
+            name='Public Cache Warming',
             replace_existing=True
         )
 
         logger.info("Default jobs registered")
 
-    def _reddit_collection_job(self) -> Dict[str, Any]:
+    def _register_subreddit_jobs(self, subreddits: List[str]):
+        """
+        subreddit 별 수집 작업 등록
+
+        주기는 CrawlState 에 저장된 적응형 주기를 이어 쓰고, 새로 등록하는 작업은 첫 실행을
+        최소 주기 안에 고르게 나눠 subreddit 들이 한꺼번에 수집되지 않게 합니다.
+        목록에서 빠진 subreddit 의 작업은 제거합니다.
+
+        Args:
+            subreddits: subreddit 이름 리스트
         """
-        Reddit 수집 작업
+        policy = CrawlIntervalPolicy.from_settings()
+        with self.app.app_context():
+            states = {
+                state.subreddit: state
+                for state in CrawlState.query.filter(
+                    CrawlState.platform == 'reddit',
+                    CrawlState.listing == listing_key(SUBREDDIT_TIME_FILTER),
+                    CrawlState.subreddit.in_(subreddits)
+                )
+            }
+
+        wanted = {subreddit_job_id(name) for name in subreddits}
+        for job in self.scheduler.get_jobs():
+            if job.id.startswith(SUBREDDIT_JOB_PREFIX) and job.id not in wanted:
+                self.remove_job(job.id)
+
+        now = datetime.now(self.scheduler.timezone)
+        for index, name in enumerate(subreddits):
+            interval = policy.initial_interval(states.get(name))
+            self.add_job(
+                func=subreddit_collection_job,
+                trigger='interval',
+                args=(name,),
+                seconds=interval,
+                jitter=policy.jitter_seconds(interval),
+                start_date=now + timedelta(seconds=policy.minimum * (index + 1) / len(subreddits)),
+                job_id=subreddit_job_id(name),
+                name=f'Reddit Collection (r/{name})',
+                replace_existing=True
+            )
+
+    def _subreddit_collection_job(self, subreddit: str) -> Dict[str, Any]:
+        """
+        subreddit 하나 수집 후 새 게시물 수로 다음 수집 주기 조정
+
+        Args:
+            subreddit: subreddit 이름
 
         Returns:
-            작업 결과 딕셔너리
+            작업 결과 딕셔너리 (interval_sec: 다음 주기, 실패 시 None)
         """
-        logger.info("Starting Reddit collection job...")
+        logger.info(f"Starting Reddit collection job for r/{subreddit}...")
 
         try:
             # Flask app context 필요
@@ -174,44 +311,227 @@ class SchedulerService:
                 if not crawler.connect():
                     raise Exception("Failed to connect to Reddit API")
 
-                # 배치 수집
+                limit = settings.REDDIT_CRAWL_LIMIT
                 result = crawler.collect_from_subreddits(
-                    subreddit_names=None,  # 기본 subreddit 사용
-                    limit_per_subreddit=10,
-                    time_filter='day',
+                    subreddit_names=[subreddit],
+                    limit_per_subreddit=limit,
+                    time_filter=SUBREDDIT_TIME_FILTER,
                     create_inspirations=True
                 )
 
+                # 중간에 끊긴 실행은 새 게시물 수를 알 수 없으므로 주기 유지
+                interval = None
+                new_count = result['subreddits'].get(subreddit, {}).get('new', 0)
+                if subreddit not in result['timed_out_subreddits'] + result['failed_subreddits']:
+                    state = CrawlState.load_many([subreddit], listing_key(SUBREDDIT_TIME_FILTER))[subreddit]
+                    interval = CrawlIntervalPolicy.from_settings().update(state, new_count, limit)
+                    db.session.commit()
+
                 logger.info(
-                    f"Reddit collection completed: "
-                    f"{result['sources_created']} sources, "
-                    f"{result['inspirations_created']} inspirations"
+                    f"Reddit collection completed for r/{subreddit}: "
+                    f"{new_count} new posts, next interval {interval}s"
                 )
 
                 return {
                     'success': True,
+                    'subreddit': subreddit,
+                    'new_posts': new_count,
                     'sources_created': result['sources_created'],
                     'inspirations_created': result['inspirations_created'],
+                    'posts_skipped': result['posts_skipped'],
+                    'timed_out': subreddit in result['timed_out_subreddits'],
+                    'failed': subreddit in result['failed_subreddits'],
+                    'interval_sec': interval,
                     'timestamp': datetime.now().isoformat()
                 }
 
         except Exception as e:
-            logger.error(f"Reddit collection job failed: {e}", exc_info=True)
+            logger.error(f"Reddit collection job for r/{subreddit} failed: {e}", exc_info=True)
             raise
 
-    def start(self):
-        """스케줄러 시작"""
-        if self.scheduler and not self.scheduler.running:
-            self.scheduler.start()
-            logger.info("Scheduler started")
+    def _reschedule_subreddit_job(self, subreddit: str, result: Any) -> None:
+        """
+        수집 결과의 주기로 subreddit 작업 트리거 교체 (주기가 바뀐 경우만)
+
+        Args:
+            subreddit: subreddit 이름
+            result: _subreddit_collection_job 반환값 (격리 실행이면 IsolatedJobResult)
+        """
+        if isinstance(result, IsolatedJobResult):
+            result = result.value
+        interval = (result or {}).get('interval_sec')
+        job = self.scheduler.get_job(subreddit_job_id(subreddit))
+        if not interval or job is None or job.trigger.interval_length == interval:
+            return
+
+        policy = CrawlIntervalPolicy.from_settings()
+        self.scheduler.reschedule_job(
+            job.id,
+            trigger=IntervalTrigger(
+                seconds=interval,
+                jitter=policy.jitter_seconds(interval),
+                timezone=self.scheduler.timezone
+            )
+        )
+        logger.info(f"Rescheduled {job.id}: every {interval}s (was {int(job.trigger.interval_length)}s)")
+
+    def _feed_collection_job(self) -> Dict[str, Any]:
+        """
+        RSS/HTML 피드 수집 작업
+
+        Returns:
+            작업 결과 딕셔너리
+        """
+        logger.info("Starting feed collection job...")
+
+        try:
+            with self.app.app_context():
+                collector = ConnectorCollector(build_connectors(Settings().FEED_SOURCES))
+                result = collector.collect(create_inspirations=True)
+
+                return {
+                    'success': True,
+                    'sources_created': result['sources_created'],
+                    'inspirations_created': result['inspirations_created'],
+                    'entries_fetched': result['entries_fetched'],
+                    'failed_connectors': result['failed_connectors'],
+                    'timestamp': datetime.now().isoformat()
+                }
+
+        except Exception as e:
+            logger.error(f"Feed collection job failed: {e}", exc_info=True)
+            raise
+
+    def _concept_clustering_job(self) -> Dict[str, Any]:
+        """
+        컨셉 클러스터링 작업
+
+        Returns:
+            작업 결과 딕셔너리
+        """
+        logger.info("Starting concept clustering job...")
+
+        try:
+            with self.app.app_context():
+                result = ConceptClusterer().cluster()
+
+                return {
+                    'success': True,
+                    **result,
+                    'timestamp': datetime.now().isoformat()
+                }
+
+        except Exception as e:
+            logger.error(f"Concept clustering job failed: {e}", exc_info=True)
+            raise
+
+    def _cache_warming_job(self) -> Dict[str, Any]:
+        """
+        캐시 예열 작업 (다음 실행 전에 만료될 항목만, 프로세스의 첫 실행은 전체)
+
+        Returns:
+            예열 결과 (대상별 예열 키 수, 소요 시간)
+        """
+        # 실행 간격이 흔들려도 만료 전에 갱신되도록 주기의 1.5배 안에 만료될 항목을 채움
+        horizon = Settings().CACHE_WARM_INTERVAL * 1.5
+        return get_cache_warmer(self.app).warm(horizon=horizon)
+
+    def start(self, lock: Optional[LeaderLock] = None):
+        """
+        스케줄러 시작
+
+        일시 정지 상태로 시작하고, 리더로 선출되면 작업 실행을 재개합니다.
+
+        Args:
+            lock: 리더 잠금 (None이면 DB 종류에 맞게 생성)
+        """
+        if not self.scheduler or self.scheduler.running:
+            return
+
+        settings = Settings()
+        with self.app.app_context():
+            engine = db.engine
+
+        # 작업 정의를 DB 에 저장 (모든 워커가 공유, 재시작 후에도 유지)
+        self.scheduler.add_jobstore(SharedEngineJobStore(engine=engine), 'default')
+        self.scheduler.start(paused=True)
+        self._register_default_jobs()
+
+        if lock is None:
+            lock = build_leader_lock(engine, self.LEADER_LOCK_NAME, settings.SCHEDULER_LOCK_FILE)
+
+        self.elector = LeaderElector(
+            lock,
+            on_elected=self.scheduler.resume,
+            on_demoted=self.scheduler.pause,
+            on_heartbeat=self._record_heartbeat,
+            interval=Settings().SCHEDULER_LEADER_INTERVAL
+        )
+        self.elector.start()
+        logger.info(f"Scheduler started ({'leader' if self.is_leader else 'standby'})")
+
+    def _record_heartbeat(self, elector: LeaderElector):
+        """
+        리더 하트비트 기록 (다른 워커의 상태 조회용)
+
+        모아 둔 실행 기록도 저장하고, 다른 워커가 잡스토어에서 바꾼 작업
+        (즉시 실행, 일시 정지 등)을 반영하도록 스케줄러를 깨웁니다.
+        다른 워커가 남긴 취소 요청도 여기서 처리합니다.
+        """
+        self.recorder.flush()
+        self.scheduler.wakeup()
+
+        with self.app.app_context():
+            try:
+                SchedulerLeader.record_heartbeat(
+                    name=self.LEADER_LOCK_NAME,
+                    hostname=elector.hostname,
+                    pid=elector.pid,
+                    lock_backend=elector.lock.backend,
+                    acquired_at=elector.acquired_at
+                )
+                for job_id in JobCancelRequest.take_all():
+                    if not self.cancel_job_run(job_id):
+                        logger.info(f"Cancel request for {job_id} ignored: not running")
+            except Exception:
+                db.session.rollback()
+                raise
+
+    @property
+    def is_leader(self) -> bool:
+        """이 워커가 작업을 실행하는 리더인지"""
+        return self.elector is not None and self.elector.is_leader
+
+    def get_leader_status(self) -> Dict[str, Any]:
+        """
+        리더 상태 (어느 워커에서 호출해도 같은 리더 정보)
+
+        Returns:
+            {'is_leader', 'worker', 'leader'} (leader 는 하트비트 기록, 없으면 None)
+        """
+        interval = self.elector.interval if self.elector else Settings().SCHEDULER_LEADER_INTERVAL
+        leader = SchedulerLeader.query.filter_by(name=self.LEADER_LOCK_NAME).first()
+
+        return {
+            'is_leader': self.is_leader,
+            'worker': self.elector.identity if self.elector else None,
+            'leader': leader.to_dict(interval=interval) if leader else None
+        }
 
     def shutdown(self, wait: bool = True):
         """
-        스케줄러 종료
+        스케줄러 종료 (리더 잠금 반환)
 
         Args:
             wait: 실행 중인 작업 완료 대기 여부
         """
+        if self.elector:
+            self.elector.stop()
+            self.elector = None
+
+        if self.recorder:
+            self.recorder.flush()
+
         if self.scheduler and self.scheduler.running:
             self.scheduler.shutdown(wait=wait)
             logger.info("Scheduler shut down")
@@ -223,6 +543,7 @@ class SchedulerService:
         job_id: str,
         name: str,
         replace_existing: bool = False,
+        args: Optional[tuple] = None,
         **trigger_kwargs
     ) -> Optional[Job]:
         """
@@ -233,7 +554,9 @@ class SchedulerService:
             trigger: 트리거 타입 ('cron', 'interval', 'date')
             job_id: Job ID (유니크)
             name: Job 이름
-            replace_existing: 기존 작업 교체 여부
+            replace_existing: 기존 작업 교체 여부 (이름과 트리거가 같으면 교체하지 않고
+                              일시 정지 상태와 다음 실행 시각을 유지)
+            args: 작업 함수 인자
             **trigger_kwargs: 트리거 파라미터 (hour, minute 등)
 
         Returns:
@@ -252,10 +575,17 @@ class SchedulerService:
             else:
                 raise ValueError(f"Unsupported trigger type: {trigger}")
 
+            # 잡스토어에 같은 정의가 있으면 유지 (워커 재시작마다 상태가 초기화되지 않도록)
+            existing = self.scheduler.get_job(job_id) if replace_existing else None
+            if (existing and existing.name == name and existing.args == tuple(args or ())
+                    and str(existing.trigger) == str(trigger_obj)):
+                return existing
+
             # 작업 추가
             job = self.scheduler.add_job(
                 func=func,
                 trigger=trigger_obj,
+                args=args,
                 id=job_id,
                 name=name,
                 replace_existing=replace_existing
@@ -350,7 +680,7 @@ class SchedulerService:
                 logger.error(f"Job not found: {job_id}")
                 return False
 
-            job.modify(next_run_time=datetime.now())
+            job.modify(next_run_time=datetime.now(self.scheduler.timezone))
             logger.info(f"Job scheduled to run now: {job_id}")
             return True
         except Exception as e:
@@ -367,6 +697,9 @@ class SchedulerService:
         if not self.scheduler:
             return []
 
+        isolated = set(Settings().SCHEDULER_ISOLATED_JOBS)
+        running = self.process_runner.running() if self.process_runner else {}
+
         jobs = []
         for job in self.scheduler.get_jobs():
             jobs.append({
@@ -374,7 +707,9 @@ class SchedulerService:
                 'name': job.name,
                 'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
                 'trigger': str(job.trigger),
-                'pending': job.pending
+                'pending': job.pending,
+                'isolated': job_family(job.id) in isolated,
+                'running_pid': running.get(job.id)  # 이 워커에서 실행 중인 자식 프로세스
             })
 
         return jobs
@@ -382,32 +717,30 @@ class SchedulerService:
     def get_job_history(
         self,
         job_id: Optional[str] = None,
+        status: Optional[str] = None,
+        before_id: Optional[int] = None,
         limit: int = 20
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, Any]:
         """
-        작업 히스토리 조회
+        작업 실행 기록 조회 (최신순 커서 페이지)
 
         Args:
             job_id: Job ID (None이면 전체)
+            status: 상태 필터 (None이면 전체)
+            before_id: 이전 페이지의 next_cursor
             limit: 최대 개수
 
         Returns:
-            히스토리 리스트 (최신순)
+            {'history': 기록 리스트, 'next_cursor': 다음 페이지 커서 또는 None}
         """
-        history = self._job_history
-
-        # 필터링
-        if job_id:
-            history = [h for h in history if h['job_id'] == job_id]
+        if self.recorder:
+            self.recorder.flush()
 
-        # 최신순 정렬 및 제한
-        history = sorted(
-            history,
-            key=lambda x: x['execution_time'],
-            reverse=True
-        )[:limit]
-
-        return history
+        runs, next_cursor = JobRun.page(job_id=job_id, status=status, before_id=before_id, limit=limit)
+        return {
+            'history': [run.to_dict() for run in runs],
+            'next_cursor': next_cursor
+        }
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -419,6 +752,7 @@ class SchedulerService:
         if not self.scheduler:
             return {
                 'running': False,
+                'is_leader': False,
                 'total_jobs': 0,
                 'active_jobs': 0
             }
@@ -426,25 +760,16 @@ class SchedulerService:
         jobs = self.scheduler.get_jobs()
 
         # 최근 24시간 실행 횟수
-        from datetime import timedelta
-        yesterday = datetime.now() - timedelta(days=1)
-
-        recent_executions = [
-            h for h in self._job_history
-            if datetime.fromisoformat(h['execution_time']) >= yesterday
-        ]
-
-        success_count = sum(1 for h in recent_executions if h['status'] == 'success')
-        failed_count = sum(1 for h in recent_executions if h['status'] == 'failed')
+        recent = JobRun.count_by_status(datetime.utcnow() - timedelta(days=1))
 
         return {
-            'running': self.scheduler.running,
+            'running': self.scheduler.state == STATE_RUNNING,  # 대기 워커는 일시 정지 상태
+            'is_leader': self.is_leader,
             'total_jobs': len(jobs),
             'active_jobs': sum(1 for j in jobs if not j.pending),
             'recent_24h': {
-                'total': len(recent_executions),
-                'success': success_count,
-                'failed': failed_count
+                'total': sum(recent.values()),
+                **{status: recent.get(status, 0) for status in JobRun.STATUSES}
             }
         }
 
@@ -468,6 +793,11 @@ def init_scheduler(app) -> SchedulerService:
     if _scheduler_instance is None:
         _scheduler_instance = SchedulerService(app)
         _scheduler_instance.start()
+        # 배포/재시작 직후의 빈 캐시를 바로 예열 (리더 워커에서)
+        if _scheduler_instance.is_leader:
+            _scheduler_instance.run_job_now('cache_warming')
+        # 워커 종료 시 리더 잠금을 바로 반환하여 다른 워커가 이어받도록
+        atexit.register(_scheduler_instance.shutdown, wait=False)
 
     return _scheduler_instance
 
@@ -480,3 +810,38 @@ def get_scheduler() -> Optional[SchedulerService]:
         SchedulerService 인스턴스 (초기화 안되었으면 None)
     """
     return _scheduler_instance
+
+
+def run_isolated_method(method_name: str, *args) -> Any:
+    """
+    격리 작업 자식 프로세스에서 SchedulerService 메서드 실행
+
+    자식은 스케줄러를 시작하지 않으므로 현재 앱만 연결한 인스턴스로 메서드를 호출합니다.
+    """
+    service = SchedulerService()
+    service.app = current_app._get_current_object()
+    return getattr(service, method_name)(*args)
+
+
+# 잡스토어에 저장되는 작업 함수 (모듈 수준 참조여야 직렬화 가능)
+def subreddit_collection_job(subreddit: str) -> Any:
+    """subreddit 수집 작업 (완료 후 새 게시물 수에 맞춰 다음 주기 조정)"""
+    service = get_scheduler()
+    result = service._execute(subreddit_job_id(subreddit), '_subreddit_collection_job', subreddit)
+    service._reschedule_subreddit_job(subreddit, result)
+    return result
+
+
+def feed_collection_job() -> Any:
+    """RSS/HTML 피드 수집 작업"""
+    return get_scheduler()._execute('feed_collection', '_feed_collection_job')
+
+
+def concept_clustering_job() -> Any:
+    """컨셉 클러스터링 작업"""
+    return get_scheduler()._execute('concept_clustering', '_concept_clustering_job')
+
+
+def cache_warming_job() -> Any:
+    """캐시 예열 작업 (예열한 캐시를 쓰도록 웹 프로세스 안에서 실행)"""
+    return get_scheduler()._execute('cache_warming', '_cache_warming_job')
@@ -0,0 +1,537 @@
+"""
+코퍼스 표절 체크용 역색인(Inverted index)
+
+해시된 문자 n-gram(shingle) → 문서 슬롯 posting list 를 유지합니다.
+Draft 를 모든 발행 게시물 / 저장된 컨셉과 비교할 때,
+    1. Draft shingle 들의 posting list 를 모아 numpy bincount 로 문서별 공유 shingle 수 계산
+    2. 공유 shingle 수 상위 후보만 DB 에서 읽어 SimilarityChecker 로 정밀 비교
+하므로 10만 건 코퍼스에서도 밀리초 단위로 후보를 찾을 수 있습니다.
+
+posting 은 대량 구축분(base: 정렬된 해시 + offset + 슬롯 배열, CSR 형식)과
+이후 증분 추가분(delta: shingle → array)으로 나뉘며, 대량 추가/스냅샷 시 base 로 합쳐집니다.
+너무 많은 문서에 등장하는 shingle (예: '습니다') 은 후보 순위에 도움이 되지 않으므로
+조회 시 건너뜁니다. 영속화는 JournaledIndex (스냅샷 + 저널) 를 사용합니다.
+"""
+import logging
+import threading
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import Settings
+from app.services.journaled_index import JournaledIndex
+from app.services.near_duplicate_index import shingle_hashes, strip_concept_boilerplate
+from app.services.similarity_checker import SimilarityChecker
+
+logger = logging.getLogger(__name__)
+
+DOC_TYPES = ('inspiration', 'post')
+
+
+def _build_csr(hashes: np.ndarray, slots: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (shingle, slot) 쌍으로 CSR posting 구성
+
+    Returns:
+        (정렬된 고유 해시, offset 배열, 슬롯 배열)
+    """
+    order = np.lexsort((slots, hashes))
+    hashes = hashes[order]
+    slots = slots[order]
+
+    unique_hashes, starts = np.unique(hashes, return_index=True)
+    offsets = np.append(starts, hashes.size).astype(np.int64)
+    return unique_hashes.astype(np.uint32), offsets, slots.astype(np.uint32)
+
+
+@dataclass
+class ShingleCandidate:
+    """공유 shingle 기반 후보 문서"""
+    doc_type: str
+    doc_id: int
+    shared_shingles: int  # 조회 텍스트와 공유하는 shingle 수
+    containment: float  # 조회 텍스트 shingle 중 이 문서에 있는 비율
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'doc_type': self.doc_type,
+            'doc_id': self.doc_id,
+            'shared_shingles': self.shared_shingles,
+            'containment': round(self.containment, 4)
+        }
+
+
+@dataclass
+class CorpusMatch:
+    """후보 문서 정밀 비교 결과"""
+    candidate: ShingleCandidate
+    overall_similarity: float
+    lexical_similarity: float
+    is_fair_use_compliant: bool
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            **self.candidate.to_dict(),
+            'overall_similarity': round(self.overall_similarity, 4),
+            'lexical_similarity': round(self.lexical_similarity, 4),
+            'is_fair_use_compliant': self.is_fair_use_compliant
+        }
+
+
+class ShingleIndex(JournaledIndex):
+    """
+    해시 shingle 역색인
+
+    Usage:
+        index = get_shingle_index()
+        index.add('post', 3, post.content)
+        candidates = index.candidates(draft.content, k=10)
+    """
+
+    INDEX_NAME = 'shingle index'
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        shingle_size: int = 3,
+        max_df_ratio: float = 0.05,
+        min_df_cutoff: int = 50,
+        merge_threshold: int = 1000
+    ):
+        """
+        Args:
+            path: 스냅샷 파일 경로 (None이면 메모리 전용)
+            shingle_size: 문자 n-gram 크기
+            max_df_ratio: 문서 비율이 이보다 높은 shingle 은 조회 시 무시
+            min_df_cutoff: 코퍼스가 작을 때의 최소 문서 빈도 컷오프
+            merge_threshold: 한 번에 이만큼 이상 추가하면 delta 대신 base 로 병합
+        """
+        super().__init__(path)
+        self.shingle_size = shingle_size
+        self.max_df_ratio = max_df_ratio
+        self.min_df_cutoff = min_df_cutoff
+        self.merge_threshold = merge_threshold
+        self._reset()
+
+    def _reset(self) -> None:
+        # base posting (CSR): shingle i 의 슬롯 = base_slots[base_offsets[i]:base_offsets[i + 1]]
+        self._base_hashes = np.zeros(0, dtype=np.uint32)
+        self._base_offsets = np.zeros(1, dtype=np.int64)
+        self._base_slots = np.zeros(0, dtype=np.uint32)
+        # delta posting (증분 추가분)
+        self._delta: Dict[int, array] = {}
+
+        # 문서는 정수 슬롯으로 관리 (삭제된 슬롯은 compact 전까지 posting 에 남음)
+        self._slot_keys: List[Optional[str]] = []
+        self._key_slot: Dict[str, int] = {}
+        self._slot_types = bytearray()
+        self._alive = bytearray()
+
+    @staticmethod
+    def _doc_key(doc_type: str, doc_id: int) -> str:
+        return f"{doc_type}:{doc_id}"
+
+    def shingles(self, text: str) -> np.ndarray:
+        """텍스트의 shingle 해시 배열 (uint32, 중복 제거)"""
+        return shingle_hashes(text, self.shingle_size).astype(np.uint32)
+
+    # ------------------------------------------------------------------
+    # 인덱스 갱신
+    # ------------------------------------------------------------------
+
+    def _assign_slot(self, key: str) -> int:
+        """문서에 새 슬롯 할당 (기존 슬롯은 삭제 처리)"""
+        self._remove(key)
+        slot = len(self._slot_keys)
+        self._slot_keys.append(key)
+        self._key_slot[key] = slot
+        self._slot_types.append(DOC_TYPES.index(key.split(':', 1)[0]))
+        self._alive.append(1)
+        return slot
+
+    def _insert(self, key: str, hashes: np.ndarray) -> None:
+        slot = self._assign_slot(key)
+
+        delta = self._delta
+        for shingle in hashes.tolist():
+            posting = delta.get(shingle)
+            if posting is None:
+                delta[shingle] = array('I', (slot,))
+            else:
+                posting.append(slot)
+
+    def _remove(self, key: str) -> None:
+        slot = self._key_slot.pop(key, None)
+        if slot is None:
+            return
+        self._slot_keys[slot] = None
+        self._alive[slot] = 0
+
+    def add(self, doc_type: str, doc_id: int, text: str, persist: bool = True) -> None:
+        """
+        문서 추가 (같은 문서가 있으면 교체)
+
+        Args:
+            doc_type: 'inspiration' 또는 'post'
+            doc_id: 문서 ID
+            text: 문서 텍스트
+            persist: 저널에 기록할지 여부
+        """
+        key = self._doc_key(doc_type, doc_id)
+        hashes = self.shingles(text)
+
+        with self._lock:
+            self._insert(key, hashes)
+            if persist:
+                self._append_journal([(key, hashes)])
+
+    def add_many(
+        self,
+        documents: Iterable[Tuple[str, int, str]],
+        persist: bool = True
+    ) -> int:
+        """
+        여러 문서 일괄 추가 (저널 쓰기 1회)
+
+        Args:
+            documents: (doc_type, doc_id, text) 이터러블
+            persist: 저널에 기록할지 여부
+
+        Returns:
+            추가된 문서 수
+        """
+        entries = [
+            (self._doc_key(doc_type, doc_id), self.shingles(text))
+            for doc_type, doc_id, text in documents
+        ]
+
+        with self._lock:
+            self._insert_many(entries)
+            if persist and entries:
+                self._append_journal(entries)
+
+        return len(entries)
+
+    def _insert_many(self, entries: List[Tuple[str, np.ndarray]]) -> None:
+        """여러 문서 일괄 삽입 (대량이면 정렬 한 번으로 base 에 병합)"""
+        if len(entries) < self.merge_threshold:
+            for key, hashes in entries:
+                self._insert(key, hashes)
+            return
+
+        slots = [
+            np.full(hashes.size, self._assign_slot(key), dtype=np.uint32)
+            for key, hashes in entries
+        ]
+        self._merge_into_base(
+            np.concatenate([hashes for _, hashes in entries]),
+            np.concatenate(slots)
+        )
+
+    def _posting_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """base + delta 의 모든 (shingle, slot) 쌍"""
+        hashes = [np.repeat(self._base_hashes, np.diff(self._base_offsets))]
+        slots = [self._base_slots]
+        if self._delta:
+            lengths = np.fromiter((len(p) for p in self._delta.values()), dtype=np.int64, count=len(self._delta))
+            hashes.append(np.repeat(np.fromiter(self._delta.keys(), dtype=np.uint32, count=len(self._delta)), lengths))
+            slots.append(np.frombuffer(b''.join(p.tobytes() for p in self._delta.values()), dtype=np.uint32))
+        return np.concatenate(hashes), np.concatenate(slots)
+
+    def _merge_into_base(self, hashes: np.ndarray, slots: np.ndarray) -> None:
+        """기존 posting 과 새 (shingle, slot) 쌍을 합쳐 base 재구성, delta 비움"""
+        old_hashes, old_slots = self._posting_pairs()
+        all_hashes = np.concatenate([old_hashes, hashes.astype(np.uint32)])
+        all_slots = np.concatenate([old_slots, slots.astype(np.uint32)])
+
+        alive = np.frombuffer(bytes(self._alive), dtype=np.uint8).astype(bool)
+        keep = alive[all_slots]
+        self._base_hashes, self._base_offsets, self._base_slots = _build_csr(
+            all_hashes[keep], all_slots[keep]
+        )
+        self._delta = {}
+
+    def remove(self, doc_type: str, doc_id: int, persist: bool = True) -> None:
+        """문서 제거"""
+        key = self._doc_key(doc_type, doc_id)
+        with self._lock:
+            self._remove(key)
+            if persist:
+                self._append_journal([(key, None)])
+
+    def __len__(self) -> int:
+        return len(self._key_slot)
+
+    def __contains__(self, item: Tuple[str, int]) -> bool:
+        return self._doc_key(*item) in self._key_slot
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def candidates(
+        self,
+        text: str,
+        k: int = 10,
+        min_shared: int = 2,
+        doc_type: Optional[str] = None,
+        exclude: Optional[Tuple[str, int]] = None
+    ) -> List[ShingleCandidate]:
+        """
+        공유 shingle 수 기준 상위 후보 문서 조회
+
+        Args:
+            text: 조회할 텍스트 (Draft 내용 등)
+            k: 최대 후보 수
+            min_shared: 최소 공유 shingle 수
+            doc_type: 문서 타입 필터 (None이면 전체)
+            exclude: 제외할 (doc_type, doc_id)
+
+        Returns:
+            ShingleCandidate 리스트 (공유 shingle 수 내림차순)
+        """
+        hashes = self.shingles(text)
+        if hashes.size == 0:
+            return []
+
+        self.sync()
+
+        with self._lock:
+            slot_count = len(self._slot_keys)
+            if slot_count == 0:
+                return []
+
+            counts = self._shared_counts(hashes, slot_count)
+
+            # 삭제된 슬롯 / 타입 필터 / 제외 문서
+            counts *= np.frombuffer(bytes(self._alive), dtype=np.uint8)
+            if doc_type:
+                types = np.frombuffer(bytes(self._slot_types), dtype=np.uint8)
+                counts[types != DOC_TYPES.index(doc_type)] = 0
+            if exclude:
+                excluded_slot = self._key_slot.get(self._doc_key(*exclude))
+                if excluded_slot is not None:
+                    counts[excluded_slot] = 0
+
+            slots = np.flatnonzero(counts >= min_shared)
+            if slots.size > k:
+                slots = slots[np.argpartition(counts[slots], -k)[-k:]]
+            slots = slots[np.argsort(-counts[slots], kind='stable')]
+
+            results = []
+            for slot in slots.tolist():
+                found_type, found_id = self._slot_keys[slot].split(':', 1)
+                shared = int(counts[slot])
+                results.append(ShingleCandidate(
+                    doc_type=found_type,
+                    doc_id=int(found_id),
+                    shared_shingles=shared,
+                    containment=shared / hashes.size
+                ))
+
+        return results
+
+    def _shared_counts(self, shingles: np.ndarray, slot_count: int) -> np.ndarray:
+        """조회 shingle 들의 posting list 를 합쳐 슬롯별 공유 shingle 수 계산"""
+        df_cutoff = max(self.min_df_cutoff, int(self.max_df_ratio * len(self)))
+
+        # base: 정렬된 해시 배열에서 이진 탐색
+        positions = np.searchsorted(self._base_hashes, shingles)
+        positions = positions[positions < self._base_hashes.size]
+        positions = positions[np.isin(self._base_hashes[positions], shingles)]
+        base_ranges = dict(zip(
+            self._base_hashes[positions].tolist(),
+            zip(self._base_offsets[positions].tolist(), self._base_offsets[positions + 1].tolist())
+        ))
+
+        postings = []
+        for shingle in shingles.tolist():
+            start, end = base_ranges.get(shingle, (0, 0))
+            delta = self._delta.get(shingle)
+            df = end - start + (len(delta) if delta is not None else 0)
+            if df == 0 or df > df_cutoff:
+                continue
+            if end > start:
+                postings.append(self._base_slots[start:end])
+            if delta is not None:
+                postings.append(np.array(delta, dtype=np.uint32))
+
+        if not postings:
+            return np.zeros(slot_count, dtype=np.int64)
+
+        # 한 문서에는 같은 shingle 이 한 번만 들어가므로 등장 횟수 = 공유 shingle 수
+        return np.bincount(np.concatenate(postings), minlength=slot_count)
+
+    # ------------------------------------------------------------------
+    # 영속화
+    # ------------------------------------------------------------------
+
+    def _encode_value(self, hashes: np.ndarray) -> bytes:
+        return hashes.astype(np.uint32).tobytes()
+
+    def _decode_value(self, raw: bytes) -> np.ndarray:
+        return np.frombuffer(raw, dtype=np.uint32)
+
+    def _snapshot_state(self) -> Dict[str, object]:
+        # 삭제된 슬롯을 제거하고 살아있는 문서만 0부터 다시 번호 매김
+        alive = np.frombuffer(bytes(self._alive), dtype=np.uint8).astype(bool)
+        remap = np.full(len(self._slot_keys), -1, dtype=np.int64)
+        remap[alive] = np.arange(int(alive.sum()))
+
+        hashes, slots = self._posting_pairs()
+        slots = remap[slots]
+        keep = slots >= 0
+        base_hashes, base_offsets, base_slots = _build_csr(hashes[keep], slots[keep].astype(np.uint32))
+
+        return {
+            'shingle_size': self.shingle_size,
+            'keys': [key for key in self._slot_keys if key is not None],
+            'hashes': base_hashes.tobytes(),
+            'offsets': base_offsets.tobytes(),
+            'slots': base_slots.tobytes()
+        }
+
+    def _restore_state(self, snapshot: Dict[str, object]) -> bool:
+        if snapshot.get('shingle_size') != self.shingle_size:
+            return False
+
+        keys = snapshot['keys']
+        self._slot_keys = list(keys)
+        self._key_slot = {key: slot for slot, key in enumerate(keys)}
+        self._slot_types = bytearray(DOC_TYPES.index(key.split(':', 1)[0]) for key in keys)
+        self._alive = bytearray(b'\x01' * len(keys))
+        self._base_hashes = np.frombuffer(snapshot['hashes'], dtype=np.uint32).copy()
+        self._base_offsets = np.frombuffer(snapshot['offsets'], dtype=np.int64).copy()
+        self._base_slots = np.frombuffer(snapshot['slots'], dtype=np.uint32).copy()
+        self._delta = {}
+        return True
+
+    def rebuild_from_database(self, batch_size: int = 1000) -> int:
+        """
+        DB의 모든 Inspiration / Post 로 역색인 재구축 (app context 필요)
+
+        Args:
+            batch_size: 한 번에 읽을 행 수
+
+        Returns:
+            인덱싱된 문서 수
+        """
+        from app import db
+        from app.models import Inspiration, Post
+
+        with self._lock:
+            self._reset()
+
+            rows = db.session.query(Inspiration.id, Inspiration.original_concept).yield_per(batch_size)
+            self.add_many(
+                (('inspiration', insp_id, strip_concept_boilerplate(concept)) for insp_id, concept in rows),
+                persist=False
+            )
+
+            rows = db.session.query(Post.id, Post.content).yield_per(batch_size)
+            self.add_many(
+                (('post', post_id, content) for post_id, content in rows),
+                persist=False
+            )
+
+        self.compact()
+        return len(self)
+
+
+def check_corpus_overlap(
+    text: str,
+    top_n: int = 10,
+    doc_type: Optional[str] = None,
+    exclude: Optional[Tuple[str, int]] = None,
+    index: Optional[ShingleIndex] = None,
+    checker: Optional[SimilarityChecker] = None
+) -> List[CorpusMatch]:
+    """
+    텍스트를 전체 코퍼스(발행 게시물 + 저장된 컨셉)와 비교 (app context 필요)
+
+    역색인으로 공유 shingle 상위 top_n 후보를 찾고,
+    그 후보들만 DB 에서 읽어 SimilarityChecker 로 정밀 비교합니다.
+
+    Args:
+        text: 비교할 텍스트 (Draft 내용 등)
+        top_n: 정밀 비교할 후보 수
+        doc_type: 문서 타입 필터 (None이면 전체)
+        exclude: 제외할 (doc_type, doc_id)
+        index: 역색인 (None이면 글로벌 인덱스)
+        checker: 유사도 체커 (None이면 기본 생성)
+
+    Returns:
+        CorpusMatch 리스트 (전체 유사도 내림차순)
+    """
+    from app import db
+    from app.models import Inspiration, Post
+
+    index = index or get_shingle_index()
+    candidates = index.candidates(text, k=top_n, doc_type=doc_type, exclude=exclude)
+    if not candidates:
+        return []
+
+    # 타입별 IN 쿼리 한 번씩으로 후보 원문 조회
+    texts: Dict[Tuple[str, int], str] = {}
+    inspiration_ids = [c.doc_id for c in candidates if c.doc_type == 'inspiration']
+    post_ids = [c.doc_id for c in candidates if c.doc_type == 'post']
+
+    if inspiration_ids:
+        rows = db.session.query(Inspiration.id, Inspiration.original_concept).filter(
+            Inspiration.id.in_(inspiration_ids)
+        )
+        texts.update((('inspiration', doc_id), strip_concept_boilerplate(concept)) for doc_id, concept in rows)
+    if post_ids:
+        rows = db.session.query(Post.id, Post.content).filter(Post.id.in_(post_ids))
+        texts.update((('post', doc_id), content) for doc_id, content in rows)
+
+    # 인덱스에는 있지만 DB에서 지워진 문서는 제외
+    candidates = [c for c in candidates if (c.doc_type, c.doc_id) in texts]
+    if not candidates:
+        return []
+
+    checker = checker or SimilarityChecker()
+    results = checker.batch_check(
+        [texts[(c.doc_type, c.doc_id)] for c in candidates],
+        [text] * len(candidates)
+    )
+
+    matches = [
+        CorpusMatch(
+            candidate=candidate,
+            overall_similarity=result.overall_similarity,
+            lexical_similarity=result.lexical_similarity,
+            is_fair_use_compliant=result.is_fair_use_compliant
+        )
+        for candidate, result in zip(candidates, results)
+    ]
+    matches.sort(key=lambda m: m.overall_similarity, reverse=True)
+    return matches
+
+
+# 글로벌 인스턴스
+_index_instance: Optional[ShingleIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_shingle_index() -> ShingleIndex:
+    """
+    글로벌 shingle 역색인 반환 (최초 호출 시 디스크에서 로드)
+
+    Returns:
+        ShingleIndex 인스턴스
+    """
+    global _index_instance
+
+    if _index_instance is None:
+        with _index_lock:
+            if _index_instance is None:
+                settings = Settings()
+                _index_instance = ShingleIndex(
+                    path=Path(settings.SIMILARITY_INDEX_DIR) / 'shingles.pkl'
+                ).load()
+
+    return _index_instance
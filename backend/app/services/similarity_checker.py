@@ -9,6 +9,8 @@ from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 import re
 
+from app.services.embedding_service import EmbeddingService, get_embedding_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,7 +20,7 @@ class SimilarityResult:
     overall_similarity: float  # 전체 유사도 (0.0-1.0)
     structural_similarity: float  # 구조적 유사도
     lexical_similarity: float  # 어휘적 유사도
-    semantic_similarity: float  # 의미적 유사도 (향후 구현)
+    semantic_similarity: float  # 의미적 유사도 (임베딩 코사인 유사도)
     is_fair_use_compliant: bool  # Fair Use 준수 여부 (< 0.7)
     details: Dict[str, any]
 
@@ -33,10 +35,54 @@ class SimilarityChecker:
 
     FAIR_USE_THRESHOLD = 0.7  # 70% 미만이면 Fair Use 준수
 
+    # 불용어 (조사, 접속사 등)
+    STOPWORDS = frozenset({
+        '은', '는', '이', '가', '을', '를', '의', '에', '에서', '으로',
+        '와', '과', '도', '만', '까지', '부터', '보다', '처럼', '같이',
+        '그', '저', '이', '그런', '저런', '이런', '것', '수',
+        '등', '및', '또', '또한', '그리고', '하지만', '그러나',
+        '있다', '없다', '이다', '아니다', '하다', '되다', '않다'
+    })
+
+    # 어휘적 유사도 가중치 (단어 Jaccard, 2-gram, 3-gram)
+    LEXICAL_WEIGHTS = {
+        'words': 0.5,
+        'bigram': 0.3,
+        'trigram': 0.2
+    }
+
+    # 전체 유사도 가중치
+    WEIGHTS = {
+        'structural': 0.3,
+        'lexical': 0.5,
+        'semantic': 0.2
+    }
+
+    def __init__(
+        self,
+        embedding_service: Optional[EmbeddingService] = None,
+        use_semantic: bool = True
+    ):
+        """
+        Args:
+            embedding_service: 의미적 유사도용 임베딩 서비스 (None이면 글로벌 서비스)
+            use_semantic: 의미적 유사도 사용 여부
+        """
+        self._embedding_service = embedding_service
+        self.use_semantic = use_semantic
+
+    @property
+    def embedding_service(self) -> Optional[EmbeddingService]:
+        """임베딩 서비스 (지연 생성)"""
+        if self._embedding_service is None and self.use_semantic:
+            self._embedding_service = get_embedding_service()
+        return self._embedding_service
+
     def check_similarity(
         self,
         original_text: str,
-        generated_text: str
+        generated_text: str,
+        semantic_similarity: Optional[float] = None
     ) -> SimilarityResult:
         """
         전체 유사도 체크
@@ -44,6 +90,7 @@ class SimilarityChecker:
         Args:
             original_text: 원본 텍스트
             generated_text: 생성된 텍스트
+            semantic_similarity: 미리 계산한 의미적 유사도 (선택, 배치 처리용)
 
         Returns:
             SimilarityResult 객체
@@ -60,14 +107,44 @@ class SimilarityChecker:
             generated_text
         )
 
-        # 3. 의미적 유사도 (향후 임베딩 모델 활용)
-        semantic_sim = 0.0  # TODO: Phase 7에서 구현
+        # 3. 의미적 유사도 (문장 임베딩 코사인 유사도)
+        if semantic_similarity is None:
+            semantic_similarity = self._check_semantic_similarity(
+                original_text,
+                generated_text
+            )
+
+        return self._combine(structural_sim, lexical_sim, semantic_similarity)
+
+    def _combine(
+        self,
+        structural_sim: float,
+        lexical_sim: float,
+        semantic_sim: Optional[float]
+    ) -> SimilarityResult:
+        """
+        세부 유사도를 가중 평균하여 SimilarityResult 생성
+
+        의미적 유사도를 계산할 수 없으면 (모델 없음) 0으로 두지 않고
+        나머지 가중치를 재분배하여 판정이 낮게 치우치지 않도록 합니다.
+        """
+        weights = dict(self.WEIGHTS)
+        semantic_available = semantic_sim is not None
+
+        if not semantic_available:
+            remaining = weights['structural'] + weights['lexical']
+            weights = {
+                'structural': weights['structural'] / remaining,
+                'lexical': weights['lexical'] / remaining,
+                'semantic': 0.0
+            }
+            semantic_sim = 0.0
 
         # 전체 유사도 (가중 평균)
         overall_sim = (
-            structural_sim * 0.3 +
-            lexical_sim * 0.5 +
-            semantic_sim * 0.2
+            structural_sim * weights['structural'] +
+            lexical_sim * weights['lexical'] +
+            semantic_sim * weights['semantic']
         )
 
         is_compliant = overall_sim < self.FAIR_USE_THRESHOLD
@@ -80,14 +157,38 @@ class SimilarityChecker:
             is_fair_use_compliant=is_compliant,
             details={
                 'threshold': self.FAIR_USE_THRESHOLD,
-                'weights': {
-                    'structural': 0.3,
-                    'lexical': 0.5,
-                    'semantic': 0.2
-                }
+                'weights': weights,
+                'semantic_available': semantic_available
             }
         )
 
+    def _check_semantic_similarity(
+        self,
+        text1: str,
+        text2: str
+    ) -> Optional[float]:
+        """
+        의미적 유사도 측정 (문장 임베딩 코사인 유사도)
+
+        원본 텍스트는 수집 시점에 캐시되어 있으므로 보통 새 텍스트만 인코딩합니다.
+
+        Args:
+            text1: 첫 번째 텍스트
+            text2: 두 번째 텍스트
+
+        Returns:
+            유사도 (0.0-1.0), 임베딩을 사용할 수 없으면 None
+        """
+        service = self.embedding_service
+        if service is None or not service.is_available():
+            return None
+
+        try:
+            return service.similarity(text1, text2)
+        except Exception as e:
+            logger.warning(f"Semantic similarity failed: {e}")
+            return None
+
     def _check_structural_similarity(
         self,
         text1: str,
@@ -173,9 +274,9 @@ class SimilarityChecker:
 
         # 가중 평균
         lexical_sim = (
-            jaccard * 0.5 +
-            bigram_sim * 0.3 +
-            trigram_sim * 0.2
+            jaccard * self.LEXICAL_WEIGHTS['words'] +
+            bigram_sim * self.LEXICAL_WEIGHTS['bigram'] +
+            trigram_sim * self.LEXICAL_WEIGHTS['trigram']
         )
 
         return min(lexical_sim, 1.0)
@@ -212,21 +313,17 @@ class SimilarityChecker:
         words = text.lower().split()
 
         # 불용어 제거 (조사, 접속사 등)
-        stopwords = {
-            '은', '는', '이', '가', '을', '를', '의', '에', '에서', '으로',
-            '와', '과', '도', '만', '까지', '부터', '보다', '처럼', '같이',
-            '그', '저', '이', '그런', '저런', '이런', '것', '수',
-            '등', '및', '또', '또한', '그리고', '하지만', '그러나',
-            '있다', '없다', '이다', '아니다', '하다', '되다', '않다'
-        }
-
         meaningful_words = {
             w for w in words
-            if len(w) >= 2 and w not in stopwords
+            if self._is_meaningful_word(w)
         }
 
         return meaningful_words
 
+    def _is_meaningful_word(self, word: str) -> bool:
+        """2글자 이상이고 불용어가 아닌 단어인지 확인"""
+        return len(word) >= 2 and word not in self.STOPWORDS
+
     def _ngram_similarity(
         self,
         text1: str,
@@ -301,6 +398,36 @@ class SimilarityChecker:
         """
         return self.check_similarity(original_concept, draft_content)
 
+    def incremental(
+        self,
+        original_text: str,
+        abort_threshold: Optional[float] = None,
+        margin: float = 0.1,
+        min_chars: int = 80,
+        max_chars: Optional[int] = None
+    ) -> 'IncrementalSimilarity':
+        """
+        스트리밍 생성용 증분 유사도 세션 생성
+
+        Args:
+            original_text: 원본 텍스트
+            abort_threshold: 조기 중단 기준 어휘적 유사도 (None이면 FAIR_USE_THRESHOLD)
+            margin: 최종 길이를 모를 때 추가로 요구하는 여유분
+            min_chars: 조기 중단 판단 전 최소 생성 글자 수 (공백 제외)
+            max_chars: 생성될 최대 글자 수 (공백 제외, 알 수 있을 때)
+
+        Returns:
+            IncrementalSimilarity 객체
+        """
+        return IncrementalSimilarity(
+            self,
+            original_text,
+            abort_threshold=abort_threshold,
+            margin=margin,
+            min_chars=min_chars,
+            max_chars=max_chars
+        )
+
     def batch_check(
         self,
         original_texts: List[str],
@@ -319,13 +446,40 @@ class SimilarityChecker:
         if len(original_texts) != len(generated_texts):
             raise ValueError("Original and generated lists must have same length")
 
+        semantic_scores = self.batch_semantic_similarity(original_texts, generated_texts)
+
         results = []
-        for orig, gen in zip(original_texts, generated_texts):
-            result = self.check_similarity(orig, gen)
+        for orig, gen, semantic in zip(original_texts, generated_texts, semantic_scores):
+            result = self.check_similarity(orig, gen, semantic_similarity=semantic)
             results.append(result)
 
         return results
 
+    def batch_semantic_similarity(
+        self,
+        original_texts: List[str],
+        generated_texts: List[str]
+    ) -> List[Optional[float]]:
+        """
+        여러 쌍의 의미적 유사도를 한 번의 배치 인코딩으로 계산
+
+        Args:
+            original_texts: 원본 텍스트 리스트
+            generated_texts: 생성된 텍스트 리스트
+
+        Returns:
+            유사도 리스트 (임베딩을 사용할 수 없으면 None 리스트)
+        """
+        service = self.embedding_service
+        if service is None or not service.is_available():
+            return [None] * len(original_texts)
+
+        try:
+            return service.pairwise_similarity(original_texts, generated_texts)
+        except Exception as e:
+            logger.warning(f"Batch semantic similarity failed: {e}")
+            return [None] * len(original_texts)
+
     def get_fair_use_report(
         self,
         similarity_result: SimilarityResult
@@ -341,6 +495,11 @@ class SimilarityChecker:
         """
         status = "✅ Fair Use 준수" if similarity_result.is_fair_use_compliant else "⚠️ Fair Use 위반 가능성"
 
+        if similarity_result.details.get('semantic_available', True):
+            semantic_line = f"{similarity_result.semantic_similarity:.2%}"
+        else:
+            semantic_line = "측정 불가 (임베딩 모델 없음, 가중치 재분배)"
+
         report = f"""
 === Fair Use 유사도 체크 리포트 ===
 
@@ -350,7 +509,7 @@ class SimilarityChecker:
 **세부 분석**:
 - 구조적 유사도: {similarity_result.structural_similarity:.2%}
 - 어휘적 유사도: {similarity_result.lexical_similarity:.2%}
-- 의미적 유사도: {similarity_result.semantic_similarity:.2%} (향후 구현)
+- 의미적 유사도: {semantic_line}
 
 **기준 임계값**: {self.FAIR_USE_THRESHOLD:.0%}
 
@@ -370,6 +529,229 @@ class SimilarityChecker:
         return report.strip()
 
 
+class IncrementalSimilarity:
+    """
+    증분 유사도 세션
+
+    LLM 이 토큰을 스트리밍하는 동안 청크 단위로 생성 텍스트를 받아
+    원본과의 단어/2-gram/3-gram 교집합 개수를 누적합니다.
+    update() 비용은 새로 들어온 텍스트 길이에 비례하며,
+    finish() 후의 어휘적 유사도는 전체 텍스트로 계산한 값과 같습니다.
+
+    Usage:
+        session = checker.incremental(original_concept)
+        for chunk in llm.generate_stream(prompt):
+            session.update(chunk)
+            if session.should_abort():
+                break  # 재샘플링
+        result = session.result()
+    """
+
+    def __init__(
+        self,
+        checker: SimilarityChecker,
+        original_text: str,
+        abort_threshold: Optional[float] = None,
+        margin: float = 0.1,
+        min_chars: int = 80,
+        max_chars: Optional[int] = None
+    ):
+        """
+        Args:
+            checker: 유사도 계산에 사용할 SimilarityChecker
+            original_text: 원본 텍스트
+            abort_threshold: 조기 중단 기준 어휘적 유사도 (None이면 FAIR_USE_THRESHOLD)
+            margin: 최종 길이를 모를 때 추가로 요구하는 여유분
+            min_chars: 조기 중단 판단 전 최소 생성 글자 수 (공백 제외)
+            max_chars: 생성될 최대 글자 수 (공백 제외, 알 수 있을 때)
+        """
+        self.checker = checker
+        self.original_text = original_text
+        self.abort_threshold = (
+            abort_threshold if abort_threshold is not None else checker.FAIR_USE_THRESHOLD
+        )
+        self.margin = margin
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+
+        # 원본 집합 (한 번만 계산)
+        self._original_words = checker._extract_meaningful_words(original_text)
+        self._original_bigrams = checker._get_ngrams(original_text, 2)
+        self._original_trigrams = checker._get_ngrams(original_text, 3)
+
+        # 생성 텍스트 누적 상태
+        self._chunks: List[str] = []
+        self._words: set = set()
+        self._bigrams: set = set()
+        self._trigrams: set = set()
+        self._word_overlap = 0
+        self._bigram_overlap = 0
+        self._trigram_overlap = 0
+        self._pending_word = ''  # 청크 경계에서 끊긴 단어
+        self._tail = ''  # 다음 n-gram 을 위한 직전 비공백 문자 (최대 2자)
+        self.char_count = 0  # 생성된 비공백 글자 수
+        self.finished = False
+
+    @property
+    def text(self) -> str:
+        """지금까지 생성된 전체 텍스트"""
+        return ''.join(self._chunks)
+
+    def update(self, chunk: str) -> None:
+        """
+        새 청크 반영 (O(len(chunk)))
+
+        Args:
+            chunk: 새로 생성된 텍스트 조각
+        """
+        if not chunk:
+            return
+        if self.finished:
+            raise RuntimeError("Session already finished")
+
+        self._chunks.append(chunk)
+
+        # 문자 n-gram (공백 제외한 연속 문자열 기준)
+        tail = self._tail
+        for char in chunk:
+            if char.isspace():
+                continue
+            self.char_count += 1
+            tail += char
+            if len(tail) >= 2:
+                self._add_ngram(tail[-2:], self._bigrams, self._original_bigrams, 'bigram')
+            if len(tail) >= 3:
+                self._add_ngram(tail[-3:], self._trigrams, self._original_trigrams, 'trigram')
+            tail = tail[-2:]
+        self._tail = tail
+
+        # 단어 (마지막 단어는 다음 청크에서 이어질 수 있으므로 보류)
+        buffer = self._pending_word + chunk
+        tokens = re.findall(r'\w+', buffer)
+        if tokens and re.match(r'\w', buffer[-1]):
+            self._pending_word = tokens.pop()
+        else:
+            self._pending_word = ''
+
+        for token in tokens:
+            self._add_word(token)
+
+    def finish(self) -> None:
+        """생성 종료 (보류 중인 마지막 단어 반영)"""
+        if self._pending_word:
+            self._add_word(self._pending_word)
+            self._pending_word = ''
+        self.finished = True
+
+    def _add_word(self, token: str) -> None:
+        """단어 집합에 추가하고 원본과의 교집합 개수 갱신"""
+        word = token.lower()
+        if not self.checker._is_meaningful_word(word) or word in self._words:
+            return
+        self._words.add(word)
+        if word in self._original_words:
+            self._word_overlap += 1
+
+    def _add_ngram(self, ngram: str, generated: set, original: set, kind: str) -> None:
+        """n-gram 집합에 추가하고 원본과의 교집합 개수 갱신"""
+        if ngram in generated:
+            return
+        generated.add(ngram)
+        if ngram in original:
+            setattr(self, f'_{kind}_overlap', getattr(self, f'_{kind}_overlap') + 1)
+
+    @staticmethod
+    def _jaccard(overlap: int, size1: int, size2: int, extra: int = 0) -> float:
+        """교집합 개수로 Jaccard 계산 (extra: 합집합에 더할 미래 원소 수)"""
+        union = size1 + size2 - overlap + extra
+        if union == 0:
+            return 0.0
+        return overlap / union
+
+    def _lexical(self, extra_words: int = 0, extra_ngrams: int = 0) -> float:
+        """누적 개수로 어휘적 유사도 계산 (extra_*: 앞으로 추가될 수 있는 최대 원소 수)"""
+        if not self._original_words and not self._words:
+            return 0.0
+
+        jaccard = self._jaccard(
+            self._word_overlap, len(self._original_words), len(self._words), extra_words
+        )
+        bigram_sim = self._jaccard(
+            self._bigram_overlap, len(self._original_bigrams), len(self._bigrams), extra_ngrams
+        )
+        trigram_sim = self._jaccard(
+            self._trigram_overlap, len(self._original_trigrams), len(self._trigrams), extra_ngrams
+        )
+
+        weights = self.checker.LEXICAL_WEIGHTS
+        lexical_sim = (
+            jaccard * weights['words'] +
+            bigram_sim * weights['bigram'] +
+            trigram_sim * weights['trigram']
+        )
+
+        return min(lexical_sim, 1.0)
+
+    @property
+    def lexical_similarity(self) -> float:
+        """현재까지의 어휘적 유사도 (보류 중인 마지막 단어 제외)"""
+        return self._lexical()
+
+    def lexical_lower_bound(self, remaining_chars: int) -> float:
+        """
+        남은 생성량이 remaining_chars 이하일 때 최종 어휘적 유사도의 하한
+
+        교집합은 줄어들지 않고, 새 비공백 문자 하나는 2-gram/3-gram 을 최대 하나씩,
+        2글자 이상 단어는 두 글자마다 최대 하나씩 합집합에 더합니다.
+
+        Args:
+            remaining_chars: 남은 최대 비공백 글자 수
+
+        Returns:
+            최종 어휘적 유사도 하한
+        """
+        remaining_chars = max(remaining_chars, 0)
+        extra_words = remaining_chars // 2 + (1 if self._pending_word else 0)
+        return self._lexical(extra_words=extra_words, extra_ngrams=remaining_chars)
+
+    def should_abort(self) -> bool:
+        """
+        조기 중단 여부
+
+        최대 길이를 알면 최종 어휘적 유사도의 하한이 기준을 넘을 때,
+        모르면 현재 어휘적 유사도가 기준 + margin 을 넘을 때 True 를 반환합니다.
+
+        Returns:
+            이미 확실히 Fair Use 기준을 넘는 초안이면 True
+        """
+        if self.char_count < self.min_chars:
+            return False
+
+        if self.max_chars is not None:
+            remaining = self.max_chars - self.char_count
+            return self.lexical_lower_bound(remaining) >= self.abort_threshold
+
+        return self.lexical_similarity >= self.abort_threshold + self.margin
+
+    def result(self) -> SimilarityResult:
+        """
+        최종 유사도 결과 (세션 종료)
+
+        어휘적 유사도는 누적 개수를 그대로 쓰고, 구조적/의미적 유사도만
+        전체 텍스트로 한 번 계산합니다.
+
+        Returns:
+            SimilarityResult 객체
+        """
+        self.finish()
+        text = self.text
+
+        structural_sim = self.checker._check_structural_similarity(self.original_text, text)
+        semantic_sim = self.checker._check_semantic_similarity(self.original_text, text)
+
+        return self.checker._combine(structural_sim, self.lexical_similarity, semantic_sim)
+
+
 # 테스트용 함수
 def test_similarity_checker():
     """SimilarityChecker 테스트"""
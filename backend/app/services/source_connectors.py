@@ -0,0 +1,509 @@
+"""
+Reddit 외 소스 커넥터 (RSS/Atom 피드, HTML 목록 페이지)
+
+커넥터는 URL 하나를 가져와 FeedEntryMetadata 목록으로 파싱합니다.
+ConnectorCollector 는 커넥터 여러 개를 하나의 연결 풀(httpx.AsyncClient)에서
+동시에 가져오고, 결과를 RedditCrawler 와 같은 공용 저장 경로(SourceIngestor)로 일괄 저장합니다.
+파싱(BeautifulSoup)은 CPU 작업이므로 스레드로 넘겨 이벤트 루프의 다운로드를 막지 않습니다.
+HTTP 캐시를 쓰면 조건부 요청을 보내고, 바뀌지 않은 페이지(304 또는 같은 본문)는 파싱하지 않습니다.
+
+Fair Use: 원문은 저장하지 않고 제목, 링크, 요약 앞부분만 사용합니다.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, ClassVar, Dict, List, Optional
+from urllib.parse import urljoin
+
+import httpx
+from bs4 import BeautifulSoup
+
+from app.config import Settings
+from app.services.http_cache import HTTPCache, get_http_cache
+from app.services.source_ingestion import SourceIngestor, empty_counts
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FeedEntryMetadata:
+    """피드/목록 페이지 항목 메타데이터"""
+    post_id: str  # 링크 해시 (같은 글은 어느 피드에서 와도 같은 ID)
+    title: str
+    url: str
+    author: Optional[str]
+    feed: str  # 커넥터 이름
+    created_utc: float
+    summary: Optional[str] = None  # 요약/본문 앞부분 (요약용, 저장 안함)
+
+    platform: ClassVar[str] = 'other'
+
+    @staticmethod
+    def make_id(url: str) -> str:
+        """링크로 항목 ID 생성"""
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()[:20]
+
+    def source_fields(self) -> Dict[str, Any]:
+        """Source 컬럼 값으로 변환"""
+        return {
+            'platform': self.platform,
+            'source_url': self.url,
+            'source_id': self.post_id,
+            'title': self.title[:300],
+            'author': self.author[:100] if self.author else None,
+            'posted_at': datetime.utcfromtimestamp(self.created_utc),
+            'metadata_json': json.dumps({
+                'feed': self.feed,
+                'created_utc': self.created_utc,
+            })
+        }
+
+    def summarize(self) -> str:
+        """
+        핵심 컨셉 요약 (제목 + 요약 첫 200자)
+
+        Returns:
+            요약된 컨셉
+        """
+        concept_parts = [f"Title: {self.title}", f"Context: {self.feed}"]
+
+        if self.summary:
+            preview = self.summary[:200].replace('\n', ' ').strip()
+            if len(self.summary) > 200:
+                preview += "..."
+            concept_parts.append(f"Preview: {preview}")
+
+        return "\n".join(concept_parts)
+
+
+@dataclass
+class ConnectorResult:
+    """커넥터 하나의 가져오기 결과 (DB 저장 전)"""
+    name: str
+    url: str
+    entries: List[FeedEntryMetadata] = field(default_factory=list)
+    status_code: Optional[int] = None
+    bytes_received: int = 0
+    elapsed: float = 0.0
+    not_modified: bool = False  # 이전 수집 이후 바뀌지 않아 파싱 생략
+    error: Optional[str] = None
+    # 저장 성공 후 캐시에 넣을 응답 (저장 전에 캐시하면 실패 시 다음 수집에서 304 로 누락됨)
+    headers: Optional[Dict[str, str]] = field(default=None, repr=False)
+    body: Optional[bytes] = field(default=None, repr=False)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """RFC 822 (RSS) / ISO 8601 (Atom, <time datetime>) 시각을 UTC 타임스탬프로 변환"""
+    if not value:
+        return None
+
+    value = value.strip()
+    for parse in (parsedate_to_datetime, datetime.fromisoformat):
+        try:
+            parsed = parse(value)
+        except (TypeError, ValueError, IndexError):
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+    return None
+
+
+def _plain_text(markup: Optional[str]) -> Optional[str]:
+    """HTML 조각을 공백으로 이어붙인 텍스트로 변환"""
+    if not markup:
+        return None
+    text = BeautifulSoup(markup, 'html.parser').get_text(' ', strip=True)
+    return text or None
+
+
+class SourceConnector:
+    """
+    소스 커넥터 베이스 클래스
+
+    하위 클래스는 parse() 만 구현합니다 (네트워크는 ConnectorCollector 가 담당).
+
+    Args:
+        name: 커넥터 이름 (요약 컨텍스트 및 통계 키)
+        url: 가져올 URL
+        max_entries: 한 번에 저장할 최대 항목 수
+    """
+
+    def __init__(self, name: str, url: str, max_entries: Optional[int] = None):
+        self.name = name
+        self.url = url
+        self.max_entries = max_entries or Settings().FEED_MAX_ENTRIES
+
+    def parse(self, body: bytes, base_url: str) -> List[FeedEntryMetadata]:
+        """
+        응답 본문을 항목 목록으로 파싱
+
+        Args:
+            body: 응답 본문
+            base_url: 상대 링크 기준 URL (리다이렉트 후 최종 URL)
+
+        Returns:
+            FeedEntryMetadata 리스트 (최대 max_entries 개)
+        """
+        raise NotImplementedError
+
+    def _entry(
+        self,
+        link: Optional[str],
+        title: Optional[str],
+        base_url: str,
+        author: Optional[str] = None,
+        published: Optional[str] = None,
+        summary: Optional[str] = None
+    ) -> Optional[FeedEntryMetadata]:
+        """링크/제목이 있는 항목만 메타데이터로 변환"""
+        title = (title or '').strip()
+        link = (link or '').strip()
+        if not link or not title:
+            return None
+
+        url = urljoin(base_url, link)
+        if len(url) > 500:  # Source.source_url 길이 제한
+            return None
+
+        return FeedEntryMetadata(
+            post_id=FeedEntryMetadata.make_id(url),
+            title=title,
+            url=url,
+            author=(author or '').strip() or None,
+            feed=self.name,
+            created_utc=_parse_timestamp(published) or time.time(),
+            summary=summary
+        )
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class FeedConnector(SourceConnector):
+    """RSS 2.0 / Atom 피드 커넥터"""
+
+    def parse(self, body: bytes, base_url: str) -> List[FeedEntryMetadata]:
+        soup = BeautifulSoup(body, 'xml')
+        entries: List[FeedEntryMetadata] = []
+
+        # RSS 2.0
+        for item in soup.find_all('item'):
+            entry = self._entry(
+                link=self._text(item, 'link') or self._text(item, 'guid'),
+                title=self._text(item, 'title'),
+                base_url=base_url,
+                author=self._text(item, 'creator') or self._text(item, 'author'),
+                published=self._text(item, 'pubDate') or self._text(item, 'date'),
+                summary=_plain_text(self._text(item, 'description'))
+            )
+            if entry:
+                entries.append(entry)
+
+        # Atom
+        for item in soup.find_all('entry'):
+            link = item.find('link', rel='alternate') or item.find('link')
+            author = item.find('author')
+            entry = self._entry(
+                link=link.get('href') if link else None,
+                title=self._text(item, 'title'),
+                base_url=base_url,
+                author=self._text(author, 'name') if author else None,
+                published=self._text(item, 'published') or self._text(item, 'updated'),
+                summary=_plain_text(self._text(item, 'summary') or self._text(item, 'content'))
+            )
+            if entry:
+                entries.append(entry)
+
+        return entries[:self.max_entries]
+
+    @staticmethod
+    def _text(element, name: str) -> Optional[str]:
+        child = element.find(name)
+        return child.get_text(strip=True) if child else None
+
+
+class HTMLListingConnector(SourceConnector):
+    """
+    HTML 목록 페이지 커넥터 (CSS 선택자 기반)
+
+    Args:
+        item_selector: 항목 하나를 감싸는 요소 선택자
+        link_selector: 항목 안의 링크 선택자 (href 사용)
+        title_selector: 제목 선택자 (None이면 링크 텍스트)
+        summary_selector: 요약 선택자 (선택)
+        author_selector: 작성자 선택자 (선택)
+        time_selector: 게시 시각 선택자 (datetime 속성 또는 텍스트)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        item_selector: str,
+        link_selector: str = 'a[href]',
+        title_selector: Optional[str] = None,
+        summary_selector: Optional[str] = None,
+        author_selector: Optional[str] = None,
+        time_selector: str = 'time',
+        max_entries: Optional[int] = None
+    ):
+        super().__init__(name, url, max_entries)
+        self.item_selector = item_selector
+        self.link_selector = link_selector
+        self.title_selector = title_selector
+        self.summary_selector = summary_selector
+        self.author_selector = author_selector
+        self.time_selector = time_selector
+
+    def parse(self, body: bytes, base_url: str) -> List[FeedEntryMetadata]:
+        soup = BeautifulSoup(body, 'html.parser')
+        entries: List[FeedEntryMetadata] = []
+
+        for item in soup.select(self.item_selector):
+            link = item.select_one(self.link_selector)
+            if link is None:
+                continue
+
+            title = self._select_text(item, self.title_selector) if self.title_selector else link.get_text(' ', strip=True)
+            published = item.select_one(self.time_selector) if self.time_selector else None
+
+            entry = self._entry(
+                link=link.get('href'),
+                title=title,
+                base_url=base_url,
+                author=self._select_text(item, self.author_selector),
+                published=(published.get('datetime') or published.get_text(strip=True)) if published else None,
+                summary=self._select_text(item, self.summary_selector)
+            )
+            if entry:
+                entries.append(entry)
+            if len(entries) >= self.max_entries:
+                break
+
+        return entries
+
+    @staticmethod
+    def _select_text(element, selector: Optional[str]) -> Optional[str]:
+        if not selector:
+            return None
+        found = element.select_one(selector)
+        return found.get_text(' ', strip=True) if found else None
+
+
+CONNECTOR_TYPES = {
+    'feed': FeedConnector,
+    'html': HTMLListingConnector,
+}
+
+
+def build_connectors(specs: List[Dict[str, Any]]) -> List[SourceConnector]:
+    """
+    설정(FEED_SOURCES) 으로부터 커넥터 생성
+
+    Args:
+        specs: [{'type': 'feed'|'html', 'name': ..., 'url': ..., (HTML 선택자 옵션)}]
+
+    Returns:
+        커넥터 리스트
+
+    Raises:
+        ValueError: 알 수 없는 커넥터 타입
+    """
+    connectors = []
+    for spec in specs:
+        options = dict(spec)
+        connector_type = options.pop('type', 'feed')
+        if connector_type not in CONNECTOR_TYPES:
+            raise ValueError(f"Unknown connector type: {connector_type}")
+        connectors.append(CONNECTOR_TYPES[connector_type](**options))
+    return connectors
+
+
+class ConnectorCollector:
+    """
+    커넥터 동시 수집기
+
+    모든 커넥터가 하나의 httpx.AsyncClient 연결 풀을 공유하고,
+    동시 요청 수는 세마포어로 제한합니다 (같은 호스트 피드는 keep-alive 연결 재사용).
+    """
+
+    def __init__(
+        self,
+        connectors: List[SourceConnector],
+        ingestor: Optional[SourceIngestor] = None,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        user_agent: Optional[str] = None,
+        http_cache: Optional[HTTPCache] = None,
+        use_cache: Optional[bool] = None
+    ):
+        """
+        Args:
+            connectors: 커넥터 리스트
+            ingestor: 공용 저장 경로 (None이면 새로 생성, 글로벌 유사도 인덱스 사용)
+            concurrency: 동시 요청 수 (None이면 설정값)
+            timeout: 요청 타임아웃(초) (None이면 설정값)
+            user_agent: User-Agent (None이면 설정값)
+            http_cache: 응답 캐시 (None이면 글로벌 캐시)
+            use_cache: 응답 캐시 사용 여부 (None이면 설정값)
+        """
+        settings = Settings()
+
+        self.connectors = connectors
+        self.ingestor = ingestor or SourceIngestor()
+        self.concurrency = max(1, concurrency or settings.FEED_CRAWL_CONCURRENCY)
+        self.timeout = timeout or settings.FEED_REQUEST_TIMEOUT
+        self.user_agent = user_agent or settings.FEED_USER_AGENT
+        self.batch_size = settings.CRAWL_PIPELINE_BATCH_SIZE
+
+        if use_cache is None:
+            use_cache = settings.HTTP_CACHE_ENABLED
+        self.http_cache = (http_cache or get_http_cache()) if use_cache else None
+
+    async def fetch_all(self) -> List[ConnectorResult]:
+        """
+        모든 커넥터를 동시에 가져오기 (DB 접근 없음)
+
+        Returns:
+            커넥터 순서대로 ConnectorResult 리스트
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency
+        )
+
+        async with httpx.AsyncClient(
+            limits=limits,
+            timeout=self.timeout,
+            headers={'User-Agent': self.user_agent},
+            follow_redirects=True
+        ) as client:
+            return await asyncio.gather(*(
+                self._fetch_one(client, semaphore, connector) for connector in self.connectors
+            ))
+
+    async def _fetch_one(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        connector: SourceConnector
+    ) -> ConnectorResult:
+        """커넥터 하나 가져오기 및 파싱 (실패는 결과에 기록)"""
+        result = ConnectorResult(name=connector.name, url=connector.url)
+        cache = self.http_cache
+
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                headers = cache.conditional_headers(connector.url) if cache else {}
+                response = await client.get(connector.url, headers=headers)
+                result.status_code = response.status_code
+
+                if response.status_code == 304 and cache:
+                    cache.record_not_modified(connector.url)
+                    result.not_modified = True
+                else:
+                    response.raise_for_status()
+                    result.bytes_received = len(response.content)
+
+                    if cache and cache.is_unchanged(connector.url, response.content):
+                        result.not_modified = True
+                    else:
+                        result.entries = await asyncio.to_thread(
+                            connector.parse, response.content, str(response.url)
+                        )
+                        result.headers, result.body = dict(response.headers), response.content
+            except httpx.TimeoutException:
+                result.error = 'timeout'
+            except httpx.HTTPError as e:
+                result.error = str(e) or type(e).__name__
+            except Exception as e:
+                result.error = f"parse error: {e}"
+            finally:
+                result.elapsed = time.monotonic() - started
+
+        if result.error:
+            logger.error(f"Error fetching {connector.name} ({connector.url}): {result.error}")
+        elif result.not_modified:
+            logger.info(f"{connector.name} not modified since last collection ({result.elapsed:.2f}s)")
+        else:
+            logger.info(f"Fetched {len(result.entries)} entries from {connector.name} ({result.elapsed:.2f}s)")
+
+        return result
+
+    def collect(self, create_inspirations: bool = True) -> Dict[str, Any]:
+        """
+        모든 커넥터 수집 후 공용 저장 경로로 일괄 저장
+
+        호출 스레드에서 이벤트 루프를 실행하므로 Flask 요청/스케줄러 스레드에서 호출합니다.
+
+        Args:
+            create_inspirations: Inspiration도 생성할지 여부
+
+        Returns:
+            {'sources_created', 'inspirations_created', 'duplicates_skipped', 'near_duplicates_skipped',
+             'entries_fetched', 'not_modified': N, 'connectors': {name: {...}}, 'failed_connectors': [...]}
+        """
+        summary: Dict[str, Any] = {
+            **empty_counts(),
+            'entries_fetched': 0,
+            'not_modified': 0,
+            'connectors': {},
+            'failed_connectors': []
+        }
+        if not self.connectors:
+            return summary
+
+        logger.info(f"Collecting from {len(self.connectors)} connectors ({self.concurrency} concurrent)...")
+        results = asyncio.run(self.fetch_all())
+
+        entries: List[FeedEntryMetadata] = []
+        for result in results:
+            if result.error:
+                summary['failed_connectors'].append(result.name)
+            summary['not_modified'] += result.not_modified
+            entries.extend(result.entries)
+            summary['connectors'][result.name] = {
+                'entries': len(result.entries),
+                'bytes': result.bytes_received,
+                'elapsed': round(result.elapsed, 3),
+                'not_modified': result.not_modified,
+                'error': result.error
+            }
+        summary['entries_fetched'] = len(entries)
+
+        saved = True
+        for start in range(0, len(entries), self.batch_size):
+            counts = self.ingestor.try_save_batch(entries[start:start + self.batch_size], create_inspirations)
+            if counts is None:
+                saved = False
+                continue
+            for key, value in counts.items():
+                summary[key] += value
+
+        # 모두 저장된 경우에만 응답 캐시 (다음 수집의 304 가 저장 실패분을 가리지 않도록)
+        if self.http_cache:
+            if saved:
+                for result in results:
+                    if result.body is not None:
+                        self.http_cache.store(result.url, result.headers, result.body)
+            self.http_cache.flush_stats()
+
+        # 원본 컨셉 임베딩 (Draft 유사도 체크 시 새 텍스트만 인코딩하도록)
+        self.ingestor.embed_pending_concepts()
+
+        logger.info(
+            f"Connector collection complete: {summary['sources_created']} sources, "
+            f"{summary['inspirations_created']} inspirations "
+            f"({summary['not_modified']} not modified, {len(summary['failed_connectors'])} failed)"
+        )
+
+        return summary
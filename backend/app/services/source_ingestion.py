@@ -0,0 +1,339 @@
+"""
+공용 수집 저장 경로
+
+Reddit 크롤러와 RSS/HTML 커넥터가 만든 메타데이터 레코드를
+Source / Inspiration 으로 일괄 저장합니다 (중복 제거 + bulk INSERT + 근접 중복 필터).
+
+레코드는 다음만 제공하면 됩니다 (SourceRecord):
+    - platform, post_id, created_utc 속성
+    - source_fields(): Source 컬럼 값
+    - summarize(): Fair Use 컨셉 요약 (원문 복사 없음)
+"""
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.config import Settings
+from app.models import CrawlState, Inspiration, Source
+from app.services.embedding_service import get_embedding_service
+from app.services.near_duplicate_index import (
+    NearDuplicateIndex,
+    get_near_duplicate_index,
+    strip_concept_boilerplate
+)
+from app.services.shingle_index import ShingleIndex, get_shingle_index
+
+logger = logging.getLogger(__name__)
+
+
+class SourceRecord(Protocol):
+    """공용 저장 경로에 넣을 수 있는 메타데이터 레코드"""
+    platform: str
+    post_id: str
+    created_utc: float
+
+    def source_fields(self) -> Dict[str, Any]:
+        ...
+
+    def summarize(self) -> str:
+        ...
+
+
+def empty_counts() -> Dict[str, int]:
+    """저장 결과 카운터 초기값"""
+    return {
+        'sources_created': 0,
+        'inspirations_created': 0,
+        'duplicates_skipped': 0,
+        'near_duplicates_skipped': 0
+    }
+
+
+class SourceIngestor:
+    """
+    메타데이터 레코드 일괄 저장 서비스
+
+    수집기(크롤러/커넥터)마다 하나씩 두고 여러 배치에 재사용합니다.
+    수집 중 생성된 컨셉은 모아 두었다가 embed_pending_concepts() 에서 한 번에 임베딩합니다.
+    """
+
+    def __init__(
+        self,
+        near_duplicate_index: Optional[NearDuplicateIndex] = None,
+        shingle_index: Optional[ShingleIndex] = None
+    ):
+        """
+        Args:
+            near_duplicate_index: 근접 중복 인덱스 (None이면 글로벌 인덱스)
+            shingle_index: 코퍼스 표절 체크용 역색인 (None이면 글로벌 인덱스)
+        """
+        self._near_duplicate_index = near_duplicate_index
+        self._shingle_index = shingle_index
+        self.near_duplicate_threshold = Settings().NEAR_DUPLICATE_THRESHOLD
+
+        # 수집 중 생성된 컨셉 (수집 종료 시 한 번에 임베딩)
+        self.pending_concepts: List[str] = []
+
+    @property
+    def near_duplicate_index(self) -> NearDuplicateIndex:
+        """근접 중복 인덱스 (지연 로드)"""
+        if self._near_duplicate_index is None:
+            self._near_duplicate_index = get_near_duplicate_index()
+        return self._near_duplicate_index
+
+    @property
+    def shingle_index(self) -> ShingleIndex:
+        """코퍼스 표절 체크용 역색인 (지연 로드)"""
+        if self._shingle_index is None:
+            self._shingle_index = get_shingle_index()
+        return self._shingle_index
+
+    def save_batch(
+        self,
+        records: List[SourceRecord],
+        create_inspirations: bool = True,
+        crawl_state: Optional[CrawlState] = None,
+        skipped: int = 0,
+        concepts: Optional[Dict[str, str]] = None
+    ) -> Dict[str, int]:
+        """
+        레코드 묶음을 한 트랜잭션으로 저장
+
+        중복은 플랫폼별 source_id IN (...) 쿼리 한 번으로 걸러내고,
+        새 Source / Inspiration 은 각각 bulk INSERT ... RETURNING 으로 생성합니다.
+        다른 워커가 같은 레코드를 먼저 저장해 충돌하면 중복 조회부터 한 번 다시 시도합니다.
+        crawl_state 는 같은 트랜잭션에서 갱신하므로 저장에 실패하면 수집 지점도 전진하지 않습니다.
+
+        Args:
+            records: 메타데이터 레코드 리스트
+            create_inspirations: Inspiration 도 생성할지 여부
+            crawl_state: 함께 갱신할 증분 수집 상태 (선택)
+            skipped: 가져오기 단계에서 이미 본 레코드라 건너뛴 수 (상태 기록용)
+            concepts: 미리 요약/근접 중복 판정한 {post_id: 컨셉} (없는 레코드는 근접 중복,
+                      None이면 여기서 계산)
+
+        Returns:
+            {'sources_created', 'inspirations_created', 'duplicates_skipped', 'near_duplicates_skipped'}
+        """
+        counts = self.try_save_batch(records, create_inspirations, crawl_state, skipped, concepts)
+        return counts or empty_counts()
+
+    def try_save_batch(
+        self,
+        records: List[SourceRecord],
+        create_inspirations: bool,
+        crawl_state: Optional[CrawlState] = None,
+        skipped: int = 0,
+        concepts: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, int]]:
+        """save_batch 와 같지만 실패 시 None 반환"""
+        unique: Dict[Tuple[str, str], SourceRecord] = {}
+        for record in records:
+            unique.setdefault((record.platform, record.post_id), record)
+
+        for attempt in range(2):
+            try:
+                return self._insert_batch(
+                    list(unique.values()), len(records), create_inspirations, crawl_state, skipped, concepts
+                )
+            except IntegrityError as e:
+                db.session.rollback()
+                if attempt:
+                    logger.error(f"Failed to save batch: {e}")
+                else:
+                    logger.info("Concurrent insert detected, retrying batch")
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Failed to save batch: {e}")
+                break
+
+        return None
+
+    def _insert_batch(
+        self,
+        records: List[SourceRecord],
+        total: int,
+        create_inspirations: bool,
+        crawl_state: Optional[CrawlState] = None,
+        skipped: int = 0,
+        concepts: Optional[Dict[str, str]] = None
+    ) -> Dict[str, int]:
+        """save_batch 본체 (예외는 호출자가 처리)"""
+        counts = empty_counts()
+
+        by_platform: Dict[str, List[str]] = {}
+        for record in records:
+            by_platform.setdefault(record.platform, []).append(record.post_id)
+
+        existing = set()
+        for platform, post_ids in by_platform.items():
+            existing.update(
+                (platform, source_id) for (source_id,) in db.session.query(Source.source_id).filter(
+                    Source.platform == platform,
+                    Source.source_id.in_(post_ids)
+                )
+            )
+
+        new_records = [record for record in records if (record.platform, record.post_id) not in existing]
+        counts['duplicates_skipped'] = total - len(new_records)
+
+        if crawl_state is not None:
+            crawl_state.advance(records, skipped, datetime.utcnow())
+
+        if not new_records:
+            if crawl_state is not None:
+                db.session.commit()
+            return counts
+
+        # RETURNING 순서는 DB 마다 보장되지 않으므로 반환된 키로 매핑
+        rows = db.session.execute(
+            insert(Source).returning(Source.id, Source.source_id),
+            [record.source_fields() for record in new_records]
+        ).all()
+        source_ids = {row.source_id: row.id for row in rows}
+        counts['sources_created'] = len(rows)
+
+        documents: List[Tuple[str, int, str]] = []
+        if create_inspirations:
+            if concepts is None:
+                concepts = dict(self.select_new_concepts(new_records))
+            else:
+                concepts = {
+                    record.post_id: concepts[record.post_id]
+                    for record in new_records if record.post_id in concepts
+                }
+            counts['near_duplicates_skipped'] = len(new_records) - len(concepts)
+
+            if concepts:
+                post_ids = {source_ids[post_id]: post_id for post_id in concepts}
+                rows = db.session.execute(
+                    insert(Inspiration).returning(Inspiration.id, Inspiration.source_id),
+                    [
+                        {
+                            'source_id': source_ids[post_id],
+                            'original_concept': concept,
+                            'status': 'collected'
+                        }
+                        for post_id, concept in concepts.items()
+                    ]
+                ).all()
+                documents = [
+                    ('inspiration', row.id, concepts[post_ids[row.source_id]])
+                    for row in rows
+                ]
+                counts['inspirations_created'] = len(rows)
+
+        db.session.commit()
+        logger.info(
+            f"Saved batch: {counts['sources_created']} sources, "
+            f"{counts['inspirations_created']} inspirations "
+            f"({counts['duplicates_skipped']} duplicates skipped)"
+        )
+
+        if documents:
+            self.index_documents(documents)
+
+        return counts
+
+    def index_documents(self, documents: List[Tuple[str, int, str]]) -> None:
+        """
+        저장된 컨셉을 유사도 인덱스에 추가하고 임베딩 대기열에 넣기
+
+        Args:
+            documents: (doc_type, doc_id, 컨셉) 리스트
+        """
+        fingerprints = [
+            (doc_type, doc_id, strip_concept_boilerplate(concept))
+            for doc_type, doc_id, concept in documents
+        ]
+        self.near_duplicate_index.add_many(fingerprints)
+        self.shingle_index.add_many(fingerprints)
+        self.pending_concepts.extend(concept for _, _, concept in documents)
+
+    def select_new_concepts(self, records: List[SourceRecord]) -> List[Tuple[str, str]]:
+        """
+        근접 중복이 아닌 레코드의 컨셉만 선택
+
+        기존 인덱스와 같은 배치 안에서 먼저 선택된 컨셉 모두와 비교합니다.
+
+        Args:
+            records: 새 레코드 리스트
+
+        Returns:
+            (post_id, original_concept) 리스트
+        """
+        is_new = self.near_duplicate_filter()
+        selected: List[Tuple[str, str]] = []
+
+        for record in records:
+            concept = record.summarize()
+            if is_new(record.post_id, concept):
+                selected.append((record.post_id, concept))
+
+        return selected
+
+    def near_duplicate_filter(self) -> Callable[[str, str], bool]:
+        """
+        근접 중복 판정 함수 생성
+
+        반환된 함수는 기존 인덱스 및 지금까지 통과한 컨셉 모두와 비교하고,
+        통과한 컨셉은 메모리 전용 LSH 인덱스에 기억합니다 (한 스레드에서만 호출).
+
+        Returns:
+            (post_id, concept) -> 새 컨셉이면 True
+        """
+        index = self.near_duplicate_index
+        index.sync()
+        # 같은 배치에서 통과한 컨셉 (기존 인덱스와 같은 해시 파라미터, 저널 없음)
+        accepted = NearDuplicateIndex(
+            num_perm=index.num_perm,
+            bands=index.bands,
+            shingle_size=index.shingle_size,
+            seed=index.seed
+        )
+
+        def is_new(post_id: str, concept: str) -> bool:
+            signature = index.signature(strip_concept_boilerplate(concept))
+            if any(
+                candidates.query_signature(
+                    signature,
+                    k=1,
+                    threshold=self.near_duplicate_threshold,
+                    doc_type='inspiration'
+                )
+                for candidates in (index, accepted)
+            ):
+                logger.info(f"Skipping near-duplicate inspiration for {post_id}")
+                return False
+
+            accepted.add_signature('inspiration', len(accepted), signature, persist=False)
+            return True
+
+        return is_new
+
+    def embed_pending_concepts(self) -> int:
+        """
+        수집된 컨셉을 배치 임베딩하여 캐시에 저장
+
+        Returns:
+            임베딩된 컨셉 수 (임베딩 사용 불가 시 0)
+        """
+        concepts, self.pending_concepts = self.pending_concepts, []
+        if not concepts:
+            return 0
+
+        service = get_embedding_service()
+        if service is None or not service.is_available():
+            return 0
+
+        try:
+            service.encode(concepts)
+            logger.info(f"Embedded {len(concepts)} concepts")
+            return len(concepts)
+        except Exception as e:
+            logger.warning(f"Failed to embed concepts: {e}")
+            return 0
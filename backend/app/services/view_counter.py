@@ -0,0 +1,158 @@
+"""
+게시물 조회수 write-behind 버퍼
+
+조회 요청마다 view_count 를 커밋하면 읽기 요청이 쓰기 트랜잭션이 되고, 인기 게시물의
+같은 행에 잠금 경합이 생깁니다. 조회수 증가분을 프로세스 메모리에 모아 두었다가
+주기마다(VIEW_COUNT_FLUSH_INTERVAL) 한 번의 batched UPDATE 로 반영합니다.
+
+- UPDATE 는 view_count = view_count + :delta 형태라 여러 워커가 각자 flush 해도 증가분이 합쳐짐
+- 조회 응답에는 아직 반영하지 않은 이 워커의 증가분을 더해서 보여줌
+- 저장에 실패하면 증가분을 버퍼에 되돌려 다음 주기에 다시 시도
+- 워커 종료 시(atexit) 남은 증가분 반영 (강제 종료되면 마지막 주기분만 유실)
+"""
+import atexit
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from flask import current_app
+from sqlalchemy import bindparam, update
+
+from app import db
+from app.config import Settings
+from app.models import Post
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """
+    조회수 증가분 버퍼 (스레드 안전)
+
+    Usage:
+        counter = get_view_counter(app)
+        counter.increment(post.id)
+        data['view_count'] = post.view_count + counter.pending(post.id)
+        counter.flush()
+    """
+
+    def __init__(self, app, interval: float = 5.0):
+        """
+        Args:
+            app: Flask app instance (저장 시 app context 용)
+            interval: 백그라운드 flush 주기(초)
+        """
+        self.app = app
+        self.interval = interval
+
+        self._pending: Counter = Counter()  # post_id -> 반영 안 된 증가분
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def increment(self, post_id: int, count: int = 1) -> None:
+        """
+        조회수 증가 (메모리에만 기록)
+
+        Args:
+            post_id: 게시물 ID
+            count: 증가분
+        """
+        with self._lock:
+            self._pending[post_id] += count
+
+    def pending(self, post_id: int) -> int:
+        """아직 반영하지 않은 증가분"""
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def pending_many(self, post_ids: Iterable[int]) -> Dict[int, int]:
+        """여러 게시물의 반영 안 된 증가분 {post_id: delta} (없는 것은 생략)"""
+        with self._lock:
+            return {post_id: self._pending[post_id] for post_id in post_ids if post_id in self._pending}
+
+    def flush(self) -> int:
+        """
+        모아 둔 증가분을 한 번의 batched UPDATE 로 반영
+
+        Returns:
+            갱신한 게시물 수
+        """
+        with self._lock:
+            deltas, self._pending = self._pending, Counter()
+
+        if not deltas:
+            return 0
+
+        posts = Post.__table__
+        statement = update(posts).where(
+            posts.c.id == bindparam('post_id')
+        ).values(
+            view_count=posts.c.view_count + bindparam('delta'),
+            updated_at=posts.c.updated_at  # 조회는 내용 수정이 아니므로 수정 시각 유지
+        )
+        rows = [{'post_id': post_id, 'delta': delta} for post_id, delta in deltas.items()]
+
+        with self.app.app_context():
+            try:
+                db.session.execute(statement, rows)
+                db.session.commit()
+                return len(rows)
+            except Exception as e:
+                db.session.rollback()
+                logger.warning(f"Failed to flush view counts for {len(rows)} posts: {e}")
+                with self._lock:
+                    self._pending.update(deltas)
+                return 0
+
+    def start(self) -> None:
+        """백그라운드 flush 시작 (종료 시 남은 증가분 반영)"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='view-counter', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def stop(self) -> None:
+        """백그라운드 flush 중지 및 남은 증가분 반영"""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval + 5)
+        self.flush()
+
+
+def init_view_counter(app, start: bool = True) -> ViewCounter:
+    """
+    조회수 버퍼 초기화 (Flask 앱 시작 시 호출)
+
+    Args:
+        app: Flask app instance
+        start: 백그라운드 flush 시작 여부 (테스트에서는 직접 flush)
+
+    Returns:
+        ViewCounter 인스턴스
+    """
+    counter = ViewCounter(app, interval=Settings().VIEW_COUNT_FLUSH_INTERVAL)
+    app.extensions['view_counter'] = counter
+    if start:
+        counter.start()
+    return counter
+
+
+def get_view_counter(app=None) -> ViewCounter:
+    """
+    앱의 조회수 버퍼 반환
+
+    Args:
+        app: Flask app instance (None이면 current_app)
+
+    Returns:
+        ViewCounter 인스턴스
+    """
+    app = app or current_app._get_current_object()
+    return app.extensions['view_counter']
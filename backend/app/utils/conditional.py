@@ -0,0 +1,141 @@
+"""
+조건부 GET (ETag / If-None-Match)
+
+공개 엔드포인트가 같은 JSON 을 반복해서 내려받지 않도록, 응답 대신 가벼운 버전 조회
+(행의 updated_at, 테이블별 ContentVersion 카운터)로 weak ETag 를 만들고, 클라이언트가 보낸 If-None-Match 와 같으면
+뷰를 실행하지 않고 바로 304 를 돌려줍니다 (DB 조회/직렬화/압축 없음).
+
+- 버전 함수는 뷰와 같은 인자를 받아 버전 문자열을 반환 (None이면 조건부 처리 안 함)
+- ETag 는 엔드포인트 + 버전 + 쿼리 문자열의 해시 (weak: 조회수처럼 모아서 반영하는 값은 제외)
+- Flask-Compress 가 붙이는 ':gzip' 같은 접미사는 비교할 때 무시
+- Cache-Control 은 라우트별 기본값, 설정(CACHE_CONTROL)에서 엔드포인트 이름으로 덮어씀
+- @cache.cached 와 함께 쓸 때는 make_cache_key=versioned_cache_key 로 캐시 키에 버전을 넣어
+  캐시된 본문과 ETag 가 어긋나지 않게 함
+
+Usage:
+    @posts_bp.route('/<int:post_id>')
+    @conditional(post_version, cache_control='public, no-cache')
+    def get_post(post_id): ...
+"""
+import hashlib
+from functools import wraps
+from typing import Callable, Optional
+
+from flask import current_app, g, make_response, request
+from sqlalchemy import select
+
+from app import db
+from app.config import Settings
+from app.models import ContentVersion
+
+
+def conditional(version: Callable[..., Optional[str]], cache_control: str = 'public, no-cache',
+                not_modified: Optional[Callable[..., None]] = None):
+    """
+    조건부 GET 데코레이터 (@route 바로 아래, @cache.cached 위에 둠)
+
+    Args:
+        version: 뷰 인자를 받아 콘텐츠 버전을 반환하는 함수 (가벼운 조회 한 번)
+        cache_control: 기본 Cache-Control (설정 CACHE_CONTROL 의 엔드포인트 값이 우선)
+        not_modified: 304 를 돌려줄 때 호출할 함수 (version, **뷰 인자), 예: 조회수 집계
+    """
+    def decorator(fn):
+        policies = {}
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            current = version(*args, **kwargs)
+            if current is None:
+                return fn(*args, **kwargs)
+
+            g.content_version = current
+            etag = make_etag(request.endpoint, current)
+            if request.method in ('GET', 'HEAD') and etag_matches(etag):
+                if not_modified:
+                    not_modified(current, *args, **kwargs)
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            if request.endpoint not in policies:
+                policies[request.endpoint] = Settings().CACHE_CONTROL.get(request.endpoint, cache_control)
+            response.headers['ETag'] = etag
+            response.headers['Cache-Control'] = policies[request.endpoint]
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def make_etag(endpoint: str, version: str) -> str:
+    """엔드포인트, 버전, 쿼리 문자열로 만든 weak ETag"""
+    args = sorted(request.args.items(multi=True))
+    digest = hashlib.sha1(f"{endpoint}|{version}|{args}".encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(etag: str) -> bool:
+    """If-None-Match 에 같은 ETag 가 있는지 (weak 비교, 압축 접미사 무시)"""
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return False
+    if if_none_match.star_tag:
+        return True
+
+    opaque = etag[3:-1]  # W/"..." -> ...
+    return any(tag.split(':', 1)[0] == opaque for tag in if_none_match.as_set(include_weak=True))
+
+
+def versioned_cache_key(*args, **kwargs) -> str:
+    """@cache.cached 용 캐시 키 (경로 + 쿼리 문자열 + conditional 이 조회한 콘텐츠 버전)"""
+    args_key = sorted(request.args.items(multi=True))
+    digest = hashlib.md5(f"{args_key}|{g.get('content_version')}".encode()).hexdigest()
+    return f"view/{request.path}/{digest}"
+
+
+def table_versions(*models) -> str:
+    """
+    테이블별 콘텐츠 버전(ContentVersion)을 한 번의 쿼리로 읽은 버전
+
+    추가/수정/삭제 모두 테이블 버전 카운터를 올리므로 행 수를 세거나 updated_at 을 훑지 않습니다.
+
+    Args:
+        *models: 버전을 관리하는 모델 (ContentVersion.TRACKED_TABLES)
+
+    Returns:
+        버전 문자열
+    """
+    names = [model.__tablename__ for model in models]
+    versions = dict(db.session.execute(
+        select(ContentVersion.table_name, ContentVersion.version).where(ContentVersion.table_name.in_(names))
+    ).all())
+    return '|'.join(str(versions.get(name, 0)) for name in names)
+
+
+def _table_version(model):
+    """테이블 버전 스칼라 서브쿼리"""
+    return select(ContentVersion.version).where(
+        ContentVersion.table_name == model.__tablename__
+    ).scalar_subquery()
+
+
+def row_version(model, *criteria, related=()) -> Optional[str]:
+    """
+    한 행의 버전 (행의 id, updated_at + 관련 테이블 버전)을 한 번의 쿼리로 조회
+
+    Args:
+        model: 모델
+        *criteria: 행 조건 (예: Post.id == post_id)
+        related: 응답에 함께 담기는 관련 모델 (테이블 단위 버전)
+
+    Returns:
+        버전 문자열, 행이 없으면 None (뷰가 404 처리)
+    """
+    columns = [model.id, model.updated_at, *(_table_version(other) for other in related)]
+    row = db.session.execute(select(*columns).where(*criteria).limit(1)).first()
+    if row is None:
+        return None
+    return '|'.join(str(value) for value in row)
@@ -0,0 +1,135 @@
+"""
+페이지네이션 전체 개수 전략
+
+페이지 응답마다 같은 필터로 COUNT(*) 를 실행하면, 큰 테이블(page_views, user_activities 등)에서는
+페이지 조회보다 개수 세기가 더 비쌉니다. 용도에 맞게 개수를 구하는 방법을 고릅니다.
+
+- exact: 매번 COUNT(*)
+- cached: 필터 조합(컴파일된 SQL + 파라미터)별로 COUNT 결과를 COUNT_CACHE_TTL 동안 재사용
+- estimated: PostgreSQL 플래너 추정치 (필터 없으면 pg_class.reltuples, 있으면 EXPLAIN 의 예상 행 수)
+             추정할 수 없는 DB(SQLite)에서는 cached 로 대신함
+- auto: 필터 없는 큰 테이블은 estimated, 그 외는 cached
+
+응답에는 개수가 정확한지(total_exact)를 함께 싣습니다.
+"""
+import hashlib
+import json
+import logging
+from typing import Optional, Tuple
+
+from sqlalchemy import Table, text
+
+from app import cache, db
+from app.config import Settings
+from app.utils.errors import ValidationError
+
+logger = logging.getLogger(__name__)
+
+EXACT = 'exact'
+CACHED = 'cached'
+ESTIMATED = 'estimated'
+AUTO = 'auto'
+STRATEGIES = (EXACT, CACHED, ESTIMATED, AUTO)
+
+
+def validate_strategy(strategy: str) -> str:
+    """
+    개수 전략 이름 검증
+
+    Raises:
+        ValidationError: 알 수 없는 전략
+    """
+    if strategy not in STRATEGIES:
+        raise ValidationError(f"count must be one of: {', '.join(STRATEGIES)}")
+    return strategy
+
+
+def count_query(query, strategy: Optional[str] = None) -> Tuple[int, bool]:
+    """
+    쿼리 결과 전체 개수
+
+    Args:
+        query: 필터가 적용된 쿼리 (정렬/LIMIT 은 무시)
+        strategy: exact, cached, estimated, auto (None이면 PAGINATION_COUNT_STRATEGY)
+
+    Returns:
+        (개수, 정확한 값인지 여부)
+    """
+    settings = Settings()
+    strategy = validate_strategy(strategy or settings.PAGINATION_COUNT_STRATEGY)
+    # 정렬/LIMIT 과 eager load JOIN 은 개수와 무관하므로 서명과 추정에서 제외
+    query = query.order_by(None).limit(None).offset(None).enable_eagerloads(False)
+
+    if strategy == EXACT:
+        return query.count(), True
+
+    if strategy in (ESTIMATED, AUTO) and db.engine.dialect.name == 'postgresql':
+        table = _unfiltered_table(query)
+        if strategy == ESTIMATED or table is not None:
+            estimate = _estimate(query, table)
+            # 작은 테이블은 COUNT 가 싸고, 통계가 없으면 추정치가 무의미
+            if estimate is not None and (strategy == ESTIMATED or estimate >= settings.COUNT_ESTIMATE_MIN_ROWS):
+                return estimate, False
+
+    return _cached_count(query, settings.COUNT_CACHE_TTL)
+
+
+def _cached_count(query, ttl: int) -> Tuple[int, bool]:
+    """필터 조합별 캐시된 COUNT (캐시에 없으면 새로 세어 정확한 값)"""
+    key = f"count:{filter_signature(query)}"
+    total = cache.get(key)
+    if total is not None:
+        return total, False
+
+    total = query.count()
+    cache.set(key, total, timeout=ttl)
+    return total, True
+
+
+def filter_signature(query) -> str:
+    """
+    쿼리의 필터 서명 (같은 테이블/조인/조건/파라미터면 같은 값)
+
+    Args:
+        query: SQLAlchemy 쿼리
+
+    Returns:
+        SHA1 해시 (hex)
+    """
+    compiled = query.statement.compile(dialect=db.engine.dialect)
+    params = json.dumps(sorted(compiled.params.items()), default=str)
+    return hashlib.sha1(f"{compiled}|{params}".encode()).hexdigest()
+
+
+def _unfiltered_table(query) -> Optional[Table]:
+    """WHERE/JOIN 없이 테이블 하나만 읽는 쿼리면 그 테이블"""
+    statement = query.statement
+    froms = statement.get_final_froms()
+    if statement.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table):
+        return froms[0]
+    return None
+
+
+def _estimate(query, table: Optional[Table]) -> Optional[int]:
+    """PostgreSQL 플래너 추정 행 수 (통계가 없거나 실패하면 None)"""
+    try:
+        # 실패해도 요청 트랜잭션이 중단되지 않도록 savepoint 안에서 실행
+        with db.session.begin_nested():
+            if table is not None:
+                reltuples = db.session.execute(
+                    text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"),
+                    {'name': table.fullname}
+                ).scalar()
+                # 한 번도 ANALYZE 되지 않은 테이블은 -1 (PostgreSQL 14+)
+                return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+
+            compiled = query.statement.compile(dialect=db.engine.dialect)
+            plan = db.session.connection().exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+            ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows'])
+    except Exception as e:
+        logger.warning(f"Row estimate failed, falling back to cached count: {e}")
+        return None
@@ -0,0 +1,254 @@
+"""
+커서(keyset) 페이지네이션
+
+query.paginate() 는 OFFSET 과 COUNT(*) 를 실행하므로 뒤쪽 페이지일수록, 테이블이 커질수록
+느려집니다. 커서 모드는 마지막 항목의 정렬 키 (예: published_at, id) 다음부터 읽으므로
+어느 위치든 첫 페이지와 같은 비용(인덱스 탐색 + LIMIT)으로 조회합니다.
+
+- 정렬 키 마지막에 항상 id 를 붙여 순서를 유일하게 만듦
+- 커서 토큰은 정렬 키 값을 담은 불투명 문자열 (정렬 기준이 다른 목록의 커서는 거부)
+- 기존 page 파라미터도 그대로 지원하고, 응답에 다음 페이지 커서를 함께 줌
+- 커서 모드의 total 은 include_total=true 일 때만 계산
+- total 은 counting.count_query 의 전략(정확/캐시/추정)으로 구하고 total_exact 로 정확 여부 표시
+
+Usage:
+    keyset = Keyset(SortKey(Post.published_at), SortKey(Post.id))
+    items, pagination = paginate_request(query, keyset)
+"""
+import base64
+import hashlib
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import request
+from sqlalchemy import and_, or_
+
+from app.utils.counting import count_query, validate_strategy
+from app.utils.errors import ValidationError
+
+
+@dataclass
+class SortKey:
+    """정렬 키 (컬럼, 방향, 항목에서 값을 읽는 함수)"""
+    column: Any
+    descending: bool = True
+    value: Optional[Callable[[Any], Any]] = None  # None이면 항목의 같은 이름 속성
+    nullable: Optional[bool] = None  # None이면 컬럼 정의를 따름 (필터로 NULL 이 빠지면 False 지정)
+
+    def __post_init__(self):
+        if self.nullable is None:
+            self.nullable = self.column.expression.nullable
+
+    @property
+    def name(self) -> str:
+        return f"{self.column.class_.__tablename__}.{self.column.key}"
+
+    def value_of(self, item) -> Any:
+        return self.value(item) if self.value else getattr(item, self.column.key)
+
+    def order_clause(self):
+        clause = self.column.desc() if self.descending else self.column.asc()
+        # NULL 정렬 위치는 DB마다 다르므로 맨 뒤로 고정 (NOT NULL 이면 인덱스 순서 그대로)
+        return clause.nulls_last() if self.nullable else clause
+
+    def after(self, value):
+        """커서 값보다 정렬 순서상 뒤인 조건 (NULL 이면 None, 같은 값은 다음 키에서 비교)"""
+        if value is None:
+            return None  # NULL 은 맨 뒤이므로 같은 NULL 안에서 다음 키로만 이어짐
+        beyond = self.column < value if self.descending else self.column > value
+        return or_(beyond, self.column.is_(None)) if self.nullable else beyond
+
+    def equals(self, value):
+        return self.column.is_(None) if value is None else self.column == value
+
+
+class Keyset:
+    """
+    정렬 키 묶음 (마지막 키는 유일해야 함, 보통 id)
+
+    Args:
+        *keys: 정렬 키 (우선순위 순)
+    """
+
+    def __init__(self, *keys: SortKey):
+        if not keys:
+            raise ValueError("Keyset requires at least one sort key")
+        self.keys = keys
+        # 다른 정렬 기준으로 만든 커서를 구분하기 위한 서명
+        spec = ','.join(f"{key.name}:{'d' if key.descending else 'a'}" for key in keys)
+        self.signature = hashlib.sha1(spec.encode()).hexdigest()[:8]
+
+    def order(self, query):
+        """정렬 적용"""
+        return query.order_by(*(key.order_clause() for key in self.keys))
+
+    def after(self, query, values: List[Any]):
+        """
+        커서 다음 항목만 남기는 조건 적용
+
+        (k1, k2, ..., id) > (v1, v2, ..., vid) 를 정렬 방향과 NULL 을 고려해 펼친 형태:
+        k1 뒤 OR (k1 같음 AND k2 뒤) OR ... OR (앞 키 모두 같음 AND id 뒤)
+        """
+        clauses = []
+        for index, key in enumerate(self.keys):
+            beyond = key.after(values[index])
+            if beyond is None:
+                continue
+            prefix = [self.keys[i].equals(values[i]) for i in range(index)]
+            clauses.append(and_(*prefix, beyond))
+        return query.filter(or_(*clauses))
+
+    def encode(self, item) -> str:
+        """항목 위치를 커서 토큰으로 변환"""
+        values = [_dump_value(key.value_of(item)) for key in self.keys]
+        payload = json.dumps({'s': self.signature, 'v': values}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode(self, token: str) -> List[Any]:
+        """
+        커서 토큰을 정렬 키 값으로 변환
+
+        Raises:
+            ValidationError: 잘못된 토큰이거나 다른 정렬 기준의 커서
+        """
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values = [_load_value(value) for value in payload['v']]
+            signature = payload['s']
+        except (ValueError, KeyError, TypeError):
+            raise ValidationError('Invalid cursor')
+
+        if signature != self.signature or len(values) != len(self.keys):
+            raise ValidationError('Cursor does not match the requested ordering')
+        return values
+
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    return value
+
+
+def _load_value(value):
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value['dt'])
+    return value
+
+
+def paginate_keyset(query, keyset: Keyset, per_page: int, cursor: Optional[str] = None,
+                    include_total: bool = False, count: Optional[str] = None) -> Tuple[list, Dict[str, Any]]:
+    """
+    커서 페이지 조회 (OFFSET/COUNT 없음)
+
+    Args:
+        query: 필터가 적용된 쿼리 (정렬은 keyset 이 적용)
+        keyset: 정렬 키
+        per_page: 페이지 크기
+        cursor: 이전 응답의 next_cursor (None이면 첫 페이지)
+        include_total: 전체 개수 포함 여부
+        count: 전체 개수 전략 (counting.count_query 참고)
+
+    Returns:
+        (항목 리스트, {'per_page', 'cursor', 'next_cursor', 'has_next', 'has_prev', 'total', 'total_exact'})
+    """
+    page_query = keyset.order(query)
+    if cursor:
+        page_query = keyset.after(page_query, keyset.decode(cursor))
+
+    # 한 개 더 읽어 다음 페이지 존재 여부 판단
+    rows = page_query.limit(per_page + 1).all()
+    items, has_next = rows[:per_page], len(rows) > per_page
+
+    total, total_exact = None, False
+    if include_total:
+        if not cursor and not has_next:
+            total, total_exact = len(items), True  # 전부 한 페이지에 있음
+        else:
+            total, total_exact = count_query(query, count)
+
+    return items, {
+        'per_page': per_page,
+        'cursor': cursor,
+        'next_cursor': keyset.encode(items[-1]) if has_next else None,
+        'has_next': has_next,
+        'has_prev': bool(cursor),
+        'total': total,
+        'total_exact': total_exact,
+    }
+
+
+def paginate_page(query, keyset: Keyset, page: int, per_page: int,
+                  count: Optional[str] = None) -> Tuple[list, Dict[str, Any]]:
+    """
+    페이지 번호 조회 (OFFSET, 기존 방식)
+
+    마지막 페이지에서는 개수를 세지 않고 OFFSET + 항목 수로 정확한 전체 개수를 구합니다.
+
+    Args:
+        query: 필터가 적용된 쿼리 (정렬은 keyset 이 적용)
+        keyset: 정렬 키
+        page: 페이지 번호 (1부터)
+        per_page: 페이지 크기
+        count: 전체 개수 전략 (counting.count_query 참고)
+
+    Returns:
+        (항목 리스트, {'page', 'per_page', 'total', 'total_exact', 'pages', 'has_next', 'has_prev', 'next_cursor'})
+    """
+    page = max(page, 1)
+    offset = (page - 1) * per_page
+    rows = keyset.order(query).limit(per_page + 1).offset(offset).all()
+    items, has_next = rows[:per_page], len(rows) > per_page
+
+    if not has_next and (items or page == 1):
+        total, total_exact = offset + len(items), True
+    else:
+        total, total_exact = count_query(query, count)
+        # 캐시/추정 값이 이 페이지 위치보다 작으면 하한으로 보정 (정확한 값은 아님)
+        # 범위 밖 페이지(항목 없음)는 위치가 개수를 뜻하지 않으므로 보정하지 않음
+        lower_bound = offset + len(items) + (1 if has_next else 0)
+        if items and total < lower_bound:
+            total, total_exact = lower_bound, False
+
+    return items, {
+        'page': page,
+        'per_page': per_page,
+        'total': total,
+        'total_exact': total_exact,
+        'pages': math.ceil(total / per_page),
+        'has_next': has_next,
+        'has_prev': page > 1,
+        'next_cursor': keyset.encode(items[-1]) if has_next else None,
+    }
+
+
+def paginate_request(query, keyset: Keyset, default_per_page: int = 20,
+                     max_per_page: int = 100) -> Tuple[list, Dict[str, Any]]:
+    """
+    요청 파라미터에 따라 페이지 조회
+
+    Query Parameters:
+        cursor (str): 있으면 커서 모드 (빈 값이면 첫 페이지)
+        page (int): 페이지 번호 (커서가 없을 때, 기존 방식)
+        per_page (int): 페이지 크기
+        include_total (bool): 커서 모드에서 전체 개수 포함 여부
+        count (str): 전체 개수 전략 (exact, cached, estimated, auto)
+
+    Returns:
+        (항목 리스트, pagination 딕셔너리)
+        page 모드 응답에도 다음 페이지 커서(next_cursor)를 포함
+    """
+    per_page = max(1, min(request.args.get('per_page', default_per_page, type=int), max_per_page))
+    count = request.args.get('count')
+    if count is not None:
+        validate_strategy(count)
+
+    if 'cursor' in request.args:
+        include_total = request.args.get('include_total', 'false').lower() == 'true'
+        return paginate_keyset(query, keyset, per_page, request.args['cursor'] or None, include_total, count)
+
+    page = request.args.get('page', 1, type=int)
+    return paginate_page(query, keyset, page, per_page, count)
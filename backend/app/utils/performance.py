@@ -5,7 +5,9 @@
 import time
 import functools
 import logging
+from contextlib import contextmanager
 from flask import g, request
+from sqlalchemy import event
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -94,6 +96,49 @@ class PerformanceMonitor:
         return None
 
 
+class QueryCounter:
+    """실행된 SQL 문 기록 (count_queries 가 반환)"""
+
+    def __init__(self):
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        """실행된 SQL 문 수 (executemany 는 1회)"""
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(engine=None):
+    """
+    블록 안에서 실행된 SQL 문 수 측정
+
+    Args:
+        engine: 측정할 SQLAlchemy 엔진 (None이면 db.engine)
+
+    Yields:
+        QueryCounter
+
+    Example:
+        with count_queries() as counter:
+            crawler.save_batch(posts)
+        assert counter.count <= 3
+    """
+    if engine is None:
+        from app import db
+        engine = db.engine
+
+    counter = QueryCounter()
+    event.listen(engine, 'before_cursor_execute', counter._record)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, 'before_cursor_execute', counter._record)
+
+
 # 요청별 성능 추적
 def init_request_monitoring(app):
     """Flask 요청 모니터링 초기화"""
@@ -0,0 +1,248 @@
+"""
+스레드 기반 스트리밍 파이프라인
+
+각 단계는 제한된 크기의 입력 큐와 자체 워커 스레드를 가지며,
+단계 함수는 입력 하나당 0개 이상의 출력을 yield 합니다 (필터/변환/펼치기).
+다운스트림이 느리면 큐가 차서 put 이 막히므로 업스트림이 자연스럽게 느려지고
+(backpressure), 메모리에는 큐 크기만큼의 항목만 남습니다.
+
+마지막 sink 단계는 호출 스레드에서 배치 단위로 실행되므로
+DB 세션/앱 컨텍스트처럼 스레드에 묶인 자원을 안전하게 쓸 수 있습니다.
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 단계 종료 표시
+_DONE = object()
+
+
+@dataclass
+class StageMetrics:
+    """단계별 처리 지표"""
+    name: str
+    workers: int
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0  # 단계 함수 실행 시간 (워커 합계)
+    blocked_seconds: float = 0.0  # 다운스트림 큐가 가득 차 대기한 시간 (backpressure)
+    max_queue_depth: int = 0  # 입력 큐 최대 길이
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'workers': self.workers,
+            'items_in': self.items_in,
+            'items_out': self.items_out,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy_seconds, 4),
+            'blocked_seconds': round(self.blocked_seconds, 4),
+            'max_queue_depth': self.max_queue_depth,
+        }
+
+
+class Stage:
+    """
+    파이프라인 단계
+
+    Args:
+        name: 단계 이름 (지표 키)
+        func: 입력 하나를 받아 출력 이터러블을 반환하는 함수
+              (sink 단계는 입력 리스트를 받고 반환값은 무시)
+        workers: 워커 스레드 수 (sink 는 항상 호출 스레드 1개)
+        queue_size: 입력 큐 최대 크기
+        batch_size: sink 단계 배치 크기
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Any], Optional[Iterable[Any]]],
+        workers: int = 1,
+        queue_size: int = 100,
+        batch_size: int = 1
+    ):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+
+
+class Pipeline:
+    """
+    단계들을 큐로 연결한 스트리밍 파이프라인
+
+    Example:
+        pipeline = Pipeline(
+            [Stage('fetch', fetch, workers=4), Stage('parse', parse, workers=2)],
+            sink=Stage('persist', save_rows, batch_size=50)
+        )
+        pipeline.run(urls)
+        print(pipeline.metrics())
+    """
+
+    def __init__(self, stages: List[Stage], sink: Stage):
+        """
+        Args:
+            stages: 워커 스레드에서 실행할 단계 (순서대로 연결)
+            sink: 호출 스레드에서 배치로 실행할 마지막 단계
+        """
+        if not stages:
+            raise ValueError('pipeline needs at least one stage')
+
+        self.stages = stages
+        self.sink = sink
+        self._metrics = {stage.name: StageMetrics(stage.name, stage.workers) for stage in stages}
+        self._metrics[sink.name] = StageMetrics(sink.name, 1)
+        self._stop = threading.Event()
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """단계 순서대로 지표 반환"""
+        return [self._metrics[stage.name].to_dict() for stage in self.stages + [self.sink]]
+
+    def _put(self, target: queue.Queue, item: Any) -> float:
+        """중단 요청을 확인하며 큐에 넣기 (대기한 시간 반환)"""
+        started = time.perf_counter()
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        return time.perf_counter() - started
+
+    def _worker(
+        self,
+        stage: Stage,
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        finished: List[int],
+        finished_lock: threading.Lock,
+        downstream_workers: int
+    ) -> None:
+        metrics = self._metrics[stage.name]
+
+        while not self._stop.is_set():
+            try:
+                item = inbox.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                break
+
+            with metrics._lock:
+                metrics.items_in += 1
+                metrics.max_queue_depth = max(metrics.max_queue_depth, inbox.qsize() + 1)
+
+            busy = blocked = 0.0
+            produced = 0
+            started = time.perf_counter()
+            try:
+                outputs = iter(stage.func(item) or ())
+                while True:
+                    try:
+                        output = next(outputs)
+                    except StopIteration:
+                        break
+                    busy += time.perf_counter() - started
+                    blocked += self._put(outbox, output)
+                    produced += 1
+                    started = time.perf_counter()
+                busy += time.perf_counter() - started
+            except Exception as e:
+                busy += time.perf_counter() - started
+                logger.error(f"Pipeline stage '{stage.name}' failed on item: {e}", exc_info=True)
+                with metrics._lock:
+                    metrics.errors += 1
+
+            with metrics._lock:
+                metrics.items_out += produced
+                metrics.busy_seconds += busy
+                metrics.blocked_seconds += blocked
+
+        # 단계의 마지막 워커가 다음 단계 워커 수만큼 종료 표시 전달
+        with finished_lock:
+            finished[0] += 1
+            last = finished[0] == stage.workers
+        if last:
+            for _ in range(downstream_workers):
+                self._put(outbox, _DONE)
+
+    def run(self, inputs: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        파이프라인 실행 (모든 입력 처리 후 반환, 인스턴스당 한 번)
+
+        Args:
+            inputs: 첫 단계 입력
+
+        Returns:
+            단계별 지표 리스트
+        """
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        queues.append(queue.Queue(maxsize=self.sink.queue_size))
+        threads: List[threading.Thread] = []
+
+        def feed():
+            for item in inputs:
+                self._put(queues[0], item)
+            for _ in range(self.stages[0].workers):
+                self._put(queues[0], _DONE)
+
+        threads.append(threading.Thread(target=feed, name='pipeline-feed', daemon=True))
+
+        for index, stage in enumerate(self.stages):
+            downstream = self.stages[index + 1].workers if index + 1 < len(self.stages) else 1
+            finished, finished_lock = [0], threading.Lock()
+            for number in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._worker,
+                    args=(stage, queues[index], queues[index + 1], finished, finished_lock, downstream),
+                    name=f'pipeline-{stage.name}-{number}',
+                    daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._drain(queues[-1])
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+        return self.metrics()
+
+    def _drain(self, inbox: queue.Queue) -> None:
+        """호출 스레드에서 sink 실행"""
+        metrics = self._metrics[self.sink.name]
+        batch: List[Any] = []
+
+        while True:
+            item = inbox.get()
+            if item is not _DONE:
+                metrics.items_in += 1
+                metrics.max_queue_depth = max(metrics.max_queue_depth, inbox.qsize() + 1)
+                batch.append(item)
+
+            if batch and (item is _DONE or len(batch) >= self.sink.batch_size):
+                started = time.perf_counter()
+                try:
+                    self.sink.func(batch)
+                    metrics.items_out += len(batch)
+                except Exception as e:
+                    logger.error(f"Pipeline sink '{self.sink.name}' failed: {e}", exc_info=True)
+                    metrics.errors += 1
+                metrics.busy_seconds += time.perf_counter() - started
+                batch = []
+
+            if item is _DONE:
+                return
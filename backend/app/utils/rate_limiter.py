@@ -0,0 +1,114 @@
+"""
+토큰 버킷 레이트 리미터
+
+여러 스레드가 하나의 외부 API 할당량(예: Reddit OAuth 분당 100회)을
+나눠 쓸 때 사용합니다. 버킷은 초당 rate 개씩 채워지고 최대 capacity 개까지
+쌓이므로, 짧은 버스트는 허용하면서 장기 평균 속도는 rate 를 넘지 않습니다.
+"""
+import threading
+import time
+from typing import Optional
+
+
+class RateLimitTimeout(Exception):
+    """제한 시간 안에 토큰을 얻지 못함"""
+    pass
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷
+
+    Example:
+        limiter = TokenBucket.per_minute(100, capacity=10)
+        limiter.acquire(timeout=5.0)  # 토큰이 생길 때까지 대기
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: 초당 충전되는 토큰 수
+            capacity: 최대 토큰 수 (None이면 rate, 최소 1)
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, capacity: Optional[float] = None) -> 'TokenBucket':
+        """분당 요청 수로 생성"""
+        return cls(requests_per_minute / 60.0, capacity)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        대기 없이 토큰 획득 시도
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            획득 여부
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        Args:
+            tokens: 필요한 토큰 수
+            timeout: 최대 대기 시간(초) (None이면 무제한)
+
+        Returns:
+            실제 대기한 시간(초)
+
+        Raises:
+            RateLimitTimeout: timeout 안에 토큰을 얻지 못한 경우
+        """
+        if tokens > self.capacity:
+            raise ValueError('tokens must not exceed capacity')
+
+        started = time.monotonic()
+        deadline = started + timeout if timeout is not None else None
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return now - started
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or wait > remaining:
+                    raise RateLimitTimeout(
+                        f'Could not acquire {tokens} token(s) within {timeout:.2f}s'
+                    )
+
+            # 락 밖에서 대기 (다른 스레드가 먼저 가져가면 다시 계산)
+            time.sleep(wait)
+
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Reddit 크롤러 처리량 벤치마크
+
+로컬 가짜 Reddit 서버(tests/fake_reddit.py)를 띄우고
+RedditCrawler.collect_from_subreddits 를 테스트 DB(in-memory SQLite)까지
+끝에서 끝으로 실행하여 wall time, posts/sec, 게시물당 쿼리 수를 측정합니다.
+실제 Reddit 자격 증명이나 네트워크는 필요하지 않습니다.
+
+두 번째 실행부터는 증분 수집(이미 본 게시물 건너뛰기) 효과가 반영됩니다.
+"""
+import json
+import os
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.services.near_duplicate_index import NearDuplicateIndex
+from app.services.reddit_crawler import RedditCrawler
+from app.services.shingle_index import ShingleIndex
+from app.utils.performance import count_queries
+from app.utils.rate_limiter import TokenBucket
+from tests.fake_reddit import FakeRedditServer
+
+
+def run_benchmark(
+    subreddit_count: int = 8,
+    posts_per_subreddit: int = 100,
+    limit: int = 100,
+    time_filter: str = 'day',
+    latency: float = 0.05,
+    workers: int = 4,
+    server_rate_limit: int = None,
+    client_rpm: int = 0,
+    runs: int = 2,
+    publish: int = 10
+):
+    """
+    벤치마크 실행
+
+    Args:
+        subreddit_count: 수집할 가짜 subreddit 수
+        posts_per_subreddit: subreddit 당 게시물 수
+        limit: subreddit 당 수집 한도
+        time_filter: 시간 필터 ('new' 면 high-water mark 로 조기 중단)
+        latency: 가짜 서버 리스팅 응답 지연(초)
+        workers: 동시 수집 subreddit 수
+        server_rate_limit: 가짜 서버 분당 허용 요청 수 (None이면 무제한)
+        client_rpm: 크롤러 토큰 버킷 분당 요청 수 (0이면 무제한)
+        runs: 반복 실행 횟수
+        publish: 실행 사이에 subreddit 마다 새로 올라오는 게시물 수
+
+    Returns:
+        실행별 결과 리스트
+    """
+    app = create_app('testing')
+    subreddits = [f"bench{i}" for i in range(subreddit_count)]
+    rate_limiter = (
+        TokenBucket.per_minute(client_rpm, capacity=max(1, client_rpm // 10))
+        if client_rpm else TokenBucket(1e6, capacity=1e6)
+    )
+    results = []
+
+    with app.app_context(), FakeRedditServer(
+        posts_per_subreddit=posts_per_subreddit,
+        latency=latency,
+        rate_limit=server_rate_limit
+    ) as server:
+        db.create_all()
+
+        crawler = RedditCrawler(
+            client_id='benchmark-id',
+            client_secret='benchmark-secret',
+            near_duplicate_index=NearDuplicateIndex(),
+            shingle_index=ShingleIndex(),
+            oauth_url=server.url,
+            reddit_url=server.url,
+            rate_limiter=rate_limiter,
+            max_workers=workers
+        )
+        if not crawler.connect():
+            raise RuntimeError('Failed to connect to fake Reddit server')
+
+        for run in range(1, runs + 1):
+            if run > 1:
+                for name in subreddits:
+                    server.publish(name, publish)
+
+            requests_before = server.listing_requests
+            throttled_before = server.throttled_requests
+
+            with count_queries() as counter:
+                started = time.perf_counter()
+                summary = crawler.collect_from_subreddits(
+                    subreddits,
+                    limit_per_subreddit=limit,
+                    time_filter=time_filter
+                )
+                wall_time = time.perf_counter() - started
+
+            processed = summary['posts_fetched'] + summary['posts_skipped']
+            results.append({
+                'run': run,
+                'wall_time': round(wall_time, 3),
+                'posts_processed': processed,
+                'posts_fetched': summary['posts_fetched'],
+                'posts_skipped': summary['posts_skipped'],
+                'sources_created': summary['sources_created'],
+                'inspirations_created': summary['inspirations_created'],
+                'posts_per_sec': round(processed / wall_time, 1) if wall_time else 0.0,
+                'queries': counter.count,
+                'queries_per_post': round(counter.count / max(summary['posts_fetched'], 1), 3),
+                'listing_requests': server.listing_requests - requests_before,
+                'throttled_requests': server.throttled_requests - throttled_before,
+                'timed_out_subreddits': summary['timed_out_subreddits'],
+                'failed_subreddits': summary['failed_subreddits'],
+            })
+
+        db.drop_all()
+
+    return results
+
+
+def print_results(results):
+    """결과 표 출력"""
+    print()
+    print(f"{'run':>3} {'wall(s)':>8} {'posts':>6} {'new':>6} {'skip':>6} {'posts/s':>9} "
+          f"{'queries':>8} {'q/post':>7} {'reqs':>5} {'429':>4}")
+    for result in results:
+        print(
+            f"{result['run']:>3} {result['wall_time']:>8.2f} {result['posts_processed']:>6} "
+            f"{result['posts_fetched']:>6} {result['posts_skipped']:>6} {result['posts_per_sec']:>9.1f} "
+            f"{result['queries']:>8} {result['queries_per_post']:>7.3f} "
+            f"{result['listing_requests']:>5} {result['throttled_requests']:>4}"
+        )
+        failed = result['timed_out_subreddits'] + result['failed_subreddits']
+        if failed:
+            print(f"    ⚠️  incomplete subreddits: {', '.join(failed)}")
+    print()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Reddit 크롤러 처리량 벤치마크 (가짜 Reddit 서버 사용)')
+    parser.add_argument('--subreddits', type=int, default=8, help='가짜 subreddit 수')
+    parser.add_argument('--posts', type=int, default=100, help='subreddit 당 게시물 수')
+    parser.add_argument('--limit', type=int, default=100, help='subreddit 당 수집 한도')
+    parser.add_argument('--time-filter', default='day', help="시간 필터 ('day', 'new', 'hot' ...)")
+    parser.add_argument('--latency', type=float, default=0.05, help='리스팅 응답 지연(초)')
+    parser.add_argument('--workers', type=int, default=4, help='동시 수집 subreddit 수')
+    parser.add_argument('--server-rate-limit', type=int, default=None, help='가짜 서버 분당 허용 요청 수')
+    parser.add_argument('--client-rpm', type=int, default=0, help='크롤러 분당 요청 수 (0이면 무제한)')
+    parser.add_argument('--runs', type=int, default=2, help='반복 실행 횟수')
+    parser.add_argument('--publish', type=int, default=10, help='실행 사이 subreddit 당 새 게시물 수')
+    parser.add_argument('--json', action='store_true', help='JSON 으로 출력')
+
+    args = parser.parse_args()
+
+    if not args.json:
+        print("🔄 크롤러 벤치마크 실행 중...")
+
+    benchmark_results = run_benchmark(
+        subreddit_count=args.subreddits,
+        posts_per_subreddit=args.posts,
+        limit=args.limit,
+        time_filter=args.time_filter,
+        latency=args.latency,
+        workers=args.workers,
+        server_rate_limit=args.server_rate_limit,
+        client_rpm=args.client_rpm,
+        runs=args.runs,
+        publish=args.publish
+    )
+
+    if args.json:
+        print(json.dumps(benchmark_results, indent=2))
+    else:
+        print_results(benchmark_results)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+유사도 인덱스 재구축 스크립트
+
+DB의 모든 Inspiration / Post 로 근접 중복(MinHash/LSH) 인덱스와
+코퍼스 표절 체크용 shingle 역색인을 다시 만들고 스냅샷으로 저장합니다.
+최초 배포 시 또는 인덱스 파일이 손상되었을 때 실행합니다.
+"""
+import os
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app
+from app.services.near_duplicate_index import get_near_duplicate_index
+from app.services.shingle_index import get_shingle_index
+
+
+def build_indexes(config_name: str):
+    """유사도 인덱스 재구축"""
+    app = create_app(config_name)
+
+    with app.app_context():
+        print("🔄 근접 중복 인덱스 재구축 중...")
+        start = time.time()
+        count = get_near_duplicate_index().rebuild_from_database()
+        print(f"✅ {count}개 문서 인덱싱 완료 ({time.time() - start:.1f}s)")
+
+        print("🔄 shingle 역색인 재구축 중...")
+        start = time.time()
+        count = get_shingle_index().rebuild_from_database()
+        print(f"✅ {count}개 문서 인덱싱 완료 ({time.time() - start:.1f}s)")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='유사도 인덱스 재구축 도구')
+    parser.add_argument(
+        '--config',
+        default=os.getenv('FLASK_ENV', 'development'),
+        help='설정 환경 이름 (development, production)'
+    )
+
+    args = parser.parse_args()
+    build_indexes(args.config)
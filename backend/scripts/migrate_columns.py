@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+컬럼 추가 마이그레이션 스크립트
+
+아직 없는 테이블(job_runs, crawl_states, scheduler_leaders 등)을 먼저 만들고,
+기존 테이블에 새로 추가된 컬럼과 인덱스를 만듭니다.
+- sources: subreddit / num_comments (metadata_json 에서 백필)
+- inspirations: cluster_id (컨셉 클러스터링 작업이 채움)
+- job_runs: isolated / cpu_time_sec / peak_rss_mb (작업 자원 사용량)
+- crawl_states: crawl_interval_sec / yield_ema (subreddit 별 적응형 수집 주기)
+- posts: content_hash / render_version (발행 시 렌더링한 HTML, scripts/rerender_posts.py 로 채움)
+
+여러 번 실행해도 안전하며 (이미 있는 컬럼/인덱스는 건너뜀),
+백필은 배치 단위로 커밋하므로 중간에 끊겨도 다시 실행하면 이어서 진행합니다.
+"""
+import os
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import inspect
+
+from app import create_app, db
+from app.models import CrawlState, Inspiration, JobRun, Post, Source
+
+# 모델별 추가할 컬럼 (이름, DDL 타입)
+NEW_COLUMNS = {
+    Source: [
+        ('subreddit', 'VARCHAR(100)'),
+        ('num_comments', 'INTEGER'),
+    ],
+    Inspiration: [
+        ('cluster_id', 'INTEGER'),
+    ],
+    JobRun: [
+        ('isolated', "BOOLEAN NOT NULL DEFAULT '0'"),
+        ('cpu_time_sec', 'FLOAT'),
+        ('peak_rss_mb', 'FLOAT'),
+    ],
+    CrawlState: [
+        ('crawl_interval_sec', 'FLOAT'),
+        ('yield_ema', 'FLOAT'),
+    ],
+    Post: [
+        ('content_hash', 'VARCHAR(64)'),
+        ('render_version', 'INTEGER'),
+    ],
+}
+
+
+def add_missing_columns(model, columns) -> list:
+    """
+    테이블에 없는 컬럼 추가
+
+    Args:
+        model: 대상 모델
+        columns: (이름, DDL 타입) 리스트
+
+    Returns:
+        추가한 컬럼 이름 리스트
+    """
+    existing = {column['name'] for column in inspect(db.engine).get_columns(model.__tablename__)}
+    added = []
+
+    with db.engine.begin() as connection:
+        for name, ddl_type in columns:
+            if name not in existing:
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {model.__tablename__} ADD COLUMN {name} {ddl_type}"
+                )
+                added.append(name)
+
+    return added
+
+
+def create_missing_indexes(model) -> list:
+    """
+    모델에 선언된 인덱스 중 없는 것 생성
+
+    Args:
+        model: 대상 모델
+
+    Returns:
+        생성한 인덱스 이름 리스트
+    """
+    existing = {index['name'] for index in inspect(db.engine).get_indexes(model.__tablename__)}
+    created = []
+
+    for index in model.__table__.indexes:
+        if index.name not in existing:
+            index.create(db.engine)
+            created.append(index.name)
+
+    return created
+
+
+def migrate(config_name: str, batch_size: int = 500):
+    """마이그레이션 실행"""
+    app = create_app(config_name, background=False)  # 스케줄러/조회수 flush 스레드 없이
+
+    with app.app_context():
+        # 새 모델의 테이블 생성 (이미 있는 테이블은 건너뜀, 새 테이블은 컬럼/인덱스까지 생성됨)
+        print("🔄 없는 테이블 생성 중...")
+        db.create_all()
+
+        for model, columns in NEW_COLUMNS.items():
+            print(f"🔄 {model.__tablename__} 컬럼/인덱스 확인 중...")
+            added = add_missing_columns(model, columns)
+            print(f"✅ 추가된 컬럼: {', '.join(added) if added else '없음'}")
+            created = create_missing_indexes(model)
+            print(f"✅ 생성된 인덱스: {', '.join(created) if created else '없음'}")
+
+        print("🔄 metadata_json 에서 백필 중...")
+        start = time.time()
+        updated = Source.backfill_from_metadata(batch_size=batch_size)
+        print(f"✅ {updated}개 행 갱신 완료 ({time.time() - start:.1f}s)")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='컬럼 추가 마이그레이션 도구')
+    parser.add_argument(
+        '--config',
+        default=os.getenv('FLASK_ENV', 'development'),
+        help='설정 환경 이름 (development, production)'
+    )
+    parser.add_argument('--batch-size', type=int, default=500, help='백필 배치 크기')
+
+    args = parser.parse_args()
+    migrate(args.config, batch_size=args.batch_size)
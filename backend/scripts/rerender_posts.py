@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+게시물 HTML 일괄 재렌더링 스크립트
+
+Markdown 렌더러(app/services/markdown_renderer.py)의 확장이나 허용 태그를 바꾸고
+RENDERER_VERSION 을 올린 뒤 실행합니다. 렌더러 버전이나 원문 해시가 저장된 값과 다른
+게시물만 프로세스 풀에서 다시 렌더링합니다 (마이그레이션 직후 최초 실행 시에는 전체).
+"""
+import os
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app
+from app.services.markdown_renderer import RENDERER_VERSION, rerender_posts
+
+
+def rerender(config_name: str, force: bool = False, workers=None, batch_size: int = 200):
+    """게시물 재렌더링"""
+    app = create_app(config_name)
+
+    with app.app_context():
+        print(f"🔄 게시물 HTML 재렌더링 중... (렌더러 v{RENDERER_VERSION}{', 전체 강제' if force else ''})")
+        start = time.time()
+        stats = rerender_posts(force=force, workers=workers, batch_size=batch_size)
+        print(
+            f"✅ {stats['rendered']}개 렌더링, {stats['skipped']}개 변경 없음 "
+            f"({stats['scanned']}개 확인, {time.time() - start:.1f}s)"
+        )
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='게시물 HTML 일괄 재렌더링 도구')
+    parser.add_argument(
+        '--config',
+        default=os.getenv('FLASK_ENV', 'development'),
+        help='설정 환경 이름 (development, production)'
+    )
+    parser.add_argument('--force', action='store_true', help='변경 여부와 관계없이 모두 다시 렌더링')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: MARKDOWN_RENDER_WORKERS)')
+    parser.add_argument('--batch-size', type=int, default=200, help='배치 크기')
+
+    args = parser.parse_args()
+    rerender(args.config, force=args.force, workers=args.workers, batch_size=args.batch_size)
@@ -195,6 +195,8 @@ def create_sample_content(users, categories, tags, styles):
         title='Funny cat behavior',
         author='reddit_user',
         score=1500,
+        subreddit='funny',
+        num_comments=234,
         metadata_json='{"subreddit": "funny", "num_comments": 234}'
     )
     db.session.commit()
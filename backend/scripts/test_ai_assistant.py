@@ -48,11 +48,12 @@ def setup_test_data(app):
         source = Source.create(
             platform='reddit',
             source_id='test_ai_123',
-            url='https://reddit.com/r/funny/test',
+            source_url='https://reddit.com/r/funny/test',
             title='Test Source for AI',
             author='test_author',
-            upvotes=1000,
-            comments=100
+            score=1000,
+            subreddit='funny',
+            num_comments=100
         )
 
         inspiration = Inspiration.create(
@@ -42,11 +42,12 @@ def setup_test_data(app):
         source = Source.create(
             platform='reddit',
             source_id='test_insp_123',
-            url='https://reddit.com/r/funny/test',
+            source_url='https://reddit.com/r/funny/test',
             title='Test Source for Inspiration',
             author='test_author',
-            upvotes=1500,
-            comments=150
+            score=1500,
+            subreddit='funny',
+            num_comments=150
         )
 
         # Inspiration 생성
@@ -163,7 +163,7 @@ def test_reddit_collection_job(app):
 
         # Reddit 수집 작업 확인
         jobs = scheduler.get_jobs()
-        reddit_job = next((j for j in jobs if j['id'] == 'reddit_collection'), None)
+        reddit_job = next((j for j in jobs if j['id'].startswith('reddit_collection:')), None)
 
         if reddit_job:
             print("✓ Reddit collection job found")
@@ -177,24 +177,24 @@ def test_reddit_collection_job(app):
             if run_now == 'y':
                 print("\nRunning Reddit collection job...")
                 print("This may take 30-60 seconds...")
-                scheduler.run_job_now('reddit_collection')
+                scheduler.run_job_now(reddit_job['id'])
 
                 # 완료 대기
                 time.sleep(5)
 
                 # 히스토리 확인
-                history = scheduler.get_job_history(job_id='reddit_collection', limit=1)
+                history = scheduler.get_job_history(job_id=reddit_job['id'], limit=1)['history']
                 if history:
                     latest = history[0]
                     print(f"\n=== Latest Execution ===")
-                    print(f"Time: {latest['execution_time']}")
+                    print(f"Time: {latest['finished_at']}")
                     print(f"Status: {latest['status']}")
-                    if latest['status'] == 'success' and latest['return_value']:
-                        result = latest['return_value']
+                    if latest['status'] == 'success' and latest['summary']:
+                        result = latest['summary']
                         print(f"Sources created: {result.get('sources_created', 0)}")
                         print(f"Inspirations created: {result.get('inspirations_created', 0)}")
                     elif latest['status'] == 'failed':
-                        print(f"Error: {latest['error_message']}")
+                        print(f"Error: {latest['error']}")
         else:
             print("✗ Reddit collection job not found")
 
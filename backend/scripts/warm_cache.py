@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+캐시 예열 스크립트 (배포 후 훅)
+
+배포나 캐시 비우기 직후 공개 엔드포인트(/api/posts, /api/search/filters, /api/categories,
+/sitemap.xml)의 응답을 미리 캐시에 채웁니다. 웹 워커와 캐시를 공유하는 백엔드
+(CACHE_TYPE=RedisCache)에서만 의미가 있으며, SimpleCache 는 워커별 메모리라
+스케줄러가 시작 직후 리더 워커에서 예열합니다.
+"""
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app
+from app.services.cache_warming import get_cache_warmer
+
+
+def warm(config_name: str, targets=None) -> int:
+    """캐시 예열 후 결과 출력 (에러 수 반환)"""
+    app = create_app(config_name)
+
+    if app.extensions['settings'].CACHE_TYPE == 'SimpleCache':
+        print("⚠ SimpleCache 는 프로세스별 메모리라 웹 워커의 캐시는 채워지지 않습니다")
+
+    warmer = get_cache_warmer(app)
+    unknown = [name for name in targets or [] if name not in warmer.targets]
+    if unknown:
+        print(f"❌ 알 수 없는 예열 대상: {', '.join(unknown)} (가능: {', '.join(warmer.targets)})")
+        return 1
+
+    print("🔄 캐시 예열 중...")
+    report = warmer.warm(names=targets)
+
+    for name, stats in report['targets'].items():
+        mark = '✅' if not stats['errors'] else '⚠'
+        print(f"{mark} {name}: {stats['keys_warmed']}개 키, {stats['duration_ms']}ms (만료 {stats['timeout']}s)")
+        for error in stats['errors']:
+            print(f"    - {error}")
+
+    print(f"✅ {report['keys_warmed']}개 키 예열 완료 ({report['duration_ms']}ms, 에러 {report['errors']}개)")
+    return report['errors']
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='캐시 예열 도구 (배포 후 실행)')
+    parser.add_argument(
+        '--config',
+        default=os.getenv('FLASK_ENV', 'development'),
+        help='설정 환경 이름 (development, production)'
+    )
+    parser.add_argument(
+        '--target',
+        action='append',
+        dest='targets',
+        help='예열할 대상 이름 (여러 번 지정 가능, 기본: 전체)'
+    )
+
+    args = parser.parse_args()
+    sys.exit(1 if warm(args.config, args.targets) else 0)
@@ -2,8 +2,8 @@
 Pytest 설정 및 Fixture 정의
 """
 import pytest
-from app import create_app, db
-from app.models import User, Category, Tag, WritingStyle
+from app import create_app, db, cache
+from app.models import User, Category, Tag, Post, WritingStyle
 
 
 @pytest.fixture(scope='session')
@@ -31,8 +31,10 @@ def db_session(app):
     with app.app_context():
         db.create_all()
         yield db
+        app.extensions['view_counter'].flush()  # 버퍼에 남은 조회수가 다음 테스트의 같은 ID 로 넘어가지 않도록
         db.session.remove()
         db.drop_all()
+        cache.clear()  # 세션 범위 앱이므로 캐시한 응답이 다음 테스트로 넘어가지 않도록
 
 
 @pytest.fixture
@@ -72,6 +74,24 @@ def sample_category(db_session):
     return category
 
 
+@pytest.fixture
+def post_factory(db_session, sample_user, sample_category):
+    """게시물 생성 함수 fixture (샘플 사용자/카테고리, 기본은 발행된 게시물)"""
+    def create_post(title='게시물', content='내용', published=True):
+        post = Post.create(
+            user_id=sample_user.id,
+            category_id=sample_category.id,
+            title=title,
+            content=content
+        )
+        if published:
+            post.publish()
+        db_session.session.commit()
+        return post
+
+    return create_post
+
+
 @pytest.fixture
 def sample_tags(db_session):
     """샘플 태그들 fixture"""
@@ -0,0 +1,224 @@
+"""
+로컬 가짜 피드/목록 페이지 서버 (테스트용)
+
+경로별로 RSS, Atom, HTML 목록 페이지를 제공하여
+ConnectorCollector 를 네트워크 없이 테스트할 수 있습니다.
+validators=True 면 ETag/Last-Modified 를 보내고 조건부 요청에 304 로 응답합니다.
+
+    with FakeFeedServer(latency=0.1) as server:
+        server.add_rss('/tech.xml', 'tech', count=5)
+        connector = FeedConnector('tech', server.url + '/tech.xml')
+"""
+import hashlib
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+
+BASE_TIMESTAMP = 1700000000.0
+
+
+def make_rss(name: str, count: int, start: int = 0) -> str:
+    """RSS 2.0 피드 (seq 가 클수록 최근 글)"""
+    items = ''.join(
+        f"""
+        <item>
+          <title>{name} story {seq}: the cat who learned to code</title>
+          <link>https://{name}.example.com/posts/{seq}</link>
+          <dc:creator>writer{seq}</dc:creator>
+          <pubDate>{formatdate(BASE_TIMESTAMP + seq * 60, usegmt=True)}</pubDate>
+          <description><![CDATA[<p>Story {seq} from <b>{name}</b>: a cat, a keyboard and a deadline.</p>]]></description>
+        </item>"""
+        for seq in reversed(range(start, start + count))
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel><title>{name}</title><link>https://{name}.example.com/</link>{items}
+  </channel>
+</rss>"""
+
+
+def make_atom(name: str, count: int) -> str:
+    """Atom 피드"""
+    entries = ''.join(
+        f"""
+  <entry>
+    <title>{name} note {seq}: coffee machine diaries</title>
+    <link rel="alternate" href="https://{name}.example.org/notes/{seq}"/>
+    <author><name>author{seq}</name></author>
+    <updated>2023-11-14T22:{seq % 60:02d}:00Z</updated>
+    <summary>Note {seq} about the office coffee machine.</summary>
+  </entry>"""
+        for seq in range(count)
+    )
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>{name}</title>{entries}
+</feed>"""
+
+
+def make_listing_html(name: str, count: int) -> str:
+    """HTML 목록 페이지 (상대 링크)"""
+    articles = ''.join(
+        f"""
+    <article class="post">
+      <h2><a href="/{name}/article-{seq}">{name} article {seq}: printer drama</a></h2>
+      <time datetime="2023-11-14T10:{seq % 60:02d}:00+09:00">Nov 14</time>
+      <p class="excerpt">Excerpt {seq}: the printer only works when the boss watches.</p>
+    </article>"""
+        for seq in range(count)
+    )
+    return f"<html><body><nav><a href='/'>home</a></nav><main>{articles}</main></body></html>"
+
+
+class FakeFeedServer:
+    """
+    스레드 기반 가짜 피드 서버
+
+    Example:
+        with FakeFeedServer(latency=0.05) as server:
+            server.add_rss('/a.xml', 'a', count=10)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failing_paths: Optional[Set[str]] = None,
+        validators: bool = True,
+        port: int = 0
+    ):
+        """
+        Args:
+            latency: 요청당 지연(초)
+            failing_paths: 500 을 반환할 경로
+            validators: ETag/Last-Modified 전송 및 조건부 요청 처리 여부
+            port: 바인딩 포트 (0이면 임의 포트)
+        """
+        self.latency = latency
+        self.failing_paths = set(failing_paths or set())
+        self.validators = validators
+        self.port = port
+
+        self.routes: Dict[str, Tuple[str, bytes, str]] = {}
+        self.requests: List[str] = []
+        self.conditional_requests = 0
+        self.not_modified_responses = 0
+        self.bytes_sent = 0
+        self.max_concurrent = 0
+        self.connections = 0  # 새 TCP 연결 수 (keep-alive 재사용 확인용)
+        self._active = 0
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def add(self, path: str, body: str, content_type: str) -> str:
+        """경로에 응답 등록 (전체 URL 반환, 같은 경로면 내용 교체)"""
+        data = body.encode('utf-8')
+        self.routes[path] = (content_type, data, formatdate(time.time(), usegmt=True))
+        return self.url + path
+
+    def add_rss(self, path: str, name: str, count: int = 5, start: int = 0) -> str:
+        return self.add(path, make_rss(name, count, start), 'application/rss+xml; charset=utf-8')
+
+    def add_atom(self, path: str, name: str, count: int = 5) -> str:
+        return self.add(path, make_atom(name, count), 'application/atom+xml; charset=utf-8')
+
+    def add_html(self, path: str, name: str, count: int = 5) -> str:
+        return self.add(path, make_listing_html(name, count), 'text/html; charset=utf-8')
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):  # noqa: A002 - 조용히
+                pass
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def _send(
+                self,
+                status: int,
+                body: bytes,
+                content_type: str = 'text/plain',
+                headers: Optional[Dict[str, str]] = None
+            ) -> None:
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', content_type)
+                    self.send_header('Content-Length', str(len(body)))
+                    for name, value in (headers or {}).items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(body)
+                    with server._lock:
+                        server.bytes_sent += len(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # 클라이언트가 타임아웃으로 먼저 끊음
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+
+                with server._lock:
+                    server._active += 1
+                    server.max_concurrent = max(server.max_concurrent, server._active)
+                    server.requests.append(path)
+                try:
+                    time.sleep(server.latency)
+                    if path in server.failing_paths:
+                        self._send(500, b'internal error')
+                    elif path not in server.routes:
+                        self._send(404, b'not found')
+                    else:
+                        content_type, body, last_modified = server.routes[path]
+                        if not server.validators:
+                            self._send(200, body, content_type)
+                            return
+
+                        etag = '"%s"' % hashlib.md5(body).hexdigest()
+                        validators = {'ETag': etag, 'Last-Modified': last_modified}
+                        if_none_match = self.headers.get('If-None-Match')
+                        if if_none_match or self.headers.get('If-Modified-Since'):
+                            with server._lock:
+                                server.conditional_requests += 1
+                        if if_none_match == etag:
+                            with server._lock:
+                                server.not_modified_responses += 1
+                            self._send(304, b'', content_type, validators)
+                        else:
+                            self._send(200, body, content_type, validators)
+                finally:
+                    with server._lock:
+                        server._active -= 1
+
+        return Handler
+
+    def start(self) -> 'FakeFeedServer':
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', self.port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> 'FakeFeedServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,283 @@
+"""
+로컬 가짜 Reddit API 서버 (테스트용)
+
+PRAW 가 실제로 호출하는 엔드포인트만 흉내냅니다.
+    - POST /api/v1/access_token: 애플리케이션 전용 OAuth 토큰
+    - GET  /r/<subreddit>/top, /hot, /new: 게시물 리스팅
+
+RedditCrawler(oauth_url=server.url, reddit_url=server.url) 로 연결하면
+네트워크 없이 동시 수집/레이트 리밋/타임아웃을 테스트할 수 있습니다.
+게시물 수, 응답 지연, 요청 할당량(X-Ratelimit-* 헤더와 429)을 설정할 수 있고,
+단독 실행하면 고정 포트로 띄워 REDDIT_OAUTH_URL/REDDIT_URL 로 연결할 수 있습니다.
+
+    python -m tests.fake_reddit --port 8081 --posts 500 --latency 0.05 --rate-limit 100
+"""
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlparse
+
+
+BASE_CREATED_UTC = 1700000000.0
+
+
+def make_post(subreddit: str, seq: int) -> Dict:
+    """
+    가짜 게시물 데이터 (Reddit t3 형식)
+
+    seq 가 클수록 최근 게시물입니다 (같은 seq 는 항상 같은 게시물).
+    """
+    post_id = f"{zlib.crc32(subreddit.lower().encode('utf-8')) & 0xffff:04x}{seq:05d}"
+    return {
+        'id': post_id,
+        'name': f't3_{post_id}',
+        'title': f'{subreddit} joke number {seq} about cats and coffee',
+        'url': f'https://i.example.com/{post_id}.jpg',
+        'author': f'user{seq}',
+        'subreddit': subreddit,
+        'score': 100 + (seq * 37) % 900,
+        'num_comments': 10 + seq % 90,
+        'created_utc': BASE_CREATED_UTC + seq * 60,
+        'permalink': f'/r/{subreddit}/comments/{post_id}/joke_{seq}/',
+        'is_self': seq % 2 == 0,
+        'selftext': f'Setup {seq}: why did the cat sit on the keyboard?' if seq % 2 == 0 else '',
+    }
+
+
+class FakeRedditServer:
+    """
+    스레드 기반 가짜 Reddit 서버
+
+    Example:
+        with FakeRedditServer(posts_per_subreddit=20, latency=0.05) as server:
+            crawler = RedditCrawler('id', 'secret', oauth_url=server.url, reddit_url=server.url)
+    """
+
+    MAX_PAGE_SIZE = 100  # Reddit 리스팅 페이지 최대 크기
+
+    def __init__(
+        self,
+        posts_per_subreddit: int = 25,
+        latency: float = 0.0,
+        slow_subreddits: Optional[Dict[str, float]] = None,
+        failing_subreddits: Optional[Set[str]] = None,
+        rate_limit: Optional[int] = None,
+        rate_limit_window: float = 60.0,
+        port: int = 0
+    ):
+        """
+        Args:
+            posts_per_subreddit: subreddit 당 게시물 수
+            latency: 리스팅 요청당 지연(초)
+            slow_subreddits: {subreddit: 지연(초)} - 특정 subreddit 만 느리게
+            failing_subreddits: 403 을 반환할 subreddit (비공개 subreddit)
+            rate_limit: 윈도우당 허용 리스팅 요청 수 (None이면 무제한, 초과 시 429)
+            rate_limit_window: 할당량 윈도우(초)
+            port: 바인딩 포트 (0이면 임의 포트)
+        """
+        self.posts_per_subreddit = posts_per_subreddit
+        self.latency = latency
+        self.slow_subreddits = {k.lower(): v for k, v in (slow_subreddits or {}).items()}
+        self.failing_subreddits = {name.lower() for name in (failing_subreddits or set())}
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.port = port
+
+        self.published: Dict[str, int] = {}
+        self.throttled_requests = 0
+        self._window_started = time.monotonic()
+        self._window_used = 0
+        self._posts_cache: Dict[tuple, List[Dict]] = {}
+        self.request_times: List[float] = []
+        self.max_concurrent = 0
+        self._active = 0
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def listing_requests(self) -> int:
+        return len(self.request_times)
+
+    def publish(self, subreddit: str, count: int = 1) -> None:
+        """subreddit 에 새 게시물 추가 (기존 게시물보다 최근)"""
+        with self._lock:
+            self.published[subreddit.lower()] = self.published.get(subreddit.lower(), 0) + count
+
+    def posts(self, subreddit: str, sort: str = 'new') -> List[Dict]:
+        """정렬된 전체 게시물 ('new' 는 최신순, 그 외는 점수순)"""
+        count = self.posts_per_subreddit + self.published.get(subreddit.lower(), 0)
+        key = (subreddit, sort, count)
+        posts = self._posts_cache.get(key)
+        if posts is None:
+            posts = [make_post(subreddit, seq) for seq in reversed(range(count))]
+            if sort != 'new':
+                posts.sort(key=lambda post: post['score'], reverse=True)
+            self._posts_cache[key] = posts
+        return posts
+
+    def _consume_quota(self) -> Dict[str, str]:
+        """
+        리스팅 요청 할당량 차감 (Reddit 과 같은 X-Ratelimit-* 헤더 반환)
+
+        Returns:
+            응답 헤더 (할당량 초과 시 'throttled' 키 포함)
+        """
+        if self.rate_limit is None:
+            return {}
+
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_started >= self.rate_limit_window:
+                self._window_started = now
+                self._window_used = 0
+
+            self._window_used += 1
+            reset = max(self.rate_limit_window - (now - self._window_started), 0.0)
+            headers = {
+                'x-ratelimit-used': str(self._window_used),
+                'x-ratelimit-remaining': str(float(max(self.rate_limit - self._window_used, 0))),
+                'x-ratelimit-reset': str(int(reset + 0.999)),
+            }
+            if self._window_used > self.rate_limit:
+                self.throttled_requests += 1
+                headers['throttled'] = '1'
+            return headers
+
+    def listing(self, subreddit: str, sort: str, limit: int, after: Optional[str]) -> Dict:
+        """리스팅 페이지 생성"""
+        posts = self.posts(subreddit, sort)
+        start = 0
+        if after:
+            names = [post['name'] for post in posts]
+            start = names.index(after) + 1 if after in names else len(posts)
+
+        page = posts[start:start + limit]
+        next_after = page[-1]['name'] if page and start + limit < len(posts) else None
+        return {
+            'kind': 'Listing',
+            'data': {
+                'after': next_after,
+                'before': None,
+                'dist': len(page),
+                'children': [{'kind': 't3', 'data': post} for post in page],
+            },
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):  # noqa: A002 - 조용히
+                pass
+
+            def _send_json(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None) -> None:
+                body = json.dumps(payload).encode('utf-8')
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    for name, value in (headers or {}).items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # 클라이언트가 타임아웃으로 먼저 끊음
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.rfile.read(length)
+                if urlparse(self.path).path.rstrip('/') == '/api/v1/access_token':
+                    self._send_json(200, {
+                        'access_token': 'fake-token',
+                        'token_type': 'bearer',
+                        'expires_in': 3600,
+                        'scope': '*',
+                    })
+                else:
+                    self._send_json(404, {'error': 404})
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                parts = [part for part in parsed.path.split('/') if part]
+                if len(parts) != 3 or parts[0] != 'r' or parts[2] not in ('top', 'hot', 'new'):
+                    self._send_json(404, {'error': 404})
+                    return
+
+                subreddit = parts[1]
+                query = parse_qs(parsed.query)
+
+                with server._lock:
+                    server._active += 1
+                    server.max_concurrent = max(server.max_concurrent, server._active)
+                    server.request_times.append(time.monotonic())
+                try:
+                    time.sleep(server.slow_subreddits.get(subreddit.lower(), server.latency))
+                    headers = server._consume_quota()
+                    if headers.pop('throttled', None):
+                        self._send_json(429, {'message': 'Too Many Requests', 'error': 429}, headers)
+                        return
+                    if subreddit.lower() in server.failing_subreddits:
+                        self._send_json(403, {'reason': 'private', 'error': 403}, headers)
+                        return
+                    limit = min(int(query.get('limit', ['25'])[0]), server.MAX_PAGE_SIZE)
+                    after = query.get('after', [None])[0]
+                    self._send_json(200, server.listing(subreddit, parts[2], limit, after), headers)
+                finally:
+                    with server._lock:
+                        server._active -= 1
+
+        return Handler
+
+    def start(self) -> 'FakeRedditServer':
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', self.port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> 'FakeRedditServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='로컬 가짜 Reddit API 서버')
+    parser.add_argument('--port', type=int, default=8081, help='바인딩 포트')
+    parser.add_argument('--posts', type=int, default=100, help='subreddit 당 게시물 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='리스팅 요청당 지연(초)')
+    parser.add_argument('--rate-limit', type=int, default=None, help='분당 허용 리스팅 요청 수')
+
+    args = parser.parse_args()
+    fake = FakeRedditServer(
+        posts_per_subreddit=args.posts,
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        port=args.port
+    ).start()
+    print(f"Fake Reddit API listening on {fake.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        fake.stop()
@@ -0,0 +1,76 @@
+"""
+캐시 예열 테스트
+"""
+import time
+
+from app.services.cache_warming import WarmTarget, get_cache_warmer
+from app.utils.performance import count_queries
+
+
+class TestCacheWarmer:
+    """캐시 예열기 테스트"""
+
+    def test_warm_fills_cache_and_refreshes(self, app, client, db_session, sample_category, post_factory):
+        """등록된 파라미터 조합을 모두 예열하고, 예열 요청은 캐시를 덮어쓰는지 테스트"""
+        post_factory('첫 게시물')
+        warmer = get_cache_warmer(app)
+
+        report = warmer.warm()
+        assert report['errors'] == 0
+        assert report['targets']['posts']['keys_warmed'] == 2  # 기본 + 카테고리별
+        assert report['targets']['posts']['timeout'] == 120
+        assert {name for name, stats in report['targets'].items() if stats['keys_warmed']} == {
+            'posts', 'search_filters', 'categories', 'sitemap'
+        }
+        assert report['keys_warmed'] == 5
+
+        # 방문자는 예열된 응답을 받음 (버전 조회 한 번뿐)
+        with count_queries() as counter:
+            assert len(client.get('/api/posts').get_json()['posts']) == 1
+        assert counter.count == 1
+
+        # 게시물이 바뀌면 버전이 달라져 새로 계산, 예열은 캐시를 읽지 않고 새 버전으로 채움
+        post_factory('두 번째 게시물')
+        warmer.warm(names=['posts'])
+        with count_queries() as counter:
+            assert len(client.get('/api/posts').get_json()['posts']) == 2
+            assert len(client.get('/api/posts', query_string={'category_id': sample_category.id}).get_json()['posts']) == 2
+        assert counter.count == 2
+
+    def test_refreshes_only_entries_expiring_soon(self, app, db_session, sample_category):
+        """horizon 안에 만료될 항목만 다시 채우고 캐시하지 않는 뷰는 에러로 보고하는지 테스트"""
+        warmer = get_cache_warmer(app)
+        warmer.warm()
+
+        report = warmer.warm(horizon=90)
+        assert report['keys_warmed'] == 0
+        assert report['keys_skipped'] == 5
+
+        # 게시물 목록(만료 120초)이 30초 뒤 만료될 상황
+        with warmer._lock:
+            for key in warmer._expires:
+                if key[0] == 'posts':
+                    warmer._expires[key] = time.time() + 30
+        report = warmer.warm(horizon=90)
+        assert report['targets']['posts']['keys_warmed'] == 2
+        assert report['keys_skipped'] == 3
+
+        status = warmer.status()
+        assert all(entry['expires_in'] > 90 for entry in status['entries'])
+        assert status['last_report'] is report
+
+        warmer.register(WarmTarget('tags', '/api/tags'))
+        try:
+            report = warmer.warm(names=['tags'])
+            assert report['errors'] == 1
+            assert 'is not cached' in report['targets']['tags']['errors'][0]
+        finally:
+            del warmer.targets['tags']
+
+    def test_app_config_follows_settings(self, app):
+        """환경별 설정 값(캐시 백엔드 포함)이 app.config 에 들어가 모든 워커가 같은 캐시를 쓰는지 테스트"""
+        settings = app.extensions['settings']
+        assert app.config['CACHE_TYPE'] == settings.CACHE_TYPE
+        assert app.config['SQLALCHEMY_DATABASE_URI'] == 'sqlite:///:memory:'
+        assert app.config['SEMANTIC_SIMILARITY_ENABLED'] is False
+        assert app.testing
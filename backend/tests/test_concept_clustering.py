@@ -0,0 +1,109 @@
+"""
+컨셉 클러스터링 테스트
+"""
+from datetime import datetime, timedelta
+
+from app.models import Inspiration, Source
+from app.services.concept_clustering import ConceptClusterer, hot_score
+from app.services.content_generator import ContentGenerator, GenerationResult
+from app.services.similarity_checker import SimilarityChecker
+
+JOKE = (
+    "A programmer tells the rubber duck about a bug, the duck stays silent, "
+    "and the programmer finds the fix while explaining the code out loud."
+)
+OTHER = "A cat walks across the keyboard during a video call and accidentally ends the meeting for everyone."
+
+NOW = datetime(2026, 10, 1, 12, 0)
+
+
+def make_inspiration(db_session, seq, concept, score, hours_ago, status='collected'):
+    """Source + Inspiration 생성"""
+    source = Source.create(
+        platform='reddit',
+        source_url=f'https://reddit.com/r/test/comments/{seq}',
+        source_id=f'post{seq}',
+        score=score,
+        posted_at=NOW - timedelta(hours=hours_ago)
+    )
+    db_session.session.flush()
+    inspiration = Inspiration.create(source_id=source.id, original_concept=concept, status=status)
+    db_session.session.flush()
+    return inspiration
+
+
+class TestConceptClustering:
+    """근접 중복 클러스터링 테스트"""
+
+    def test_hot_score_balances_score_and_freshness(self):
+        """점수 10배와 12.5시간 최신성이 같은 가치인지 테스트"""
+        assert hot_score(1000, NOW) == round(hot_score(100, NOW + timedelta(hours=12.5)), 7)
+        assert hot_score(100, NOW) > hot_score(100, NOW - timedelta(hours=1))
+        assert hot_score(None, None) == 0.0
+
+    def test_reposts_grouped_under_best_ranked(self, db_session):
+        """재게시된 컨셉을 한 클러스터로 묶고 점수/최신성이 가장 높은 것을 대표로 고르는지 테스트"""
+        old_popular = make_inspiration(db_session, 1, JOKE, score=5000, hours_ago=48)
+        fresh_popular = make_inspiration(db_session, 2, JOKE + " Classic.", score=3000, hours_ago=2)
+        fresh_weak = make_inspiration(db_session, 3, "Repost: " + JOKE, score=10, hours_ago=1)
+        unique = make_inspiration(db_session, 4, OTHER, score=50, hours_ago=3)
+        db_session.session.commit()
+
+        result = ConceptClusterer().cluster()
+
+        assert result == {'inspirations': 4, 'clusters': 1, 'duplicates': 2, 'updated': 3}
+        db_session.session.expire_all()
+        assert fresh_popular.cluster_id == fresh_popular.id
+        assert fresh_popular.is_cluster_representative
+        assert old_popular.cluster_id == fresh_weak.cluster_id == fresh_popular.id
+        assert not old_popular.is_cluster_representative
+        assert unique.cluster_id is None and unique.is_cluster_representative
+
+        # 변경이 없으면 다시 쓰지 않음
+        assert ConceptClusterer().cluster()['updated'] == 0
+
+    def test_generated_inspiration_stays_representative(self, db_session):
+        """이미 생성 중인 Inspiration 을 대표로 유지하고 거절되면 클러스터에서 빼는지 테스트"""
+        drafted = make_inspiration(db_session, 1, JOKE, score=1, hours_ago=100, status='in_progress')
+        better = make_inspiration(db_session, 2, JOKE + " Classic.", score=9000, hours_ago=1)
+        db_session.session.commit()
+
+        ConceptClusterer().cluster()
+        db_session.session.expire_all()
+        assert better.cluster_id == drafted.id
+
+        drafted.reject()
+        ConceptClusterer().cluster()
+        db_session.session.expire_all()
+        assert drafted.cluster_id is None
+        assert better.cluster_id is None
+
+    def test_batch_generate_skips_cluster_members(self, db_session):
+        """배치 생성이 대표만 생성하고 나머지 멤버는 건너뛰는지 테스트"""
+        members = [
+            make_inspiration(db_session, seq, JOKE + " " * seq, score=100 * seq, hours_ago=1)
+            for seq in range(1, 4)
+        ]
+        unique = make_inspiration(db_session, 4, OTHER, score=50, hours_ago=1)
+        db_session.session.commit()
+        ConceptClusterer().cluster()
+
+        generator = ContentGenerator(similarity_checker=SimilarityChecker(use_semantic=False))
+        generated = []
+
+        def fake_generate(inspiration_id, style, use_few_shot):
+            generated.append(inspiration_id)
+            return GenerationResult('t', 'c', style.value, 0.1, 10, True)
+
+        generator.generate_from_inspiration = fake_generate
+        ids = [member.id for member in members] + [unique.id]
+        results = generator.batch_generate(ids)
+
+        representative = members[-1].id
+        assert generated == [representative, unique.id]
+        assert [result.duplicate_of for result in results] == [representative, representative, None, None]
+        assert not results[0].success
+
+        generated.clear()
+        generator.batch_generate(ids, skip_cluster_duplicates=False)
+        assert generated == ids
@@ -0,0 +1,95 @@
+"""
+조건부 GET (ETag / If-None-Match) 테스트
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.markdown_renderer import rerender_posts
+from app.services.view_counter import get_view_counter
+from app.utils.performance import count_queries
+
+
+class TestConditionalGet:
+    """조건부 GET 테스트"""
+
+    def test_post_detail_not_modified(self, app, client, db_session, post_factory):
+        """같은 ETag 면 버전 조회 한 번으로 304 를 주고 조회수는 집계하는지 테스트"""
+        post = post_factory('게시물')
+
+        response = client.get(f'/api/posts/{post.id}')
+        etag = response.headers['ETag']
+        assert response.status_code == 200
+        assert etag.startswith('W/"')
+        assert response.headers['Cache-Control'] == 'public, no-cache'
+
+        # 압축 접미사가 붙은 ETag 도 같은 것으로 봄
+        with count_queries() as counter:
+            response = client.get(f'/api/posts/{post.id}', headers={'If-None-Match': f'{etag[:-1]}:gzip"'})
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+        assert counter.count == 1
+        assert get_view_counter(app).pending(post.id) == 2
+
+        response = client.get(f'/api/posts/slug/{post.slug}', headers={'If-None-Match': etag})
+        assert response.status_code == 200  # 엔드포인트가 다르면 ETag 도 다름
+        slug_etag = response.headers['ETag']
+        assert client.get(f'/api/posts/slug/{post.slug}', headers={'If-None-Match': slug_etag}).status_code == 304
+        assert get_view_counter(app).pending(post.id) == 4
+
+        # 수정되면 새 ETag
+        post.update(title='수정된 게시물')
+        db_session.session.commit()
+        response = client.get(f'/api/posts/{post.id}', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_list_etag_tracks_content(self, client, db_session, post_factory):
+        """목록 ETag 가 쿼리 문자열과 콘텐츠 변경에 따라 달라지는지 테스트"""
+        post = post_factory('게시물')
+
+        etag = client.get('/api/posts').headers['ETag']
+        assert client.get('/api/posts?per_page=5').headers['ETag'] != etag
+        assert client.get('/api/posts', headers={'If-None-Match': etag}).status_code == 304
+
+        post_factory('두 번째 게시물')
+        response = client.get('/api/posts', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert len(response.get_json()['posts']) == 2
+
+        category_etag = client.get('/api/categories').headers['ETag']
+        assert client.get('/api/categories', headers={'If-None-Match': category_etag}).status_code == 304
+        post.delete()
+        response = client.get('/api/categories', headers={'If-None-Match': category_etag})
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == 'public, max-age=300'
+
+    def test_list_version_reads_counters(self, client, db_session, post_factory):
+        """목록 버전은 행 수를 세지 않고 테이블 버전 카운터만 읽으며, 삭제와 일괄 재렌더링에도 바뀌는지 테스트"""
+        post = post_factory('게시물')
+        etag = client.get('/api/posts').headers['ETag']
+
+        with count_queries() as counter:
+            assert client.get('/api/posts', headers={'If-None-Match': etag}).status_code == 304
+        assert counter.count == 1
+        assert 'count(' not in counter.statements[0].lower()
+
+        # 조회수 flush(ORM 을 거치지 않는 UPDATE)는 버전을 바꾸지 않음
+        get_view_counter().increment(post.id)
+        get_view_counter().flush()
+        assert client.get('/api/posts', headers={'If-None-Match': etag}).status_code == 304
+
+        rerender_posts(force=True, executor=ThreadPoolExecutor(max_workers=1))
+        rerendered_etag = client.get('/api/posts', headers={'If-None-Match': etag}).headers['ETag']
+        assert rerendered_etag != etag
+
+        post.delete()
+        assert client.get('/api/posts', headers={'If-None-Match': rerendered_etag}).status_code == 200
+
+    def test_unpublished_and_missing_skip_etag(self, client, db_session, post_factory):
+        """미발행/없는 게시물은 ETag 없이 뷰가 처리하는지 테스트"""
+        post = post_factory('초안', published=False)
+        db_session.session.commit()
+
+        response = client.get(f'/api/posts/{post.id}', headers={'If-None-Match': '*'})
+        assert response.status_code == 404
+        assert 'ETag' not in response.headers
@@ -0,0 +1,58 @@
+"""
+게시물 Markdown 렌더링 테스트
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from app import db
+from app.services.markdown_renderer import RENDERER_VERSION, content_hash, render_markdown, rerender_posts
+
+
+class TestMarkdownRenderer:
+    """Markdown 렌더링 테스트"""
+
+    def test_renders_sanitized_html(self):
+        """Markdown 을 렌더링하고 스크립트/위험한 링크를 제거하는지 테스트"""
+        html = render_markdown(
+            "# 제목\n\n**굵게** [링크](https://example.com) [악성](javascript:alert(1))\n\n"
+            "<script>alert(1)</script>\n\n| a | b |\n|---|---|\n| 1 | 2 |"
+        )
+        assert '<h1>제목</h1>' in html
+        assert '<strong>굵게</strong>' in html
+        assert 'href="https://example.com"' in html
+        assert 'javascript:' not in html
+        assert '<script>' not in html
+        assert '<td>1</td>' in html
+
+    def test_renders_once_at_publish(self, db_session, post_factory):
+        """발행 시 한 번 렌더링하고 원문이 그대로면 다시 렌더링하지 않는지 테스트"""
+        post = post_factory(content='*안녕*', published=False)
+        post.publish()
+
+        assert post.content_html == '<p><em>안녕</em></p>'
+        assert post.content_hash == content_hash('*안녕*')
+        assert post.render_version == RENDERER_VERSION
+        assert post.render_content_html() is False
+
+        post.content = '**바뀜**'
+        assert post.render_content_html() is True
+        assert post.content_html == '<p><strong>바뀜</strong></p>'
+
+    def test_bulk_rerender_only_stale_posts(self, app, db_session, post_factory):
+        """렌더러 버전이 다르거나 렌더링된 적 없는 게시물만 다시 렌더링하는지 테스트"""
+        current = post_factory(content='최신', published=False)
+        current.render_content_html()
+        stale = post_factory(content='`예전`', published=False)
+        stale.update(content_html='`예전`', content_hash=content_hash('`예전`'), render_version=RENDERER_VERSION - 1)
+        never = post_factory(content='> 처음', published=False)
+        db_session.session.commit()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stats = rerender_posts(workers=2, batch_size=2, executor=executor)
+            assert stats == {'scanned': 3, 'rendered': 2, 'skipped': 1}
+
+            db.session.expire_all()
+            assert stale.content_html == '<p><code>예전</code></p>'
+            assert stale.render_version == RENDERER_VERSION
+            assert never.content_html.startswith('<blockquote>')
+            assert rerender_posts(executor=executor)['rendered'] == 0
+            assert rerender_posts(force=True, executor=executor)['rendered'] == 3
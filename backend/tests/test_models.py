@@ -251,6 +251,46 @@ class TestSource:
         assert found is not None
         assert found.id == source.id
 
+    def test_backfill_from_metadata(self, db_session):
+        """metadata_json 으로 승격 컬럼을 채우는지 테스트"""
+        for index, metadata_json in enumerate([
+            '{"subreddit": "funny", "num_comments": 42}',
+            '{"subreddit": "Jokes", "comments_count": "7"}',
+            'not json',
+            None,
+        ]):
+            Source.create(
+                platform='reddit',
+                source_url=f'https://reddit.com/r/backfill/{index}',
+                source_id=f'backfill{index}',
+                metadata_json=metadata_json
+            )
+        db_session.session.commit()
+
+        assert Source.backfill_from_metadata(batch_size=1) == 2
+        assert Source.backfill_from_metadata() == 0
+
+        rows = Source.query.order_by(Source.id).all()
+        assert [(row.subreddit, row.num_comments) for row in rows] == [
+            ('funny', 42), ('Jokes', 7), (None, None), (None, None)
+        ]
+
+    def test_subreddit_stats_use_index(self, db_session):
+        """subreddit 통계가 인덱스로 처리되는지 테스트"""
+        query = db_session.session.query(
+            Source.subreddit, db_session.func.count()
+        ).filter(Source.platform == 'reddit').group_by(Source.subreddit)
+
+        sql = str(query.statement.compile(
+            dialect=db_session.engine.dialect, compile_kwargs={'literal_binds': True}
+        ))
+        plan = ' '.join(
+            str(row[-1]) for row in db_session.session.execute(db_session.text(f'EXPLAIN QUERY PLAN {sql}'))
+        )
+
+        assert 'idx_source_platform_subreddit' in plan
+        assert 'SCAN sources' not in plan.replace('USING COVERING INDEX', '')
+
 
 class TestInspiration:
     """Inspiration 모델 테스트"""
@@ -0,0 +1,145 @@
+"""
+커서(keyset) 페이지네이션 테스트
+"""
+from datetime import datetime, timedelta
+
+from app.models import Draft, Post, Source
+from app.utils.counting import _unfiltered_table, count_query
+from app.utils.pagination import Keyset, SortKey, paginate_keyset
+from app.utils.performance import count_queries
+
+NOW = datetime(2026, 10, 1, 12, 0)
+
+
+def create_posts(db_session, user, category, count):
+    """발행 게시물 생성 (두 개씩 같은 발행 시각)"""
+    for seq in range(count):
+        Post.create(
+            user_id=user.id,
+            category_id=category.id,
+            title=f'게시물 {seq}',
+            content='내용',
+            is_published=True,
+            published_at=NOW - timedelta(minutes=seq // 2)
+        )
+    db_session.session.commit()
+
+
+class TestCursorPagination:
+    """커서 페이지네이션 테스트"""
+
+    def test_walks_post_list_without_gaps(self, client, db_session, sample_user, sample_category):
+        """커서로 끝까지 넘기면 page 모드와 같은 순서로 빠짐없이 조회하는지 테스트"""
+        create_posts(db_session, sample_user, sample_category, 7)
+
+        expected = [post['id'] for post in client.get('/api/posts?per_page=100').get_json()['posts']]
+        first_page = client.get('/api/posts?per_page=3').get_json()['pagination']
+        assert first_page['total'] == 7 and first_page['next_cursor']
+
+        seen, cursor, pages = [], '', 0
+        while cursor is not None:
+            with count_queries() as counter:
+                body = client.get('/api/posts', query_string={'per_page': 3, 'cursor': cursor}).get_json()
+            assert counter.count <= 3  # 버전, 목록, 태그 (COUNT 없음)
+            seen += [post['id'] for post in body['posts']]
+            cursor = body['pagination']['next_cursor']
+            assert body['pagination']['total'] is None
+            pages += 1
+
+        assert seen == expected
+        assert pages == 3
+
+        # page 모드가 준 커서로 이어 받기
+        body = client.get('/api/posts', query_string={'per_page': 3, 'cursor': first_page['next_cursor']}).get_json()
+        assert [post['id'] for post in body['posts']] == expected[3:6]
+
+        body = client.get('/api/posts', query_string={'cursor': '', 'include_total': 'true'}).get_json()
+        assert body['pagination']['total'] == 7
+
+    def test_rejects_invalid_cursor(self, app, client, db_session, sample_user, sample_category):
+        """잘못된 토큰이나 다른 정렬 기준의 커서를 400으로 거부하는지 테스트"""
+        create_posts(db_session, sample_user, sample_category, 2)
+
+        assert client.get('/api/posts?cursor=not-a-cursor').status_code == 400
+
+        source_keyset = Keyset(SortKey(Source.created_at), SortKey(Source.id))
+        foreign = source_keyset.encode(Post.query.first())
+        assert client.get('/api/posts', query_string={'cursor': foreign}).status_code == 400
+
+    def test_nullable_sort_key(self, app, db_session):
+        """NULL 정렬 값이 맨 뒤에 오고 커서가 NULL 구간도 이어가는지 테스트"""
+        for seq, score in enumerate([5, None, 9, 5, None, 1]):
+            Source.create(
+                platform='reddit',
+                source_url=f'https://reddit.com/r/test/comments/{seq}',
+                source_id=f'post{seq}',
+                score=score
+            )
+        db_session.session.commit()
+
+        for descending in (True, False):
+            keyset = Keyset(SortKey(Source.score, descending), SortKey(Source.id, descending))
+            seen, cursor = [], None
+            while True:
+                items, pagination = paginate_keyset(Source.query, keyset, 2, cursor)
+                seen += [(source.score, source.id) for source in items]
+                cursor = pagination['next_cursor']
+                if cursor is None:
+                    break
+
+            scored = sorted([row for row in seen if row[0] is not None], reverse=descending)
+            nulls = sorted([row for row in seen if row[0] is None], reverse=descending)
+            assert seen == scored + nulls
+            assert len(seen) == 6
+
+
+class TestCountStrategies:
+    """전체 개수 전략 테스트"""
+
+    def test_cached_count_per_filter(self, client, db_session, sample_user, sample_category):
+        """필터 조합별로 COUNT 를 재사용하고 정확 여부를 표시하는지 테스트"""
+        create_posts(db_session, sample_user, sample_category, 3)
+
+        pagination = client.get('/api/posts?per_page=1').get_json()['pagination']
+        assert (pagination['total'], pagination['total_exact'], pagination['pages']) == (3, True, 3)
+
+        create_posts(db_session, sample_user, sample_category, 2)
+
+        # 다른 페이지도 같은 필터면 캐시된 개수 사용
+        pagination = client.get('/api/posts?per_page=1&page=2').get_json()['pagination']
+        assert (pagination['total'], pagination['total_exact']) == (3, False)
+
+        pagination = client.get('/api/posts?per_page=1&page=2&count=exact').get_json()['pagination']
+        assert (pagination['total'], pagination['total_exact']) == (5, True)
+
+        # 마지막 페이지는 개수를 세지 않고 정확한 값
+        pagination = client.get('/api/posts?per_page=2&page=3').get_json()['pagination']
+        assert (pagination['total'], pagination['total_exact'], pagination['has_next']) == (5, True, False)
+
+        assert client.get('/api/posts?count=approximate').status_code == 400
+
+    def test_page_out_of_range(self, client, db_session, sample_user, sample_category):
+        """범위 밖 페이지는 OFFSET 으로 개수를 부풀리지 않고, 보정한 개수는 정확하다고 표시하지 않는지 테스트"""
+        create_posts(db_session, sample_user, sample_category, 3)
+
+        for strategy in ('exact', 'cached'):
+            body = client.get(f'/api/posts?per_page=2&page=5&count={strategy}').get_json()
+            pagination = body['pagination']
+            assert body['posts'] == []
+            assert (pagination['total'], pagination['pages'], pagination['has_next']) == (3, 2, False)
+
+        # 캐시된 개수(3)가 실제 위치보다 작으면 하한으로 보정하되 정확하지 않음
+        create_posts(db_session, sample_user, sample_category, 2)
+        pagination = client.get('/api/posts?per_page=1&page=4&count=cached').get_json()['pagination']
+        assert (pagination['total'], pagination['total_exact'], pagination['has_next']) == (5, False, True)
+
+    def test_estimate_needs_unfiltered_postgres(self, app, db_session, sample_user, sample_category):
+        """추정은 필터 없는 단일 테이블에만 쓰고, SQLite 에서는 캐시된 COUNT 로 대신하는지 테스트"""
+        create_posts(db_session, sample_user, sample_category, 2)
+
+        assert _unfiltered_table(Draft.query.options(*Draft.list_options()).enable_eagerloads(False)) is Draft.__table__
+        assert _unfiltered_table(Post.query.filter_by(is_published=True)) is None
+
+        query = Post.query.filter_by(is_published=True)
+        assert count_query(query, 'estimated') == (2, True)
+        assert count_query(query, 'estimated') == (2, False)
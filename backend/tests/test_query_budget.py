@@ -0,0 +1,136 @@
+"""
+목록 조회 쿼리 수 예산 테스트 (N+1 방지)
+
+목록 엔드포인트의 쿼리 수는 항목 수와 무관하게 일정해야 합니다.
+"""
+from app import cache
+from app.models import Category, Draft, Inspiration, Post, Source, Tag
+from app.utils.performance import count_queries
+
+
+def create_posts(db_session, user, category, tags, start, count):
+    """태그가 달린 발행 게시물 생성"""
+    for seq in range(start, start + count):
+        post = Post.create(
+            user_id=user.id,
+            category_id=category.id,
+            title=f'게시물 {seq}',
+            content='내용',
+            is_published=True
+        )
+        post.tags.extend(tags)
+        post.publish()
+    db_session.session.commit()
+    db_session.session.expire_all()
+
+
+def create_drafts(db_session, user, style, start, count):
+    """Inspiration 과 발행 게시물이 연결된 초안 생성"""
+    category = Category.query.first()
+    for seq in range(start, start + count):
+        source = Source.create(
+            platform='reddit',
+            source_url=f'https://reddit.com/r/test/comments/{seq}',
+            source_id=f'post{seq}',
+            title=f'소스 {seq}'
+        )
+        db_session.session.flush()
+        inspiration = Inspiration.create(source_id=source.id, original_concept=f'컨셉 {seq}')
+        db_session.session.flush()
+        draft = Draft.create(
+            user_id=user.id,
+            inspiration_id=inspiration.id,
+            writing_style_id=style.id,
+            title=f'초안 {seq}',
+            content='내용'
+        )
+        db_session.session.flush()
+        if seq % 2:
+            Post.create(
+                user_id=user.id,
+                category_id=category.id,
+                draft_id=draft.id,
+                title=f'초안 게시물 {seq}',
+                content='내용',
+                is_published=True
+            )
+    db_session.session.commit()
+    db_session.session.expire_all()
+
+
+def count_list_queries(query, serialize):
+    """첫 페이지 조회 + 직렬화 쿼리 수"""
+    with count_queries() as counter:
+        pagination = query.paginate(page=1, per_page=20, error_out=False)
+        items = [serialize(item) for item in pagination.items]
+    return counter.count, items
+
+
+class TestListQueryBudget:
+    """목록 쿼리 예산 테스트"""
+
+    def test_post_list(self, client, db_session, sample_user, sample_category):
+        """게시물 목록 쿼리 수가 게시물 수와 무관한지 테스트"""
+        tags = [Tag.create(name=f'태그{i}') for i in range(3)]
+        create_posts(db_session, sample_user, sample_category, tags, 0, 1)
+
+        with count_queries() as single:
+            response = client.get('/api/posts')
+        assert len(response.get_json()['posts']) == 1
+
+        create_posts(db_session, sample_user, sample_category, tags, 1, 9)
+        cache.clear()
+
+        with count_queries() as many:
+            response = client.get('/api/posts')
+        posts = response.get_json()['posts']
+        assert len(posts) == 10
+        assert many.count == single.count <= 3  # 버전, 목록, 태그 (한 페이지면 총 개수는 세지 않음)
+        assert all(len(post['tags']) == 3 and post['category']['id'] == sample_category.id for post in posts)
+        assert 'content' not in posts[0]
+
+    def test_category_list(self, client, db_session, sample_user, sample_category):
+        """카테고리 목록이 카테고리마다 COUNT 하지 않는지 테스트"""
+        other = Category.create(name='다른 카테고리')
+        for seq in range(3):
+            Category.create(name=f'빈 카테고리 {seq}')
+        db_session.session.commit()
+        create_posts(db_session, sample_user, sample_category, [], 0, 2)
+        create_posts(db_session, sample_user, other, [], 2, 1)
+
+        with count_queries() as counter:
+            response = client.get('/api/categories')
+        counts = {c['name']: c['active_post_count'] for c in response.get_json()['categories']}
+        assert counter.count <= 3  # 버전, 카테고리, 게시물 수
+        assert counts[sample_category.name] == 2
+        assert counts[other.name] == 1
+        assert counts['빈 카테고리 0'] == 0
+
+    def test_draft_list(self, db_session, sample_user, sample_category, sample_writing_style):
+        """초안 목록(작성자, Inspiration, 문체, 발행 여부) 쿼리 수가 일정한지 테스트"""
+        query = Draft.query.options(*Draft.list_options()).order_by(Draft.id)
+
+        create_drafts(db_session, sample_user, sample_writing_style, 0, 1)
+        single, _ = count_list_queries(query, Draft.to_list_dict)
+
+        create_drafts(db_session, sample_user, sample_writing_style, 1, 9)
+        many, drafts = count_list_queries(query, Draft.to_list_dict)
+
+        assert many == single <= 3  # 목록, 총 개수, 게시물
+        assert [draft['is_published'] for draft in drafts[:2]] == [False, True]
+        assert drafts[0]['inspiration']['original_concept'] == '컨셉 0'
+        assert drafts[0]['writing_style']['name'] == sample_writing_style.name
+
+    def test_inspiration_list(self, db_session, sample_user, sample_category, sample_writing_style):
+        """Inspiration 목록(Source, 초안 여부) 쿼리 수가 일정한지 테스트"""
+        query = Inspiration.query.options(*Inspiration.list_options()).order_by(Inspiration.id)
+
+        create_drafts(db_session, sample_user, sample_writing_style, 0, 1)
+        single, _ = count_list_queries(query, Inspiration.to_list_dict)
+
+        create_drafts(db_session, sample_user, sample_writing_style, 1, 9)
+        many, inspirations = count_list_queries(query, Inspiration.to_list_dict)
+
+        assert many == single <= 3  # 목록, 총 개수, 초안
+        assert all(inspiration['has_draft'] for inspiration in inspirations)
+        assert inspirations[0]['source']['title'] == '소스 0'
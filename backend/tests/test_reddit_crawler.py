@@ -0,0 +1,278 @@
+"""
+Reddit 크롤러 테스트 (로컬 가짜 Reddit 서버 사용)
+"""
+import time
+
+import pytest
+
+from app.models import Inspiration, Source
+from app.services.near_duplicate_index import NearDuplicateIndex
+from app.services.reddit_crawler import RedditCrawler, RedditPostMetadata
+from app.services.shingle_index import ShingleIndex
+from app.utils.performance import count_queries
+from app.utils.pipeline import Pipeline, Stage
+from app.utils.rate_limiter import RateLimitTimeout, TokenBucket
+from tests.fake_reddit import FakeRedditServer, make_post
+
+
+def make_crawler(server, **kwargs):
+    """가짜 서버에 연결하는 크롤러 생성"""
+    kwargs.setdefault('rate_limiter', TokenBucket(1000, capacity=1000))
+    return RedditCrawler(
+        client_id='fake-id',
+        client_secret='fake-secret',
+        near_duplicate_index=NearDuplicateIndex(),
+        shingle_index=ShingleIndex(),
+        oauth_url=server.url,
+        reddit_url=server.url,
+        **kwargs
+    )
+
+
+def make_metadata(post_id, title, subreddit='funny'):
+    """테스트용 게시물 메타데이터"""
+    return RedditPostMetadata(
+        post_id=post_id,
+        title=title,
+        url=f'https://i.example.com/{post_id}.jpg',
+        author='someone',
+        subreddit=subreddit,
+        score=500,
+        num_comments=40,
+        created_utc=1700000000.0,
+        permalink=f'https://reddit.com/r/{subreddit}/comments/{post_id}/',
+        is_self=False,
+        selftext=None
+    )
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_burst_then_refill(self):
+        """버스트 이후에는 충전 속도만큼만 허용하는지 테스트"""
+        bucket = TokenBucket(rate=20, capacity=3)
+        assert all(bucket.try_acquire() for _ in range(3))
+        assert bucket.try_acquire() is False
+
+        waited = bucket.acquire()
+        assert waited == pytest.approx(1 / 20, abs=0.04)
+
+    def test_timeout(self):
+        """제한 시간 안에 토큰을 얻지 못하면 예외가 발생하는지 테스트"""
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+
+        with pytest.raises(RateLimitTimeout):
+            bucket.acquire(timeout=0.1)
+
+
+class TestConcurrentCollection:
+    """동시 수집 테스트"""
+
+    SUBREDDITS = ['funny', 'Jokes', 'dadjokes', 'tifu']
+
+    def test_fetches_subreddits_concurrently(self, db_session):
+        """subreddit 을 동시에 가져오고 모두 저장하는지 테스트"""
+        with FakeRedditServer(posts_per_subreddit=5, latency=0.3) as server:
+            crawler = make_crawler(server, max_workers=4)
+            assert crawler.connect()
+
+            result = crawler.collect_from_subreddits(self.SUBREDDITS, limit_per_subreddit=5)
+
+        assert server.max_concurrent == len(self.SUBREDDITS)
+        assert result['posts_fetched'] == 20
+        assert result['sources_created'] == 20
+        assert result['timed_out_subreddits'] == []
+        assert Source.query.filter_by(platform='reddit').count() == 20
+
+    def test_slow_and_failing_subreddits_isolated(self, db_session):
+        """느린/실패한 subreddit 이 다른 subreddit 수집을 막지 않는지 테스트"""
+        with FakeRedditServer(
+            posts_per_subreddit=3,
+            slow_subreddits={'tifu': 3.0},
+            failing_subreddits={'Jokes'}
+        ) as server:
+            crawler = make_crawler(server, max_workers=4, subreddit_timeout=1.5)
+            assert crawler.connect()
+            result = crawler.collect_from_subreddits(self.SUBREDDITS, limit_per_subreddit=3)
+
+        assert result['timed_out_subreddits'] == ['tifu']
+        assert result['failed_subreddits'] == ['Jokes']
+        assert result['sources_created'] == 6
+
+    def test_shared_rate_limit(self, db_session):
+        """모든 수집 스레드가 하나의 요청 할당량을 공유하는지 테스트"""
+        with FakeRedditServer(posts_per_subreddit=2) as server:
+            crawler = make_crawler(server, max_workers=4, rate_limiter=TokenBucket(rate=10, capacity=1))
+            assert crawler.connect()
+            crawler.collect_from_subreddits(self.SUBREDDITS, limit_per_subreddit=2)
+
+        # 리스팅 요청 간격이 초당 10회를 넘지 않음 (약간의 타이머 오차 허용)
+        times = sorted(server.request_times)
+        span = times[-1] - times[0]
+        assert span >= (len(times) - 1) / 10 * 0.8
+
+
+class TestFakeRedditServer:
+    """가짜 Reddit 서버 테스트"""
+
+    def test_rate_limit_headers_and_throttling(self):
+        """할당량 헤더를 보내고 초과 요청은 429 로 거절하는지 테스트"""
+        import requests
+
+        with FakeRedditServer(posts_per_subreddit=3, rate_limit=2) as server:
+            responses = [requests.get(f'{server.url}/r/funny/new?limit=3') for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200, 200, 429]
+        assert responses[0].headers['x-ratelimit-remaining'] == '1.0'
+        assert len(responses[0].json()['data']['children']) == 3
+        assert server.throttled_requests == 1
+
+
+class TestPipeline:
+    """스트리밍 파이프라인 테스트"""
+
+    def test_bounded_queues_apply_backpressure(self):
+        """느린 sink 때문에 업스트림이 막히고 큐가 한도를 넘지 않는지 테스트"""
+        saved = []
+
+        def explode(n):
+            for i in range(10):
+                yield n * 10 + i
+
+        def slow_persist(batch):
+            time.sleep(0.01)
+            saved.extend(batch)
+
+        pipeline = Pipeline(
+            [Stage('explode', explode, workers=2, queue_size=2),
+             Stage('double', lambda n: [n * 2], workers=3, queue_size=4)],
+            sink=Stage('persist', slow_persist, queue_size=4, batch_size=5)
+        )
+        metrics = {m['name']: m for m in pipeline.run(range(10))}
+
+        assert sorted(saved) == [n * 2 for n in range(100)]
+        assert metrics['double']['max_queue_depth'] <= 4
+        assert metrics['persist']['max_queue_depth'] <= 4
+        assert metrics['explode']['blocked_seconds'] > 0
+        assert metrics['persist']['items_out'] == 100
+
+    def test_stage_errors_counted(self):
+        """단계 오류는 해당 항목만 버리고 계속 진행하는지 테스트"""
+        saved = []
+
+        def reject_odd(n):
+            if n % 2:
+                raise ValueError('odd')
+            yield n
+
+        pipeline = Pipeline([Stage('even', reject_odd)], sink=Stage('persist', saved.extend, batch_size=3))
+        metrics = pipeline.run(range(6))
+
+        assert sorted(saved) == [0, 2, 4]
+        assert metrics[0]['errors'] == 3
+
+    def test_collection_reports_stage_metrics(self, db_session):
+        """수집 결과에 단계별 지표가 포함되는지 테스트"""
+        with FakeRedditServer(posts_per_subreddit=30) as server:
+            crawler = make_crawler(server)
+            crawler.pipeline_queue_size = 5
+            crawler.pipeline_batch_size = 7
+            assert crawler.connect()
+            result = crawler.collect_from_subreddits(['funny', 'Jokes'], limit_per_subreddit=30)
+
+        stages = {stage['name']: stage for stage in result['stages']}
+        assert list(stages) == ['fetch', 'normalize', 'dedup', 'summarize', 'fingerprint', 'persist']
+        assert stages['fetch']['items_out'] == 60
+        assert stages['persist']['items_in'] == 60
+        assert stages['persist']['max_queue_depth'] <= 5
+        assert result['sources_created'] == 60
+
+
+class TestBulkSave:
+    """배치 저장 테스트"""
+
+    def test_save_batch_deduplicates_in_few_queries(self, db_session):
+        """기존/배치 내/근접 중복을 걸러내고 정확한 생성 수를 반환하는지 테스트"""
+        crawler = RedditCrawler(
+            client_id='fake-id',
+            client_secret='fake-secret',
+            near_duplicate_index=NearDuplicateIndex(),
+            shingle_index=ShingleIndex()
+        )
+        crawler.save_batch([make_metadata('old1', 'My cat learned to open the fridge at night')])
+
+        posts = [
+            make_metadata('old1', 'My cat learned to open the fridge at night'),
+            make_metadata('new1', 'Dad tried to fix the sink and flooded the kitchen again'),
+            make_metadata('new1', 'Dad tried to fix the sink and flooded the kitchen again'),
+            make_metadata('new2', 'Dad tried to fix the sink and flooded the kitchen again', subreddit='Jokes'),
+            make_metadata('new3', 'The office printer only works when the boss is watching'),
+        ]
+
+        with count_queries() as counter:
+            result = crawler.save_batch(posts)
+
+        assert result == {
+            'sources_created': 3,
+            'inspirations_created': 2,
+            'duplicates_skipped': 2,
+            'near_duplicates_skipped': 1
+        }
+        # 중복 조회 1 + Source INSERT 1 + Inspiration INSERT 1 (+ 트랜잭션 제어)
+        assert sum(1 for sql in counter.statements if sql.lstrip().upper().startswith(('SELECT', 'INSERT'))) == 3
+
+        assert Source.query.count() == 4
+        assert Inspiration.query.count() == 3
+        assert len(crawler.near_duplicate_index) == 3
+
+
+class TestIncrementalCrawl:
+    """증분 수집 테스트"""
+
+    def test_new_listing_stops_at_high_water_mark(self, db_session):
+        """시간순 리스팅은 이전 수집 지점에서 페이징을 멈추는지 테스트"""
+        from app.models import CrawlState
+
+        with FakeRedditServer(posts_per_subreddit=250) as server:
+            crawler = make_crawler(server)
+            assert crawler.connect()
+
+            first = crawler.collect_from_subreddits(['funny'], limit_per_subreddit=250, time_filter='new')
+            first_requests = server.listing_requests
+
+            server.publish('funny', 3)
+            second = crawler.collect_from_subreddits(['funny'], limit_per_subreddit=250, time_filter='new')
+
+        assert first['sources_created'] == 250
+        assert first_requests == 3  # 100개씩 3페이지
+
+        assert second['posts_fetched'] == 3
+        assert second['sources_created'] == 3
+        assert second['subreddits']['funny']['stopped_early'] is True
+        assert server.listing_requests - first_requests == 1
+
+        state = CrawlState.query.filter_by(subreddit='funny', listing='new').one()
+        assert state.last_new_count == 3
+        assert state.last_fullname == make_post('funny', 252)['name']
+
+    def test_top_listing_skips_seen_posts(self, db_session):
+        """시간순이 아닌 리스팅은 본 게시물을 건너뛰고 건수를 보고하는지 테스트"""
+        with FakeRedditServer(posts_per_subreddit=5) as server:
+            crawler = make_crawler(server)
+            assert crawler.connect()
+
+            crawler.collect_from_subreddits(['funny', 'Jokes'], limit_per_subreddit=5)
+            with count_queries() as counter:
+                second = crawler.collect_from_subreddits(['funny', 'Jokes'], limit_per_subreddit=5)
+            full = crawler.collect_from_subreddits(['funny'], limit_per_subreddit=5, incremental=False)
+
+        assert second['posts_fetched'] == 0
+        assert second['posts_skipped'] == 10
+        assert second['subreddits']['Jokes'] == {'new': 0, 'skipped': 5, 'stopped_early': False}
+        # 본 게시물은 중복 조회 없이 건너뜀
+        assert not any('FROM sources' in sql for sql in counter.statements)
+
+        assert full['posts_fetched'] == 5
+        assert full['duplicates_skipped'] == 5
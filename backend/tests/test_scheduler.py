@@ -0,0 +1,349 @@
+"""
+스케줄러 테스트 (리더 선출, 공유 잡스토어, 실행 기록, 적응형 수집 주기)
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from app.models import CrawlState, JobCancelRequest, JobRun, SchedulerLeader
+from app.services import scheduler as scheduler_module
+from app.services.crawl_schedule import CrawlIntervalPolicy
+from app.services.job_isolation import IsolatedJobError, ProcessJobRunner
+from app.services.job_runs import JobRunRecorder
+from app.services.leader_election import FileLeaderLock, LeaderElector
+from app.services.reddit_crawler import RedditCrawler
+from app.services.scheduler import SchedulerService, subreddit_job_id
+
+
+def succeeding_job():
+    """기록 테스트용 성공 작업"""
+    return {'processed': 3}
+
+
+def failing_job():
+    """기록 테스트용 실패 작업"""
+    raise RuntimeError('boom')
+
+
+def burn_cpu():
+    """CPU 를 0.3초 이상 쓰고 자식 PID 반환"""
+    end = time.process_time() + 0.3
+    while time.process_time() < end:
+        pass
+    return {'pid': os.getpid()}
+
+
+def make_elector(path, events, name):
+    """선출/퇴임 이벤트를 기록하는 elector 생성"""
+    return LeaderElector(
+        FileLeaderLock(path),
+        on_elected=lambda: events.append((name, 'elected')),
+        on_demoted=lambda: events.append((name, 'demoted')),
+        interval=60
+    )
+
+
+class TestLeaderElection:
+    """리더 선출 테스트"""
+
+    def test_single_leader_and_takeover(self, tmp_path):
+        """잠금을 잡은 하나만 리더가 되고, 리더가 멈추면 다른 쪽이 이어받는지 테스트"""
+        events = []
+        first = make_elector(tmp_path / 'scheduler.lock', events, 'first')
+        second = make_elector(tmp_path / 'scheduler.lock', events, 'second')
+
+        first.tick()
+        second.tick()
+        assert first.is_leader and not second.is_leader
+
+        first.stop()
+        second.tick()
+        assert second.is_leader
+        assert events == [('first', 'elected'), ('first', 'demoted'), ('second', 'elected')]
+        second.stop()
+
+    def test_dead_leader_process_releases_lock(self, tmp_path):
+        """리더 프로세스가 강제 종료되면 잠금이 풀려 다른 프로세스가 리더가 되는지 테스트"""
+        path = tmp_path / 'scheduler.lock'
+        leader = subprocess.Popen(
+            [sys.executable, '-c', (
+                "import fcntl, sys, time\n"
+                f"f = open({str(path)!r}, 'a+')\n"
+                "fcntl.flock(f.fileno(), fcntl.LOCK_EX)\n"
+                "print('locked', flush=True)\n"
+                "time.sleep(60)\n"
+            )],
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        try:
+            assert leader.stdout.readline().strip() == 'locked'
+            lock = FileLeaderLock(path)
+            assert not lock.acquire()
+
+            leader.kill()
+            leader.wait()
+            assert lock.acquire()
+            lock.release()
+        finally:
+            leader.kill()
+            leader.stdout.close()
+
+
+class TestSchedulerService:
+    """스케줄러 서비스 테스트"""
+
+    def make_service(self, app, path):
+        service = SchedulerService(app)
+        service.start(lock=FileLeaderLock(path))
+        return service
+
+    def test_only_leader_runs_jobs(self, app, db_session, tmp_path):
+        """리더 워커만 작업을 실행하고 모든 워커가 같은 리더 상태를 보고하는지 테스트"""
+        path = tmp_path / 'scheduler.lock'
+        leader = self.make_service(app, path)
+        standby = self.make_service(app, path)
+
+        try:
+            assert leader.is_leader and not standby.is_leader
+            assert leader.get_statistics()['running'] is True
+            assert standby.get_statistics()['running'] is False
+
+            status = standby.get_leader_status()
+            assert status['worker'] == standby.elector.identity
+            assert status['leader']['holder'] == leader.elector.identity
+            assert status['leader']['lock_backend'] == 'file'
+            assert status['leader']['alive'] is True
+
+            # 리더가 종료되면 대기 워커가 다음 확인 주기에 이어받음
+            leader.shutdown(wait=False)
+            standby.elector.tick()
+            assert standby.is_leader
+            assert standby.get_statistics()['running'] is True
+            assert SchedulerLeader.query.count() == 1
+        finally:
+            leader.shutdown(wait=False)
+            standby.shutdown(wait=False)
+
+    def test_shared_job_store_and_run_history(self, app, db_session, tmp_path):
+        """대기 워커에서 즉시 실행한 작업을 리더가 실행하고 실행 기록을 DB 에서 페이지로 조회하는지 테스트"""
+        path = tmp_path / 'scheduler.lock'
+        leader = self.make_service(app, path)
+        standby = self.make_service(app, path)
+
+        try:
+            leader.add_job(func=succeeding_job, trigger='interval', job_id='ok_job', name='OK', hours=6)
+            leader.add_job(func=failing_job, trigger='interval', job_id='bad_job', name='Bad', hours=6)
+
+            # 작업 정의는 잡스토어를 통해 모든 워커가 공유
+            assert {'ok_job', 'bad_job'} <= {job['id'] for job in standby.get_jobs()}
+            assert standby.run_job_now('ok_job') and standby.run_job_now('bad_job')
+
+            leader.elector.tick()  # 하트비트 때 잡스토어 변경을 반영
+            deadline = time.time() + 5
+            while JobRun.query.count() < 2 and time.time() < deadline:
+                time.sleep(0.05)
+                leader.recorder.flush()
+
+            failed = standby.get_job_history(status='failed')['history']
+            assert [run['job_id'] for run in failed] == ['bad_job']
+            assert failed[0]['error'] == 'boom'
+            assert failed[0]['duration_sec'] is not None
+
+            first = standby.get_job_history(limit=1)
+            second = standby.get_job_history(limit=1, before_id=first['next_cursor'])
+            runs = first['history'] + second['history']
+            assert {run['job_id'] for run in runs} == {'ok_job', 'bad_job'}
+            assert second['next_cursor'] is None
+            assert next(run for run in runs if run['job_id'] == 'ok_job')['summary'] == {'processed': 3}
+
+            recent = standby.get_statistics()['recent_24h']
+            assert (recent['total'], recent['success'], recent['failed'], recent['timeout']) == (2, 1, 1, 0)
+        finally:
+            leader.shutdown(wait=False)
+            standby.shutdown(wait=False)
+
+    def test_cancel_request_applied_by_leader(self, app, db_session, tmp_path):
+        """대기 워커가 남긴 취소 요청을 리더가 하트비트 때 처리하는지 테스트"""
+        path = tmp_path / 'scheduler.lock'
+        leader = self.make_service(app, path)
+        standby = self.make_service(app, path)
+        errors = []
+
+        def run_slow():
+            try:
+                leader.process_runner.run('slow', time.sleep, args=(30,), timeout=60)
+            except IsolatedJobError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run_slow)
+        try:
+            thread.start()
+            deadline = time.time() + 10
+            while 'slow' not in leader.process_runner.running() and time.time() < deadline:
+                time.sleep(0.01)
+
+            # 대기 워커에는 실행 중인 자식이 없으므로 요청만 남김
+            assert not standby.cancel_job_run('slow')
+            JobCancelRequest.request('slow')
+            JobCancelRequest.request('slow')  # 중복 요청은 한 번만
+
+            leader.elector.tick()
+            thread.join(timeout=10)
+            assert errors[0].status == 'cancelled'
+            assert JobCancelRequest.query.count() == 0
+        finally:
+            leader.process_runner.cancel('slow')
+            thread.join(timeout=10)
+            leader.shutdown(wait=False)
+            standby.shutdown(wait=False)
+
+
+class TestProcessJobRunner:
+    """작업 프로세스 격리 실행 테스트"""
+
+    def test_runs_in_child_and_records_resources(self, app, db_session):
+        """자식 프로세스에서 실행하고 CPU 시간/최대 RSS 를 실행 기록에 남기는지 테스트"""
+        result = ProcessJobRunner(app).run('burn', burn_cpu, timeout=30)
+
+        assert result.value['pid'] != os.getpid()
+        assert result.metrics.isolated
+        assert result.metrics.cpu_time_sec >= 0.3
+        assert result.metrics.peak_rss_mb > 0
+
+        recorder = JobRunRecorder(app, batch_size=1)
+        recorder.finished('burn', None, 'success', summary=result.value, metrics=result.metrics)
+        run = JobRun.query.one()
+        assert run.isolated and run.cpu_time_sec == result.metrics.cpu_time_sec
+        assert run.duration_sec == result.metrics.wall_time_sec
+
+    def test_failure_timeout_and_cancel(self, app, db_session):
+        """작업 예외, 하드 타임아웃, 취소를 각각의 상태로 구분하는지 테스트"""
+        runner = ProcessJobRunner(app, max_workers=2)
+
+        with pytest.raises(IsolatedJobError) as failed:
+            runner.run('bad', failing_job)
+        assert failed.value.status == 'failed'
+        assert 'RuntimeError: boom' in str(failed.value)
+
+        start = time.monotonic()
+        with pytest.raises(IsolatedJobError) as timed_out:
+            runner.run('slow', time.sleep, args=(30,), timeout=0.5)
+        assert timed_out.value.status == 'timeout'
+        assert time.monotonic() - start < 5
+
+        errors = []
+
+        def run_slow():
+            try:
+                runner.run('slow', time.sleep, args=(30,), timeout=60)
+            except IsolatedJobError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run_slow)
+        thread.start()
+        deadline = time.time() + 5
+        while 'slow' not in runner.running() and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert runner.cancel('slow')
+        thread.join(timeout=5)
+        assert errors[0].status == 'cancelled'
+        assert errors[0].metrics.wall_time_sec < 5
+        assert runner.running() == {}
+        assert not runner.cancel('slow')
+
+
+class FakeCrawler:
+    """subreddit 마다 정해진 수의 새 게시물을 돌려주는 크롤러"""
+
+    DEFAULT_SUBREDDITS = RedditCrawler.DEFAULT_SUBREDDITS
+    yields = {}
+
+    def __init__(self, client_id=None, client_secret=None):
+        pass
+
+    def connect(self):
+        return True
+
+    def collect_from_subreddits(self, subreddit_names, limit_per_subreddit, time_filter, create_inspirations):
+        name = subreddit_names[0]
+        return {
+            'sources_created': 0,
+            'inspirations_created': 0,
+            'posts_skipped': 0,
+            'subreddits': {name: {'new': self.yields[name], 'skipped': 0, 'stopped_early': True}},
+            'timed_out_subreddits': [],
+            'failed_subreddits': []
+        }
+
+
+class TestAdaptiveCrawlSchedule:
+    """subreddit 별 적응형 수집 주기 테스트"""
+
+    def test_interval_follows_yield(self):
+        """새 게시물이 많으면 주기를 줄이고 없으면 늘리며 최소/최대 주기를 지키는지 테스트"""
+        policy = CrawlIntervalPolicy(default=3600 * 12, minimum=3600, maximum=3600 * 48, target_yield=3)
+
+        assert policy.next_interval(None, yield_ema=6, saturated=False) == 3600 * 6
+        assert policy.next_interval(3600 * 12, yield_ema=0, saturated=False) == 3600 * 24
+        assert policy.next_interval(3600 * 12, yield_ema=100, saturated=False) == 3600 * 6  # 한 번에 최대 절반
+        assert policy.next_interval(3600 * 12, yield_ema=3, saturated=True) == 3600 * 6
+        assert policy.next_interval(3600 * 40, yield_ema=0, saturated=False) == 3600 * 48
+        assert policy.next_interval(3600, yield_ema=100, saturated=False) == 3600
+
+        # 조용한 subreddit 은 실행마다 주기가 늘어나 최대 주기에 수렴
+        state = CrawlState(subreddit='quiet', listing='top:day')
+        intervals = [policy.update(state, new_count=0, limit=10) for _ in range(3)]
+        assert intervals == [3600 * 24, 3600 * 48, 3600 * 48]
+        assert state.yield_ema == 0
+
+    def test_per_subreddit_jobs_adapt(self, app, db_session, tmp_path, monkeypatch):
+        """subreddit 마다 작업을 등록하고 수집 결과에 따라 각자의 주기로 다시 예약하는지 테스트"""
+        CrawlState.create(subreddit='funny', listing='top:day', crawl_interval_sec=7200)
+        db_session.session.commit()
+        monkeypatch.setattr(scheduler_module, 'RedditCrawler', FakeCrawler)
+        monkeypatch.setattr(FakeCrawler, 'yields', {'funny': 10, 'Jokes': 0})
+
+        service = SchedulerService(app)
+        service.start(lock=FileLeaderLock(tmp_path / 'scheduler.lock'))
+        monkeypatch.setattr(scheduler_module, '_scheduler_instance', service)
+
+        try:
+            jobs = {job['id']: job for job in service.get_jobs()}
+            for name in RedditCrawler.DEFAULT_SUBREDDITS:
+                assert jobs[subreddit_job_id(name)]['isolated']
+            assert jobs[subreddit_job_id('funny')]['trigger'] == 'interval[2:00:00]'
+            assert jobs[subreddit_job_id('Jokes')]['trigger'] == 'interval[12:00:00]'
+
+            # 첫 실행은 최소 주기 안에 나뉘어 예약
+            first_runs = {job['next_run_time'] for job in jobs.values() if job['id'].startswith('reddit_collection:')}
+            assert len(first_runs) == len(RedditCrawler.DEFAULT_SUBREDDITS)
+
+            # 모두 새 게시물이면 절반으로, 새 게시물이 없으면 두 배로
+            monkeypatch.setenv('SCHEDULER_ISOLATED_JOBS', '[]')  # 메모리 DB 는 자식 프로세스와 공유되지 않음
+            for name in ('funny', 'Jokes'):
+                scheduler_module.subreddit_collection_job(name)
+
+            funny = service.scheduler.get_job(subreddit_job_id('funny'))
+            jokes = service.scheduler.get_job(subreddit_job_id('Jokes'))
+            assert str(funny.trigger) == 'interval[1:00:00]'
+            assert str(jokes.trigger) == 'interval[1 day, 0:00:00]'
+            assert funny.trigger.jitter == 360
+
+            states = {state.subreddit: state for state in CrawlState.query.all()}
+            assert states['funny'].crawl_interval_sec == 3600
+            assert states['Jokes'].crawl_interval_sec == 86400
+
+            # 재시작해도 조정된 주기를 이어 씀
+            service.shutdown(wait=False)
+            restarted = SchedulerService(app)
+            restarted.start(lock=FileLeaderLock(tmp_path / 'scheduler.lock'))
+            assert str(restarted.scheduler.get_job(subreddit_job_id('funny')).trigger) == 'interval[1:00:00]'
+            restarted.shutdown(wait=False)
+        finally:
+            service.shutdown(wait=False)
@@ -0,0 +1,426 @@
+"""
+유사도 서비스 테스트
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.services.batch_similarity import (
+    iter_batch_similarity,
+    load_inspiration_pairs,
+    persist_similarity_scores
+)
+from app.services.embedding_service import EmbeddingCache, EmbeddingService, get_embedding_service
+from app.services.near_duplicate_index import NearDuplicateIndex, strip_concept_boilerplate
+from app.services.shingle_index import ShingleIndex, check_corpus_overlap
+from app.services.similarity_checker import SimilarityChecker
+
+
+JOKE = "회의 중에 카메라가 꺼져있는 줄 알고 하품을 했는데 사실 켜져있었다. 팀장님이 웃으셨다."
+JOKE_REPOST = "회의 중에 카메라가 꺼져있는 줄 알고 하품을 했는데 사실 켜져 있었다! 팀장님이 웃으셨다."
+OTHER = "고양이가 키보드 위에서 자다가 사장님께 이상한 이메일을 보내버렸다."
+
+
+class TestNearDuplicateIndex:
+    """NearDuplicateIndex 테스트"""
+
+    def test_query_finds_near_duplicate(self):
+        """근접 중복 조회 테스트"""
+        index = NearDuplicateIndex()
+        index.add('inspiration', 1, JOKE, persist=False)
+        index.add('inspiration', 2, OTHER, persist=False)
+
+        results = index.query(JOKE_REPOST, k=5, threshold=0.6)
+
+        assert [(r.doc_type, r.doc_id) for r in results] == [('inspiration', 1)]
+        assert results[0].similarity >= 0.6
+
+    def test_query_filters_type_and_exclude(self):
+        """문서 타입 필터 및 자기 자신 제외 테스트"""
+        index = NearDuplicateIndex()
+        index.add('inspiration', 1, JOKE, persist=False)
+        index.add('post', 7, JOKE, persist=False)
+
+        assert [r.doc_id for r in index.query(JOKE, threshold=0.9, doc_type='post')] == [7]
+        assert index.query(JOKE, threshold=0.9, doc_type='post', exclude=('post', 7)) == []
+
+    def test_remove(self):
+        """문서 제거 테스트"""
+        index = NearDuplicateIndex()
+        index.add('post', 1, JOKE, persist=False)
+        index.remove('post', 1, persist=False)
+
+        assert len(index) == 0
+        assert index.query(JOKE, threshold=0.5) == []
+
+    def test_persistence_and_journal_sync(self, tmp_path):
+        """스냅샷/저널 영속화 및 프로세스 간 동기화 테스트"""
+        path = tmp_path / 'index.pkl'
+        writer = NearDuplicateIndex(path=path).load()
+        writer.add('inspiration', 1, JOKE)
+
+        # 다른 워커: 저널만으로 로드
+        reader = NearDuplicateIndex(path=path).load()
+        assert ('inspiration', 1) in reader
+
+        # 스냅샷 후 추가분은 조회 시 동기화
+        writer.compact()
+        writer.add('post', 2, OTHER)
+        assert [r.doc_id for r in reader.query(OTHER, threshold=0.9)] == [2]
+
+        reloaded = NearDuplicateIndex(path=path).load()
+        assert len(reloaded) == 2
+
+    def test_journal_compacted_by_other_process(self, tmp_path):
+        """다른 프로세스가 compact 한 저널이 읽은 위치보다 커져도 스냅샷부터 다시 읽는지 테스트"""
+        path = tmp_path / 'index.pkl'
+        writer = NearDuplicateIndex(path=path).load()
+        for doc_id in range(3):
+            writer.add('inspiration', doc_id, f'{OTHER} {doc_id}')
+        reader = NearDuplicateIndex(path=path).load()
+        assert len(reader) == 3
+
+        writer.compact()
+        writer.remove('inspiration', 0)
+        for doc_id in range(10, 16):
+            writer.add('post', doc_id, f'{JOKE} {doc_id}')
+        assert writer.journal_path.stat().st_size > reader._journal_offset
+
+        reader.sync()
+        assert len(reader) == len(writer) == 8
+        assert ('inspiration', 0) not in reader
+
+    def test_invalid_journal_line_forces_reload(self, tmp_path):
+        """깨진 저널 줄은 예외 대신 전체 재로드 후 건너뛰는지 테스트"""
+        path = tmp_path / 'index.pkl'
+        writer = NearDuplicateIndex(path=path).load()
+        writer.add('inspiration', 1, JOKE)
+        reader = NearDuplicateIndex(path=path).load()
+
+        with open(writer.journal_path, 'ab') as journal:
+            journal.write(b'inspiration:2\tnot-hex\n')
+        writer.add('post', 3, OTHER)
+
+        reader.sync()
+        assert ('inspiration', 1) in reader and ('post', 3) in reader
+        assert len(reader) == 2
+
+    def test_strip_concept_boilerplate(self):
+        """컨셉 요약 라벨 제거 테스트"""
+        concept = "Title: 웃긴 이야기\nContext: r/funny\nPreview: 본문 미리보기\nPopularity: 120 upvotes, 15 comments"
+
+        assert strip_concept_boilerplate(concept) == "웃긴 이야기\n본문 미리보기"
+
+
+class TestShingleIndex:
+    """코퍼스 표절 체크 역색인 테스트"""
+
+    def test_candidates_ranked_by_shared_shingles(self):
+        """공유 shingle 수 순으로 후보를 반환하는지 테스트"""
+        index = ShingleIndex()
+        index.add('post', 1, OTHER, persist=False)
+        index.add('post', 2, JOKE, persist=False)
+        index.add('inspiration', 3, JOKE[:30], persist=False)
+
+        candidates = index.candidates(JOKE_REPOST, k=5)
+
+        assert [(c.doc_type, c.doc_id) for c in candidates] == [('post', 2), ('inspiration', 3)]
+        assert candidates[0].shared_shingles > candidates[1].shared_shingles
+        assert [c.doc_id for c in index.candidates(JOKE_REPOST, doc_type='inspiration')] == [3]
+        assert index.candidates(JOKE_REPOST, exclude=('post', 2))[0].doc_id == 3
+
+    def test_bulk_and_incremental_inserts_agree(self):
+        """대량 병합(base)과 증분 추가(delta)가 같은 결과인지 테스트"""
+        documents = [('post', i, f"{i}번째 이야기: " + (JOKE if i % 2 else OTHER)) for i in range(40)]
+
+        bulk = ShingleIndex(merge_threshold=10)
+        bulk.add_many(documents, persist=False)
+        incremental = ShingleIndex()
+        for document in documents:
+            incremental.add(*document, persist=False)
+
+        for query in (JOKE, OTHER):
+            assert bulk.candidates(query, k=40) == incremental.candidates(query, k=40)
+
+    def test_common_shingles_ignored(self):
+        """대부분 문서에 등장하는 shingle 은 조회에서 무시하는지 테스트"""
+        index = ShingleIndex(max_df_ratio=0.5, min_df_cutoff=1)
+        index.add_many(
+            [('post', i, f"공통문구입니다 {i}{i}{i}") for i in range(10)] + [('post', 99, JOKE)],
+            persist=False
+        )
+
+        assert index.candidates("공통문구입니다", min_shared=1) == []
+        assert index.candidates(JOKE)[0].doc_id == 99
+
+    def test_remove_and_persistence(self, tmp_path):
+        """삭제 및 스냅샷/저널 영속화 테스트"""
+        path = tmp_path / 'shingles.pkl'
+        writer = ShingleIndex(path=path).load()
+        writer.add('post', 1, JOKE)
+        writer.add('post', 2, OTHER)
+        writer.remove('post', 1)
+        writer.compact()
+        writer.add('inspiration', 5, JOKE)
+
+        reader = ShingleIndex(path=path).load()
+
+        assert len(reader) == 2
+        assert [(c.doc_type, c.doc_id) for c in reader.candidates(JOKE)] == [('inspiration', 5)]
+
+    def test_check_corpus_overlap(self, db_session, sample_user, sample_category):
+        """후보만 DB 에서 읽어 정밀 유사도를 계산하는지 테스트"""
+        from app.models import Post
+
+        copied = Post.create(user_id=sample_user.id, category_id=sample_category.id, title='복사', content=JOKE)
+        other = Post.create(user_id=sample_user.id, category_id=sample_category.id, title='다른 글', content=OTHER)
+        db_session.session.commit()
+
+        index = ShingleIndex()
+        index.add('post', copied.id, copied.content, persist=False)
+        index.add('post', other.id, other.content, persist=False)
+        index.add('post', 9999, JOKE, persist=False)  # DB 에서 삭제된 문서
+
+        matches = check_corpus_overlap(
+            JOKE_REPOST,
+            index=index,
+            checker=SimilarityChecker(use_semantic=False)
+        )
+
+        assert [m.candidate.doc_id for m in matches] == [copied.id]
+        assert not matches[0].is_fair_use_compliant
+
+
+class CountingEmbeddingService(EmbeddingService):
+    """모델 대신 글자 빈도 벡터를 쓰는 임베딩 서비스 (인코딩 횟수 기록)"""
+
+    def __init__(self, cache=None):
+        super().__init__(model_name='test-char-counts', cache=cache)
+        self.encoded_texts = []
+
+    def is_available(self):
+        return True
+
+    def _encode_batch(self, texts):
+        self.encoded_texts.extend(texts)
+        vectors = np.zeros((len(texts), 64), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for char in text:
+                vectors[row, ord(char) % 64] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class TestSemanticSimilarity:
+    """의미적 유사도 테스트"""
+
+    def test_embedding_cache_avoids_reencoding(self, tmp_path):
+        """원본은 캐시에서 읽고 새 텍스트만 인코딩하는지 테스트"""
+        cache = EmbeddingCache(tmp_path / 'embeddings.sqlite')
+        CountingEmbeddingService(cache=cache).encode([JOKE])
+
+        # 새 프로세스에서도 디스크 캐시 사용
+        service = CountingEmbeddingService(cache=EmbeddingCache(tmp_path / 'embeddings.sqlite'))
+        service.similarity(JOKE, OTHER)
+
+        assert service.encoded_texts == [OTHER]
+
+    def test_semantic_component_included(self):
+        """의미적 유사도가 가중 평균에 포함되는지 테스트"""
+        checker = SimilarityChecker(embedding_service=CountingEmbeddingService())
+        result = checker.check_similarity(JOKE, JOKE_REPOST)
+
+        assert result.details['semantic_available'] is True
+        assert result.semantic_similarity > 0.9
+        assert result.details['weights'] == SimilarityChecker.WEIGHTS
+
+    def test_disabled_by_testing_config(self, app):
+        """앱의 환경별 설정(TestingConfig)으로 모델을 로드하지 않는지 테스트"""
+        with app.app_context():
+            assert get_embedding_service() is None
+
+    def test_weights_redistributed_without_model(self):
+        """임베딩 모델이 없으면 가중치를 재분배하는지 테스트"""
+        checker = SimilarityChecker(use_semantic=False)
+        result = checker.check_similarity(JOKE, JOKE)
+
+        assert result.details['semantic_available'] is False
+        assert result.overall_similarity == pytest.approx(1.0)
+        assert not result.is_fair_use_compliant
+
+    def test_batch_check_matches_single_check(self):
+        """배치 체크가 단건 체크와 같은 결과인지 테스트"""
+        checker = SimilarityChecker(embedding_service=CountingEmbeddingService())
+        batch = checker.batch_check([JOKE, JOKE], [JOKE_REPOST, OTHER])
+
+        for result, generated in zip(batch, [JOKE_REPOST, OTHER]):
+            single = checker.check_similarity(JOKE, generated)
+            assert result.overall_similarity == pytest.approx(single.overall_similarity, abs=1e-6)
+
+
+LONG_ORIGINAL = (
+    "재택근무 중에 화상회의에 들어갔는데 카메라가 꺼져있는 줄 알고 크게 하품을 했다. "
+    "그런데 화면을 보니 카메라는 켜져 있었고 팀장님과 동료들이 모두 나를 보고 있었다. "
+    "팀장님이 웃으면서 어젯밤에 잠을 못 잤냐고 물어보셨다."
+)
+ORIGINAL_STORY = (
+    "오늘 점심시간에 편의점에서 삼각김밥을 샀는데 포장을 뜯는 방법을 몰라서 "
+    "김이 전부 찢어졌다. 옆에 있던 인턴이 조용히 다가와서 번호 순서대로 뜯으면 된다고 알려줬다."
+)
+
+
+def feed(session, text, size):
+    """텍스트를 size 글자씩 나눠 세션에 넣기"""
+    for i in range(0, len(text), size):
+        session.update(text[i:i + size])
+    return session
+
+
+class TestIncrementalSimilarity:
+    """증분 유사도 세션 테스트"""
+
+    @pytest.mark.parametrize('chunk_size', [1, 3, 7, 50])
+    def test_matches_full_computation(self, chunk_size):
+        """청크 크기와 무관하게 전체 계산과 같은 결과인지 테스트"""
+        checker = SimilarityChecker(use_semantic=False)
+        generated = JOKE_REPOST + "\n" + ORIGINAL_STORY
+
+        session = feed(checker.incremental(LONG_ORIGINAL), generated, chunk_size)
+        result = session.result()
+        expected = checker.check_similarity(LONG_ORIGINAL, generated)
+
+        assert result.lexical_similarity == pytest.approx(expected.lexical_similarity)
+        assert result.overall_similarity == pytest.approx(expected.overall_similarity)
+
+    def test_aborts_on_copied_text(self):
+        """원본을 베끼는 생성은 끝나기 전에 중단 신호를 주는지 테스트"""
+        checker = SimilarityChecker(use_semantic=False)
+        session = checker.incremental(LONG_ORIGINAL, min_chars=40)
+
+        aborted_at = None
+        for i in range(0, len(LONG_ORIGINAL), 4):
+            session.update(LONG_ORIGINAL[i:i + 4])
+            if session.should_abort():
+                aborted_at = i
+                break
+
+        assert aborted_at is not None
+        assert aborted_at < len(LONG_ORIGINAL) - 4
+
+    def test_no_abort_on_original_text(self):
+        """원본과 다른 생성은 중단하지 않는지 테스트"""
+        checker = SimilarityChecker(use_semantic=False)
+        session = checker.incremental(LONG_ORIGINAL, min_chars=10, max_chars=200)
+
+        for i in range(0, len(ORIGINAL_STORY), 5):
+            session.update(ORIGINAL_STORY[i:i + 5])
+            assert not session.should_abort()
+
+    def test_lower_bound_holds(self):
+        """남은 생성량 기반 하한이 최종 값 이하인지 테스트"""
+        checker = SimilarityChecker(use_semantic=False)
+        generated = LONG_ORIGINAL + " " + ORIGINAL_STORY
+        prefix = LONG_ORIGINAL[:60]
+
+        session = checker.incremental(LONG_ORIGINAL)
+        session.update(prefix)
+        remaining = len(''.join(generated[len(prefix):].split()))
+        bound = session.lexical_lower_bound(remaining)
+
+        session.update(generated[len(prefix):])
+        session.finish()
+
+        assert bound <= session.lexical_similarity
+
+
+class FakeStreamingLLM:
+    """스트리밍 결과를 차례로 돌려주는 LLM 대역 (중단 시 소비된 청크 수 기록)"""
+
+    model_name = 'fake-llm'
+
+    def __init__(self, outputs):
+        self.outputs = list(outputs)
+        self.consumed = []
+
+    def is_loaded(self):
+        return True
+
+    def generate_stream_with_system_prompt(self, system_prompt, user_prompt, **kwargs):
+        text = self.outputs.pop(0)
+        chunks = [text[i:i + 4] for i in range(0, len(text), 4)]
+        self.consumed.append(0)
+        for chunk in chunks:
+            self.consumed[-1] += 1
+            yield chunk
+
+
+class TestStreamingGeneration:
+    """ContentGenerator 스트리밍 Fair Use 체크 테스트"""
+
+    def test_resamples_copied_draft_early(self, monkeypatch):
+        """베끼는 초안은 조기 중단하고 재샘플링하는지 테스트"""
+        from app.llm.prompts import PromptTemplate
+        from app.services.content_generator import ContentGenerator
+
+        monkeypatch.setattr(
+            PromptTemplate, 'build_full_prompt',
+            staticmethod(lambda **kwargs: ('system', 'user')),
+            raising=False
+        )
+
+        generator = ContentGenerator(similarity_checker=SimilarityChecker(use_semantic=False))
+        fresh = "제목: 삼각김밥\n내용:\n" + ORIGINAL_STORY
+        generator.llm = FakeStreamingLLM([LONG_ORIGINAL, fresh])
+
+        result = generator.generate(LONG_ORIGINAL, max_retries=2)
+
+        assert result.success
+        assert result.early_aborts == 1
+        assert result.title == '삼각김밥'
+        assert result.similarity_score < SimilarityChecker.FAIR_USE_THRESHOLD
+        # 첫 시도는 끝까지 소비하지 않음
+        assert generator.llm.consumed[0] < len(range(0, len(LONG_ORIGINAL), 4))
+
+
+class TestBatchSimilarity:
+    """배치 유사도 체크 테스트"""
+
+    def test_chunks_match_single_checks(self):
+        """청크로 나눠 채점해도 단건 체크와 같은 결과인지 테스트"""
+        checker = SimilarityChecker(embedding_service=CountingEmbeddingService())
+        pairs = [(JOKE, JOKE_REPOST), (JOKE, OTHER), (LONG_ORIGINAL, ORIGINAL_STORY)] * 3
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = dict(iter_batch_similarity(pairs, checker=checker, executor=executor, chunk_size=2))
+
+        assert sorted(results) == list(range(len(pairs)))
+        for index, (original, generated) in enumerate(pairs):
+            expected = checker.check_similarity(original, generated)
+            assert results[index].overall_similarity == pytest.approx(expected.overall_similarity, abs=1e-6)
+            assert results[index].details['semantic_available'] is True
+
+    def test_persist_scores_in_bulk(self, db_session, sample_user):
+        """Draft 가 있는 Inspiration 만 읽고 점수를 일괄 저장하는지 테스트"""
+        from app.models import Draft, Inspiration, Source
+
+        source = Source.create(platform='reddit', source_url='https://reddit.com/r/funny/batch', source_id='batch1')
+        db_session.session.flush()
+        with_draft = Inspiration.create(source_id=source.id, original_concept=JOKE)
+        without_draft = Inspiration.create(source_id=source.id, original_concept=OTHER)
+        db_session.session.flush()
+        Draft.create(
+            user_id=sample_user.id,
+            inspiration_id=with_draft.id,
+            title='초안',
+            content=JOKE_REPOST
+        )
+        db_session.session.commit()
+
+        loaded = load_inspiration_pairs([with_draft.id, without_draft.id])
+        assert loaded == {with_draft.id: (JOKE, JOKE_REPOST)}
+
+        assert persist_similarity_scores({with_draft.id: 0.91}) == 1
+        db_session.session.expire_all()
+        assert Inspiration.query.get(with_draft.id).similarity_score == pytest.approx(0.91)
+        assert Inspiration.query.get(without_draft.id).similarity_score is None
@@ -0,0 +1,215 @@
+"""
+피드/HTML 커넥터 테스트 (로컬 가짜 피드 서버 사용)
+"""
+import pytest
+
+from app.models import Inspiration, Source
+from app.services.http_cache import HTTPCache
+from app.services.near_duplicate_index import NearDuplicateIndex
+from app.services.shingle_index import ShingleIndex
+from app.services.source_connectors import (
+    ConnectorCollector,
+    FeedConnector,
+    HTMLListingConnector,
+    build_connectors
+)
+from app.services.source_ingestion import SourceIngestor
+from tests.fake_feeds import BASE_TIMESTAMP, FakeFeedServer, make_atom, make_listing_html, make_rss
+
+
+def make_collector(connectors, **kwargs):
+    """테스트용 인덱스를 쓰는 수집기 생성 (http_cache 를 주지 않으면 캐시 사용 안 함)"""
+    ingestor = SourceIngestor(NearDuplicateIndex(), ShingleIndex())
+    kwargs.setdefault('use_cache', 'http_cache' in kwargs)
+    return ConnectorCollector(connectors, ingestor=ingestor, **kwargs)
+
+
+class TestParsing:
+    """커넥터 파싱 테스트"""
+
+    def test_rss(self):
+        """RSS 항목의 링크/작성자/시각/요약을 추출하는지 테스트"""
+        entries = FeedConnector('tech', 'http://x/feed').parse(make_rss('tech', 3).encode(), 'http://x/feed')
+
+        assert [entry.url for entry in entries] == [f'https://tech.example.com/posts/{seq}' for seq in (2, 1, 0)]
+        assert entries[0].author == 'writer2'
+        assert entries[0].created_utc == BASE_TIMESTAMP + 120
+        assert entries[0].summary == 'Story 2 from tech : a cat, a keyboard and a deadline.'
+        assert entries[0].post_id == FeedConnector('other', 'http://y').parse(
+            make_rss('tech', 3).encode(), 'http://y'
+        )[0].post_id
+
+    def test_atom(self):
+        """Atom 항목을 파싱하는지 테스트"""
+        entries = FeedConnector('notes', 'http://x/atom', max_entries=2).parse(
+            make_atom('notes', 5).encode(), 'http://x/atom'
+        )
+
+        assert len(entries) == 2
+        assert entries[0].url == 'https://notes.example.org/notes/0'
+        assert entries[0].author == 'author0'
+        assert entries[0].summary == 'Note 0 about the office coffee machine.'
+
+    def test_html_listing_resolves_relative_links(self):
+        """HTML 목록 페이지에서 선택자로 항목을 뽑고 상대 링크를 절대 URL로 바꾸는지 테스트"""
+        connector = HTMLListingConnector(
+            'blog', 'http://blog.test/list',
+            item_selector='article.post',
+            summary_selector='.excerpt'
+        )
+        entries = connector.parse(make_listing_html('blog', 2).encode(), 'http://blog.test/list')
+
+        assert [entry.url for entry in entries] == ['http://blog.test/blog/article-0', 'http://blog.test/blog/article-1']
+        assert entries[0].title == 'blog article 0: printer drama'
+        assert entries[0].summary.startswith('Excerpt 0')
+        assert entries[0].created_utc == pytest.approx(1699923600.0)
+
+    def test_build_connectors(self):
+        """설정으로부터 커넥터를 만들고 잘못된 타입은 거절하는지 테스트"""
+        connectors = build_connectors([
+            {'name': 'a', 'url': 'http://a/feed'},
+            {'type': 'html', 'name': 'b', 'url': 'http://b/', 'item_selector': 'li'},
+        ])
+        assert [type(c) for c in connectors] == [FeedConnector, HTMLListingConnector]
+
+        with pytest.raises(ValueError):
+            build_connectors([{'type': 'ftp', 'name': 'c', 'url': 'ftp://c'}])
+
+
+class TestConnectorCollector:
+    """커넥터 동시 수집 테스트"""
+
+    def test_collects_many_feeds_concurrently(self, db_session):
+        """여러 피드를 연결 풀에서 동시에 가져와 공용 저장 경로로 저장하는지 테스트"""
+        with FakeFeedServer(latency=0.2) as server:
+            connectors = [
+                FeedConnector(f'feed{i}', server.add_rss(f'/feed{i}.xml', f'feed{i}', count=3))
+                for i in range(12)
+            ]
+            connectors.append(FeedConnector('atom', server.add_atom('/atom.xml', 'atom', count=3)))
+            connectors.append(HTMLListingConnector(
+                'blog', server.add_html('/blog', 'blog', count=3), item_selector='article.post'
+            ))
+
+            result = make_collector(connectors, concurrency=8).collect()
+
+        assert server.max_concurrent == 8
+        assert server.connections <= 8  # keep-alive 연결 재사용
+        assert result['entries_fetched'] == 42
+        assert result['sources_created'] == 42
+        assert result['failed_connectors'] == []
+        assert Source.query.filter_by(platform='other').count() == 42
+        assert Inspiration.query.count() == result['inspirations_created'] > 0
+
+    def test_failures_isolated_and_rerun_deduplicated(self, db_session):
+        """실패한 피드는 기록만 하고, 다시 수집하면 중복을 건너뛰는지 테스트"""
+        with FakeFeedServer(failing_paths={'/broken.xml'}) as server:
+            connectors = [
+                FeedConnector('good', server.add_rss('/good.xml', 'good', count=4)),
+                FeedConnector('mirror', server.add_rss('/mirror.xml', 'good', count=4)),
+                FeedConnector('broken', server.url + '/broken.xml'),
+                FeedConnector('missing', server.url + '/missing.xml'),
+            ]
+            collector = make_collector(connectors)
+            first = collector.collect()
+            second = collector.collect()
+
+        assert first['failed_connectors'] == ['broken', 'missing']
+        assert first['connectors']['good']['entries'] == 4
+        assert '500' in first['connectors']['broken']['error']
+        # 같은 링크를 가진 미러 피드 항목은 한 번만 저장
+        assert first['sources_created'] == 4
+        assert first['duplicates_skipped'] == 4
+
+        assert second['sources_created'] == 0
+        assert second['duplicates_skipped'] == 8
+
+
+class TestHTTPCache:
+    """HTTP 응답 캐시 테스트"""
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        """크기 제한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제하는지 테스트"""
+        cache = HTTPCache(tmp_path, max_bytes=250)
+        cache.store('http://a', {'etag': '"a"'}, b'a' * 100)
+        cache.store('http://b', {'last-modified': 'Tue, 14 Nov 2023 22:13:20 GMT'}, b'b' * 100)
+        cache.record_not_modified('http://a')  # a 를 최근 사용으로
+        cache.store('http://c', {}, b'c' * 100)
+
+        assert cache.get('http://b') is None
+        assert cache.read_body('http://a') == b'a' * 100
+        assert cache.conditional_headers('http://a') == {'If-None-Match': '"a"'}
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['size_bytes'] == 200
+
+        # 재시작 후에도 항목과 통계 유지
+        cache.flush_stats()
+        reopened = HTTPCache(tmp_path, max_bytes=250)
+        assert reopened.get('http://c').size == 100
+        assert reopened.stats()['bytes_saved'] == 100
+
+    def test_stats_merged_across_processes(self, tmp_path):
+        """여러 프로세스가 저장한 통계를 잃지 않고 합치고, 이미 로드한 인스턴스도 다시 읽는지 테스트"""
+        admin = HTTPCache(tmp_path, max_bytes=1024)
+        assert admin.stats()['entries'] == 0
+
+        # 같은 디렉터리를 쓰는 두 수집 프로세스
+        workers = [HTTPCache(tmp_path, max_bytes=1024) for _ in range(2)]
+        workers[0].store('http://a', {'etag': '"a"'}, b'a' * 10)
+        for worker in workers:
+            worker.record_not_modified('http://a')
+            worker.is_unchanged('http://b', b'b')
+        for worker in workers:
+            worker.flush_stats()
+        workers[0].flush_stats()  # 증가분이 없으면 다시 더하지 않음
+
+        stats = admin.stats()
+        assert (stats['hits'], stats['misses'], stats['not_modified']) == (2, 2, 2)
+        assert stats['bytes_saved'] == 20
+        assert (stats['entries'], stats['size_bytes']) == (1, 10)
+
+    def test_unchanged_feeds_skip_parsing(self, db_session, tmp_path):
+        """바뀌지 않은 피드는 304 로 본문 없이 건너뛰고 바뀐 피드만 다시 파싱하는지 테스트"""
+        cache = HTTPCache(tmp_path, max_bytes=1024 * 1024)
+
+        with FakeFeedServer() as server:
+            connectors = [
+                FeedConnector(f'feed{i}', server.add_rss(f'/feed{i}.xml', f'feed{i}', count=3))
+                for i in range(3)
+            ]
+            collector = make_collector(connectors, http_cache=cache)
+
+            first = collector.collect()
+            first_bytes = server.bytes_sent
+
+            server.add_rss('/feed0.xml', 'feed0', count=4)
+            second = collector.collect()
+
+        assert first['sources_created'] == 9
+        assert second['not_modified'] == 2
+        assert second['entries_fetched'] == 4
+        assert second['sources_created'] == 1
+        assert server.conditional_requests == 3
+        assert server.bytes_sent - first_bytes == second['connectors']['feed0']['bytes']
+
+        stats = cache.stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 4
+        assert stats['bytes_saved'] == first['connectors']['feed1']['bytes'] + first['connectors']['feed2']['bytes']
+
+    def test_servers_without_validators_compared_by_body(self, db_session, tmp_path):
+        """검증자를 주지 않는 서버는 본문이 같으면 파싱을 건너뛰는지 테스트"""
+        cache = HTTPCache(tmp_path, max_bytes=1024 * 1024)
+
+        with FakeFeedServer(validators=False) as server:
+            collector = make_collector(
+                [FeedConnector('plain', server.add_rss('/plain.xml', 'plain', count=3))],
+                http_cache=cache
+            )
+            collector.collect()
+            second = collector.collect()
+
+        assert server.conditional_requests == 0
+        assert second['not_modified'] == 1
+        assert second['entries_fetched'] == 0
+        assert cache.stats()['hits'] == 1
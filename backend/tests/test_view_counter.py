@@ -0,0 +1,57 @@
+"""
+게시물 조회수 write-behind 버퍼 테스트
+"""
+from app import db
+from app.models import Post
+from app.services.view_counter import ViewCounter, get_view_counter
+from app.utils.performance import count_queries
+
+
+def stored_view_count(post_id):
+    """DB 에 저장된 조회수"""
+    return db.session.execute(db.select(Post.view_count).where(Post.id == post_id)).scalar()
+
+
+class TestViewCounter:
+    """조회수 버퍼 테스트"""
+
+    def test_views_are_buffered_and_merged(self, app, client, db_session, post_factory):
+        """조회 요청은 DB 에 쓰지 않고, 응답에는 반영 안 된 조회수가 더해지는지 테스트"""
+        post = post_factory('인기 게시물')
+        updated_at = post.updated_at
+
+        with count_queries() as counter:
+            client.get(f'/api/posts/{post.id}')
+        assert not any(statement.lstrip().upper().startswith('UPDATE') for statement in counter.statements)
+
+        response = client.get(f'/api/posts/slug/{post.slug}')
+        assert response.get_json()['view_count'] == 2
+        assert stored_view_count(post.id) == 0
+
+        listed = client.get('/api/posts').get_json()['posts']
+        assert listed[0]['view_count'] == 2
+
+        assert get_view_counter(app).flush() == 1
+        db.session.expire_all()
+        assert stored_view_count(post.id) == 2
+        assert Post.query.get(post.id).updated_at == updated_at
+        assert get_view_counter(app).pending(post.id) == 0
+
+    def test_workers_flush_in_one_update(self, app, db_session, post_factory):
+        """워커별 버퍼가 각자 한 번의 UPDATE 로 반영해도 증가분이 합쳐지는지 테스트"""
+        posts = [post_factory(f'게시물 {i}') for i in range(3)]
+        workers = [ViewCounter(app), ViewCounter(app)]
+
+        for worker in workers:
+            for post in posts:
+                worker.increment(post.id, 5)
+        workers[0].increment(posts[0].id)
+
+        for worker in workers:
+            with count_queries() as counter:
+                assert worker.flush() == 3
+            assert sum(statement.lstrip().upper().startswith('UPDATE') for statement in counter.statements) == 1
+
+        db.session.expire_all()
+        assert [stored_view_count(post.id) for post in posts] == [11, 10, 10]
+        assert workers[0].flush() == 0